@@ -0,0 +1,68 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import time
+import random
+
+import ezdxf
+from ezdxf.layouts import Modelspace
+
+COUNT = 100_000
+LAYERS = 100
+QUERIES = 20
+QUERY = 'LINE[layer=="LAYER7" & color==1]'
+
+
+def setup_modelspace(count: int) -> Modelspace:
+    random.seed(0)
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for _ in range(count):
+        dxfattribs = {
+            "layer": f"LAYER{random.randrange(LAYERS)}",
+            "color": random.randrange(1, 8),
+        }
+        if random.random() < 0.5:
+            msp.add_line((0, 0), (1, 0), dxfattribs=dxfattribs)
+        else:
+            msp.add_circle((0, 0), 1, dxfattribs=dxfattribs)
+    return msp
+
+
+def query(msp: Modelspace, count: int) -> int:
+    result = 0
+    for _ in range(count):
+        result = len(msp.query(QUERY))
+    return result
+
+
+def modify_and_query(msp: Modelspace, count: int) -> int:
+    entities = list(msp)
+    result = 0
+    for _ in range(count):
+        random.choice(entities).dxf.layer = "LAYER7"
+        result = len(msp.query(QUERY))
+    return result
+
+
+def run(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    t1 = time.perf_counter()
+    return t1 - t0
+
+
+def print_result(name: str, t: float, count: int):
+    print(f"{name}: {t:.3f}s, {t / count * 1000:.3f}ms per query")
+
+
+if __name__ == "__main__":
+    msp = setup_modelspace(COUNT)
+    print(f"query {QUERY} in {COUNT} entities\n")
+    print_result("linear scan", run(query, msp, QUERIES), QUERIES)
+    t0 = time.perf_counter()
+    msp.doc.entitydb.create_attribute_index()
+    print(f"create attribute index: {time.perf_counter() - t0:.3f}s")
+    print_result("attribute index", run(query, msp, QUERIES * 10), QUERIES * 10)
+    print_result(
+        "modify and query", run(modify_and_query, msp, QUERIES * 10), QUERIES * 10
+    )
@@ -0,0 +1,74 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import sys
+import time
+import random
+
+import ezdxf
+from ezdxf import bbox
+from ezdxf.layouts import Modelspace
+from ezdxf.math import BoundingBox
+
+COUNT = 100_000
+BLOCK_REFS = 1_000
+
+
+def setup_modelspace(count: int) -> Modelspace:
+    def rnd():
+        return random.uniform(-1000, 1000)
+
+    random.seed(0)
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for _ in range(count):
+        choice = random.randrange(5)
+        if choice == 0:
+            msp.add_line((rnd(), rnd()), (rnd(), rnd()))
+        elif choice == 1:
+            msp.add_circle((rnd(), rnd()), 10)
+        elif choice == 2:
+            msp.add_arc((rnd(), rnd()), 10, rnd(), rnd())
+        elif choice == 3:
+            msp.add_point((rnd(), rnd()))
+        else:
+            points = [(rnd(), rnd(), 0, 0, random.choice((0, 0.5))) for _ in range(5)]
+            msp.add_lwpolyline(points, format="xyseb")
+    block = doc.blocks.new("BLOCK")
+    block.add_line((0, 0), (1, 0))
+    block.add_circle((0, 0), 1)
+    block.add_text("TEXT")
+    for _ in range(BLOCK_REFS):
+        msp.add_blockref("BLOCK", (rnd(), rnd()), dxfattribs={"rotation": rnd()})
+    return msp
+
+
+def primitive_extents(msp: Modelspace) -> BoundingBox:
+    # bounding box calculation based on the disassembled primitives only
+    extents = BoundingBox()
+    for box in bbox.multi_flat(msp, fast=True):
+        extents.extend(box)
+    return extents
+
+
+def batch_extents(msp: Modelspace) -> BoundingBox:
+    return bbox.extents(msp, fast=True)
+
+
+def run(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    t1 = time.perf_counter()
+    return t1 - t0
+
+
+def print_result(name: str, t: float, count: int):
+    print(f"{name}: {t:.3f}s, {t / count * 1e6:.3f}us per entity")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    msp = setup_modelspace(count)
+    total = len(msp)
+    print(f"bounding box of {total} entities\n")
+    print_result("primitives", run(primitive_extents, msp), total)
+    print_result("NumPy batches", run(batch_extents, msp), total)
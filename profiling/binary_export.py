@@ -0,0 +1,59 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import os
+import tempfile
+import time
+
+import ezdxf
+from ezdxf.render import forms
+from ezdxf.lldxf.tagwriter import BinaryTagWriter, BufferedBinaryTagWriter
+
+COUNT = 20_000
+
+
+def create_doc():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    points = [(x, x / 3) for x in range(100)]
+    for index in range(COUNT):
+        msp.add_line((index, 0.5), (0, index / 3))
+        msp.add_text(f"TEXT{index}", dxfattribs={"height": 2.5})
+        if index % 10 == 0:
+            msp.add_lwpolyline(points)
+            forms.sphere(16, 8).render_mesh(msp)
+    return doc
+
+
+def export_entities(doc, filename, tagwriter_class):
+    with open(filename, "wb") as fp:
+        tagwriter = tagwriter_class(fp, dxfversion=doc.dxfversion)
+        for entity in doc.modelspace():
+            entity.export_dxf(tagwriter)
+        if hasattr(tagwriter, "flush"):
+            tagwriter.flush()
+
+
+def print_result(seconds, size, text):
+    mb = size / 1_000_000
+    print(f"Operation: {text} takes {seconds:.2f} s, {mb / seconds:.1f} MB/s\n")
+
+
+def run(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    doc = create_doc()
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, "binary_export.dxb")
+        seconds = run(export_entities, doc, filename, BinaryTagWriter)
+        size = os.path.getsize(filename)
+        print(f"modelspace entities: {size / 1_000_000:.1f} MB\n")
+        print_result(seconds, size, "BinaryTagWriter()")
+        seconds = run(export_entities, doc, filename, BufferedBinaryTagWriter)
+        print_result(seconds, size, "BufferedBinaryTagWriter()")
+        seconds = run(doc.saveas, filename, fmt="bin")
+        print_result(seconds, os.path.getsize(filename), "Drawing.saveas(fmt='bin')")
@@ -0,0 +1,58 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import time
+
+import numpy as np
+import ezdxf
+from ezdxf import columnar
+
+COUNT = 50_000
+
+
+def add_lines_one_by_one(starts, ends):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        msp.add_line(start, end)
+    return msp
+
+
+def add_lines_bulk(starts, ends):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    msp.add_lines(starts, ends)
+    return msp
+
+
+def read_lines_one_by_one(msp):
+    starts = []
+    ends = []
+    for line in msp.query("LINE"):
+        starts.append(line.dxf.start)
+        ends.append(line.dxf.end)
+    return np.array(starts), np.array(ends)
+
+
+def run(func, *args):
+    t0 = time.perf_counter()
+    result = func(*args)
+    t1 = time.perf_counter()
+    return t1 - t0, result
+
+
+def print_result(name: str, t: float):
+    print(f"{name}: {t:.3f}s, {t / COUNT * 1e6:.1f}µs per entity")
+
+
+if __name__ == "__main__":
+    print(f"{COUNT} LINE entities\n")
+    starts = np.random.random((COUNT, 3))
+    ends = np.random.random((COUNT, 3))
+    t, _ = run(add_lines_one_by_one, starts, ends)
+    print_result("add_line() one by one", t)
+    t, msp = run(add_lines_bulk, starts, ends)
+    print_result("add_lines() bulk", t)
+    t, _ = run(read_lines_one_by_one, msp)
+    print_result("read lines one by one", t)
+    t, _ = run(columnar.lines, msp)
+    print_result("columnar.lines()", t)
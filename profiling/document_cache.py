@@ -0,0 +1,32 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import time
+import ezdxf
+from ezdxf.doccache import default_cache
+
+BIG_FILE = ezdxf.options.test_files_path / "CADKitSamples" / "torso_uniform.dxf"
+
+
+def load(**kwargs):
+    ezdxf.readfile(BIG_FILE, **kwargs)
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, **kwargs):
+    start = time.perf_counter()
+    func(**kwargs)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    default_cache().discard(BIG_FILE)
+    print_result(run(load), "ezdxf.readfile()")
+    print_result(run(load, use_cache=True), "ezdxf.readfile(), cache miss")
+    print_result(run(load, use_cache=True), "ezdxf.readfile(), cache hit")
+    print_result(
+        run(default_cache().get, filename=BIG_FILE), "load DXF structure from cache"
+    )
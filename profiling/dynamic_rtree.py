@@ -0,0 +1,74 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import time
+import random
+
+from ezdxf.math import BoundingBox2d, Vec2
+from ezdxf.math.rtree import DynamicRTree
+
+COUNT = 50_000
+QUERIES = 1_000
+
+
+def random_boxes(count: int) -> list[tuple[int, BoundingBox2d]]:
+    random.seed(0)
+    boxes = []
+    for key in range(count):
+        x = random.uniform(0, 1000)
+        y = random.uniform(0, 1000)
+        size = Vec2(random.uniform(0, 5), random.uniform(0, 5))
+        boxes.append((key, BoundingBox2d([(x, y), Vec2(x, y) + size])))
+    return boxes
+
+
+def insert_boxes(tree: DynamicRTree, boxes):
+    for key, box in boxes:
+        tree.insert(key, box)
+
+
+def delete_boxes(tree: DynamicRTree, boxes):
+    for key, _ in boxes:
+        tree.delete(key)
+
+
+def query_boxes(tree: DynamicRTree, queries: list[BoundingBox2d]):
+    for query in queries:
+        list(tree.overlapping(query))
+
+
+def nearest_boxes(tree: DynamicRTree, queries: list[BoundingBox2d]):
+    for query in queries:
+        tree.nearest(query.center, 10)
+
+
+def run(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    t1 = time.perf_counter()
+    return t1 - t0
+
+
+def print_result(name: str, t: float, count: int):
+    print(f"{name}: {t:.3f}s, {t / count * 1e6:.2f}µs per operation")
+
+
+if __name__ == "__main__":
+    print(f"DynamicRTree with {COUNT} bounding boxes\n")
+    boxes = random_boxes(COUNT)
+    t0 = time.perf_counter()
+    packed_tree = DynamicRTree.bulk_load(boxes)
+    print_result("bulk_load()", time.perf_counter() - t0, COUNT)
+    tree: DynamicRTree = DynamicRTree()
+    print_result("insert()", run(insert_boxes, tree, boxes), COUNT)
+    queries = [
+        BoundingBox2d([box.extmin, box.extmin + Vec2(20, 20)])
+        for _, box in random_boxes(QUERIES)
+    ]
+    print_result(
+        "overlapping() packed tree", run(query_boxes, packed_tree, queries), QUERIES
+    )
+    print_result(
+        "overlapping() inserted tree", run(query_boxes, tree, queries), QUERIES
+    )
+    print_result("nearest(count=10)", run(nearest_boxes, tree, queries), QUERIES)
+    print_result("delete()", run(delete_boxes, tree, boxes[: COUNT // 2]), COUNT // 2)
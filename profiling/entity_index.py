@@ -0,0 +1,47 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import random
+import tempfile
+import time
+from pathlib import Path
+import ezdxf
+from ezdxf.lldxf import fileindex
+
+BIG_FILE = ezdxf.options.test_files_path / "CADKitSamples" / "torso_uniform.dxf"
+
+# Results for a 11MB ASCII DXF file with 100k LINE entities, Python 3.11:
+#
+# fileindex.load(): 1.49 s (structure tags and handles)
+# fileindex.build_entity_index(): 0.79 s
+# fileindex.load_entity_index(): 0.03 s
+# EntityIndex.load_entities() 10 random entities: < 0.01 s
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.3f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    end = time.perf_counter()
+    return end - start, result
+
+
+def main():
+    t, _ = run(fileindex.load, str(BIG_FILE))
+    print_result(t, "fileindex.load()")
+    t, index = run(fileindex.build_entity_index, BIG_FILE)
+    print_result(t, "fileindex.build_entity_index()")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index_filename = Path(tmp_dir) / "entity.index"
+        index.save(index_filename)
+        t, index = run(fileindex.load_entity_index, index_filename)
+        print_result(t, "fileindex.load_entity_index()")
+    handles = random.sample(list(index), 10)
+    t, _ = run(index.load_entities, handles)
+    print_result(t, "EntityIndex.load_entities() 10 random entities")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import time
+import random
+
+import ezdxf
+from ezdxf.layouts import Modelspace
+
+COUNT = 200_000
+DELETE = COUNT // 10
+
+
+def setup_modelspace(count: int) -> Modelspace:
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(count):
+        msp.add_line((index, 0), (0, index))
+    return msp
+
+
+def delete_entity(msp: Modelspace, entities):
+    for entity in entities:
+        msp.delete_entity(entity)
+
+
+def delete_entities(msp: Modelspace, entities):
+    msp.delete_entities(entities)
+
+
+def run(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    t1 = time.perf_counter()
+    return t1 - t0
+
+
+def print_result(name: str, t: float, count: int = DELETE):
+    print(f"{name}: {t:.3f}s, {t / count * 1e6:.2f}µs per entity")
+
+
+def random_entities(msp: Modelspace, count: int):
+    entities = list(msp)
+    random.shuffle(entities)
+    return entities[:count]
+
+
+if __name__ == "__main__":
+    print(f"delete {DELETE} of {COUNT} LINE entities from modelspace\n")
+    msp = setup_modelspace(COUNT)
+    print_result(
+        "msp.delete_entity()", run(delete_entity, msp, random_entities(msp, DELETE))
+    )
+    msp = setup_modelspace(COUNT)
+    print_result(
+        "msp.delete_entities()",
+        run(delete_entities, msp, random_entities(msp, DELETE)),
+    )
@@ -0,0 +1,65 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import time
+import random
+
+import ezdxf
+from ezdxf.entitydb import EntityDB
+from ezdxf.entities import Line
+
+COUNT = 200_000
+
+
+def add_entities(db: EntityDB, entities: list[Line]):
+    for entity in entities:
+        db.add(entity)
+
+
+def lookup_handles(db: EntityDB, handles: list[str]):
+    for handle in handles:
+        _ = db[handle]
+
+
+def get_handles(db: EntityDB, handles: list[str]):
+    get = db.get
+    for handle in handles:
+        get(handle)
+
+
+def contains_handles(db: EntityDB, handles: list[str]):
+    for handle in handles:
+        _ = handle in db
+
+
+def add_lines_to_modelspace(count: int):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(count):
+        msp.add_line((index, 0), (0, index))
+
+
+def run(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    t1 = time.perf_counter()
+    return t1 - t0
+
+
+def print_result(name: str, t: float, count: int = COUNT):
+    print(f"{name}: {t:.3f}s, {t / count * 1e6:.2f}µs per entity")
+
+
+if __name__ == "__main__":
+    print(f"EntityDB with {COUNT} entities\n")
+    db = EntityDB()
+    entities = [Line() for _ in range(COUNT)]
+    print_result("add new entities", run(add_entities, db, entities))
+    handles = list(db.keys())
+    random.shuffle(handles)
+    print_result("db[handle]", run(lookup_handles, db, handles))
+    print_result("db.get(handle)", run(get_handles, db, handles))
+    print_result("handle in db", run(contains_handles, db, handles))
+    count = COUNT // 4
+    print_result(
+        "msp.add_line()", run(add_lines_to_modelspace, count), count
+    )
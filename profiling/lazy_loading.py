@@ -0,0 +1,40 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import time
+import tracemalloc
+import ezdxf
+
+BIG_FILE = ezdxf.options.test_files_path / "CADKitSamples" / "torso_uniform.dxf"
+
+
+def load(**kwargs):
+    doc = ezdxf.readfile(BIG_FILE, **kwargs)
+    return doc
+
+
+def print_result(time, memory, text):
+    print(f"Operation: {text} takes {time:.2f} s and {memory / 1e6:.1f} MB\n")
+
+
+def run(**kwargs):
+    tracemalloc.start()
+    start = time.perf_counter()
+    doc = load(**kwargs)
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del doc
+    return end - start, peak
+
+
+if __name__ == "__main__":
+    print_result(*run(), "ezdxf.readfile()")
+    print_result(*run(lazy=True), "ezdxf.readfile(lazy=True)")
+    print_result(
+        *run(lazy=True, prefilter=lambda dxftype, layer: dxftype == "INSERT"),
+        "ezdxf.readfile(lazy=True, prefilter=...)",
+    )
+    print_result(
+        *run(filter=ezdxf.LoadFilter(types=["INSERT"])),
+        "ezdxf.readfile(filter=LoadFilter(...))",
+    )
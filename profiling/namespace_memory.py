@@ -0,0 +1,64 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import gc
+import tracemalloc
+
+import ezdxf
+from ezdxf.entities import Line, Point, Circle, Arc, Text, Insert, DXFNamespace
+
+COUNT = 20_000
+COMPACT_TYPES = [Line, Point, Circle, Arc, Text, Insert]
+
+
+def create_entities(msp, dxftype: str):
+    for index in range(COUNT):
+        if dxftype == "LINE":
+            msp.add_line((index, 0), (0, index), dxfattribs={"color": 1})
+        elif dxftype == "POINT":
+            msp.add_point((index, 0))
+        elif dxftype == "CIRCLE":
+            msp.add_circle((index, 0), radius=2)
+        elif dxftype == "ARC":
+            msp.add_arc((index, 0), radius=2, start_angle=30, end_angle=60)
+        elif dxftype == "TEXT":
+            msp.add_text(f"TEXT{index}", height=2.5).set_placement((index, 0))
+        elif dxftype == "INSERT":
+            msp.add_blockref("BLOCK", (index, 0), dxfattribs={"xscale": 2})
+
+
+def measure(dxftype: str) -> float:
+    doc = ezdxf.new()
+    doc.blocks.new("BLOCK")
+    msp = doc.modelspace()
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    create_entities(msp, dxftype)
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start) / COUNT
+
+
+def measure_all() -> dict[str, float]:
+    return {
+        cls.DXFTYPE: measure(cls.DXFTYPE) for cls in COMPACT_TYPES  # type: ignore
+    }
+
+
+def use_dict_namespace():
+    for cls in COMPACT_TYPES:
+        cls.DXFNAMESPACE = DXFNamespace
+
+
+if __name__ == "__main__":
+    print(f"memory usage per entity, {COUNT} entities of each type\n")
+    compact = measure_all()
+    use_dict_namespace()
+    default = measure_all()
+    for dxftype, size in compact.items():
+        saving = 1.0 - size / default[dxftype]
+        print(
+            f"{dxftype:8}: DXFNamespace {default[dxftype]:6.0f} bytes, "
+            f"CompactDXFNamespace {size:6.0f} bytes, {saving:.0%} less"
+        )
@@ -0,0 +1,43 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import os
+import tempfile
+import time
+
+import ezdxf
+
+COUNT = 50_000
+WORKERS = os.cpu_count() or 1
+
+
+def create_doc():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        msp.add_line((index, 0.5), (0, index / 3))
+        msp.add_lwpolyline([(0, 0), (1.1, 2), (3, index / 7)])
+        msp.add_text(f"TEXT{index}", dxfattribs={"height": 2.5})
+    return doc
+
+
+def print_result(seconds, text):
+    print(f"Operation: {text} takes {seconds:.2f} s\n")
+
+
+def run(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    doc = create_doc()
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, "parallel_export.dxf")
+        print_result(run(doc.saveas, filename), "Drawing.saveas()")
+        for workers in sorted({2, WORKERS} - {1}):
+            print_result(
+                run(doc.saveas, filename, workers=workers),
+                f"Drawing.saveas(workers={workers})",
+            )
@@ -0,0 +1,71 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import sys
+import time
+import random
+
+import ezdxf
+from ezdxf.document import Drawing
+
+# 1M entities require several GB of memory, pass a smaller count as argument
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+LAYERS = 100
+REPEAT = 3
+QUERIES = [
+    "LINE",
+    'LINE[layer=="LAYER7"]',
+    '*[layer=="layer7" & color==1]i',
+    '*[layer ? "LAYER1.*" | color>5]',
+    '* !CIRCLE[!(linetype=="DASHED" & color<3)]',
+]
+
+
+def setup_document(count: int) -> Drawing:
+    random.seed(0)
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for _ in range(count):
+        dxfattribs = {
+            "layer": f"LAYER{random.randrange(LAYERS)}",
+            "color": random.randrange(1, 8),
+        }
+        if random.random() < 0.5:
+            msp.add_line((0, 0), (1, 0), dxfattribs=dxfattribs)
+        else:
+            msp.add_circle((0, 0), 1, dxfattribs=dxfattribs)
+    return doc
+
+
+def query(doc: Drawing, query_string: str, count: int) -> int:
+    result = 0
+    for _ in range(count):
+        result = len(doc.query(query_string))
+    return result
+
+
+def run(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    t1 = time.perf_counter()
+    return t1 - t0
+
+
+def print_result(name: str, t: float, count: int):
+    throughput = COUNT * count / t / 1e6
+    print(f"{name}: {t / count:.3f}s per query, {throughput:.2f}M entities/s")
+
+
+def query_all(doc: Drawing):
+    for query_string in QUERIES:
+        print_result(query_string, run(query, doc, query_string, REPEAT), REPEAT)
+
+
+if __name__ == "__main__":
+    t0 = time.perf_counter()
+    doc = setup_document(COUNT)
+    print(f"setup {COUNT} entities: {time.perf_counter() - t0:.1f}s\n")
+    print("doc.query() without attribute index:")
+    query_all(doc)
+    doc.entitydb.create_attribute_index()
+    print("\ndoc.query() with attribute index:")
+    query_all(doc)
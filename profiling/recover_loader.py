@@ -0,0 +1,64 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import base64
+import time
+from io import BytesIO
+
+import ezdxf
+from ezdxf import recover
+from ezdxf.recover import bytes_loader, fast_bytes_loader, safe_tag_loader
+
+COUNT = 50_000
+
+
+def create_sample() -> bytes:
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        msp.add_line((index, 0), (0, index))
+        msp.add_text(f"TEXT{index}", dxfattribs={"height": 2.5})
+    return base64.b64decode(doc.encode_base64())
+
+
+def corrupt_sample(data: bytes) -> bytes:
+    # malformed group codes and numeric values, which are repaired by the
+    # recover module:
+    data = data.replace(b"\n 10\n", b"\n 10 # x\n")
+    data = data.replace(b"\n 40\n2.5\n", b"\n 40\n2.5xyz\n")
+    return data.replace(b"\n", b"\r\n")
+
+
+def load_tags(data: bytes, loader):
+    list(loader(BytesIO(data)))
+
+
+def load_and_compile_tags(data: bytes, loader):
+    list(safe_tag_loader(BytesIO(data), loader))
+
+
+def recover_read(data: bytes, loader):
+    recover_tool = recover.Recover.run(BytesIO(data), loader=loader)
+    recover._load_and_audit_document(recover_tool)
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.2f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    sample = corrupt_sample(create_sample())
+    print(f"corrupted sample with {COUNT} LINE and TEXT entities, {len(sample)} bytes\n")
+    for loader in (bytes_loader, fast_bytes_loader):
+        name = loader.__name__
+        print_result(run(load_tags, sample, loader), f"{name}()")
+        print_result(
+            run(load_and_compile_tags, sample, loader), f"safe_tag_loader({name})"
+        )
+        print_result(run(recover_read, sample, loader), f"recover.read({name})")
@@ -0,0 +1,50 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import io
+import time
+
+import ezdxf
+
+COUNT = 50_000
+VARIANTS = 10
+
+
+def create_doc():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        msp.add_line((index, 0), (0, index), dxfattribs={"layer": "LINES"})
+    return doc
+
+
+def reload_variants(data: str):
+    for _ in range(VARIANTS):
+        variant = ezdxf.read(io.StringIO(data))
+        variant.layers.get("0").color = 2
+
+
+def derive_variants(snapshot):
+    for _ in range(VARIANTS):
+        variant = snapshot.document()
+        variant.layers.get("0").color = 2
+
+
+def run(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    t1 = time.perf_counter()
+    return t1 - t0
+
+
+if __name__ == "__main__":
+    print(f"{VARIANTS} variants of a document with {COUNT} LINE entities\n")
+    doc = create_doc()
+    stream = io.StringIO()
+    doc.write(stream)
+    t0 = time.perf_counter()
+    snapshot = doc.snapshot()
+    print(f"create snapshot: {time.perf_counter() - t0:.3f}s")
+    t = run(reload_variants, stream.getvalue())
+    print(f"reload from DXF data: {t:.3f}s, {t / VARIANTS:.3f}s per variant")
+    t = run(derive_variants, snapshot)
+    print(f"derive from snapshot: {t:.3f}s, {t / VARIANTS:.3f}s per variant")
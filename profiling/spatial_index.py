@@ -0,0 +1,81 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import time
+import random
+
+import ezdxf
+from ezdxf import select, bbox
+from ezdxf.layouts import Modelspace
+
+COUNT = 20_000
+QUERIES = 1_000
+LINEAR_SCAN_QUERIES = 20
+
+
+def setup_modelspace(count: int) -> Modelspace:
+    random.seed(0)
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for _ in range(count):
+        x = random.uniform(0, 1000)
+        y = random.uniform(0, 1000)
+        msp.add_line((x, y), (x + random.uniform(0, 10), y + random.uniform(0, 10)))
+    return msp
+
+
+def windows(count: int) -> list[select.Window]:
+    result = []
+    for _ in range(count):
+        x = random.uniform(0, 1000)
+        y = random.uniform(0, 1000)
+        result.append(select.Window((x, y), (x + 20, y + 20)))
+    return result
+
+
+def linear_scan(msp: Modelspace, shapes: list[select.Window]):
+    cache = bbox.Cache()
+    for shape in shapes:
+        select.bbox_inside(shape, msp, cache=cache)
+
+
+def spatial_index(msp: Modelspace, shapes: list[select.Window]):
+    index = msp.spatial_index()
+    for shape in shapes:
+        index.bbox_inside(shape)
+
+
+def modify_and_query(msp: Modelspace, shapes: list[select.Window]):
+    index = msp.spatial_index()
+    entities = list(msp)
+    for shape in shapes:
+        random.choice(entities).translate(1, 1, 0)
+        index.bbox_inside(shape)
+
+
+def run(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    t1 = time.perf_counter()
+    return t1 - t0
+
+
+def print_result(name: str, t: float, count: int = QUERIES):
+    print(f"{name}: {t:.3f}s, {t / count * 1e3:.3f}ms per query")
+
+
+if __name__ == "__main__":
+    print(f"{QUERIES} window selections of {COUNT} LINE entities\n")
+    msp = setup_modelspace(COUNT)
+    shapes = windows(QUERIES)
+    print_result(
+        "select.bbox_inside()",
+        run(linear_scan, msp, shapes[:LINEAR_SCAN_QUERIES]),
+        LINEAR_SCAN_QUERIES,
+    )
+    t = run(msp.spatial_index)
+    print(f"build spatial index: {t:.3f}s")
+    print_result("SpatialIndex.bbox_inside()", run(spatial_index, msp, shapes))
+    print_result(
+        "transform entity + SpatialIndex.bbox_inside()",
+        run(modify_and_query, msp, shapes),
+    )
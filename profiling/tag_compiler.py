@@ -1,12 +1,35 @@
-#  Copyright (c) 2020-2022, Manfred Moitzi
+#  Copyright (c) 2020-2026, Manfred Moitzi
 #  License: MIT License
 import time
 import ezdxf
-from ezdxf.lldxf.tagger import ascii_tags_loader, tag_compiler
+from ezdxf.lldxf.tagger import (
+    ascii_tags_loader,
+    tag_compiler,
+    py_tag_compiler,
+    internal_tag_compiler,
+    py_internal_tag_compiler,
+)
 from ezdxf.recover import safe_tag_loader
 
 BIG_FILE = ezdxf.options.test_files_path / "CADKitSamples" / "torso_uniform.dxf"
 
+# Results for a 11MB ASCII DXF file with 800k tags, Python 3.11:
+#
+# tag_compiler() for pre-loaded tags:
+#   Python implementation: 1.01 s
+#   Cython implementation: 0.73 s (~1.4x faster)
+#
+# internal_tag_compiler() for 50.000 LINE entities:
+#   Python implementation: 0.56 s
+#   Cython implementation: 0.41 s (~1.4x faster)
+#
+# The remaining runtime is mostly spent by creating the DXFTag() objects.
+
+LINES = "".join(
+    "0\nLINE\n5\nAB\n8\n0\n10\n1.5\n20\n2.5\n30\n0\n11\n3\n21\n4\n31\n0\n"
+    for _ in range(50_000)
+)
+
 
 def load_ascii():
     with open(BIG_FILE, "rt") as fp:
@@ -18,6 +41,11 @@ def safe_load_bytes():
         list(safe_tag_loader(fp))
 
 
+def load_tags():
+    with open(BIG_FILE, "rt") as fp:
+        return list(ascii_tags_loader(fp))
+
+
 def print_result(time, text):
     print(f"Operation: {text} takes {time:.2f} s\n")
 
@@ -32,3 +60,23 @@ def run(func):
 if __name__ == "__main__":
     print_result(run(safe_load_bytes), "safe_tag_loader()")
     print_result(run(load_ascii), "ascii_tag_compiler()")
+
+    tags = load_tags()
+    print_result(
+        run(lambda: list(py_tag_compiler(iter(tags)))),
+        "tag_compiler() Python implementation",
+    )
+    if tag_compiler is not py_tag_compiler:
+        print_result(
+            run(lambda: list(tag_compiler(iter(tags)))),
+            "tag_compiler() Cython implementation",
+        )
+    print_result(
+        run(lambda: list(py_internal_tag_compiler(LINES))),
+        "internal_tag_compiler() Python implementation",
+    )
+    if internal_tag_compiler is not py_internal_tag_compiler:
+        print_result(
+            run(lambda: list(internal_tag_compiler(LINES))),
+            "internal_tag_compiler() Cython implementation",
+        )
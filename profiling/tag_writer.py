@@ -0,0 +1,71 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import os
+import tempfile
+import time
+
+import ezdxf
+from ezdxf.lldxf.tagger import ascii_tags_loader, tag_compiler
+from ezdxf.lldxf.tagwriter import TagWriter
+
+COUNT = 50_000
+
+
+def create_doc():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        msp.add_line((index, 0.5), (0, index / 3))
+        msp.add_lwpolyline([(0, 0), (1.1, 2), (3, index / 7)])
+        msp.add_text(f"TEXT{index}", dxfattribs={"height": 2.5})
+    return doc
+
+
+def load_tags(filename):
+    with open(filename, "rt", encoding="utf8") as fp:
+        return list(tag_compiler(ascii_tags_loader(fp)))
+
+
+def write_text_stream(tags, filename):
+    with open(filename, "wt", encoding="utf8", errors="dxfreplace") as fp:
+        tagwriter = TagWriter(fp)
+        for tag in tags:
+            tagwriter.write_tag(tag)
+
+
+def saveas_text_stream(doc, filename):
+    with open(filename, "wt", encoding="utf8", errors="dxfreplace") as fp:
+        doc.write(fp)
+
+
+def saveas(doc, filename):
+    doc.saveas(filename)
+
+
+def print_result(seconds, size, text):
+    mb = size / 1_000_000
+    print(f"Operation: {text} takes {seconds:.2f} s, {mb / seconds:.1f} MB/s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    doc = create_doc()
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, "tag_writer.dxf")
+        doc.saveas(filename)
+        size = os.path.getsize(filename)
+        tags = load_tags(filename)
+        print(f"{len(tags)} tags, {size / 1_000_000:.1f} MB\n")
+        print_result(
+            run(write_text_stream, tags, filename), size, "TagWriter(text stream)"
+        )
+        print_result(
+            run(saveas_text_stream, doc, filename), size, "Drawing.write(text stream)"
+        )
+        print_result(run(saveas, doc, filename), size, "Drawing.saveas()")
@@ -33,7 +33,16 @@ from ezdxf.colors import (
 from ezdxf.enums import InsertUnits
 from ezdxf.lldxf import const
 from ezdxf.lldxf.validator import is_dxf_file, is_dxf_stream
-from ezdxf.filemanagement import readzip, new, read, readfile, decode_base64
+from ezdxf.filemanagement import (
+    readzip,
+    new,
+    read,
+    readfile,
+    aread,
+    areadfile,
+    decode_base64,
+)
+from ezdxf.lldxf.loader import LoadFilter
 from ezdxf.tools.standards import (
     setup_linetypes,
     setup_styles,
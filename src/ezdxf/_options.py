@@ -1,4 +1,4 @@
-# Copyright (c) 2011-2023, Manfred Moitzi
+# Copyright (c) 2011-2026, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
 from typing import TextIO, Sequence
@@ -64,6 +64,7 @@ def default_config() -> ConfigParser:
         "FILTER_INVALID_XDATA_GROUP_CODES": "true",
         "WRITE_FIXED_META_DATA_FOR_TESTING": "false",
         "DISABLE_C_EXT": "false",
+        "DOCUMENT_CACHE_MAX_SIZE": "1024",
     }
     config[BROWSE_COMMAND] = {
         "TEXT_EDITOR": r'"C:\Program Files\Notepad++\notepad++.exe" '
@@ -275,6 +276,15 @@ class Options:
         """Disable C-extensions if ``True``."""
         return self.get_bool(CORE, "DISABLE_C_EXT", default=False)
 
+    @property
+    def document_cache_max_size(self) -> int:
+        """Max. size of the document cache in megabytes."""
+        return self.get_int(CORE, "DOCUMENT_CACHE_MAX_SIZE", default=1024)
+
+    @document_cache_max_size.setter
+    def document_cache_max_size(self, size: int) -> None:
+        self.set(CORE, "DOCUMENT_CACHE_MAX_SIZE", str(int(size)))
+
     @property
     def use_c_ext(self) -> bool:
         """Returns ``True`` if the C-extensions are in use."""
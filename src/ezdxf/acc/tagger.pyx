@@ -0,0 +1,200 @@
+# cython: language_level=3
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+# Cython implementation of the tag compilers in module ezdxf.lldxf.tagger,
+# both implementations have to produce identical results.
+from typing import Iterable, Iterator
+from ezdxf.lldxf.types import DXFTag, DXFVertex, DXFBinaryTag, TYPE_TABLE
+from ezdxf.lldxf.const import DXFStructureError
+
+__all__ = ["internal_tag_compiler", "tag_compiler"]
+
+cdef enum:
+    MAX_GROUP_CODE = 1071
+    TYPE_STR = 0
+    TYPE_INT = 1
+    TYPE_FLOAT = 2
+
+cdef unsigned char VALUE_TYPES[MAX_GROUP_CODE + 1]
+
+
+cdef void setup_value_types():
+    cdef int code
+    for code in range(MAX_GROUP_CODE + 1):
+        caster = TYPE_TABLE.get(code, str)
+        if caster is int:
+            VALUE_TYPES[code] = TYPE_INT
+        elif caster is float:
+            VALUE_TYPES[code] = TYPE_FLOAT
+        else:
+            VALUE_TYPES[code] = TYPE_STR
+
+
+setup_value_types()
+
+
+cdef inline int value_type(int code):
+    if 0 <= code <= MAX_GROUP_CODE:
+        return VALUE_TYPES[code]
+    return TYPE_STR
+
+
+cdef inline bint is_point_code(int code):
+    # POINT_CODES of module ezdxf.lldxf.types
+    return (
+        (10 <= code <= 18)
+        or (110 <= code <= 112)
+        or (210 <= code <= 213)
+        or (1010 <= code <= 1013)
+    )
+
+
+cdef inline bint is_binary_data(int code):
+    # BINARY_DATA of module ezdxf.lldxf.types
+    return (310 <= code <= 319) or code == 1004
+
+
+# marks the end of the tag stream
+cdef object _END = object()
+
+
+cdef object cast_value(int code, object value):
+    cdef int type_ = value_type(code)
+    if type_ == TYPE_INT:
+        return int(value)
+    if type_ == TYPE_FLOAT:
+        return float(value)
+    return value
+
+
+def internal_tag_compiler(str s) -> Iterable[DXFTag]:
+    """Yields DXFTag() from trusted (internal) source - relies on
+    well-formed and error free DXF format. Does not skip comment
+    tags (group code == 999).
+
+    Args:
+        s: DXF unicode string, lines separated by universal line endings '\n'
+
+    """
+    cdef list lines = s.split("\n")
+    # split() creates an extra item, if s ends with '\n',
+    # but lines[-1] can be an empty string!!!
+    if s.endswith("\n"):
+        lines.pop()
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t count = len(lines)
+    cdef int code, z_code
+    while pos < count:
+        code = int(lines[pos])
+        value = lines[pos + 1]
+        pos += 2
+        if is_point_code(code):
+            # next tag; y-axis is mandatory
+            y = lines[pos + 1]
+            pos += 2
+            if pos < count:
+                # next tag; z coordinate just for 3d points
+                z_code = int(lines[pos])
+                z = lines[pos + 1]
+            else:  # if string s ends with a 2d point
+                z_code, z = -1, ""
+            if z_code == code + 20:  # 3d point
+                pos += 2
+                yield DXFVertex(code, (float(value), float(y), float(z)))
+            else:  # 2d point
+                yield DXFVertex(code, (float(value), float(y)))
+        elif is_binary_data(code):
+            yield DXFBinaryTag.from_string(code, value)
+        else:  # single value tag: int, float or string
+            yield DXFTag(code, cast_value(code, value))
+
+
+def tag_compiler(tags: Iterator[DXFTag]) -> Iterator[DXFTag]:
+    """Compiles DXF tag values imported by ascii_tags_loader() into Python
+    types, see Python implementation in module ezdxf.lldxf.tagger.
+
+    Raises:
+        DXFStructureError: Found invalid DXF tag or unexpected coordinate order.
+
+    """
+    cdef int line = 2
+    cdef int code
+    cdef int type_
+    it = iter(tags)
+    x = next(it, _END)
+    while x is not _END:
+        if type(x) is DXFTag:  # fast slot access for tags from the tag loaders
+            code = x._code
+            value = x._value
+        else:
+            code = x.code
+            value = x.value
+        if is_point_code(code):
+            # y-axis is mandatory
+            y = next(it, _END)
+            line += 2
+            if y is _END:
+                return
+            if y.code != code + 10:  # like 20 for base x-code 10
+                raise DXFStructureError(
+                    f"Missing required y coordinate near line: {line}."
+                )
+            # z-axis just for 3d points
+            z = next(it, _END)
+            if z is not _END:
+                line += 2
+            try:
+                # z-axis like (30, 0.0) for base x-code 10
+                if z is not _END and z.code == code + 20:
+                    point = (float(value), float(y.value), float(z.value))
+                    x = next(it, _END)
+                    line += 2
+                else:
+                    point = (float(value), float(y.value))
+                    x = z  # z is the next tag or the end of the stream
+            except ValueError:
+                raise DXFStructureError(
+                    f"Invalid floating point values near line: {line}."
+                )
+            yield DXFVertex(code, point)
+            continue
+        if is_binary_data(code):
+            # Maybe pre compiled in low level tagger (binary DXF):
+            if isinstance(x, DXFBinaryTag):
+                tag = x
+            else:
+                try:
+                    tag = DXFBinaryTag.from_string(code, value)
+                except ValueError:
+                    raise DXFStructureError(
+                        f"Invalid binary data near line: {line}."
+                    )
+        else:  # Just a single tag
+            if code == 0:
+                value = value.strip()
+            type_ = value_type(code)
+            try:
+                if type_ == TYPE_INT:
+                    value = int(value)
+                elif type_ == TYPE_FLOAT:
+                    value = float(value)
+                elif type(value) is not str:
+                    # e.g. values of string group codes loaded from JSON data
+                    value = str(value)
+            except ValueError:
+                # ProE stores int values as floats :((
+                if type_ == TYPE_INT:
+                    try:
+                        value = int(float(value))
+                    except ValueError:
+                        raise DXFStructureError(error_msg(x, line))
+                else:
+                    raise DXFStructureError(error_msg(x, line))
+            tag = DXFTag(code, value)
+        yield tag
+        x = next(it, _END)
+        line += 2
+
+
+cdef str error_msg(tag, int line):
+    return f'Invalid tag (code={tag.code}, value="{tag.value}") near line: {line}.'
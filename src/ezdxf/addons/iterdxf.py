@@ -1,4 +1,4 @@
-# Copyright (c) 2020-2022, Manfred Moitzi
+# Copyright (c) 2020-2026, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
 from typing import (
@@ -14,15 +14,26 @@ from io import StringIO
 from pathlib import Path
 from ezdxf.lldxf.const import DXFStructureError
 from ezdxf.lldxf.extendedtags import ExtendedTags, DXFTag
-from ezdxf.lldxf.tagwriter import TagWriter
-from ezdxf.lldxf.tagger import tag_compiler, ascii_tags_loader
+from ezdxf.lldxf.tagwriter import TagWriter, BinaryTagWriter, AbstractTagWriter
+from ezdxf.lldxf.tagger import (
+    tag_compiler,
+    ascii_tags_loader,
+    binary_stream_tags_loader,
+    binary_chunk_tags_locator,
+    BINARY_DXF_SIGNATURE,
+)
 from ezdxf.filemanagement import dxf_file_info
 from ezdxf.lldxf import fileindex
 
-from ezdxf.entities import DXFGraphic, DXFEntity, Polyline, Insert
+from ezdxf.entities import DXFGraphic, Polyline, Insert
 from ezdxf.entities import factory
 from ezdxf.entities.subentity import entity_linker
 from ezdxf.tools.codepage import toencoding
+from ezdxf.tools.compressedfile import (
+    compression_by_extension,
+    detect_compression,
+    open_file,
+)
 
 __all__ = ["opendxf", "single_pass_modelspace", "modelspace"]
 
@@ -63,7 +74,8 @@ Filename = Union[Path, str]
 
 
 class IterDXF:
-    """Iterator for DXF entities stored in the modelspace.
+    """Iterator for DXF entities stored in the modelspace of ASCII and binary
+    DXF files.
 
     Args:
         name: filename, has to be a seekable file.
@@ -111,6 +123,11 @@ class IterDXF:
     def dxfversion(self):
         return self.structure.version
 
+    @property
+    def is_binary(self) -> bool:
+        """``True`` for binary DXF files."""
+        return self.structure.binary
+
     def export(self, name: Filename) -> IterDXFWriter:
         """Returns a companion object to export parts from the source DXF file
         into another DXF file, the new file will have the same HEADER, CLASSES,
@@ -118,7 +135,8 @@ class IterDXF:
         dependencies are present in the new file.
 
         Args:
-            name: filename, no special requirements
+            name: filename, no special requirements, the extension ".gz" or
+                ".zst" creates a compressed DXF file
 
         """
         doc = IterDXFWriter(name, self)
@@ -186,6 +204,18 @@ class IterDXF:
                 "\r\n", "\n"
             )
 
+        def load_binary_tags(data: bytes) -> ExtendedTags:
+            tags = binary_chunk_tags_locator(
+                _no_data,
+                data,
+                r12=r12,
+                encoding=self.encoding,
+                errors=self.errors,
+            )
+            return ExtendedTags(tag_compiler(tag for _, tag in tags))
+
+        binary = self.is_binary
+        r12 = self.dxfversion <= "AC1009"
         index = start
         entry = self.structure.index[index]
         self.file.seek(entry.location)
@@ -195,7 +225,10 @@ class IterDXF:
             size = next_entry.location - entry.location
             data = self.file.read(size)
             if entry.value in requested_types:
-                xtags = ExtendedTags.from_text(to_str(data))
+                if binary:
+                    xtags = load_binary_tags(data)
+                else:
+                    xtags = ExtendedTags.from_text(to_str(data))
                 yield factory.load(xtags)  # type: ignore
             entry = next_entry
 
@@ -207,9 +240,16 @@ class IterDXF:
 class IterDXFWriter:
     def __init__(self, name: Filename, loader: IterDXF):
         self.name = str(name)
-        self.file: BinaryIO = open(name, mode="wb")
+        self.file: BinaryIO = open_file(name, "wb", compression_by_extension(name))
         self.text = StringIO()
-        self.entity_writer = TagWriter(self.text, loader.dxfversion)
+        self.entity_writer: AbstractTagWriter
+        if loader.is_binary:
+            # binary DXF tags are written directly into the export file
+            self.entity_writer = BinaryTagWriter(
+                self.file, loader.dxfversion, encoding=loader.encoding
+            )
+        else:
+            self.entity_writer = TagWriter(self.text, loader.dxfversion)
         self.loader = loader
 
     def write_data(self, data: bytes):
@@ -250,29 +290,36 @@ class IterDXFWriter:
                 for attrib in insert.attribs:
                     attrib.export_dxf(self.entity_writer)
                 insert.seqend.export_dxf(self.entity_writer)  # type: ignore
-        data = self.text.getvalue().encode(self.loader.encoding)
-        self.file.write(data)
+        if not self.loader.is_binary:
+            data = self.text.getvalue().encode(self.loader.encoding)
+            self.file.write(data)
 
     def close(self):
         """Safe closing of exported DXF file. Copying of OBJECTS section
         happens only at closing the file, without closing the new DXF file is
         invalid.
         """
-        self.file.write(b"  0\r\nENDSEC\r\n")  # for ENTITIES section
-        if self.loader.dxfversion > "AC1009":
-            self.loader.copy_objects_section(self.file)
-        self.file.write(b"  0\r\nEOF\r\n")
+        if self.loader.is_binary:
+            self.entity_writer.write_tag2(0, "ENDSEC")  # for ENTITIES section
+            if self.loader.dxfversion > "AC1009":
+                self.loader.copy_objects_section(self.file)
+            self.entity_writer.write_tag2(0, "EOF")
+        else:
+            self.file.write(b"  0\r\nENDSEC\r\n")  # for ENTITIES section
+            if self.loader.dxfversion > "AC1009":
+                self.loader.copy_objects_section(self.file)
+            self.file.write(b"  0\r\nEOF\r\n")
         self.file.close()
 
 
 def opendxf(filename: Filename, errors: str = "surrogateescape") -> IterDXF:
-    """Open DXF file for iterating, be sure to open valid DXF files, no DXF
-    structure checks will be applied.
+    """Open ASCII or binary DXF file for iterating, be sure to open valid DXF
+    files, no DXF structure checks will be applied.
 
     Use this function to split up big DXF files as shown in the example above.
 
     Args:
-        filename: DXF filename of a seekable DXF file.
+        filename: DXF filename of a seekable and uncompressed DXF file.
         errors: specify decoding error handler
 
             - "surrogateescape" to preserve possible binary data (default)
@@ -293,11 +340,14 @@ def modelspace(
     errors: str = "surrogateescape",
 ) -> Iterable[DXFGraphic]:
     """Iterate over all modelspace entities as :class:`DXFGraphic` objects of
-    a seekable file.
+    a seekable ASCII or binary DXF file.
 
     Use this function to iterate "quick" over modelspace entities of a DXF file,
     filtering DXF types may speed up things if many entity types will be skipped.
 
+    Compressed DXF files like "drawing.dxf.gz" or "drawing.dxf.zst" are
+    decompressed on the fly.
+
     Args:
         filename: filename of a seekable DXF file
         types: DXF types like ``['LINE', '3DFACE']`` which should be returned,
@@ -313,47 +363,25 @@ def modelspace(
         UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
 
     """
-    info = dxf_file_info(str(filename))
-    prev_code: int = -1
-    prev_value: Any = ""
-    entities = False
     requested_types = _requested_types(types)
+    compression = detect_compression(filename)
+    with open_file(filename, "rb", compression) as fp:
+        binary = fp.read(22) == BINARY_DXF_SIGNATURE
+    if binary:
+        with open_file(filename, "rb", compression) as fp:
+            yield from _load_modelspace(
+                tag_compiler(binary_stream_tags_loader(fp, errors)),
+                requested_types,
+            )
+        return
 
-    with open(filename, mode="rt", encoding=info.encoding, errors=errors) as fp:
-        tagger = ascii_tags_loader(fp)
-        queued: Optional[DXFEntity] = None
-        tags: list[DXFTag] = []
-        linked_entity = entity_linker()
-
-        for tag in tag_compiler(tagger):
-            code = tag.code
-            value = tag.value
-            if entities:
-                if code == 0:
-                    if len(tags) and tags[0].value in requested_types:
-                        entity = factory.load(ExtendedTags(tags))
-                        if (
-                            not linked_entity(entity)
-                            and entity.dxf.paperspace == 0
-                        ):
-                            # queue one entity for collecting linked entities:
-                            # VERTEX, ATTRIB
-                            if queued:
-                                yield queued  # type: ignore
-                            queued = entity
-                    tags = [tag]
-                else:
-                    tags.append(tag)
-                if code == 0 and value == "ENDSEC":
-                    if queued:
-                        yield queued  # type: ignore
-                    return
-                continue  # if entities - nothing else matters
-            elif code == 2 and prev_code == 0 and prev_value == "SECTION":
-                entities = value == "ENTITIES"
-
-            prev_code = code
-            prev_value = value
+    info = dxf_file_info(str(filename))
+    with open_file(
+        filename, "rt", compression, encoding=info.encoding, errors=errors
+    ) as fp:
+        yield from _load_modelspace(
+            tag_compiler(ascii_tags_loader(fp)), requested_types
+        )
 
 
 def single_pass_modelspace(
@@ -365,11 +393,12 @@ def single_pass_modelspace(
     a single pass.
 
     Use this function to 'quick' iterate over modelspace entities of a **not**
-    seekable binary DXF stream, filtering DXF types may speed up things if many
-    entity types will be skipped.
+    seekable binary stream, filtering DXF types may speed up things if many
+    entity types will be skipped. The stream can contain an ASCII or a binary
+    DXF document, binary DXF documents are loaded in chunks of constant size.
 
     Args:
-        stream: (not seekable) binary DXF stream
+        stream: (not seekable) binary stream
         types: DXF types like ``['LINE', '3DFACE']`` which should be returned,
             ``None`` returns all supported types.
         errors: specify decoding error handler
@@ -383,13 +412,22 @@ def single_pass_modelspace(
         UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
 
     """
+    requested_types = _requested_types(types)
+    signature = stream.read(len(BINARY_DXF_SIGNATURE))
+    stream = _PrefixedStream(signature, stream)  # type: ignore
+    if signature == BINARY_DXF_SIGNATURE:
+        yield from _load_modelspace(
+            tag_compiler(binary_stream_tags_loader(stream, errors)),
+            requested_types,
+        )
+        return
+
     fetch_header_var: Optional[str] = None
     encoding = "cp1252"
     version = "AC1009"
     prev_code: int = -1
     prev_value: str = ""
     entities = False
-    requested_types = _requested_types(types)
 
     for code, value in binary_tagger(stream):
         if code == 0 and value == b"ENDSEC":
@@ -422,10 +460,6 @@ def single_pass_modelspace(
         code = tag.code
         value = tag.value
         if entities:
-            if code == 0 and value == "ENDSEC":
-                if queued:
-                    yield queued
-                return
             if code == 0:
                 if len(tags) and tags[0].value in requested_types:
                     entity = cast(DXFGraphic, factory.load(ExtendedTags(tags)))
@@ -435,6 +469,10 @@ def single_pass_modelspace(
                         if queued:
                             yield queued
                         queued = entity
+                if value == "ENDSEC":
+                    if queued:
+                        yield queued
+                    return
                 tags = [tag]
             else:
                 tags.append(tag)
@@ -466,6 +504,82 @@ def binary_tagger(
             return
 
 
+def _load_modelspace(
+    tagger: Iterable[DXFTag], requested_types: set[str]
+) -> Iterator[DXFGraphic]:
+    """Yields the requested modelspace entities from the compiled DXF tags of a
+    DXF document.
+    """
+    prev_code: int = -1
+    prev_value: Any = ""
+    entities = False
+    queued: Optional[DXFGraphic] = None
+    tags: list[DXFTag] = []
+    linked_entity = entity_linker()
+
+    for tag in tagger:
+        code = tag.code
+        value = tag.value
+        if entities:
+            if code == 0:
+                if len(tags) and tags[0].value in requested_types:
+                    entity = cast(DXFGraphic, factory.load(ExtendedTags(tags)))
+                    if not linked_entity(entity) and entity.dxf.paperspace == 0:
+                        # queue one entity for collecting linked entities:
+                        # VERTEX, ATTRIB
+                        if queued:
+                            yield queued
+                        queued = entity
+                if value == "ENDSEC":
+                    if queued:
+                        yield queued
+                    return
+                tags = [tag]
+            else:
+                tags.append(tag)
+            continue  # if entities - nothing else matters
+        elif code == 2 and prev_code == 0 and prev_value == "SECTION":
+            entities = value == "ENTITIES"
+
+        prev_code = code
+        prev_value = value
+
+
+class _PrefixedStream:
+    """Binary stream which returns the already consumed `prefix` before the
+    remaining data of `stream`.
+    """
+
+    def __init__(self, prefix: bytes, stream: BinaryIO):
+        self._prefix = prefix
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        prefix = self._prefix
+        if not prefix:
+            return self._stream.read(size)
+        if 0 <= size <= len(prefix):
+            self._prefix = prefix[size:]
+            return prefix[:size]
+        self._prefix = b""
+        return prefix + self._stream.read(-1 if size < 0 else size - len(prefix))
+
+    def readline(self) -> bytes:
+        prefix = self._prefix
+        if not prefix:
+            return self._stream.readline()
+        index = prefix.find(b"\n")
+        if index >= 0:
+            self._prefix = prefix[index + 1 :]
+            return prefix[: index + 1]
+        self._prefix = b""
+        return prefix + self._stream.readline()
+
+
+def _no_data(size: int) -> bytes:
+    return b""
+
+
 def _requested_types(types: Optional[Iterable[str]]) -> set[str]:
     if types:
         requested = SUPPORTED_TYPES.intersection(set(types))
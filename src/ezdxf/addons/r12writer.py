@@ -20,6 +20,7 @@ from functools import partial
 from io import StringIO
 from pathlib import Path
 from ezdxf.lldxf.tagwriter import BinaryTagWriter
+from ezdxf.tools.compressedfile import compression_by_extension, open_file
 
 Vertex = Sequence[float]
 rnd = partial(round, ndigits=6)
@@ -73,16 +74,21 @@ def r12writer(
     write Binary DXF files. ASCII DXF require a :class:`TextIO` stream and
     Binary DXF require a :class:`BinaryIO` stream.
 
+    A file name with the extension ".gz" or ".zst" creates a gzip or zstd
+    compressed DXF file, the data is compressed on the fly.
+
     """
     _stream: Union[TextIO, BinaryIO, None] = None
 
     if fmt.startswith("asc"):
         if isinstance(stream, (str, Path)):
-            _stream = open(stream, "wt", encoding="cp1252")
+            _stream = open_file(
+                stream, "wt", compression_by_extension(stream), encoding="cp1252"
+            )
             stream = _stream
     elif fmt.startswith("bin"):
         if isinstance(stream, (str, Path)):
-            _stream = open(stream, "wb")
+            _stream = open_file(stream, "wb", compression_by_extension(stream))
             stream = cast(TextIO, BinaryDXFWriter(_stream))
         else:
             stream = cast(TextIO, BinaryDXFWriter(cast(BinaryIO, stream)))
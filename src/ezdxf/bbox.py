@@ -1,14 +1,18 @@
 #  Copyright (c) 2021-2022, Manfred Moitzi
 #  License: MIT License
 from __future__ import annotations
-from typing import TYPE_CHECKING, Iterable, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+import math
+
+import numpy as np
 
 import ezdxf
 from ezdxf import disassemble
-from ezdxf.math import BoundingBox
+from ezdxf.math import BoundingBox, Z_AXIS
 
 if TYPE_CHECKING:
     from ezdxf.entities import DXFEntity
+    from ezdxf.entitydb import Changes
 
 MAX_FLATTENING_DISTANCE = disassemble.Primitive.max_flattening_distance
 
@@ -74,6 +78,20 @@ class Cache:
             except KeyError:
                 pass
 
+    def apply_changes(self, changes: Changes) -> None:
+        """Invalidate cache entries for the created, modified and deleted
+        entities of the given `changes` from the change journal of the entity
+        database, see :meth:`ezdxf.entitydb.EntityDB.start_journal`.
+
+        Changes of block definitions do not invalidate the cache entries of
+        the block references (INSERT).
+
+        """
+        boxes = self._boxes
+        for handles in (changes.created, changes.modified, changes.deleted):
+            for handle in handles:
+                boxes.pop(handle, None)
+
     def _get_key(self, entity: DXFEntity) -> Optional[str]:
         if entity.dxftype() == "HATCH":
             # Special treatment for multiple primitives for the same
@@ -135,10 +153,47 @@ def extents(
     If argument `fast` is ``True`` the calculation of Bézier curves is based on
     their control points, this may return a slightly larger bounding box.
 
+    The bounding boxes of the simple entities LINE, POINT, CIRCLE, ARC and
+    LWPOLYLINE, also as sub-entities of block references, are calculated by
+    vectorized NumPy operations, all other entities are processed as
+    primitives of the :mod:`ezdxf.disassemble` module.
+
+    The `cache` stores the bounding boxes of all given entities, also of block
+    references and of entities without a bounding box, like
+    :func:`multi_flat` does. The bounding boxes of batch processed virtual
+    sub-entities of block references are not stored, these virtual entities
+    get a new UUID at each call.
+
     """
     _extends = BoundingBox()
-    for box in multi_flat(entities, fast=fast, cache=cache):
-        _extends.extend(box)
+    batch = _SimpleEntityBatch()
+    # top level entities of the groups, required to store the bounding boxes
+    # in the cache:
+    groups: list[DXFEntity] = []
+    group = 0
+    for entity in entities:
+        if cache is not None:
+            box = cache.get(entity)
+            if box is not None:
+                if box.has_data:
+                    _extends.extend(box)
+                continue
+            group = len(groups)
+            groups.append(entity)
+        if batch.add(entity, group):
+            continue
+        for sub_entity in disassemble.recursive_decompose((entity,)):
+            if sub_entity is entity or not batch.add(sub_entity, group):
+                for box in multi_recursive((sub_entity,), fast=fast, cache=cache):
+                    batch.add_box(box, group)
+
+    extmin, extmax, group_ids = batch.extents()
+    if len(extmin):
+        _extends.extend((tuple(extmin.min(axis=0)), tuple(extmax.max(axis=0))))
+    if cache is not None:
+        boxes = _group_extents(extmin, extmax, group_ids, len(groups))
+        for entity, box in zip(groups, boxes):
+            cache.store(entity, box)
     return _extends
 
 
@@ -173,3 +228,247 @@ def multi_flat(
 
         if box.has_data:
             yield box
+
+
+class _SimpleEntityBatch:
+    """Collects the geometry of simple DXF entities to calculate their bounding
+    boxes by vectorized NumPy operations.
+
+    The bounding boxes are calculated from the exact geometry, the primitives of
+    the :mod:`ezdxf.disassemble` module approximate arcs by Bézier curves.
+    Each entity is added to a group by an index to calculate the bounding boxes
+    of block references as a whole. Entities which are not supported by this
+    batch processing, are rejected by the :meth:`add` method.
+
+    """
+
+    def __init__(self) -> None:
+        # vertex coordinates as flat list: x0, y0, z0, x1, y1, z1, ...
+        self.coords: list[float] = []
+        self.coord_groups: list[int] = []
+        # rows of (cx, cy, cz, radius)
+        self.circles: list[float] = []
+        self.circle_groups: list[int] = []
+        # rows of (cx, cy, cz, radius, start angle, end angle), angles in degrees
+        self.arcs: list[float] = []
+        self.arc_groups: list[int] = []
+        # LWPOLYLINE data as arrays of (x, y, start width, end width, bulge)
+        self.polylines: list[np.ndarray] = []
+        self.polyline_elevations: list[float] = []
+        self.polyline_closed: list[bool] = []
+        self.polyline_groups: list[int] = []
+        self.collectors: dict[str, Callable[[DXFEntity, int], bool]] = {
+            "LINE": self._add_line,
+            "POINT": self._add_point,
+            "CIRCLE": self._add_circle,
+            "ARC": self._add_arc,
+            "LWPOLYLINE": self._add_lwpolyline,
+        }
+
+    def add(self, entity: DXFEntity, group: int) -> bool:
+        """Returns ``True`` if the `entity` was added to the batch."""
+        collector = self.collectors.get(entity.dxftype())
+        if collector is None:
+            return False
+        return collector(entity, group)
+
+    def add_box(self, box: BoundingBox, group: int) -> None:
+        """Add a precalculated bounding box."""
+        if box.has_data:
+            self.coords.extend(box.extmin)
+            self.coords.extend(box.extmax)
+            self.coord_groups.extend((group, group))
+
+    def _add_line(self, entity: DXFEntity, group: int) -> bool:
+        dxf = entity.dxf
+        self.coords.extend(dxf.start)
+        self.coords.extend(dxf.end)
+        self.coord_groups.extend((group, group))
+        return True
+
+    def _add_point(self, entity: DXFEntity, group: int) -> bool:
+        self.coords.extend(entity.dxf.location)
+        self.coord_groups.append(group)
+        return True
+
+    def _add_circle(self, entity: DXFEntity, group: int) -> bool:
+        dxf = entity.dxf
+        if not Z_AXIS.isclose(dxf.extrusion):
+            return False
+        radius = abs(dxf.radius)
+        if radius > 1e-12:
+            self.circles.extend(dxf.center)
+            self.circles.append(radius)
+            self.circle_groups.append(group)
+        return True
+
+    def _add_arc(self, entity: DXFEntity, group: int) -> bool:
+        dxf = entity.dxf
+        if not Z_AXIS.isclose(dxf.extrusion):
+            return False
+        radius = abs(dxf.radius)
+        start_angle = dxf.start_angle
+        end_angle = dxf.end_angle
+        # arcs with equal start- and end angles are empty
+        if radius > 1e-12 and not math.isclose(start_angle, end_angle):
+            self.arcs.extend(dxf.center)
+            self.arcs.extend((radius, start_angle, end_angle))
+            self.arc_groups.append(group)
+        return True
+
+    def _add_lwpolyline(self, entity: DXFEntity, group: int) -> bool:
+        dxf = entity.dxf
+        if not Z_AXIS.isclose(dxf.extrusion):
+            return False
+        values = entity.lwpoints.values  # type: ignore
+        if len(values) < 2:  # empty path
+            return True
+        # polylines with width are meshes:
+        if dxf.const_width or values[:, 2:4].any():
+            return False
+        self.polylines.append(values)
+        self.polyline_elevations.append(dxf.elevation)
+        self.polyline_closed.append(entity.closed)  # type: ignore
+        self.polyline_groups.append(group)
+        return True
+
+    def extents(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the min- and max vertices of all collected bounding boxes as
+        arrays of shape (n, 3) and their group indices as array of shape (n,).
+        """
+        vertices = np.array(self.coords, dtype=np.float64).reshape(-1, 3)
+        extmin = [vertices]
+        extmax = [vertices]
+        groups = [np.array(self.coord_groups, dtype=np.intp)]
+
+        if self.circles:
+            circles = np.array(self.circles, dtype=np.float64).reshape(-1, 4)
+            centers = circles[:, :3]
+            radius = np.zeros_like(centers)
+            radius[:, 0] = circles[:, 3]
+            radius[:, 1] = circles[:, 3]
+            extmin.append(centers - radius)
+            extmax.append(centers + radius)
+            groups.append(np.array(self.circle_groups, dtype=np.intp))
+
+        if self.arcs:
+            arcs = np.array(self.arcs, dtype=np.float64).reshape(-1, 6)
+            arc_min, arc_max = _arc_extents(
+                arcs[:, :3], arcs[:, 3], np.radians(arcs[:, 4]), np.radians(arcs[:, 5])
+            )
+            extmin.append(arc_min)
+            extmax.append(arc_max)
+            groups.append(np.array(self.arc_groups, dtype=np.intp))
+
+        if self.polylines:
+            poly_vertices, poly_min, poly_max, poly_groups = self._polyline_extents()
+            extmin.extend((poly_vertices, poly_min))
+            extmax.extend((poly_vertices, poly_max))
+            groups.extend(poly_groups)
+
+        return np.concatenate(extmin), np.concatenate(extmax), np.concatenate(groups)
+
+    def _polyline_extents(self):
+        values = np.concatenate(self.polylines)
+        counts = np.array([len(v) for v in self.polylines], dtype=np.intp)
+        groups = np.repeat(np.array(self.polyline_groups, dtype=np.intp), counts)
+        elevations = np.repeat(np.array(self.polyline_elevations), counts)
+        vertices = np.column_stack((values[:, :2], elevations))
+
+        # Each vertex starts a segment to the next vertex, the last vertex
+        # of closed polylines starts the closing segment to the first vertex:
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        next_index = np.arange(1, len(values) + 1)
+        next_index[ends - 1] = starts
+        is_segment = np.ones(len(values), dtype=bool)
+        is_segment[ends - 1] = self.polyline_closed
+
+        # Bulge values near 0 are ignored, see ezdxf.path.tools.add_2d_polyline()
+        bulges = values[:, 4]
+        is_arc = is_segment & (np.abs(bulges) >= 1e-6)
+        start_points = values[is_arc, :2]
+        end_points = values[next_index[is_arc], :2]
+        centers, radius, start_angles, end_angles = _bulge_to_arc(
+            start_points, end_points, bulges[is_arc]
+        )
+        centers = np.column_stack((centers, elevations[is_arc]))
+        arc_min, arc_max = _arc_extents(centers, radius, start_angles, end_angles)
+        return vertices, arc_min, arc_max, (groups, groups[is_arc])
+
+
+def _bulge_to_arc(
+    start_points: np.ndarray, end_points: np.ndarray, bulges: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized version of :func:`ezdxf.math.bulge_to_arc`, returns the arc
+    centers, radii, start- and end angles in radians of counter-clockwise
+    oriented arcs.
+    """
+    chords = end_points - start_points
+    lengths = np.hypot(chords[:, 0], chords[:, 1])
+    radius = lengths * (1.0 + bulges * bulges) / 4.0 / bulges
+    angles = np.arctan2(chords[:, 1], chords[:, 0])
+    angles += math.pi / 2.0 - np.arctan(bulges) * 2.0
+    centers = start_points + radius[:, np.newaxis] * np.column_stack(
+        (np.cos(angles), np.sin(angles))
+    )
+    start_vectors = start_points - centers
+    end_vectors = end_points - centers
+    start_angles = np.arctan2(start_vectors[:, 1], start_vectors[:, 0])
+    end_angles = np.arctan2(end_vectors[:, 1], end_vectors[:, 0])
+    clockwise = bulges < 0.0
+    return (
+        centers,
+        np.abs(radius),
+        np.where(clockwise, end_angles, start_angles),
+        np.where(clockwise, start_angles, end_angles),
+    )
+
+
+def _arc_extents(
+    centers: np.ndarray,
+    radius: np.ndarray,
+    start_angles: np.ndarray,
+    end_angles: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the min- and max vertices of the bounding boxes of
+    counter-clockwise oriented arcs in the xy-plane, angles in radians.
+    Arcs with equal normalized start- and end angles are full circles.
+    """
+    tau = math.tau
+    start_angles = start_angles % tau
+    spans = (end_angles - start_angles) % tau
+    spans[spans == 0.0] = tau
+    cx = centers[:, 0]
+    cy = centers[:, 1]
+    start_x = cx + radius * np.cos(start_angles)
+    start_y = cy + radius * np.sin(start_angles)
+    end_x = cx + radius * np.cos(end_angles)
+    end_y = cy + radius * np.sin(end_angles)
+
+    def passes(angle: float) -> np.ndarray:
+        return (angle - start_angles) % tau <= spans
+
+    min_x = np.where(passes(math.pi), cx - radius, np.minimum(start_x, end_x))
+    max_x = np.where(passes(0.0), cx + radius, np.maximum(start_x, end_x))
+    min_y = np.where(passes(math.pi * 1.5), cy - radius, np.minimum(start_y, end_y))
+    max_y = np.where(passes(math.pi * 0.5), cy + radius, np.maximum(start_y, end_y))
+    cz = centers[:, 2]
+    return np.column_stack((min_x, min_y, cz)), np.column_stack((max_x, max_y, cz))
+
+
+def _group_extents(
+    extmin: np.ndarray, extmax: np.ndarray, group_ids: np.ndarray, count: int
+) -> list[BoundingBox]:
+    """Returns the bounding boxes of `count` groups."""
+    group_min = np.full((count, 3), np.inf)
+    group_max = np.full((count, 3), -np.inf)
+    np.minimum.at(group_min, group_ids, extmin)
+    np.maximum.at(group_max, group_ids, extmax)
+    has_data = np.isfinite(group_min[:, 0])
+    return [
+        BoundingBox((tuple(vmin), tuple(vmax))) if valid else BoundingBox()
+        for vmin, vmax, valid in zip(
+            group_min.tolist(), group_max.tolist(), has_data.tolist()
+        )
+    ]
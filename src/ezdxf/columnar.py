@@ -0,0 +1,75 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+"""
+Columnar access to the DXF attributes of many simple entities as NumPy arrays
+for vectorized analysis.
+
+The functions accept any iterable of DXF entities like layouts, blocks or
+:class:`~ezdxf.query.EntityQuery` containers and ignore all entities of other
+DXF types. The counterparts for creating many entities at once are the
+:meth:`add_points`, :meth:`add_lines` and :meth:`add_circles` methods of the
+layouts.
+
+"""
+from __future__ import annotations
+from typing import Iterable, Iterator
+
+import numpy as np
+import numpy.typing as npt
+
+from ezdxf.entities import DXFEntity
+
+__all__ = ["points", "lines", "circles"]
+
+
+def points(entities: Iterable[DXFEntity]) -> npt.NDArray[np.float64]:
+    """Returns the locations of all POINT entities as array of shape (n, 3)."""
+    locations: list[float] = []
+    for point in _of_type(entities, "POINT"):
+        locations.extend(point.dxf.location)
+    return _vertex_array(locations)
+
+
+def lines(
+    entities: Iterable[DXFEntity],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Returns the start- and end points of all LINE entities as two arrays of
+    shape (n, 3).
+    """
+    starts: list[float] = []
+    ends: list[float] = []
+    for line in _of_type(entities, "LINE"):
+        dxf = line.dxf
+        starts.extend(dxf.start)
+        ends.extend(dxf.end)
+    return _vertex_array(starts), _vertex_array(ends)
+
+
+def circles(
+    entities: Iterable[DXFEntity],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Returns the center points of all CIRCLE entities as array of shape (n, 3)
+    and the radii as array of shape (n,).
+
+    The center points are :ref:`OCS` coordinates like the stored DXF attribute
+    :attr:`~ezdxf.entities.Circle.dxf.center`, which are equal to :ref:`WCS`
+    coordinates for the default extrusion vector (0, 0, 1).
+    """
+    centers: list[float] = []
+    radii: list[float] = []
+    for circle in _of_type(entities, "CIRCLE"):
+        dxf = circle.dxf
+        centers.extend(dxf.center)
+        radii.append(dxf.radius)
+    return _vertex_array(centers), np.array(radii, dtype=np.float64)
+
+
+def _of_type(entities: Iterable[DXFEntity], dxftype: str) -> Iterator[DXFEntity]:
+    for entity in entities:
+        if entity.dxftype() == dxftype and entity.is_alive:
+            yield entity
+
+
+def _vertex_array(coordinates: list[float]) -> npt.NDArray[np.float64]:
+    # flat list of x, y, z coordinates, collected by list.extend(Vec3)
+    return np.array(coordinates, dtype=np.float64).reshape(-1, 3)
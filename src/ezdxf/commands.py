@@ -1,4 +1,4 @@
-#  Copyright (c) 2021-2024, Manfred Moitzi
+#  Copyright (c) 2021-2026, Manfred Moitzi
 #  License: MIT License
 from __future__ import annotations
 
@@ -724,6 +724,62 @@ class Config(Command):
             options.print()
 
 
+@register
+class Cache(Command):
+    """Launcher sub-command: cache"""
+
+    NAME = "cache"
+
+    @staticmethod
+    def add_parser(subparsers):
+        parser = subparsers.add_parser(Cache.NAME, help="manage the document cache")
+        parser.add_argument(
+            "-l",
+            "--list",
+            action="store_true",
+            help="list cached DXF files, least recently used first",
+        )
+        parser.add_argument(
+            "-c",
+            "--clear",
+            action="store_true",
+            help="remove all cache entries",
+        )
+        parser.add_argument(
+            "--evict",
+            metavar="MB",
+            type=int,
+            help="remove least recently used cache entries until the cache "
+            "size is less or equal to MB megabytes",
+        )
+
+    @staticmethod
+    def run(args):
+        from ezdxf.doccache import default_cache
+
+        cache = default_cache()
+        if args.clear:
+            count = cache.clear()
+            print(f"removed {count} cache entries")
+        elif args.evict is not None:
+            count = cache.evict(max(args.evict, 0) * 1024 * 1024)
+            print(f"removed {count} cache entries")
+        if args.list:
+            for entry in cache.entries():
+                last_used = time.strftime(
+                    "%Y-%m-%d %H:%M:%S", time.localtime(entry.last_used)
+                )
+                print(f"{last_used} {entry.size / 1048576:10.2f} MB {entry.filename}")
+        entries = cache.entries()
+        total_size = sum(entry.size for entry in entries)
+        print(f"cache directory: {cache.directory}")
+        print(f"cache entries: {len(entries)}")
+        print(
+            f"cache size: {total_size / 1048576:.2f} MB of "
+            f"{cache.max_size / 1048576:.2f} MB"
+        )
+
+
 def load_every_document(filename: str):
     def io_error() -> str:
         msg = f'Not a DXF file or a generic I/O error: "{filename}"'
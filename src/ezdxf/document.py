@@ -13,13 +13,17 @@ from typing import (
     Optional,
     Sequence,
     Any,
+    TypeVar,
 )
 import abc
+import asyncio
 import base64
+import functools
 import io
 import logging
 import os
 import pathlib
+import threading
 from datetime import datetime, timezone
 from itertools import chain
 
@@ -29,7 +33,7 @@ from ezdxf.entities.dxfgroups import GroupCollection
 from ezdxf.entities.material import MaterialCollection
 from ezdxf.entities.mleader import MLeaderStyleCollection
 from ezdxf.entities.mline import MLineStyleCollection
-from ezdxf.entitydb import EntityDB
+from ezdxf.entitydb import EntityDB, LazyEntitySpace
 from ezdxf.groupby import groupby
 from ezdxf.layouts import Modelspace, Paperspace
 from ezdxf.layouts.layouts import Layouts
@@ -48,10 +52,10 @@ from ezdxf.lldxf import loader
 from ezdxf.lldxf.tagwriter import (
     AbstractTagWriter,
     TagWriter,
-    BinaryTagWriter,
+    BufferedBinaryTagWriter,
     JSONTagWriter,
 )
-from ezdxf.query import EntityQuery
+from ezdxf.query import EntityQuery, indexed_query
 from ezdxf.render.dimension import DimensionRenderer
 from ezdxf.sections.acdsdata import AcDsDataSection, new_acds_data_section
 from ezdxf.sections.blocks import BlocksSection
@@ -60,7 +64,7 @@ from ezdxf.sections.entities import EntitySection, StoredSection
 from ezdxf.sections.header import HeaderSection
 from ezdxf.sections.objects import ObjectsSection
 from ezdxf.sections.tables import TablesSection
-from ezdxf.tools import guid
+from ezdxf.tools import guid, compressedfile
 from ezdxf.tools.codepage import tocodepage, toencoding
 from ezdxf.tools.juliandate import juliandate
 from ezdxf.tools.text import safe_string, MAX_STR_LEN
@@ -75,6 +79,7 @@ if TYPE_CHECKING:
     from ezdxf.layouts import Layout
     from ezdxf.lldxf.tags import Tags
     from ezdxf.lldxf.types import DXFTag
+    from ezdxf.snapshot import Snapshot
     from ezdxf.sections.tables import (
         LayerTable,
         LinetypeTable,
@@ -334,7 +339,13 @@ class Drawing:
         return pathlib.Path(self.filename).resolve()
 
     @classmethod
-    def read(cls, stream: TextIO) -> Drawing:
+    def read(
+        cls,
+        stream: TextIO,
+        *,
+        filter: Optional[loader.LoadFilter] = None,
+        progress: Optional[loader.ProgressFunc] = None,
+    ) -> Drawing:
         """Open an existing drawing. Package users should use the factory
         function :func:`ezdxf.read`. To preserve possible binary data in
         XRECORD entities use :code:`errors='surrogateescape'` as error handler
@@ -342,29 +353,91 @@ class Drawing:
 
         Args:
              stream: text stream yielding text (unicode) strings by readline()
+             filter: load only the layout entities accepted by this
+                :class:`~ezdxf.lldxf.loader.LoadFilter`
+             progress: function to report the loading progress, see :meth:`load`
 
         """
         from .lldxf.tagger import ascii_tags_loader
 
         tag_loader = ascii_tags_loader(stream)
-        return cls.load(tag_loader)
+        return cls.load(tag_loader, filter=filter, progress=progress)
 
     @classmethod
-    def load(cls, tag_loader: Iterable[DXFTag]) -> Drawing:
+    def load(
+        cls,
+        tag_loader: Iterable[DXFTag],
+        *,
+        lazy: bool = False,
+        prefilter: Optional[loader.PrefilterFunc] = None,
+        filter: Optional[loader.LoadFilter] = None,
+        progress: Optional[loader.ProgressFunc] = None,
+    ) -> Drawing:
         """Load DXF document from a DXF tag loader, in general an external
         untrusted source.
 
         Args:
             tag_loader: DXF tag loader
+            lazy: load the entities of the ENTITIES section at the first access
+            prefilter: function to skip entities of the ENTITIES section in lazy
+                loading mode, gets the DXF type and the layer name of the entity
+                as arguments and returns ``False`` to skip the entity
+            filter: load only the layout entities accepted by this
+                :class:`~ezdxf.lldxf.loader.LoadFilter`
+            progress: function to report the loading progress, gets the
+                section name, the count of processed entities and the total
+                count of entities of the section or 0 if unknown
 
         """
         from .lldxf.tagger import tag_compiler
 
         tag_loader = tag_compiler(tag_loader)  # type: ignore
         doc = cls()
-        doc._load(tag_loader)
+        doc._load(
+            tag_loader,
+            lazy=lazy,
+            prefilter=prefilter,
+            filter=filter,
+            progress=progress,
+        )
         return doc
 
+    @classmethod
+    async def load_async(
+        cls,
+        tag_loader: Iterable[DXFTag],
+        *,
+        lazy: bool = False,
+        prefilter: Optional[loader.PrefilterFunc] = None,
+        filter: Optional[loader.LoadFilter] = None,
+        progress: Optional[loader.ProgressFunc] = None,
+    ) -> Drawing:
+        """Coroutine to load a DXF document from a DXF tag loader by
+        :meth:`load` in a worker thread without blocking the event loop.
+
+        The `progress` function is called in the thread of the event loop.
+        Cancelling the awaiting task stops the worker thread at the next
+        progress report.
+
+        Args:
+            tag_loader: DXF tag loader
+            lazy: see :meth:`load`
+            prefilter: see :meth:`load`
+            filter: see :meth:`load`
+            progress: see :meth:`load`
+
+        """
+        return await run_in_worker_thread(
+            functools.partial(
+                cls.load,
+                tag_loader,
+                lazy=lazy,
+                prefilter=prefilter,
+                filter=filter,
+            ),
+            progress,
+        )
+
     @classmethod
     def from_tags(cls, compiled_tags: Iterable[DXFTag]) -> Drawing:
         """Create new drawing from compiled tags. (internal API)"""
@@ -372,17 +445,40 @@ class Drawing:
         doc._load(tagger=compiled_tags)
         return doc
 
-    def _load(self, tagger: Iterable[DXFTag]) -> None:
+    def _load(
+        self,
+        tagger: Iterable[DXFTag],
+        lazy: bool = False,
+        prefilter: Optional[loader.PrefilterFunc] = None,
+        filter: Optional[loader.LoadFilter] = None,
+        progress: Optional[loader.ProgressFunc] = None,
+    ) -> None:
         # 1st Loading stage: load complete DXF entity structure
         self.is_loading = True
-        sections = loader.load_dxf_structure(tagger)
+        sections = loader.load_dxf_structure(tagger, progress=progress)
         if "THUMBNAILIMAGE" in sections:
             del sections["THUMBNAILIMAGE"]
-        self._load_section_dict(sections)
+        self._load_section_dict(
+            sections,
+            lazy=lazy,
+            prefilter=prefilter,
+            filter=filter,
+            progress=progress,
+        )
 
-    def _load_section_dict(self, sections: loader.SectionDict) -> None:
+    def _load_section_dict(
+        self,
+        sections: loader.SectionDict,
+        lazy: bool = False,
+        prefilter: Optional[loader.PrefilterFunc] = None,
+        filter: Optional[loader.LoadFilter] = None,
+        progress: Optional[loader.ProgressFunc] = None,
+        unloaded_entities: Optional[list[loader.UnloadedEntity]] = None,
+    ) -> None:
         """Internal API to load a DXF document from a section dict."""
         self.is_loading = True
+        if filter is not None:
+            loader.filter_layout_entities(sections, filter)
         # Create header section:
         header_entities: list[Tags] = sections.get("HEADER", [])  # type: ignore
         if header_entities:
@@ -404,7 +500,14 @@ class Drawing:
         self.entitydb.handles.reset(_validate_handle_seed(seed))
 
         # Store all necessary DXF entities in the entity database:
-        loader.load_and_bind_dxf_content(sections, self)
+        loader.load_and_bind_dxf_content(
+            sections,
+            self,
+            lazy=lazy,
+            prefilter=prefilter,
+            progress=progress,
+            unloaded_entities=unloaded_entities,
+        )
 
         # End of 1. loading stage, all entities of the DXF file are
         # stored in the entity database.
@@ -418,6 +521,11 @@ class Drawing:
         # Create *Model_Space and *Paper_Space BLOCK_RECORDS
         # BlockSection setup takes care about the rest:
         self._create_required_block_records()
+        if self.entitydb.has_unloaded_entities():
+            # Lazy loading mode: the BlocksSection creates the block layouts,
+            # which share the entity spaces of the BLOCK_RECORDS, therefore
+            # the lazy entity spaces have to be installed beforehand:
+            self._setup_lazy_entity_spaces()
 
         # At this point all table entries are required:
         self.blocks = BlocksSection(self, sections.get("BLOCKS", None))  # type: ignore
@@ -479,7 +587,11 @@ class Drawing:
 
         """
         db = self.entitydb
-        for entity in db.values():
+        # The entity database contains unloaded entities in lazy loading mode,
+        # these entities call their post_load_hook() when loaded.
+        for entity in list(db._database.values()):
+            if not entity.is_alive:
+                continue
             # The post_load_hook() can return a callable, which should be
             # executed, when the DXF document is fully initialized.
             cmd = entity.post_load_hook(self)
@@ -507,11 +619,21 @@ class Drawing:
         if "*Paper_Space" not in self.block_records:
             self.block_records.new("*Paper_Space")
 
+    def _setup_lazy_entity_spaces(self):
+        db = self.entitydb
+        for name in ("*Model_Space", "*Paper_Space"):
+            block_record = self.block_records.get(name)
+            block_record.set_entity_space(  # type: ignore
+                LazyEntitySpace(db, block_record.entity_space)  # type: ignore
+            )
+
     def saveas(
         self,
         filename: Union[os.PathLike, str],
         encoding: Optional[str] = None,
         fmt: str = "asc",
+        *,
+        workers: int = 1,
     ) -> None:
         """Set :class:`Drawing` attribute :attr:`filename` to `filename` and
         write drawing to the file system. Override file encoding by argument
@@ -523,20 +645,40 @@ class Drawing:
             filename: file name as string
             encoding: override default encoding as Python encoding string like ``'utf-8'``
             fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for Binary DXF
+            workers: count of worker processes for the ASCII DXF export, see
+                :meth:`save`
 
         """
         self.filename = str(filename)
-        self.save(encoding=encoding, fmt=fmt)
+        self.save(encoding=encoding, fmt=fmt, workers=workers)
 
-    def save(self, encoding: Optional[str] = None, fmt: str = "asc") -> None:
+    def save(
+        self, encoding: Optional[str] = None, fmt: str = "asc", *, workers: int = 1
+    ) -> None:
         """Write drawing to file-system by using the :attr:`filename` attribute
         as filename. Override file encoding by argument `encoding`, handle with
         care, but this option allows you to create DXF files for applications
         that handle file encoding different from AutoCAD.
 
+        The ASCII DXF export of large layouts and blocks can be distributed
+        across multiple worker processes by setting the argument `workers` > 1,
+        the output is identical to the export by a single process.
+        The parallel export requires the "fork" start method of the
+        :mod:`multiprocessing` module and is not available on Windows.
+        The document is exported by a single process if the document is small,
+        only a single CPU is available or the process has multiple running
+        threads, because forking a multithreaded process is unsafe, see module
+        :mod:`ezdxf.parallelexport`.
+        The Binary DXF export ignores the argument `workers`.
+
+        The file is compressed on the fly if the :attr:`filename` has the
+        extension ".gz" for the gzip format or ".zst" for the zstd format,
+        see module :mod:`ezdxf.tools.compressedfile`.
+
         Args:
             encoding: override default encoding as Python encoding string like ``'utf-8'``
             fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for Binary DXF
+            workers: count of worker processes for the ASCII DXF export
 
         """
         # DXF R12, R2000, R2004 - ASCII encoding
@@ -551,24 +693,45 @@ class Drawing:
             # different than AutoCAD
             enc = encoding
 
+        filename = str(self.filename)
+        compression = compressedfile.compression_by_extension(filename)
+        fp: Union[TextIO, BinaryIO]
         if fmt.startswith("asc"):
-            fp = io.open(
-                self.filename, mode="wt", encoding=enc, errors="dxfreplace"  # type: ignore
+            fp = compressedfile.open_file(
+                filename, "wt", compression, encoding=enc, errors="dxfreplace"
             )
         elif fmt.startswith("bin"):
-            fp = open(self.filename, "wb")  # type: ignore
+            fp = compressedfile.open_file(filename, "wb", compression)
         else:
             raise ValueError(f"Unknown output format: '{fmt}'.")
+        with fp:
+            if workers > 1:
+                self.write(fp, fmt=fmt, workers=workers)
+            else:  # overridden write() methods without argument workers
+                self.write(fp, fmt=fmt)
+
+    def _export_parallel(self, stream: TextIO, handles: bool, workers: int) -> None:
+        from ezdxf.parallelexport import ParallelTagWriter
+
+        tagwriter = ParallelTagWriter(
+            stream,
+            self,
+            workers,
+            write_handles=handles,
+            dxfversion=self.dxfversion,
+        )
         try:
-            self.write(fp, fmt=fmt)  # type: ignore
+            self.export_sections(tagwriter)
         finally:
-            fp.close()
+            tagwriter.close()
 
     def encode(self, s: str) -> bytes:
         """Encode string `s` with correct encoding and error handler."""
         return s.encode(encoding=self.output_encoding, errors="dxfreplace")
 
-    def write(self, stream: Union[TextIO, BinaryIO], fmt: str = "asc") -> None:
+    def write(
+        self, stream: Union[TextIO, BinaryIO], fmt: str = "asc", *, workers: int = 1
+    ) -> None:
         """Write drawing as ASCII DXF to a text stream or as Binary DXF to a
         binary stream. For DXF R2004 (AC1018) and prior open stream with
         drawing :attr:`encoding` and :code:`mode='wt'`. For DXF R2007 (AC1021)
@@ -585,7 +748,39 @@ class Drawing:
         Args:
             stream: output text stream or binary stream
             fmt: "asc" for ASCII DXF (default) or "bin" for binary DXF
+            workers: count of worker processes for the ASCII DXF export, see
+                :meth:`save`
 
+        """
+        dxfversion = self.dxfversion
+        handles = self._prepare_export()
+        if fmt.startswith("asc"):
+            text_stream = cast(TextIO, stream)
+            if workers > 1:
+                self._export_parallel(text_stream, handles, workers)
+                return
+            tagwriter = TagWriter(
+                text_stream,
+                write_handles=handles,
+                dxfversion=dxfversion,
+            )
+            self.export_sections(tagwriter)
+        elif fmt.startswith("bin"):
+            binary_tagwriter = BufferedBinaryTagWriter(
+                cast(BinaryIO, stream),
+                write_handles=handles,
+                dxfversion=dxfversion,
+                encoding=self.output_encoding,
+            )
+            binary_tagwriter.write_signature()
+            self.export_sections(binary_tagwriter)
+            binary_tagwriter.flush()
+        else:
+            raise ValueError(f"Unknown output format: '{fmt}'.")
+
+    def _prepare_export(self) -> bool:
+        """Prepare the document for the DXF export and returns ``True`` if
+        handles have to be written.
         """
         # These changes may alter the document content (create new entities, blocks ...)
         # and have to be done before the export and the update of internal structures
@@ -601,24 +796,20 @@ class Drawing:
             self.classes.add_required_classes(dxfversion)
 
         self.update_all()
-        if fmt.startswith("asc"):
-            tagwriter = TagWriter(
-                stream,  # type: ignore
-                write_handles=handles,
-                dxfversion=dxfversion,
-            )
-        elif fmt.startswith("bin"):
-            tagwriter = BinaryTagWriter(  # type: ignore
-                stream,  # type: ignore
-                write_handles=handles,
-                dxfversion=dxfversion,
-                encoding=self.output_encoding,
-            )
-            tagwriter.write_signature()  # type: ignore
-        else:
-            raise ValueError(f"Unknown output format: '{fmt}'.")
+        return handles
 
-        self.export_sections(tagwriter)
+    def snapshot(self) -> Snapshot:
+        """Returns an immutable :class:`~ezdxf.snapshot.Snapshot` of the
+        current state of the document. Each call of
+        :meth:`Snapshot.document` creates a new independent document from the
+        snapshot, which is much faster than loading the DXF document again.
+
+        The document is prepared for the export like for saving the document.
+
+        """
+        from ezdxf.snapshot import Snapshot
+
+        return Snapshot.from_document(self)
 
     def encode_base64(self) -> bytes:
         """Returns DXF document as base64 encoded binary data."""
@@ -888,7 +1079,9 @@ class Drawing:
             :ref:`entity query string` and :ref:`entity queries`
 
         """
-        return EntityQuery(self.chain_layouts_and_blocks(), query)
+        return indexed_query(
+            self.chain_layouts_and_blocks(), query, self.entitydb.attribute_index
+        )
 
     def groupby(self, dxfattrib="", key=None) -> dict:
         """Groups DXF entities of all layouts and blocks (excluding the
@@ -1184,6 +1377,52 @@ class Drawing:
         return vport
 
 
+T = TypeVar("T")
+
+
+class _LoadingCancelled(Exception):
+    pass
+
+
+async def run_in_worker_thread(
+    func: Callable[..., T], progress: Optional[loader.ProgressFunc] = None
+) -> T:
+    """Run the loading function `func` in a worker thread without blocking the
+    event loop and returns the result of `func`. (internal API)
+
+    The function `func` gets a progress function as keyword argument `progress`,
+    which forwards the progress reports to the `progress` function in the thread
+    of the event loop. Cancelling the awaiting task raises an exception in the
+    worker thread at the next progress report to stop the loading process.
+
+    """
+    event_loop = asyncio.get_running_loop()
+    cancelled = threading.Event()
+
+    def report(section: str, count: int, total: int) -> None:
+        if cancelled.is_set():
+            raise _LoadingCancelled
+        if progress is not None:
+            event_loop.call_soon_threadsafe(progress, section, count, total)
+
+    future = event_loop.run_in_executor(
+        None, functools.partial(func, progress=report)
+    )
+    try:
+        return await future
+    except asyncio.CancelledError:
+        cancelled.set()
+        # The worker thread stops at the next progress report, the result or
+        # the exception of the worker thread has to be retrieved by someone:
+        future.add_done_callback(_retrieve_result)
+        raise
+
+
+def _retrieve_result(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
 class MetaData(abc.ABC):
     """Manage ezdxf meta-data by dict-like interface. Values are limited to
     strings with a maximum length of 254 characters.
@@ -23,7 +23,12 @@ from ezdxf.lldxf.attributes import (
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER
 from .dxfentity import base_class
 from .dxfgfx import acdb_entity
-from .circle import acdb_circle, Circle, merged_circle_group_codes
+from .circle import (
+    acdb_circle,
+    Circle,
+    CircleNamespace,
+    merged_circle_group_codes,
+)
 from .factory import register_entity
 
 if TYPE_CHECKING:
@@ -45,12 +50,17 @@ merged_arc_group_codes = merge_group_code_mappings(
 )
 
 
+class ArcNamespace(CircleNamespace):
+    __slots__ = ("start_angle", "end_angle")
+
+
 @register_entity
 class Arc(Circle):
     """DXF ARC entity"""
 
     DXFTYPE = "ARC"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_circle, acdb_arc)
+    DXFNAMESPACE = ArcNamespace
     MERGED_GROUP_CODES = merged_arc_group_codes
 
     def export_entity(self, tagwriter: AbstractTagWriter) -> None:
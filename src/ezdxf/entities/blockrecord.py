@@ -1,7 +1,7 @@
 # Copyright (c) 2019-2024, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
 from typing_extensions import Self
 import logging
 
@@ -285,6 +285,19 @@ class BlockRecord(DXFEntity):
         # errors!
         self.entity_space.add(entity)
 
+    def add_entities(self, entities: Sequence[DXFGraphic]) -> None:
+        """Add multiple existing DXF entities to BLOCK_RECORD.
+
+        Args:
+            entities: sequence of :class:`DXFGraphic`
+
+        """
+        owner = self.dxf.handle
+        paperspace = int(self.is_any_paperspace)
+        for entity in entities:
+            entity.set_owner(owner, paperspace=paperspace)
+        self.entity_space.extend(entities)
+
     def unlink_entity(self, entity: DXFGraphic) -> None:
         """Unlink `entity` from BLOCK_RECORD.
 
@@ -312,6 +325,38 @@ class BlockRecord(DXFEntity):
         self.unlink_entity(entity)  # 1. unlink from entity space
         entity.destroy()
 
+    def unlink_entities(self, entities: Iterable[DXFGraphic]) -> None:
+        """Unlink multiple `entities` from BLOCK_RECORD in a single pass over
+        the entity space.
+
+        Removes `entities` just from entity space but not from the drawing
+        database.
+
+        Args:
+            entities: iterable of :class:`DXFGraphic`
+
+        """
+        alive = [entity for entity in entities if entity.is_alive]
+        self.entity_space.remove_entities(alive)
+        for entity in alive:
+            try:
+                entity.set_owner(None)
+            except AttributeError:
+                pass  # unsupported entities as DXFTagStorage
+
+    def delete_entities(self, entities: Iterable[DXFGraphic]) -> None:
+        """Delete multiple `entities` from BLOCK_RECORD entity space and drawing
+        database in a single pass over the entity space.
+
+        Args:
+            entities: iterable of :class:`DXFGraphic`
+
+        """
+        alive = [entity for entity in entities if entity.is_alive]
+        self.unlink_entities(alive)
+        for entity in alive:
+            entity.destroy()
+
     def audit(self, auditor: Auditor) -> None:
         """Validity check. (internal API)"""
         if not self.is_alive:
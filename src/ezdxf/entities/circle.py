@@ -25,6 +25,7 @@ from ezdxf.lldxf.attributes import (
 )
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, DXFValueError
 from .dxfentity import base_class, SubclassProcessor
+from .dxfns import CompactDXFNamespace
 from .dxfgfx import (
     DXFGraphic,
     acdb_entity,
@@ -70,12 +71,17 @@ merged_circle_group_codes = merge_group_code_mappings(
 )
 
 
+class CircleNamespace(CompactDXFNamespace):
+    __slots__ = ("center", "radius", "thickness", "extrusion")
+
+
 @register_entity
 class Circle(DXFGraphic):
     """DXF CIRCLE entity"""
 
     DXFTYPE = "CIRCLE"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_circle)
+    DXFNAMESPACE = CircleNamespace
     MERGED_GROUP_CODES = merged_circle_group_codes
 
     def load_dxf_attribs(
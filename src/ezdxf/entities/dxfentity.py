@@ -47,6 +47,7 @@ if TYPE_CHECKING:
     from ezdxf.audit import Auditor
     from ezdxf.document import Drawing
     from ezdxf.entities import DXFGraphic, Insert
+    from ezdxf.entitydb import ChangeJournal, AttributeIndex
     from ezdxf.lldxf.attributes import DXFAttr
     from ezdxf.lldxf.tagwriter import AbstractTagWriter
     from ezdxf.math import Matrix44
@@ -97,12 +98,14 @@ class DXFEntity:
     # an existing object in the dxf namespace.
     DEFAULT_ATTRIBS: dict[str, Any] = {}
     MIN_DXF_VERSION_FOR_EXPORT = const.DXF12
+    # DXF namespace class to store the DXF attributes:
+    DXFNAMESPACE: type[DXFNamespace] = DXFNamespace
 
     def __init__(self) -> None:
         """Default constructor. (internal API)"""
         # Public attributes for package users
         self.doc: Optional[Drawing] = None
-        self.dxf: DXFNamespace = DXFNamespace(entity=self)
+        self.dxf: DXFNamespace = self.DXFNAMESPACE(entity=self)
 
         # None public attributes for package users
         # create extended data only if needed:
@@ -255,7 +258,7 @@ class DXFEntity:
         self, processor: Optional[SubclassProcessor] = None
     ) -> DXFNamespace:
         """Load DXF attributes into DXF namespace."""
-        return DXFNamespace(processor, self)
+        return self.DXFNAMESPACE(processor, self)
 
     def post_load_hook(self, doc: Drawing) -> Optional[Callable]:
         """The 2nd loading stage when loading DXF documents from an external
@@ -395,7 +398,7 @@ class DXFEntity:
 
     def update_handle(self, handle: str) -> None:
         """Update entity handle. (internal API)"""
-        self.dxf.handle = handle
+        self.dxf.unprotected_set("handle", handle)
         if self.extension_dict:
             self.extension_dict.update_owner(handle)
 
@@ -583,6 +586,22 @@ class DXFEntity:
             self.del_source_of_copy()
             self.del_source_block_reference()
 
+    def change_journal(self) -> Optional[ChangeJournal]:
+        """Returns the change journal of the entity database of the bound
+        document or ``None`` if the recording of changes is not started.
+
+        (internal API)
+        """
+        return getattr(getattr(self.doc, "entitydb", None), "journal", None)
+
+    def attribute_index(self) -> Optional[AttributeIndex]:
+        """Returns the attribute index of the entity database of the bound
+        document or ``None`` if the index is not created.
+
+        (internal API)
+        """
+        return getattr(getattr(self.doc, "entitydb", None), "attribute_index", None)
+
     def destroy(self) -> None:
         """Delete all data and references. Does not delete entity from
         structures like layouts or groups.
@@ -592,6 +611,14 @@ class DXFEntity:
         if not self.is_alive:
             return
 
+        handle = self.dxf.handle
+        if handle is not None:
+            journal = self.change_journal()
+            if journal is not None:
+                journal.deleted(handle)
+            index = self.attribute_index()
+            if index is not None:
+                index.discard(handle)
         if self.extension_dict is not None:
             self.extension_dict.destroy()
             del self.extension_dict
@@ -1050,10 +1077,12 @@ class DXFTagStorage(DXFEntity):
         self.DXFTYPE = self.base_class[0].value
         try:
             acdb_entity = tags.get_subclass("AcDbEntity")
-            self.dxf.__dict__["paperspace"] = acdb_entity.get_first_value(67, 0)
+            self.dxf.unprotected_set(
+                "paperspace", acdb_entity.get_first_value(67, 0)
+            )
         except const.DXFKeyError:
             # just fake it
-            self.dxf.__dict__["paperspace"] = 0
+            self.dxf.unprotected_set("paperspace", 0)
 
     def store_embedded_objects(self, tags: ExtendedTags) -> None:
         self.embedded_objects = tags.embedded_objects
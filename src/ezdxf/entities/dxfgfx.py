@@ -481,6 +481,11 @@ class DXFGraphic(DXFEntity):
         """Should be called if the main entity transformation was successful."""
         if self.xdata is not None:
             self.xdata.transform(m)
+        journal = self.change_journal()
+        if journal is not None and self.dxf.handle is not None:
+            # record also the modification of data which is not stored in the
+            # DXF namespace like the vertices of LWPOLYLINE:
+            journal.modified(self.dxf.handle)
 
     @property
     def is_post_transform_required(self) -> bool:
@@ -1,7 +1,16 @@
 # Copyright (c) 2020-2025, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import Any, Optional, Union, Iterable, TYPE_CHECKING, Set
+from typing import (
+    Any,
+    Optional,
+    Union,
+    Iterable,
+    Iterator,
+    TYPE_CHECKING,
+    Set,
+    MutableMapping,
+)
 import logging
 import itertools
 from ezdxf import options
@@ -16,7 +25,7 @@ if TYPE_CHECKING:
     from ezdxf.lldxf.tagwriter import AbstractTagWriter
 
 
-__all__ = ["DXFNamespace", "SubclassProcessor"]
+__all__ = ["DXFNamespace", "CompactDXFNamespace", "SubclassProcessor"]
 logger = logging.getLogger("ezdxf")
 
 ERR_INVALID_DXF_ATTRIB = 'Invalid DXF attribute "{}" for entity {}'
@@ -34,6 +43,8 @@ SETTER_EVENTS = {
     "dimstyle": "on_dimstyle_change",
 }
 EXCLUDE_FROM_UPDATE = frozenset(["_entity", "handle", "owner"])
+# DXF attributes indexed by the AttributeIndex of the entity database:
+INDEXED_ATTRIBUTES: tuple[str, ...] = ("layer", "color", "linetype")
 
 
 class DXFNamespace:
@@ -97,8 +108,8 @@ class DXFNamespace:
 
     def reset_handles(self):
         """Reset handle and owner to None."""
-        self.__dict__["handle"] = None
-        self.__dict__["owner"] = None
+        self.unprotected_set("handle", None)
+        self.unprotected_set("owner", None)
 
     def rewire(
         self,
@@ -115,11 +126,11 @@ class DXFNamespace:
 
         """
         # bypass __setattr__()
-        self.__dict__["_entity"] = entity
+        object.__setattr__(self, "_entity", entity)
         if handle is not None:
-            self.__dict__["handle"] = handle
+            self.unprotected_set("handle", handle)
         if owner is not None:
-            self.__dict__["owner"] = owner
+            self.unprotected_set("owner", owner)
 
     def __getattr__(self, key: str) -> Any:
         """Called if DXF attribute `key` does not exist, returns the DXF
@@ -178,7 +189,7 @@ class DXFNamespace:
             if attrib_def.xtype == XType.callback:
                 attrib_def.set_callback_value(self._entity, value)
             else:
-                self.__dict__[key] = check(value)
+                self.unprotected_set(key, check(value))
         else:
             raise const.DXFAttributeError(
                 ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype)
@@ -188,6 +199,7 @@ class DXFNamespace:
             handler = getattr(self._entity, SETTER_EVENTS[key], None)
             if handler:
                 handler(value)
+        self._record_modification(key)
 
     def __delattr__(self, key: str) -> None:
         """Delete DXF attribute `key`.
@@ -197,10 +209,30 @@ class DXFNamespace:
 
         """
         if self.hasattr(key):
-            del self.__dict__[key]
+            self.discard(key)
+            self._record_modification(key)
         else:
             raise const.DXFAttributeError(ERR_DXF_ATTRIB_NOT_EXITS.format(key))
 
+    def _record_modification(self, key: str) -> None:
+        # Record the modification in the change journal and update the
+        # attribute index of the entity database, if these are enabled:
+        entitydb = getattr(getattr(self._entity, "doc", None), "entitydb", None)
+        if entitydb is None or not getattr(entitydb, "tracks_modifications", False):
+            return
+        handle = self.get("handle")
+        if handle is None:
+            return
+        journal = entitydb.journal
+        if journal is not None:
+            journal.modified(handle)
+        if key in INDEXED_ATTRIBUTES:
+            index = entitydb.attribute_index
+            if index is not None and handle in index:
+                # remove the entry of the old value before adding the new value:
+                index.discard(handle)
+                index.add(self._entity)
+
     def get(self, key: str, default: Any = None) -> Any:
         """Returns value of DXF attribute `key` or the given `default` value
         not DXF default value for unset attributes.
@@ -213,6 +245,12 @@ class DXFNamespace:
         if self.hasattr(key):
             # do not return the DXF default value
             return self.__dict__[key]
+        return self._unset_value(key, default)
+
+    def _unset_value(self, key: str, default: Any) -> Any:
+        """Returns the callback value or the given `default` value of the unset
+        DXF attribute `key`.
+        """
         attrib_def: Optional["DXFAttr"] = self.dxfattribs.get(key)
         if attrib_def:
             if attrib_def.xtype == XType.callback:
@@ -400,6 +438,200 @@ class DXFNamespace:
         _export_group_codes(tagwriter, attrib, value)
 
 
+class CompactDXFNamespace(DXFNamespace):
+    """Compact DXF namespace for entity types with many instances like LINE or
+    TEXT.
+
+    The attributes listed in :attr:`__slots__` of the inherited classes are
+    stored in slots, all other DXF attributes are stored in a dict which is
+    created only when needed. The slots store the common graphic attributes,
+    inherited classes add the attributes of their entity type.
+
+    The instance dict inherited from :class:`DXFNamespace` is not used, the
+    :attr:`__dict__` attribute returns a live view of the DXF attributes for
+    code which accesses the attribute storage of the :class:`DXFNamespace`
+    directly.
+
+    (internal class)
+    """
+
+    __slots__ = (
+        "_entity",
+        "_extra",
+        "handle",
+        "owner",
+        "layer",
+        "linetype",
+        "color",
+        "lineweight",
+        "paperspace",
+    )
+    # member descriptors of all slot attributes except "_entity" and "_extra"
+    _slots: dict[str, Any] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._slots = _collect_slots(cls)
+
+    def __init__(
+        self,
+        processor: Optional[SubclassProcessor] = None,
+        entity: Optional[DXFEntity] = None,
+    ):
+        object.__setattr__(self, "_extra", None)
+        super().__init__(processor, entity)
+
+    def copy(self, entity: DXFEntity):
+        namespace = self.__class__()
+        for name, descriptor in self._slots.items():
+            try:
+                descriptor.__set__(namespace, descriptor.__get__(self))
+            except AttributeError:
+                pass
+        if self._extra:
+            object.__setattr__(namespace, "_extra", dict(self._extra))
+        namespace.rewire(entity)
+        return namespace
+
+    def __getstate__(self) -> object:
+        state = self.all_existing_dxf_attribs()
+        state["_entity"] = self._entity
+        return state
+
+    def __setstate__(self, state: object) -> None:
+        if not isinstance(state, dict):
+            raise TypeError(f"invalid state: {type(state).__name__}")
+        object.__setattr__(self, "_extra", None)
+        object.__setattr__(self, "_entity", state.get("_entity"))
+        for key, value in state.items():
+            if key != "_entity":
+                self.unprotected_set(key, value)
+
+    @property
+    def __dict__(self) -> MutableMapping[str, Any]:  # type: ignore[override]
+        return _CompactNamespaceView(self)
+
+    def __getattr__(self, key: str) -> Any:
+        """Called if DXF attribute `key` is not stored in a slot."""
+        if key in _PRIVATE_SLOTS:  # not initialized
+            raise AttributeError(key)
+        extra = self._extra
+        if extra is not None and key in extra:
+            return extra[key]
+        return super().__getattr__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        descriptor = self._slots.get(key)
+        if descriptor is None:
+            extra = self._extra
+            if extra is not None and key in extra:
+                return extra[key]
+        else:
+            try:
+                return descriptor.__get__(self)
+            except AttributeError:  # unset slot
+                pass
+        return self._unset_value(key, default)
+
+    def unprotected_set(self, key: str, value: Any) -> None:
+        descriptor = self._slots.get(key)
+        if descriptor is None:
+            extra = self._extra
+            if extra is None:
+                extra = {}
+                object.__setattr__(self, "_extra", extra)
+            extra[key] = value
+        else:
+            descriptor.__set__(self, value)
+
+    def all_existing_dxf_attribs(self) -> dict:
+        attribs = {}
+        for name, descriptor in self._slots.items():
+            try:
+                attribs[name] = descriptor.__get__(self)
+            except AttributeError:
+                pass
+        if self._extra:
+            attribs.update(self._extra)
+        return attribs
+
+    def discard(self, key: str) -> None:
+        descriptor = self._slots.get(key)
+        if descriptor is None:
+            if self._extra:
+                self._extra.pop(key, None)
+        else:
+            try:
+                descriptor.__delete__(self)
+            except AttributeError:
+                pass
+
+    def hasattr(self, key: str) -> bool:
+        descriptor = self._slots.get(key)
+        if descriptor is None:
+            extra = self._extra
+            return extra is not None and key in extra
+        try:
+            descriptor.__get__(self)
+        except AttributeError:
+            return False
+        return True
+
+
+_PRIVATE_SLOTS = frozenset(["_entity", "_extra"])
+
+
+class _CompactNamespaceView(MutableMapping[str, Any]):
+    """Mutable mapping of the DXF attributes and the "_entity" back-link of a
+    :class:`CompactDXFNamespace`, like the :attr:`__dict__` of the
+    :class:`DXFNamespace`. Setting items bypasses the validity checks.
+    """
+
+    __slots__ = ("_namespace",)
+
+    def __init__(self, namespace: CompactDXFNamespace):
+        self._namespace = namespace
+
+    def __getitem__(self, key: str) -> Any:
+        namespace = self._namespace
+        if key == "_entity":
+            return namespace._entity
+        if namespace.hasattr(key):
+            return namespace.get(key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "_entity":
+            object.__setattr__(self._namespace, "_entity", value)
+        else:
+            self._namespace.unprotected_set(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        namespace = self._namespace
+        if key == "_entity" or not namespace.hasattr(key):
+            raise KeyError(key)
+        namespace.discard(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield "_entity"
+        yield from self._namespace.all_existing_dxf_attribs()
+
+    def __len__(self) -> int:
+        return len(self._namespace.all_existing_dxf_attribs()) + 1
+
+
+def _collect_slots(cls: type) -> dict[str, Any]:
+    slots: dict[str, Any] = {}
+    for base in reversed(cls.__mro__):
+        for name in base.__dict__.get("__slots__", ()):
+            if name not in _PRIVATE_SLOTS:
+                slots[name] = base.__dict__[name]
+    return slots
+
+
+CompactDXFNamespace._slots = _collect_slots(CompactDXFNamespace)
+
+
 def _export_group_codes(
     tagwriter: AbstractTagWriter, attrib: DXFAttr, value: Any
 ) -> None:
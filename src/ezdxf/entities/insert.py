@@ -53,6 +53,7 @@ from ezdxf.entities import factory
 from ezdxf.query import EntityQuery
 from ezdxf.audit import AuditError
 from .dxfentity import base_class, SubclassProcessor
+from .dxfns import CompactDXFNamespace
 from .dxfgfx import (
     DXFGraphic,
     acdb_entity,
@@ -160,6 +161,18 @@ merged_insert_group_codes = merge_group_code_mappings(
 # necessary.
 
 
+class InsertNamespace(CompactDXFNamespace):
+    __slots__ = (
+        "name",
+        "insert",
+        "xscale",
+        "yscale",
+        "zscale",
+        "rotation",
+        "extrusion",
+    )
+
+
 @factory.register_entity
 class Insert(LinkedEntities):
     """DXF INSERT entity
@@ -178,6 +191,7 @@ class Insert(LinkedEntities):
 
     DXFTYPE = "INSERT"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_block_reference)
+    DXFNAMESPACE = InsertNamespace
 
     @property
     def attribs(self) -> list[Attrib]:
@@ -18,6 +18,7 @@ from ezdxf.math.transformtools import (
     transform_thickness_and_extrusion_without_ocs,
 )
 from .dxfentity import base_class, SubclassProcessor
+from .dxfns import CompactDXFNamespace
 from .dxfgfx import DXFGraphic, acdb_entity, acdb_entity_group_codes
 from .factory import register_entity
 
@@ -50,12 +51,17 @@ merged_line_group_codes = merge_group_code_mappings(
 )
 
 
+class LineNamespace(CompactDXFNamespace):
+    __slots__ = ("start", "end", "thickness", "extrusion")
+
+
 @register_entity
 class Line(DXFGraphic):
     """The LINE entity represents a 3D line from `start` to `end`"""
 
     DXFTYPE = "LINE"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_line)
+    DXFNAMESPACE = LineNamespace
 
     def load_dxf_attribs(
         self, processor: Optional[SubclassProcessor] = None
@@ -149,7 +149,7 @@ class LWPolyline(DXFGraphic):
             tagwriter,
             ["count", "flags", "const_width", "elevation", "thickness"],
         )
-        tagwriter.write_tags(Tags(self.lwpoints.dxftags()))
+        self.lwpoints.export_dxf(tagwriter)
         self.dxf.export_dxf_attribs(tagwriter, "extrusion")
 
     @property
@@ -479,6 +479,13 @@ class LWPolylinePoints(VertexArray):
     def append(self, point: Sequence[float], format: str = DEFAULT_FORMAT) -> None:
         super().append(compile_array(point, format=format))
 
+    def export_dxf(self, tagwriter: AbstractTagWriter, code=10) -> None:
+        values = self.values
+        if values[:, 2:].any():
+            tagwriter.write_tags(Tags(self.dxftags()))
+        else:  # export all vertices at once, if no widths and bulges are set
+            tagwriter.write_vertices(self.VERTEX_CODE, values[:, :2].tolist())
+
     def dxftags(self) -> Iterator[DXFTag]:
         for point in self:
             x, y, start_width, end_width, bulge = point
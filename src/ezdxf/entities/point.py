@@ -18,6 +18,7 @@ from ezdxf.math.transformtools import (
     transform_thickness_and_extrusion_without_ocs,
 )
 from .dxfentity import base_class, SubclassProcessor
+from .dxfns import CompactDXFNamespace
 from .dxfgfx import DXFGraphic, acdb_entity, acdb_entity_group_codes
 from .factory import register_entity
 
@@ -72,12 +73,17 @@ merged_point_group_codes = merge_group_code_mappings(
 )
 
 
+class PointNamespace(CompactDXFNamespace):
+    __slots__ = ("location", "thickness", "extrusion", "angle")
+
+
 @register_entity
 class Point(DXFGraphic):
     """DXF POINT entity"""
 
     DXFTYPE = "POINT"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_point)
+    DXFNAMESPACE = PointNamespace
 
     def load_dxf_attribs(
         self, processor: Optional[SubclassProcessor] = None
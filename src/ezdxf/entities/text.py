@@ -27,6 +27,7 @@ from ezdxf.audit import Auditor
 from ezdxf.tools.text import plain_text
 
 from .dxfentity import base_class, SubclassProcessor
+from .dxfns import CompactDXFNamespace
 from .dxfgfx import (
     DXFGraphic,
     acdb_entity,
@@ -155,12 +156,28 @@ merged_text_group_codes = merge_group_code_mappings(
 # %%u in TEXT start underline formatting until next %%u or until end of line
 
 
+class TextNamespace(CompactDXFNamespace):
+    __slots__ = (
+        "insert",
+        "height",
+        "text",
+        "rotation",
+        "oblique",
+        "style",
+        "width",
+        "halign",
+        "valign",
+        "align_point",
+    )
+
+
 @register_entity
 class Text(DXFGraphic):
     """DXF TEXT entity"""
 
     DXFTYPE = "TEXT"
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_text, acdb_text2)
+    DXFNAMESPACE = TextNamespace
     # horizontal align values
     LEFT = 0
     CENTER = 1
@@ -6,16 +6,23 @@ from typing import (
     Iterable,
     TYPE_CHECKING,
     Iterator,
+    Callable,
+    Any,
+    NamedTuple,
+    Union,
 )
 from contextlib import contextmanager
+import weakref
+from operator import itemgetter
 from ezdxf.tools.handle import HandleGenerator
 from ezdxf.lldxf.types import is_valid_handle
 from ezdxf.entities.dxfentity import DXFEntity
 from ezdxf.entities.dxfobj import DXFObject
+from ezdxf.entities.dxfns import INDEXED_ATTRIBUTES
 from ezdxf.audit import AuditError, Auditor
 from ezdxf.lldxf.const import DXFInternalEzdxfError
 from ezdxf.entities import factory
-from ezdxf.query import EntityQuery
+from ezdxf.query import EntityQuery, indexed_query
 from ezdxf.entities.copy import default_copy
 
 if TYPE_CHECKING:
@@ -33,6 +40,285 @@ DATABASE_EXCLUDE = {
 }
 
 
+class Changes(NamedTuple):
+    """Changes of the entity database since a certain revision, returned by
+    :meth:`ChangeJournal.changes_since`.
+
+    Attributes:
+        revision: current revision of the journal, the start revision for the
+            next query
+        created: handles of new entities, an entity can also replace a deleted
+            entity with the same handle
+        modified: handles of modified entities
+        deleted: handles of deleted entities
+
+    """
+
+    revision: int
+    created: set[str]
+    modified: set[str]
+    deleted: set[str]
+
+
+class ChangeJournal:
+    """Records the handles of created, modified and deleted entities of an
+    :class:`EntityDB` with a monotonic revision counter.
+
+    Caches of derived data like bounding boxes can be updated incrementally
+    by processing the changes since the revision of their last update instead
+    of rebuilding the whole cache.
+
+    Modifications of DXF attributes by the :class:`DXFNamespace` are recorded
+    automatically, modifications of other entity data like the vertices of
+    LWPOLYLINE or the boundary paths of HATCH have to be recorded manually by
+    :meth:`modified`. Entities loaded by the lazy loading mode are not
+    recorded as created entities.
+
+    Readers like the :class:`~ezdxf.select.SpatialIndex` report their processed
+    revision by :meth:`acknowledge`, changes processed by all registered
+    readers are discarded automatically. Readers are weakly referenced and
+    released when they are garbage collected.
+
+    """
+
+    def __init__(self) -> None:
+        self.revision: int = 0
+        # handles of changed entities in order of their last change,
+        # value is (revision of creation, revision of last change, deleted)
+        # and the revision of creation is 0 for existing entities:
+        self._entries: dict[str, tuple[int, int, bool]] = {}
+        # start revision of the recorded changes:
+        self._start: int = 0
+        # processed revision of registered readers:
+        self._readers: weakref.WeakKeyDictionary[Any, int] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __len__(self) -> int:
+        """Count of recorded entities."""
+        return len(self._entries)
+
+    def created(self, handle: str) -> None:
+        """Record a created entity."""
+        self.revision += 1
+        self._entries.pop(handle, None)
+        self._entries[handle] = (self.revision, self.revision, False)
+
+    def modified(self, handle: str) -> None:
+        """Record a modified entity, ignores deleted entities."""
+        self._record(handle, deleted=False)
+
+    def deleted(self, handle: str) -> None:
+        """Record a deleted entity."""
+        self._record(handle, deleted=True)
+
+    def _record(self, handle: str, deleted: bool) -> None:
+        entries = self._entries
+        entry = entries.get(handle)
+        if entry is None:
+            created = 0
+        elif entry[2]:  # deleted entities keep their position and revision
+            return
+        else:
+            created = entry[0]
+            # move the entry to the end of the most recent changes:
+            del entries[handle]
+        self.revision += 1
+        entries[handle] = (created, self.revision, deleted)
+
+    def changes_since(self, revision: int) -> Changes:
+        """Returns the changes after the given `revision`. Entities created and
+        deleted after the given `revision` are not included.
+
+        Raises:
+            ValueError: changes after `revision` were discarded by
+                :meth:`discard`
+
+        """
+        if revision < self._start:
+            raise ValueError(f"changes since revision {revision} were discarded")
+        created: set[str] = set()
+        modified: set[str] = set()
+        deleted: set[str] = set()
+        entries = self._entries
+        # the most recent changes are located at the end of the dict:
+        for handle in reversed(entries):
+            first, last, is_deleted = entries[handle]
+            if last <= revision:
+                break
+            if first > revision:
+                if not is_deleted:
+                    created.add(handle)
+            elif is_deleted:
+                deleted.add(handle)
+            else:
+                modified.add(handle)
+        return Changes(self.revision, created, modified, deleted)
+
+    def discard(self, revision: int) -> None:
+        """Discard all changes until the given `revision` to free memory,
+        changes since older revisions are not available anymore.
+        """
+        revision = min(revision, self.revision)
+        entries = self._entries
+        discarded: list[str] = []
+        # the entries are ordered by the revision of their last change:
+        for handle, entry in entries.items():
+            if entry[1] > revision:
+                break
+            discarded.append(handle)
+        for handle in discarded:
+            del entries[handle]
+        self._start = max(self._start, revision)
+
+    def acknowledge(self, reader: Any, revision: int) -> None:
+        """Registers the `reader` and sets its processed `revision`. Discards
+        all changes until the lowest processed revision of all registered
+        readers.
+        """
+        self._readers[reader] = revision
+        self.discard(min(self._readers.values()))
+
+    def release(self, reader: Any) -> None:
+        """Unregisters the `reader`, does not raise an exception if the
+        `reader` is not registered.
+        """
+        self._readers.pop(reader, None)
+
+
+class AttributeIndex:
+    """Secondary indexes of an :class:`EntityDB` for the DXF type and the DXF
+    attributes layer, color and linetype of the stored entities.
+
+    Each index maps an attribute value to the handles of all entities with
+    this value, unset attributes are indexed by their DXF default value.
+    The layer and linetype names are stored in lowercase, because these names
+    are case-insensitive. Entities which do not support an attribute are not
+    included in the index of this attribute.
+
+    The :class:`EntityDB` updates the indexes for added and removed entities,
+    modifications of indexed DXF attributes are updated automatically by the
+    :class:`DXFNamespace`, except for the internal method
+    :meth:`unprotected_set`.
+
+    """
+
+    ATTRIBUTES: tuple[str, ...] = INDEXED_ATTRIBUTES
+
+    def __init__(self) -> None:
+        # indexed values of all entities: (dxftype, layer, color, linetype)
+        self._keys: dict[str, tuple] = {}
+        self._indexes: dict[str, dict[Any, set[str]]] = {
+            name: {} for name in ("dxftype",) + self.ATTRIBUTES
+        }
+
+    def __len__(self) -> int:
+        """Count of indexed entities."""
+        return len(self._keys)
+
+    def __contains__(self, handle: str) -> bool:
+        """Returns ``True`` if the entity `handle` is indexed."""
+        return handle in self._keys
+
+    def add(self, entity: DXFEntity) -> None:
+        """Add `entity` to the indexes or update the indexed values of an
+        existing `entity`.
+        """
+        handle = entity.dxf.handle
+        if handle is None:
+            return
+        keys = _index_keys(entity)
+        old_keys = self._keys.get(handle)
+        if old_keys == keys:
+            return
+        if old_keys is not None:
+            self._remove(handle, old_keys)
+        self._keys[handle] = keys
+        for index, key in zip(self._indexes.values(), keys):
+            if key is not None:
+                index.setdefault(key, set()).add(handle)
+
+    def discard(self, handle: str) -> None:
+        """Remove the entity `handle` from the indexes, does not raise an
+        exception if the `handle` is not indexed.
+        """
+        keys = self._keys.pop(handle, None)
+        if keys is not None:
+            self._remove(handle, keys)
+
+    def _remove(self, handle: str, keys: tuple) -> None:
+        for index, key in zip(self._indexes.values(), keys):
+            if key is not None:
+                handles = index[key]
+                handles.discard(handle)
+                if not handles:
+                    del index[key]
+
+    def find(
+        self,
+        dxftypes: Optional[Iterable[str]] = None,
+        attributes: Iterable[tuple[str, Any]] = tuple(),
+    ) -> set[str]:
+        """Returns the handles of all entities with one of the given
+        `dxftypes` and where all given indexed `attributes` are equal to the
+        associated values. The `attributes` are (name, value) tuples. All
+        entity types are included if `dxftypes` is ``None``.
+
+        Raises:
+            KeyError: attribute `name` is not indexed
+
+        """
+        candidates: list[set[str]] = []
+        if dxftypes is not None:
+            index = self._indexes["dxftype"]
+            types = [index.get(dxftype, _EMPTY) for dxftype in set(dxftypes)]
+            candidates.append(types[0] if len(types) == 1 else set().union(*types))
+        for name, value in attributes:
+            candidates.append(self._lookup(name, value))
+        if not candidates:
+            return set(self._keys)
+        # the intersection is fastest by starting with the smallest set:
+        candidates.sort(key=len)
+        return set(candidates[0]).intersection(*candidates[1:])
+
+    def get(self, name: str, value: Any) -> set[str]:
+        """Returns the handles of all entities where the indexed attribute
+        `name` is equal to `value`, the attribute name "dxftype" refers to the
+        DXF type of the entities.
+
+        Raises:
+            KeyError: attribute `name` is not indexed
+
+        """
+        return set(self._lookup(name, value))
+
+    def _lookup(self, name: str, value: Any) -> set[str]:
+        index = self._indexes[name]
+        if isinstance(value, str) and name != "dxftype":
+            value = value.lower()
+        try:
+            return index.get(value, _EMPTY)
+        except TypeError:  # unhashable value
+            return _EMPTY
+
+
+_EMPTY: set[str] = set()  # never modified
+
+
+def _index_keys(entity: DXFEntity) -> tuple:
+    dxf = entity.dxf
+    keys: list[Any] = [entity.dxftype()]
+    for name in AttributeIndex.ATTRIBUTES:
+        if dxf.is_supported(name):
+            value = dxf.get_default(name)
+            if isinstance(value, str):
+                value = value.lower()
+            keys.append(value)
+        else:
+            keys.append(None)
+    return tuple(keys)
+
+
 class EntityDB:
     """A simple key/entity database.
 
@@ -46,7 +332,7 @@ class EntityDB:
         """Store handles to entities which should be deleted later."""
 
         def __init__(self, db: EntityDB):
-            self._database = db._database
+            self._db = db
             self._handles: set[str] = set()
 
         def add(self, handle: str):
@@ -59,13 +345,17 @@ class EntityDB:
             """Remove handles in trashcan from database and destroy entities if
             still alive.
             """
-            db = self._database
+            db = self._db
+            # operate on the underlying data structure, does not load unloaded
+            # entities:
+            database = db._database
             for handle in self._handles:
-                entity = db.get(handle)
+                entity = database.get(handle)
                 if entity and entity.is_alive:
                     entity.destroy()
 
-                if handle in db:
+                if handle in database:
+                    # updates the change journal and the attribute index:
                     del db[handle]
 
             self._handles.clear()
@@ -75,12 +365,31 @@ class EntityDB:
         # DXF handles of entities to delete later:
         self.handles = HandleGenerator()
         self.locked: bool = False  # used only for debugging
+        # Not yet loaded entities of the lazy loading mode, the raw entity
+        # data is opaque for the entity database:
+        self._unloaded: dict[str, tuple[tuple[str, ...], Any]] = {}
+        # Loads an unloaded entity from raw entity data and stores the
+        # entity and its sub-entities in the database:
+        self.entity_loader: Optional[Callable[[Any], DXFEntity]] = None
+        # Records the changes of the database, if started:
+        self.journal: Optional[ChangeJournal] = None
+        # Secondary indexes for entity queries, if created:
+        self.attribute_index: Optional[AttributeIndex] = None
+        # Modifications of DXF attributes have to be reported by the
+        # DXFNamespace, True if the change journal is started or the
+        # attribute index is created:
+        self.tracks_modifications: bool = False
 
     def __getitem__(self, handle: str) -> DXFEntity:
         """Get entity by `handle`, does not filter destroyed entities nor
         entities in the trashcan.
         """
-        return self._database[handle]
+        try:
+            return self._database[handle]
+        except KeyError:
+            if handle in self._unloaded:
+                return self._load_entity(handle)
+            raise
 
     def __setitem__(self, handle: str, entity: DXFEntity) -> None:
         """Set `entity` for `handle`."""
@@ -92,7 +401,11 @@ class EntityDB:
 
         if handle == "0" or not is_valid_handle(handle):
             raise ValueError(f"Invalid handle {handle}.")
+        if self.journal is not None and self._database.get(handle) is not entity:
+            self.journal.created(handle)
         self._database[handle] = entity
+        if self.attribute_index is not None:
+            self.attribute_index.add(entity)
 
     def __delitem__(self, handle: str) -> None:
         """Delete entity by `handle`. Removes entity only from database, does
@@ -101,37 +414,127 @@ class EntityDB:
         if self.locked:
             raise DXFInternalEzdxfError("Locked entity database.")
         del self._database[handle]
+        if self.journal is not None:
+            self.journal.deleted(handle)
+        if self.attribute_index is not None:
+            self.attribute_index.discard(handle)
 
     def __contains__(self, handle: str) -> bool:
         """``True`` if database contains `handle`."""
         if handle is None:
             return False
         assert isinstance(handle, str), type(handle)
-        return handle in self._database
+        return handle in self._database or handle in self._unloaded
 
     def __len__(self) -> int:
-        """Count of database items."""
-        return len(self._database)
+        """Count of database items including unloaded entities."""
+        return len(self._database) + len(self._unloaded)
 
     def __iter__(self) -> Iterator[str]:
-        """Iterable of all handles, does filter destroyed entities but not
-        entities in the trashcan.
+        """Iterable of all handles including the handles of unloaded entities,
+        does filter destroyed entities but not entities in the trashcan.
         """
-        return self.keys()  # type: ignore
+        for handle, entity in list(self._database.items()):
+            if entity.is_alive:
+                yield handle
+        yield from list(self._unloaded)
 
     def get(self, handle: str) -> Optional[DXFEntity]:
         """Returns entity for `handle` or ``None`` if no entry exist, does
         not filter destroyed entities.
         """
-        return self._database.get(handle)
+        entity = self._database.get(handle)
+        if entity is None and handle in self._unloaded:
+            return self._load_entity(handle)
+        return entity
 
     def next_handle(self) -> str:
         """Returns next unique handle."""
+        database = self._database
+        unloaded = self._unloaded
+        next_ = self.handles.next
         while True:
-            handle = self.handles.next()
-            if handle not in self._database:
+            handle = next_()
+            if handle not in database and handle not in unloaded:
                 return handle
 
+    def add_unloaded_entity(self, handles: Iterable[str], data: Any) -> None:
+        """Add the raw `data` of an unloaded entity for the lazy loading mode.
+        The entity will be loaded by the :attr:`entity_loader` at the first
+        access. The `handles` are the handles of the entity and its linked
+        sub-entities like VERTEX, ATTRIB and SEQEND. (internal API)
+        """
+        handles = tuple(handles)
+        entry = (handles, data)
+        for handle in handles:
+            self._unloaded[handle] = entry
+
+    def has_unloaded_entities(self) -> bool:
+        """Returns ``True`` if the database contains unloaded entities."""
+        return bool(self._unloaded)
+
+    def load_all(self) -> None:
+        """Load all unloaded entities of the lazy loading mode."""
+        unloaded = self._unloaded
+        while unloaded:
+            self._load_entity(next(iter(unloaded)))
+
+    def _load_entity(self, handle: str) -> DXFEntity:
+        handles, data = self._unloaded[handle]
+        # remove all handles of the entity and its sub-entities:
+        for key in handles:
+            del self._unloaded[key]
+        assert self.entity_loader is not None, "entity loader required"
+        # loading an existing entity is not a change of the database:
+        journal = self.journal
+        self.journal = None
+        try:
+            self.entity_loader(data)
+        finally:
+            self.journal = journal
+        if self.attribute_index is not None:
+            # the loading process may change attributes of stored entities:
+            for key in handles:
+                entity = self._database.get(key)
+                if entity is not None:
+                    self.attribute_index.add(entity)
+        return self._database[handle]
+
+    def start_journal(self) -> ChangeJournal:
+        """Starts recording the changes of the database and returns the
+        :class:`ChangeJournal`. Returns the existing journal if the recording
+        is already started.
+        """
+        if self.journal is None:
+            self.journal = ChangeJournal()
+            self.tracks_modifications = True
+        return self.journal
+
+    def stop_journal(self) -> None:
+        """Stops recording the changes of the database and deletes the
+        :class:`ChangeJournal`.
+        """
+        self.journal = None
+        self.tracks_modifications = self.attribute_index is not None
+
+    def create_attribute_index(self) -> AttributeIndex:
+        """Creates the :class:`AttributeIndex` of all stored entities, which
+        is used by entity queries. Returns the existing index if the index is
+        already created. Loads all unloaded entities of the lazy loading mode.
+        """
+        if self.attribute_index is None:
+            index = AttributeIndex()
+            for entity in self.values():
+                index.add(entity)
+            self.attribute_index = index
+            self.tracks_modifications = True
+        return self.attribute_index
+
+    def delete_attribute_index(self) -> None:
+        """Deletes the :class:`AttributeIndex`."""
+        self.attribute_index = None
+        self.tracks_modifications = self.journal is not None
+
     def keys(self) -> Iterable[str]:
         """Iterable of all handles, does filter destroyed entities."""
         return (handle for handle, entity in self.items())
@@ -142,8 +545,10 @@ class EntityDB:
 
     def items(self) -> Iterable[tuple[str, DXFEntity]]:
         """Iterable of all (handle, entities) pairs, does filter destroyed
-        entities.
+        entities. Loads all unloaded entities of the lazy loading mode.
         """
+        if self._unloaded:
+            self.load_all()
         return (
             (handle, entity)
             for handle, entity in self._database.items()
@@ -164,9 +569,19 @@ class EntityDB:
             return
         handle: str = entity.dxf.handle
         if handle is None:
+            if self.locked:
+                raise DXFInternalEzdxfError("Locked entity database.")
+            assert entity.is_alive, "Can not store destroyed entity."
+            # a new handle is always valid, bypass the checks of __setitem__()
             handle = self.next_handle()
             entity.update_handle(handle)
-        self[handle] = entity
+            self._database[handle] = entity
+            if self.journal is not None:
+                self.journal.created(handle)
+            if self.attribute_index is not None:
+                self.attribute_index.add(entity)
+        else:
+            self[handle] = entity
 
         # Add sub entities ATTRIB, VERTEX and SEQEND to database:
         # Add linked MTEXT columns to database:
@@ -191,6 +606,11 @@ class EntityDB:
                 entity.dxf.handle = None
             except KeyError:
                 pass
+            else:
+                if self.journal is not None:
+                    self.journal.deleted(handle)
+                if self.attribute_index is not None:
+                    self.attribute_index.discard(handle)
 
     def duplicate_entity(self, entity: DXFEntity) -> DXFEntity:
         """Duplicates `entity` and its sub entities (VERTEX, ATTRIB, SEQEND)
@@ -302,7 +722,7 @@ class EntityDB:
         Returns ``True`` if successful and ``False`` otherwise.
 
         """
-        if handle in self._database:
+        if handle in self:
             return False
         self.discard(entity)
         entity.dxf.handle = handle
@@ -320,7 +740,25 @@ class EntityDB:
             :ref:`entity query string` and :ref:`entity queries`
 
         """
-        return EntityQuery((e for e in self._database.values() if e.is_alive), query)
+        if self._unloaded:
+            self.load_all()
+        return indexed_query(
+            (e for e in self._database.values() if e.is_alive),
+            query,
+            self.attribute_index,
+        )
+
+
+class _Removed:
+    """Placeholder for removed entities in the :class:`EntitySpace`."""
+
+    is_alive = False
+
+    def __repr__(self):
+        return "<removed>"
+
+
+REMOVED: Any = _Removed()
 
 
 class EntitySpace:
@@ -332,12 +770,22 @@ class EntitySpace:
     layout and :class:`~ezdxf.layouts.BlockLayout` objects have an
     :class:`EntitySpace` container to store their entities.
 
+    Removed entities are replaced by placeholders, which are filtered like
+    destroyed entities, this makes removing entities an O(1) operation. The
+    placeholders are removed when they occupy more than the half of the
+    underlying list or before accessing entities by index.
+
     """
 
     def __init__(self, entities: Optional[Iterable[DXFEntity]] = None):
         self.entities: list[DXFEntity] = (
             list(e for e in entities if e.is_alive) if entities else []
         )
+        # count of placeholders for removed entities:
+        self._removed = 0
+        # list index of entities by id(entity), created on demand by remove(),
+        # the LazyEntitySpace stores unloaded entities by their handle:
+        self._positions: Optional[dict[Union[int, str], int]] = None
 
     def __iter__(self) -> Iterator[DXFEntity]:
         """Iterable of all entities, filters destroyed entities."""
@@ -353,11 +801,13 @@ class EntitySpace:
         ``list[DXFEntity]``. Does not filter destroyed entities.
 
         """
+        if self._removed:
+            self._compact()
         return self.entities[index]
 
     def __len__(self) -> int:
         """Count of entities including destroyed entities."""
-        return len(self.entities)
+        return len(self.entities) - self._removed
 
     def has_handle(self, handle: str) -> bool:
         """``True`` if `handle` is present, does filter destroyed entities."""
@@ -367,11 +817,15 @@ class EntitySpace:
     def purge(self):
         """Remove all destroyed entities from entity space."""
         self.entities = list(self)
+        self._removed = 0
+        self._positions = None
 
     def add(self, entity: DXFEntity) -> None:
         """Add `entity`."""
         assert isinstance(entity, DXFEntity), type(entity)
         assert entity.is_alive, "Can not store destroyed entities"
+        if self._positions is not None:
+            self._positions.setdefault(id(entity), len(self.entities))
         self.entities.append(entity)
 
     def extend(self, entities: Iterable[DXFEntity]) -> None:
@@ -384,24 +838,102 @@ class EntitySpace:
 
         (internal API)
         """
-        for entity in iter(self):
-            entity.export_dxf(tagwriter)
+        tagwriter.write_entities(iter(self))
 
     def remove(self, entity: DXFEntity) -> None:
-        """Remove `entity`."""
-        self.entities.remove(entity)
+        """Remove `entity`.
+
+        Raises:
+            ValueError: `entity` does not exist
+
+        """
+        positions = self._positions
+        if positions is None:
+            positions = self._build_positions()
+        index = positions.pop(id(entity), None)
+        if index is None:
+            # fallback for multiple references of the same entity
+            self._compact()
+            self.entities.remove(entity)
+            return
+        self._remove_at(index)
+
+    def _remove_at(self, index: int) -> None:
+        self.entities[index] = REMOVED
+        self._removed += 1
+        if self._removed * 2 > len(self.entities):
+            self._compact()
+
+    def remove_entities(self, entities: Iterable[DXFEntity]) -> None:
+        """Remove multiple `entities` in a single pass. The entity space is
+        unchanged if any of the `entities` does not exist.
+
+        Raises:
+            ValueError: any of the `entities` does not exist
+
+        """
+        ids = set(map(id, entities))
+        if not ids:
+            return
+        remaining = [e for e in self.entities if id(e) not in ids]
+        if len(self.entities) - len(remaining) < len(ids):
+            raise ValueError("entity does not exist")
+        # placeholders for removed entities are also removed from the list:
+        self.entities = [e for e in remaining if e is not REMOVED]
+        self._removed = 0
+        self._positions = None
+
+    def select(self, entities: Iterable[DXFEntity]) -> list[DXFEntity]:
+        """Returns the given `entities` which are stored in the entity space in
+        the order of the entity space, ignores destroyed entities and entities
+        which are not stored in the entity space.
+        """
+        positions = self._positions
+        if positions is None:
+            positions = self._build_positions()
+        selection = []
+        for entity in entities:
+            index = positions.get(id(entity))
+            if index is not None and entity.is_alive:
+                selection.append((index, entity))
+        selection.sort(key=itemgetter(0))
+        return [entity for _, entity in selection]
 
     def clear(self) -> None:
         """Remove all entities."""
         # Do not destroy entities!
         self.entities = list()
+        self._removed = 0
+        self._positions = None
 
     def pop(self, index: int = -1) -> DXFEntity:
+        if self._removed:
+            self._compact()
+        self._positions = None
         return self.entities.pop(index)
 
     def insert(self, index: int, entity: DXFEntity) -> None:
+        if self._removed:
+            self._compact()
+        self._positions = None
         self.entities.insert(index, entity)
 
+    def _build_positions(self) -> dict[Union[int, str], int]:
+        # stores the index of the first reference of an entity:
+        positions: dict[Union[int, str], int] = {}
+        entities = self.entities
+        for index in range(len(entities) - 1, -1, -1):
+            positions[id(entities[index])] = index
+        self._positions = positions
+        return positions
+
+    def _compact(self) -> None:
+        """Removes the placeholders of removed entities."""
+        if self._removed:
+            self.entities = [e for e in self.entities if e is not REMOVED]
+            self._removed = 0
+        self._positions = None
+
     def audit(self, auditor: Auditor) -> None:
         db_get = auditor.entitydb.get
         purge: list[DXFEntity] = []
@@ -426,7 +958,141 @@ class EntitySpace:
         if not purge:
             return
         for entity in purge:
-            self.entities.remove(entity)
+            self.remove(entity)
             # These are invalid entities do not call destroy() on them, because
             # this method relies on well-defined entities!
             entity._silent_kill()
+
+
+class LazyEntitySpace(EntitySpace):
+    """An :class:`EntitySpace` for the lazy loading mode, which stores the
+    handles of unloaded entities and loads these entities from the entity
+    database at the first access.
+
+    """
+
+    def __init__(
+        self, entitydb: EntityDB, entities: Optional[Iterable[DXFEntity]] = None
+    ):
+        super().__init__(entities)
+        self._entitydb = entitydb
+        self._unloaded_count = 0
+
+    def add_unloaded(self, handle: str) -> None:
+        """Add the `handle` of an unloaded entity."""
+        if self._positions is not None:
+            self._positions.setdefault(handle, len(self.entities))
+        self.entities.append(handle)  # type: ignore
+        self._unloaded_count += 1
+
+    def unloaded_count(self) -> int:
+        """Returns the count of unloaded entities."""
+        return self._unloaded_count
+
+    def _load(self, index: int) -> DXFEntity:
+        entity = self.entities[index]
+        if isinstance(entity, str):
+            handle = entity
+            entity = self._entitydb[handle]
+            self.entities[index] = entity
+            self._unloaded_count -= 1
+            positions = self._positions
+            if positions is not None and positions.get(handle) == index:
+                del positions[handle]
+                positions.setdefault(id(entity), index)
+        return entity
+
+    def load_all(self) -> None:
+        """Load all unloaded entities."""
+        if self._unloaded_count:
+            for index in range(len(self.entities)):
+                self._load(index)
+
+    def __iter__(self) -> Iterator[DXFEntity]:
+        """Iterable of all entities, filters destroyed entities and loads
+        unloaded entities.
+        """
+        entities = self.entities
+        index = 0
+        while index < len(entities):
+            entity = entities[index]
+            if isinstance(entity, str):
+                entity = self._load(index)
+            if entity.is_alive:
+                yield entity
+            index += 1
+
+    def __getitem__(self, index) -> DXFEntity:
+        if self._removed:
+            self._compact()
+        if isinstance(index, int):
+            return self._load(index)
+        self.load_all()
+        return self.entities[index]
+
+    def remove(self, entity: DXFEntity) -> None:
+        if self._unloaded_count:
+            positions = self._positions
+            if positions is None:
+                positions = self._build_positions()
+            handle = entity.dxf.handle
+            if id(entity) not in positions and handle in positions:
+                # The entity was loaded by the entity database, but the entity
+                # space still stores the handle:
+                self._unloaded_count -= 1
+                self._remove_at(positions.pop(handle))
+                return
+        super().remove(entity)
+
+    def remove_entities(self, entities: Iterable[DXFEntity]) -> None:
+        if not self._unloaded_count:
+            super().remove_entities(entities)
+            return
+        ids: set[int] = set()
+        handles: set[str] = set()
+        for entity in entities:
+            ids.add(id(entity))
+            handles.add(entity.dxf.handle)
+        if not ids:
+            return
+        remaining = []
+        unloaded_count = 0
+        for entity in self.entities:
+            if isinstance(entity, str):
+                if entity in handles:
+                    unloaded_count += 1
+                    continue
+            elif id(entity) in ids or entity is REMOVED:
+                continue
+            remaining.append(entity)
+        removed_count = len(self.entities) - self._removed - len(remaining)
+        if removed_count < len(ids):
+            raise ValueError("entity does not exist")
+        self.entities = remaining
+        self._unloaded_count -= unloaded_count
+        self._removed = 0
+        self._positions = None
+
+    def _build_positions(self) -> dict[Union[int, str], int]:
+        # unloaded entities are stored by their handle:
+        positions: dict[Union[int, str], int] = {}
+        entities = self.entities
+        for index in range(len(entities) - 1, -1, -1):
+            entity = entities[index]
+            positions[entity if isinstance(entity, str) else id(entity)] = index
+        self._positions = positions
+        return positions
+
+    def select(self, entities: Iterable[DXFEntity]) -> list[DXFEntity]:
+        self.load_all()
+        return super().select(entities)
+
+    def pop(self, index: int = -1) -> DXFEntity:
+        if self._removed:
+            self._compact()
+        self._load(index)
+        return super().pop(index)
+
+    def clear(self) -> None:
+        super().clear()
+        self._unloaded_count = 0
@@ -1,8 +1,9 @@
-# Copyright (C) 2018-2023, Manfred Moitzi
+# Copyright (C) 2018-2026, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
 from typing import TextIO, TYPE_CHECKING, Union, Sequence, Optional
 import base64
+import functools
 import io
 import pathlib
 import os
@@ -13,6 +14,8 @@ from ezdxf.document import Drawing
 
 if TYPE_CHECKING:
     from ezdxf.lldxf.validator import DXFInfo
+    from ezdxf.lldxf.loader import PrefilterFunc, LoadFilter, ProgressFunc
+    from ezdxf.eztypes import SectionDict
 
 
 def new(
@@ -69,7 +72,12 @@ def new(
     return doc
 
 
-def read(stream: TextIO) -> Drawing:
+def read(
+    stream: TextIO,
+    *,
+    filter: Optional[LoadFilter] = None,
+    progress: Optional[ProgressFunc] = None,
+) -> Drawing:
     """Read a DXF document from a text-stream. Open stream in text mode
     (``mode='rt'``) and set correct text encoding, the stream requires at least
     a :meth:`readline` method.
@@ -85,6 +93,9 @@ def read(stream: TextIO) -> Drawing:
 
     Args:
         stream: input text stream opened with correct encoding
+        filter: load only the layout entities accepted by this
+            :class:`~ezdxf.lldxf.loader.LoadFilter`, see :func:`readfile`
+        progress: function to report the loading progress, see :func:`readfile`
 
     Raises:
         DXFStructureError: for invalid or corrupted DXF structures
@@ -92,13 +103,48 @@ def read(stream: TextIO) -> Drawing:
     """
     from ezdxf.document import Drawing
 
-    return Drawing.read(stream)
+    return Drawing.read(stream, filter=filter, progress=progress)
+
+
+async def aread(
+    stream: TextIO,
+    *,
+    filter: Optional[LoadFilter] = None,
+    progress: Optional[ProgressFunc] = None,
+) -> Drawing:
+    """Coroutine to read a DXF document from a text-stream like :func:`read`
+    in a worker thread without blocking the event loop.
+
+    The `progress` function is called in the thread of the event loop.
+    Cancelling the awaiting task stops the loading process at the next
+    progress report.
+
+    Args:
+        stream: input text stream opened with correct encoding
+        filter: see :func:`read`
+        progress: function to report the loading progress, see :func:`readfile`
+
+    Raises:
+        DXFStructureError: for invalid or corrupted DXF structures
+
+    """
+    from ezdxf.document import run_in_worker_thread
+
+    return await run_in_worker_thread(
+        functools.partial(read, stream, filter=filter), progress
+    )
 
 
 def readfile(
     filename: str | os.PathLike,
     encoding: Optional[str] = None,
     errors: str = "surrogateescape",
+    *,
+    lazy: bool = False,
+    prefilter: Optional[PrefilterFunc] = None,
+    use_cache: bool = False,
+    filter: Optional[LoadFilter] = None,
+    progress: Optional[ProgressFunc] = None,
 ) -> Drawing:
     """Read the DXF document `filename` from the file-system.
 
@@ -106,6 +152,10 @@ def readfile(
     the required text encoding will be detected automatically and decoding
     errors will be ignored.
 
+    Compressed DXF files like "drawing.dxf.gz" or "drawing.dxf.zst" are
+    detected automatically and decompressed on the fly, see module
+    :mod:`ezdxf.tools.compressedfile`.
+
     Override encoding detection by setting argument `encoding` to the
     estimated encoding. (use Python encoding names like in the :func:`open`
     function).
@@ -124,37 +174,86 @@ def readfile(
             - "ignore" to use the replacement char U+FFFD "\ufffd" for invalid data
             - "strict" to raise an :class:`UnicodeDecodeError` exception for invalid data
 
+        lazy: lazy loading mode, the entities of the ENTITIES section are stored
+            as compiled DXF tags and loaded at the first access by handle,
+            iteration or query
+        prefilter: function to skip entities of the ENTITIES section in lazy
+            loading mode without loading them, gets the DXF type and the layer
+            name of the entity as arguments and returns ``False`` to skip the
+            entity, e.g. :code:`lambda dxftype, layer: layer == "TITLE"`
+        use_cache: use the persistent document cache, a cache hit skips loading
+            and compiling the DXF tags, but a cache miss is slower than loading
+            without cache, see module :mod:`ezdxf.doccache`
+        filter: load only the layout entities accepted by this
+            :class:`~ezdxf.lldxf.loader.LoadFilter`, the rejected entities
+            are removed before the DXF entities are created, the content of
+            the TABLES and BLOCKS sections and the objects which are not owned
+            by rejected entities are preserved, e.g.
+            :code:`LoadFilter(types=["LWPOLYLINE", "HATCH"], layers=["WALL*"])`
+        progress: function to report the loading progress, gets the section
+            name, the count of processed entities and the total count of
+            entities of the section, the total count is 0 while loading the
+            DXF tags, see :data:`ezdxf.lldxf.loader.ProgressFunc`
+
     Raises:
         IOError: not a DXF file or file does not exist
         DXFStructureError: for invalid or corrupted DXF structures
         UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
+        ValueError: argument `prefilter` without lazy loading mode
 
     """
-    from ezdxf.lldxf.validator import is_dxf_file, is_binary_dxf_file
+    from ezdxf.lldxf.validator import (
+        is_dxf_file,
+        is_binary_dxf_file,
+        is_dxf_stream,
+    )
+    from ezdxf.lldxf.tagger import BINARY_DXF_SIGNATURE
     from ezdxf.tools.codepage import is_supported_encoding
-    from ezdxf.lldxf.tagger import binary_tags_loader
+    from ezdxf.tools.compressedfile import detect_compression, open_file
 
+    if prefilter is not None and not lazy:
+        raise ValueError("argument prefilter requires the lazy loading mode")
     filename = str(filename)
-    if is_binary_dxf_file(filename):
-        with open(filename, "rb") as fp:
-            data = fp.read()
-            loader = binary_tags_loader(data, errors=errors)
-            doc = Drawing.load(loader)
-            doc.filename = filename
-            return doc
-
-    if not is_dxf_file(filename):
+    compression = detect_compression(filename)
+    if compression is None:
+        binary_dxf = is_binary_dxf_file(filename)
+        is_dxf = binary_dxf or is_dxf_file(filename)
+    else:
+        with open_file(filename, "rb", compression) as fp:
+            binary_dxf = fp.read(len(BINARY_DXF_SIGNATURE)) == BINARY_DXF_SIGNATURE
+        is_dxf = binary_dxf
+        if not binary_dxf:
+            with open_file(filename, "rt", compression, errors="ignore") as fp:
+                is_dxf = is_dxf_stream(fp)
+    if not binary_dxf and not is_dxf:
         raise IOError(f"File '{filename}' is not a DXF file.")
 
-    info = dxf_file_info(filename)
-    if encoding is not None:
-        # override default encodings if absolute necessary
-        info.encoding = encoding
-    with open(filename, mode="rt", encoding=info.encoding, errors=errors) as fp:
-        doc = read(fp)
-
+    cache = None
+    sections = None
+    if use_cache:
+        from ezdxf.doccache import default_cache
+
+        cache = default_cache()
+        sections = cache.get(filename, encoding=encoding, errors=errors)
+    if sections is None:
+        sections = _load_dxf_structure(
+            filename,
+            binary_dxf,
+            encoding=encoding,
+            errors=errors,
+            progress=progress,
+            compression=compression,
+        )
+        if cache is not None:
+            cache.put(filename, sections, encoding=encoding, errors=errors)
+
+    doc = Drawing()
+    doc._load_section_dict(
+        sections, lazy=lazy, prefilter=prefilter, filter=filter, progress=progress
+    )
     doc.filename = filename
-    if encoding is not None and is_supported_encoding(encoding):
+    # argument encoding is ignored for Binary DXF files
+    if not binary_dxf and encoding is not None and is_supported_encoding(encoding):
         # store overridden encoding if supported by AutoCAD, else default
         # encoding stored in $DWGENCODING is used as document encoding or
         # 'cp1252' if $DWGENCODING is unset.
@@ -162,13 +261,121 @@ def readfile(
     return doc
 
 
+async def areadfile(
+    filename: str | os.PathLike,
+    encoding: Optional[str] = None,
+    errors: str = "surrogateescape",
+    *,
+    lazy: bool = False,
+    prefilter: Optional[PrefilterFunc] = None,
+    use_cache: bool = False,
+    filter: Optional[LoadFilter] = None,
+    progress: Optional[ProgressFunc] = None,
+) -> Drawing:
+    """Coroutine to read the DXF document `filename` from the file-system like
+    :func:`readfile` in a worker thread without blocking the event loop.
+    All arguments have the same meaning as for :func:`readfile`.
+
+    The `progress` function is called in the thread of the event loop.
+    Cancelling the awaiting task stops the loading process at the next
+    progress report, e.g.::
+
+        task = asyncio.create_task(ezdxf.areadfile("big.dxf", progress=show))
+        ...
+        task.cancel()
+
+    Raises:
+        IOError: not a DXF file or file does not exist
+        DXFStructureError: for invalid or corrupted DXF structures
+        UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
+
+    """
+    from ezdxf.document import run_in_worker_thread
+
+    return await run_in_worker_thread(
+        functools.partial(
+            readfile,
+            filename,
+            encoding,
+            errors,
+            lazy=lazy,
+            prefilter=prefilter,
+            use_cache=use_cache,
+            filter=filter,
+        ),
+        progress,
+    )
+
+
+def _load_dxf_structure(
+    filename: str,
+    binary_dxf: bool,
+    encoding: Optional[str],
+    errors: str,
+    progress: Optional[ProgressFunc] = None,
+    compression: Optional[str] = None,
+) -> SectionDict:
+    """Returns the compiled DXF structure of the DXF file `filename` without the
+    THUMBNAILIMAGE section, see :func:`readfile` for the arguments.
+    """
+    from ezdxf.lldxf.loader import load_dxf_structure
+    from ezdxf.lldxf.tagger import (
+        binary_tags_loader,
+        binary_stream_tags_loader,
+        ascii_tags_loader,
+        tag_compiler,
+    )
+    from ezdxf.tools.compressedfile import open_file
+
+    if binary_dxf and compression is not None:
+        # decompress and load the binary DXF tags in chunks
+        with open_file(filename, "rb", compression) as fp:
+            sections = load_dxf_structure(
+                tag_compiler(binary_stream_tags_loader(fp, errors=errors)),
+                progress=progress,
+            )
+    elif binary_dxf:
+        with open(filename, "rb") as fp:
+            data = fp.read()
+        sections = load_dxf_structure(
+            tag_compiler(binary_tags_loader(data, errors=errors)),
+            progress=progress,
+        )
+    else:
+        info = dxf_file_info(filename)
+        if encoding is not None:
+            # override default encodings if absolute necessary
+            info.encoding = encoding
+        if compression is not None:
+            with open_file(
+                filename, "rt", compression, encoding=info.encoding, errors=errors
+            ) as fp:
+                sections = load_dxf_structure(
+                    tag_compiler(ascii_tags_loader(fp)), progress=progress
+                )
+        else:
+            with open(
+                filename, mode="rt", encoding=info.encoding, errors=errors
+            ) as fp:
+                sections = load_dxf_structure(
+                    tag_compiler(ascii_tags_loader(fp)), progress=progress
+                )
+    sections.pop("THUMBNAILIMAGE", None)
+    return sections
+
+
 def dxf_file_info(filename: str | os.PathLike) -> DXFInfo:
     """Reads basic file information from a DXF document: DXF version, encoding
-    and handle seed.
+    and handle seed. Supports also compressed DXF files.
 
     """
+    from ezdxf.tools.compressedfile import detect_compression, open_file
+
     filename = str(filename)
-    with open(filename, mode="rt", encoding="utf-8", errors="ignore") as fp:
+    compression = detect_compression(filename)
+    with open_file(
+        filename, "rt", compression, encoding="utf-8", errors="ignore"
+    ) as fp:
         return dxf_stream_info(fp)
 
 
@@ -11,6 +11,10 @@ from typing import (
 import math
 import logging
 import warnings
+
+import numpy as np
+import numpy.typing as npt
+
 from ezdxf.lldxf import const
 from ezdxf.lldxf.const import DXFValueError, DXFVersionError, DXF2000, DXF2013
 from ezdxf.math import (
@@ -105,6 +109,57 @@ class CreatorInterface:
         self.add_entity(entity)  # type: ignore
         return entity  # type: ignore
 
+    def new_entities(
+        self, type_: str, dxfattribs: dict, columns: dict[str, Sequence]
+    ) -> list[DXFGraphic]:
+        """
+        Create multiple entities of the same DXF type in the drawing database
+        and add the entities to the entity space.
+
+        The common `dxfattribs` are validated only once, the `columns` dict
+        contains a sequence of values for each DXF attribute which differs for
+        each entity, all sequences must have the same length. The values of the
+        columns are not validated and have to be of the correct type like
+        :class:`~ezdxf.math.Vec3` for points and ``float`` for lengths.
+
+        Args:
+            type_ : DXF type string, like "LINE", "CIRCLE" or "POINT"
+            dxfattribs: common DXF attributes for all new entities
+            columns: DXF attribute values for each new entity
+
+        """
+        # the template entity validates the common DXF attributes:
+        template = factory.new(type_, dxfattribs=dxfattribs)
+        common_attribs = template.dxf.all_existing_dxf_attribs()
+        for key in ("handle", "owner"):
+            common_attribs.pop(key, None)
+        cls = type(template)
+        doc = self.doc
+        entitydb = doc.entitydb if doc else None
+        keys = list(columns.keys())
+        entities: list[DXFGraphic] = []
+        for values in zip(*columns.values(), strict=True):
+            entity = cls()
+            dxf = entity.dxf
+            for key, value in common_attribs.items():
+                dxf.unprotected_set(key, value)
+            for key, value in zip(keys, values):
+                dxf.unprotected_set(key, value)
+            if entitydb is not None:
+                # same as factory.bind(), new entities have no extension dict
+                entity.doc = doc
+                handle = entitydb.next_handle()
+                dxf.unprotected_set("handle", handle)
+                entitydb[handle] = entity
+                entity.post_bind_hook()
+            entities.append(entity)  # type: ignore
+        self.add_entities(entities)
+        return entities
+
+    def add_entities(self, entities: Sequence[DXFGraphic]) -> None:
+        for entity in entities:
+            self.add_entity(entity)
+
     def add_entity(self, entity: DXFGraphic) -> None:
         pass
 
@@ -136,6 +191,80 @@ class CreatorInterface:
         dxfattribs["end"] = Vec3(end)
         return self.new_entity("LINE", dxfattribs)  # type: ignore
 
+    def add_points(self, locations: npt.ArrayLike, dxfattribs=None) -> list[Point]:
+        """
+        Add multiple :class:`~ezdxf.entities.Point` entities at once, this is
+        much faster than adding the entities one by one.
+
+        Args:
+            locations: 2D/3D points in :ref:`WCS` as array-like object of
+                shape (n, 2) or (n, 3), e.g. a NumPy array
+            dxfattribs: common DXF attributes for all new entities
+
+        Raises:
+            DXFValueError: invalid array shape or invalid coordinates
+
+        """
+        columns = {"location": _vec3_column(locations)}
+        return self.new_entities("POINT", dict(dxfattribs or {}), columns)  # type: ignore
+
+    def add_lines(
+        self, starts: npt.ArrayLike, ends: npt.ArrayLike, dxfattribs=None
+    ) -> list[Line]:
+        """
+        Add multiple :class:`~ezdxf.entities.Line` entities at once, this is
+        much faster than adding the entities one by one.
+
+        Args:
+            starts: 2D/3D start points in :ref:`WCS` as array-like object of
+                shape (n, 2) or (n, 3), e.g. a NumPy array
+            ends: 2D/3D end points in :ref:`WCS` as array-like object of
+                shape (n, 2) or (n, 3), e.g. a NumPy array
+            dxfattribs: common DXF attributes for all new entities
+
+        Raises:
+            DXFValueError: invalid array shape, invalid coordinates or count of
+                start- and end points does not match
+
+        """
+        columns = {"start": _vec3_column(starts), "end": _vec3_column(ends)}
+        if len(columns["start"]) != len(columns["end"]):
+            raise DXFValueError("count of start- and end points does not match")
+        return self.new_entities("LINE", dict(dxfattribs or {}), columns)  # type: ignore
+
+    def add_circles(
+        self, centers: npt.ArrayLike, radii: npt.ArrayLike, dxfattribs=None
+    ) -> list[Circle]:
+        """
+        Add multiple :class:`~ezdxf.entities.Circle` entities at once, this is
+        much faster than adding the entities one by one.
+
+        Args:
+            centers: 2D/3D center points in :ref:`WCS` as array-like object of
+                shape (n, 2) or (n, 3), e.g. a NumPy array
+            radii: the radius of each circle as array-like object of shape (n,)
+                or a single radius for all circles
+            dxfattribs: common DXF attributes for all new entities
+
+        Raises:
+            DXFValueError: invalid array shape, invalid coordinates or radii or
+                count of centers and radii does not match
+
+        """
+        columns: dict[str, Sequence] = {"center": _vec3_column(centers)}
+        count = len(columns["center"])
+        try:
+            radius_column = np.broadcast_to(
+                np.asarray(radii, dtype=np.float64), (count,)
+            )
+        except ValueError:
+            raise DXFValueError("count of centers and radii does not match")
+        # also rejects NaN:
+        if not np.all((radius_column > 0.0) & np.isfinite(radius_column)):
+            raise DXFValueError("invalid radius, expected finite values > 0")
+        columns["radius"] = radius_column.tolist()
+        return self.new_entities("CIRCLE", dict(dxfattribs or {}), columns)  # type: ignore
+
     def add_circle(
         self, center: UVec, radius: float, dxfattribs=None
     ) -> Circle:
@@ -2683,3 +2812,18 @@ class CreatorInterface:
 
 
 LEADER_UNSUPPORTED_DIMSTYLE_ATTRIBS = {"dimblk", "dimblk1", "dimblk2"}
+
+
+def _vec3_column(points: npt.ArrayLike) -> list[Vec3]:
+    """Returns an array-like object of 2D/3D points as list of Vec3."""
+    vertices = np.asarray(points, dtype=np.float64)
+    if vertices.ndim == 1 and vertices.shape[0] == 0:  # no points
+        return []
+    if vertices.ndim != 2 or vertices.shape[1] not in (2, 3):
+        raise DXFValueError(
+            f"expected array of 2D/3D points of shape (n, 2) or (n, 3), "
+            f"got shape {vertices.shape}"
+        )
+    if not np.all(np.isfinite(vertices)):
+        raise DXFValueError("invalid coordinates, expected finite values")
+    return [Vec3(vertex) for vertex in vertices.tolist()]
@@ -1,7 +1,7 @@
 # Copyright (c) 2019-2023, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import TYPE_CHECKING, Iterator, Union, Iterable, Optional
+from typing import TYPE_CHECKING, Iterator, Union, Iterable, Optional, Sequence
 
 from ezdxf.entities import factory, is_graphic_entity, SortEntsTable
 from ezdxf.enums import InsertUnits
@@ -12,7 +12,7 @@ from ezdxf.lldxf.const import (
     LATEST_DXF_VERSION,
     DXFTypeError,
 )
-from ezdxf.query import EntityQuery
+from ezdxf.query import EntityQuery, plan_query, indexed_query
 from ezdxf.groupby import groupby
 from ezdxf.entitydb import EntityDB, EntitySpace
 from ezdxf.graphicsfactory import CreatorInterface
@@ -20,6 +20,7 @@ from ezdxf.graphicsfactory import CreatorInterface
 if TYPE_CHECKING:
     from ezdxf.entities import DXFGraphic, BlockRecord, ExtensionDict
     from ezdxf.eztypes import KeyFunc
+    from ezdxf.select import SpatialIndex
 
 SUPPORTED_FOREIGN_ENTITY_TYPES = {
     "ARC",
@@ -106,6 +107,27 @@ class BaseLayout(_AbstractLayout):
         self.entity_space = block_record.entity_space
         # This is the real central layout management structure:
         self.block_record: BlockRecord = block_record
+        # Persistent spatial search index, created on demand:
+        self._spatial_index: Optional[SpatialIndex] = None
+
+    def query(self, query: str = "*") -> EntityQuery:
+        """Get all DXF entities matching the :ref:`entity query string`.
+
+        Uses the attribute index of the entity database if the index exist,
+        see :meth:`ezdxf.entitydb.EntityDB.create_attribute_index`.
+        """
+        entitydb = self.doc.entitydb
+        index = entitydb.attribute_index
+        if index is not None and query != "*":
+            plan = plan_query(query, index)
+            # sorting a small count of candidates into the order of the layout
+            # is faster than scanning the layout:
+            if plan is not None and len(plan.handles) * 8 < len(self.entity_space):
+                candidates = self.entity_space.select(
+                    entitydb.get(handle) for handle in plan.handles  # type: ignore
+                )
+                return EntityQuery(filter(plan.match, candidates))
+        return indexed_query(iter(self), query, index)
 
     @property
     def block_record_handle(self):
@@ -208,6 +230,21 @@ class BaseLayout(_AbstractLayout):
             raise DXFTypeError(f"invalid entity {str(entity)}")
         self.block_record.add_entity(entity)
 
+    def add_entities(self, entities: Sequence[DXFGraphic]) -> None:
+        """Add multiple new :class:`DXFGraphic` entities of the same DXF
+        document to a layout. (internal API)
+        """
+        entitydb = self.doc.entitydb
+        for entity in entities:
+            handle = entity.dxf.handle
+            if handle is None or handle not in entitydb:
+                raise DXFStructureError(
+                    "Adding entities from a different DXF drawing is not supported."
+                )
+            if not is_graphic_entity(entity):
+                raise DXFTypeError(f"invalid entity {str(entity)}")
+        self.block_record.add_entities(entities)
+
     def add_foreign_entity(self, entity: DXFGraphic, copy=True) -> None:
         """Add a foreign DXF entity to a layout, this foreign entity could be
         from another DXF document or an entity without an assigned DXF document.
@@ -287,14 +324,35 @@ class BaseLayout(_AbstractLayout):
         """
         self.block_record.delete_entity(entity)
 
+    def unlink_entities(self, entities: Iterable[DXFGraphic]) -> None:
+        """Unlink multiple `entities` from layout in a single pass over the
+        layout entity space, does not delete the `entities` from the entity
+        database.
+
+        Raises:
+            ValueError: any of the `entities` is not in this layout, no entity
+                is unlinked in this case
+
+        """
+        self.block_record.unlink_entities(entities)
+
+    def delete_entities(self, entities: Iterable[DXFGraphic]) -> None:
+        """Delete multiple `entities` from layout entity space and the entity
+        database in a single pass over the layout entity space, this destroys
+        the `entities`.
+
+        Raises:
+            ValueError: any of the `entities` is not in this layout, no entity
+                is deleted in this case
+
+        """
+        self.block_record.delete_entities(entities)
+
     def delete_all_entities(self) -> None:
         """Delete all entities from this layout and from entity database,
         this destroys all entities in this layout.
         """
-        # Create list, because delete modifies the base data structure of
-        # the iterator:
-        for entity in list(self):
-            self.delete_entity(entity)
+        self.delete_entities(list(self))
 
     def move_to_layout(self, entity: DXFGraphic, layout: BaseLayout) -> None:
         """Move entity to another layout.
@@ -405,6 +463,19 @@ class BaseLayout(_AbstractLayout):
             return reorder.descending(self.entity_space, redraw_order)  # type: ignore
         return reorder.ascending(self.entity_space, redraw_order)  # type: ignore
 
+    def spatial_index(self) -> SpatialIndex:
+        """Returns the persistent 2D spatial search index of the entity bounding
+        boxes of this layout, see :class:`ezdxf.select.SpatialIndex`.
+
+        The index is created at the first call and updates itself incrementally by
+        the change journal of the entity database, which is started by the index.
+        """
+        if self._spatial_index is None:
+            from ezdxf.select import SpatialIndex
+
+            self._spatial_index = SpatialIndex(self)
+        return self._spatial_index
+
 
 class VirtualLayout(_AbstractLayout):
     """Helper class to disassemble complex entities into basic DXF
@@ -429,6 +500,9 @@ class VirtualLayout(_AbstractLayout):
     def add_entity(self, entity: DXFGraphic) -> None:
         self.entity_space.add(entity)
 
+    def add_entities(self, entities: Sequence[DXFGraphic]) -> None:
+        self.entity_space.extend(entities)
+
     def new_entity(self, type_: str, dxfattribs: dict) -> DXFGraphic:
         entity = factory.new(type_, dxfattribs=dxfattribs)
         self.entity_space.add(entity)
@@ -440,6 +514,12 @@ class VirtualLayout(_AbstractLayout):
     def delete_entity(self, entity: DXFGraphic) -> None:
         self.entity_space.remove(entity)
 
+    def unlink_entities(self, entities: Iterable[DXFGraphic]) -> None:
+        self.entity_space.remove_entities(entities)
+
+    def delete_entities(self, entities: Iterable[DXFGraphic]) -> None:
+        self.entity_space.remove_entities(entities)
+
     def delete_all_entities(self) -> None:
         self.entity_space.clear()
 
@@ -1,11 +1,32 @@
-# Copyright (c) 2020-2022, Manfred Moitzi
+# Copyright (c) 2020-2026, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import Iterable, NamedTuple, BinaryIO
+from typing import Iterable, Iterator, NamedTuple, BinaryIO, Optional, TYPE_CHECKING
+from array import array
+import io
+import logging
+import marshal
+import os
+import re
+import sys
 
 from .const import DXFStructureError
+from .tagger import (
+    BINARY_DXF_SIGNATURE,
+    binary_stream_tags_locator,
+    binary_chunk_tags_locator,
+    ascii_bytes_tags_loader,
+    scan_binary_dxf_params,
+    tag_compiler,
+)
+from .tags import group_tags
 from ezdxf.tools.codepage import toencoding
 
+if TYPE_CHECKING:
+    from ezdxf.entities import DXFEntity
+
+logger = logging.getLogger("ezdxf")
+
 
 class IndexEntry(NamedTuple):
     code: int
@@ -23,7 +44,7 @@ class FileStructure:
         - code: group code
         - value: tag value as string
         - location: file location as int
-        - line: line number as int
+        - line: line number as int, 0 for binary DXF files
 
     Indexed tags:
 
@@ -41,6 +62,8 @@ class FileStructure:
         self.version: str = "AC1009"
         # Python encoding required to read the DXF document as text file.
         self.encoding: str = "cp1252"
+        # True for binary DXF files
+        self.binary: bool = False
         self.index: list[IndexEntry] = []
 
     def print(self) -> None:
@@ -77,6 +100,7 @@ class FileStructure:
 
 def load(filename: str) -> FileStructure:
     """Load DXF file structure for file `filename`, the file has to be seekable.
+    Supports ASCII and binary DXF files.
 
     Args:
         filename: file system file name
@@ -85,6 +109,10 @@ def load(filename: str) -> FileStructure:
         DXFStructureError: Invalid or incomplete DXF file.
 
     """
+    with open(filename, mode="rb") as fp:
+        binary = fp.read(22) == BINARY_DXF_SIGNATURE
+    if binary:
+        return load_binary(filename)
     file_structure = FileStructure(filename)
     file: BinaryIO = open(filename, mode="rb")
     line: int = 1
@@ -156,3 +184,663 @@ def load(filename: str) -> FileStructure:
         file_structure.encoding = "utf-8"
     file_structure.index = index
     return file_structure
+
+
+def load_binary(filename: str) -> FileStructure:
+    """Load DXF file structure for the binary DXF file `filename`, the file is
+    loaded in chunks and has to be seekable.
+
+    Args:
+        filename: file system file name
+
+    Raises:
+        DXFStructureError: Invalid or incomplete DXF file.
+
+    """
+    file_structure = FileStructure(filename)
+    file_structure.binary = True
+    eof: bool = False
+    index: list[IndexEntry] = []
+    prev_code: int = -1
+    prev_value: str = ""
+    structure = None  # the current structure tag: 'SECTION', 'LINE', ...
+
+    with open(filename, mode="rb") as file:
+        encoding, version = scan_binary_dxf_params(file.read(1024))
+        file.seek(0)
+        file_structure.encoding = encoding
+        file_structure.version = version
+        for location, tag in binary_stream_tags_locator(file):
+            code = tag.code
+            value = tag.value
+            if code == 0:
+                # All structure tags have group code == 0, store file location
+                structure = value
+                index.append(IndexEntry(0, value, location, 0))
+                if value == "EOF":
+                    eof = True
+                    break
+
+            elif code == 2 and prev_code == 0 and prev_value == "SECTION":
+                # Section name is the tag (2, name) following the (0, SECTION) tag.
+                index.append(IndexEntry(2, value, location, 0))
+
+            elif code == 5 and structure != "DIMSTYLE":
+                # Entity handles have always group code 5.
+                index.append(IndexEntry(5, value, location, 0))
+
+            elif code == 105 and structure == "DIMSTYLE":
+                # Except the DIMSTYLE table entry has group code 105.
+                index.append(IndexEntry(5, value, location, 0))
+
+            prev_code = code
+            prev_value = value
+
+    if not eof:
+        raise DXFStructureError(f"Unexpected end of file.")
+    file_structure.index = index
+    return file_structure
+
+
+class EntityLocation(NamedTuple):
+    """Location and basic attributes of a DXF entity in a DXF file."""
+
+    offset: int  # file location of the (0, DXFTYPE) structure tag
+    length: int  # size in bytes, includes linked sub-entities of POLYLINE and INSERT
+    dxftype: str
+    layer: str  # empty string if the entity has no layer attribute
+    owner: str  # empty string if the entity has no owner handle
+
+
+ENTITY_INDEX_MAGIC = b"EZDXFEI" + bytes([2])
+# Fixed size array types of the persistent entity index, stored in little endian
+# byte order: file locations as signed 64-bit ints and string ids as unsigned
+# 32-bit ints.
+_LOCATION_TYPE = "q"
+_STRING_ID_TYPE = "I"
+INDEX_CHUNK_SIZE = 16 * 1024 * 1024
+# count of bytes to parse for the basic attributes of an entity
+_HEAD_SIZE = 4096
+# max. count of tags to parse for the basic attributes of an entity
+_HEAD_TAGS = 32
+# structure tags without a handle
+_NOT_INDEXED = {"SECTION", "ENDSEC", "ENDTAB", "EOF"}
+# subclass markers which do not end the search for the basic attributes
+_BASIC_SUBCLASSES = {"AcDbEntity", "AcDbBlockBegin"}
+# matches all lines which contain just a "0", the group code of structure tags
+_STRUCTURE_CODE = re.compile(rb"^[ \t]*0\r?$", re.MULTILINE)
+_ACADVER = re.compile(rb"\$ACADVER\r?\n[ \t]*1\r?\n([^\r\n]*)")
+_DWGCODEPAGE = re.compile(rb"\$DWGCODEPAGE\r?\n[ \t]*3\r?\n([^\r\n]*)")
+
+
+class EntityIndex:
+    """Index of all DXF entities of a DXF file by handle, provides random access
+    to single entities and block definitions of huge DXF files without loading
+    the whole file.
+
+    The index maps the handle of each entity to an :class:`EntityLocation`,
+    the DXF type, layer and owner handle are stored as indices into a string
+    table to keep the memory footprint small. The index is built by the
+    function :func:`build_entity_index` and can be stored persistently by
+    :meth:`save`.
+
+    The loaded entities are virtual entities without an assigned DXF document,
+    like the entities loaded by the :mod:`~ezdxf.addons.iterdxf` add-on.
+
+    """
+
+    def __init__(self, filename: str):
+        # stores the file system name of the DXF document.
+        self.filename: str = filename
+        # DXF version if header variable $ACADVER is present, default is DXFR12
+        self.version: str = "AC1009"
+        # Python encoding required to decode the strings of the DXF document.
+        self.encoding: str = "cp1252"
+        # True for binary DXF files
+        self.binary: bool = False
+        # modification time and size of the indexed DXF file
+        self.source_mtime_ns: int = 0
+        self.source_size: int = 0
+        # block definitions: block name -> (offset, length) of BLOCK ... ENDBLK
+        self.blocks: dict[str, tuple[int, int]] = dict()
+        self._rows: dict[str, int] = dict()
+        self._offsets = array(_LOCATION_TYPE)
+        self._lengths = array(_LOCATION_TYPE)
+        self._strings: list[str] = []
+        self._string_ids: dict[str, int] = dict()
+        self._dxftypes = array(_STRING_ID_TYPE)
+        self._layers = array(_STRING_ID_TYPE)
+        self._owners = array(_STRING_ID_TYPE)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, handle: str) -> bool:
+        return handle in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        """Returns an iterator of all indexed handles in file order."""
+        return iter(self._rows)
+
+    def __getitem__(self, handle: str) -> EntityLocation:
+        """Returns the :class:`EntityLocation` of the entity `handle`, raises
+        :class:`KeyError` if `handle` does not exist.
+        """
+        return self._location(self._rows[handle])
+
+    def get(
+        self, handle: str, default: Optional[EntityLocation] = None
+    ) -> Optional[EntityLocation]:
+        """Returns the :class:`EntityLocation` of the entity `handle` or
+        `default` if `handle` does not exist.
+        """
+        row = self._rows.get(handle)
+        if row is None:
+            return default
+        return self._location(row)
+
+    def _location(self, row: int) -> EntityLocation:
+        strings = self._strings
+        return EntityLocation(
+            self._offsets[row],
+            self._lengths[row],
+            strings[self._dxftypes[row]],
+            strings[self._layers[row]],
+            strings[self._owners[row]],
+        )
+
+    def _string_id(self, s: str) -> int:
+        index = self._string_ids.get(s)
+        if index is None:
+            index = len(self._strings)
+            self._strings.append(s)
+            self._string_ids[s] = index
+        return index
+
+    def _add(
+        self, handle: str, offset: int, length: int, dxftype: str, layer: str, owner: str
+    ) -> int:
+        row = len(self._offsets)
+        self._rows[handle] = row
+        self._offsets.append(offset)
+        self._lengths.append(length)
+        string_id = self._string_id
+        self._dxftypes.append(string_id(dxftype))
+        self._layers.append(string_id(layer))
+        self._owners.append(string_id(owner))
+        return row
+
+    def select(
+        self,
+        dxftype: Optional[str] = None,
+        layer: Optional[str] = None,
+        owner: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yields the handles of all entities matching the given DXF type,
+        layer name and owner handle in file order, ``None`` matches all values.
+        The comparison is case-sensitive.
+        """
+        string_ids = self._string_ids
+        columns = []
+        for value, column in (
+            (dxftype, self._dxftypes),
+            (layer, self._layers),
+            (owner, self._owners),
+        ):
+            if value is not None:
+                if value not in string_ids:
+                    return
+                columns.append((string_ids[value], column))
+        for handle, row in self._rows.items():
+            if all(column[row] == value_id for value_id, column in columns):
+                yield handle
+
+    def is_up_to_date(self) -> bool:
+        """Returns ``True`` if the indexed DXF file was not modified since the
+        index was built.
+        """
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return False
+        return (
+            stat.st_mtime_ns == self.source_mtime_ns
+            and stat.st_size == self.source_size
+        )
+
+    def read_data(self, offset: int, length: int) -> bytes:
+        """Returns `length` bytes of the indexed DXF file starting at file
+        location `offset`.
+        """
+        with open(self.filename, "rb") as fp:
+            fp.seek(offset)
+            return fp.read(length)
+
+    def load_entity(self, handle: str) -> DXFEntity:
+        """Load the entity `handle` from the indexed DXF file, linked
+        sub-entities like VERTEX, ATTRIB and SEQEND are loaded and linked to
+        their main entity. Raises :class:`KeyError` if `handle` does not exist.
+        """
+        return self.load_entities([handle])[handle]
+
+    def load_entities(self, handles: Iterable[str]) -> dict[str, DXFEntity]:
+        """Load the entities `handles` from the indexed DXF file in file order,
+        returns a dict of the loaded entities by handle. Raises
+        :class:`KeyError` if a handle does not exist.
+        """
+        rows = sorted(self._rows[handle] for handle in handles)
+        offsets = self._offsets
+        lengths = self._lengths
+        result: dict[str, DXFEntity] = dict()
+        with open(self.filename, "rb") as fp:
+            for row in rows:
+                fp.seek(offsets[row])
+                entities = self._load_data(fp.read(lengths[row]))
+                if entities:
+                    entity = entities[0]
+                    result[entity.dxf.handle] = entity
+        return result
+
+    def load_block(self, name: str) -> list[DXFEntity]:
+        """Load the definition of block `name` from the indexed DXF file,
+        returns the BLOCK entity, the block content and the ENDBLK entity as
+        list. Raises :class:`KeyError` if block `name` does not exist, the
+        block name is case-sensitive.
+        """
+        offset, length = self.blocks[name]
+        return self._load_data(self.read_data(offset, length))
+
+    def _load_data(self, data: bytes) -> list[DXFEntity]:
+        from ezdxf.entities import factory
+        from ezdxf.entities.subentity import entity_linker
+        from .extendedtags import ExtendedTags
+
+        if self.binary:
+            located_tags = binary_chunk_tags_locator(
+                _no_data,
+                data,
+                r12=self.version <= "AC1009",
+                encoding=self.encoding,
+            )
+            tags = tag_compiler(tag for _, tag in located_tags)
+        else:
+            tags = tag_compiler(
+                ascii_bytes_tags_loader(io.BytesIO(data), encoding=self.encoding)
+            )
+        link_entity = entity_linker()
+        entities: list[DXFEntity] = []
+        for entity_tags in group_tags(tags):
+            entity = factory.load(ExtendedTags(entity_tags))
+            if not link_entity(entity):
+                entities.append(entity)
+        return entities
+
+    def save(self, filename: str | os.PathLike) -> None:
+        """Store the entity index persistently in file `filename`."""
+        data = marshal.dumps(
+            (
+                self.filename,
+                self.source_mtime_ns,
+                self.source_size,
+                self.version,
+                self.encoding,
+                self.binary,
+                tuple(self._rows),
+                _to_bytes(self._offsets),
+                _to_bytes(self._lengths),
+                tuple(self._strings),
+                _to_bytes(self._dxftypes),
+                _to_bytes(self._layers),
+                _to_bytes(self._owners),
+                tuple(self.blocks.items()),
+            )
+        )
+        tmp_path = os.fspath(filename) + ".tmp"
+        with open(tmp_path, "wb") as fp:
+            fp.write(ENTITY_INDEX_MAGIC)
+            fp.write(data)
+        os.replace(tmp_path, filename)
+
+
+def _no_data(size: int) -> bytes:
+    return b""
+
+
+def _to_bytes(values: array) -> bytes:
+    """Returns the content of array `values` in little endian byte order."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(values: array, data: bytes) -> None:
+    """Appends the little endian encoded `data` to the array `values`."""
+    if len(data) % values.itemsize:
+        raise ValueError("invalid array data")
+    if sys.byteorder == "big":
+        swapped = array(values.typecode, data)
+        swapped.byteswap()
+        values.extend(swapped)
+    else:
+        values.frombytes(data)
+
+
+def load_entity_index(filename: str | os.PathLike) -> EntityIndex:
+    """Load an :class:`EntityIndex` stored by :meth:`EntityIndex.save`.
+
+    Raises:
+        IOError: file does not exist or is not readable
+        ValueError: file is not a valid entity index file
+
+    """
+    with open(filename, "rb") as fp:
+        data = fp.read()
+    if not data.startswith(ENTITY_INDEX_MAGIC):
+        raise ValueError(f"'{filename}' is not an entity index file")
+    try:
+        (
+            source,
+            mtime_ns,
+            size,
+            version,
+            encoding,
+            binary,
+            handles,
+            offsets,
+            lengths,
+            strings,
+            dxftypes,
+            layers,
+            owners,
+            blocks,
+        ) = marshal.loads(data[len(ENTITY_INDEX_MAGIC) :])
+    except (ValueError, EOFError, TypeError):
+        raise ValueError(f"invalid entity index file '{filename}'")
+    index = EntityIndex(source)
+    index.source_mtime_ns = mtime_ns
+    index.source_size = size
+    index.version = version
+    index.encoding = encoding
+    index.binary = binary
+    index.blocks = dict(blocks)
+    index._rows = {handle: row for row, handle in enumerate(handles)}
+    index._strings = list(strings)
+    index._string_ids = {s: i for i, s in enumerate(strings)}
+    try:
+        _from_bytes(index._offsets, offsets)
+        _from_bytes(index._lengths, lengths)
+        _from_bytes(index._dxftypes, dxftypes)
+        _from_bytes(index._layers, layers)
+        _from_bytes(index._owners, owners)
+    except (ValueError, TypeError):
+        raise ValueError(f"invalid entity index file '{filename}'")
+    count = len(index._rows)
+    if any(
+        len(column) != count
+        for column in (
+            index._offsets,
+            index._lengths,
+            index._dxftypes,
+            index._layers,
+            index._owners,
+        )
+    ):
+        raise ValueError(f"invalid entity index file '{filename}'")
+    return index
+
+
+def open_entity_index(
+    filename: str | os.PathLike, index_filename: str | os.PathLike
+) -> EntityIndex:
+    """Returns the :class:`EntityIndex` of the DXF file `filename`. Loads the
+    index from the file `index_filename` if the stored index is up-to-date,
+    otherwise the index is rebuilt and stored in `index_filename`.
+    """
+    filename = os.path.abspath(os.fspath(filename))
+    try:
+        index = load_entity_index(index_filename)
+    except (IOError, ValueError):
+        pass
+    else:
+        if index.filename == filename and index.is_up_to_date():
+            return index
+    index = build_entity_index(filename)
+    try:
+        index.save(index_filename)
+    except IOError as e:
+        logger.info(f"cannot store entity index '{index_filename}': {str(e)}")
+    return index
+
+
+class _EntityIndexBuilder:
+    def __init__(self, index: EntityIndex):
+        self.index = index
+        self.main_row = -1  # POLYLINE or INSERT with following sub-entities
+        self.block_name = ""
+        self.block_offset = 0
+
+    def add(
+        self,
+        offset: int,
+        end: int,
+        dxftype: str,
+        handle: str,
+        layer: str,
+        owner: str,
+        name: str,
+    ) -> None:
+        index = self.index
+        length = end - offset
+        if dxftype == "BLOCK":
+            self.block_name = name
+            self.block_offset = offset
+        elif dxftype == "ENDBLK" and self.block_name:
+            index.blocks[self.block_name] = (
+                self.block_offset,
+                end - self.block_offset,
+            )
+            self.block_name = ""
+        row = -1
+        if handle:
+            row = index._add(handle, offset, length, dxftype, layer, owner)
+
+        # The index entry of a main entity includes the linked sub-entities:
+        if dxftype == "POLYLINE" or dxftype == "INSERT":
+            self.main_row = row
+        elif dxftype == "SEQEND":
+            if self.main_row >= 0:
+                lengths = index._lengths
+                main_row = self.main_row
+                lengths[main_row] = end - index._offsets[main_row]
+            self.main_row = -1
+        elif dxftype != "VERTEX" and dxftype != "ATTRIB":
+            self.main_row = -1
+
+
+def build_entity_index(filename: str | os.PathLike) -> EntityIndex:
+    """Build the :class:`EntityIndex` of the DXF file `filename` in a single
+    pass. ASCII DXF files are scanned in chunks of :attr:`INDEX_CHUNK_SIZE`
+    bytes and only the first tags of each entity are parsed. Supports ASCII
+    and binary DXF files.
+
+    Raises:
+        DXFStructureError: Invalid or incomplete DXF file.
+
+    """
+    filename = os.path.abspath(os.fspath(filename))
+    index = EntityIndex(filename)
+    stat = os.stat(filename)
+    index.source_mtime_ns = stat.st_mtime_ns
+    index.source_size = stat.st_size
+    with open(filename, mode="rb") as fp:
+        index.binary = fp.read(22) == BINARY_DXF_SIGNATURE
+        fp.seek(0)
+        if index.binary:
+            eof = _scan_binary_entities(fp, index)
+        else:
+            eof = _scan_ascii_entities(fp, index)
+    if not eof:
+        raise DXFStructureError(f"Unexpected end of file.")
+    return index
+
+
+def _scan_ascii_entities(fp: BinaryIO, index: EntityIndex) -> bool:
+    builder = _EntityIndexBuilder(index)
+    buffer = b""
+    base = 0  # file location of buffer[0], is always the start of a code line
+    while True:
+        data = fp.read(INDEX_CHUNK_SIZE)
+        buffer += data
+        starts: list[int] = []
+        lines = 0
+        last = 0
+        count = buffer.count
+        for match in _STRUCTURE_CODE.finditer(buffer):
+            pos = match.start()
+            lines += count(b"\n", last, pos)
+            last = pos
+            if not (lines & 1):  # group code line
+                starts.append(pos)
+        if data:
+            # The last structure entity is incomplete and will be processed
+            # with the next chunk:
+            ends = starts[1:]
+        else:
+            ends = starts[1:] + [len(buffer)]
+        for start, end in zip(starts, ends):
+            if _index_ascii_entity(buffer, start, end, base, builder):
+                return True  # EOF
+        if not data:
+            return False
+        if len(starts) > 1:
+            last_start = starts[len(ends)]
+            buffer = buffer[last_start:]
+            base += last_start
+
+
+def _index_ascii_entity(
+    buffer: bytes, start: int, end: int, base: int, builder: _EntityIndexBuilder
+) -> bool:
+    index = builder.index
+    lines = buffer[start : min(end, start + _HEAD_SIZE)].split(
+        b"\n", _HEAD_TAGS * 2 + 1
+    )
+    if len(lines) < 2:
+        return False
+    dxftype = lines[1].strip().decode(index.encoding, errors="ignore")
+    if dxftype in _NOT_INDEXED:
+        if dxftype == "SECTION" and len(lines) > 3 and lines[3].strip() == b"HEADER":
+            _scan_ascii_header(buffer[start:end], index)
+        return dxftype == "EOF"
+
+    encoding = index.encoding
+    r12 = index.version <= "AC1009"
+    is_block = dxftype == "BLOCK"
+    handle_code = 105 if dxftype == "DIMSTYLE" else 5
+    handle = layer = owner = name = ""
+    inside_app_data = False
+    # The last line is empty or may be incomplete:
+    count = len(lines) - 1
+    for i in range(2, count - 1, 2):
+        try:
+            code = int(lines[i])
+        except ValueError:
+            raise DXFStructureError(
+                f"Invalid group code at file location {base + start}."
+            )
+        value = lines[i + 1].rstrip(b"\r")
+        if code == 102:
+            inside_app_data = value.startswith(b"{")
+            continue
+        if inside_app_data:
+            continue
+        if code == handle_code:
+            handle = value.decode(encoding, errors="ignore")
+        elif code == 330:
+            if not owner:
+                owner = value.decode(encoding, errors="ignore")
+        elif code == 8:
+            layer = value.decode(encoding, errors="surrogateescape")
+        elif code == 2:
+            if is_block and not name:
+                name = value.decode(encoding, errors="surrogateescape")
+        elif code == 100:
+            if handle and value.decode(encoding) not in _BASIC_SUBCLASSES:
+                break
+        elif code == 1001:  # XDATA
+            break
+        if handle and layer and (owner or r12) and (name or not is_block):
+            break
+    builder.add(base + start, base + end, dxftype, handle, layer, owner, name)
+    return False
+
+
+def _scan_ascii_header(data: bytes, index: EntityIndex) -> None:
+    match = _ACADVER.search(data)
+    if match:
+        index.version = match.group(1).strip().decode(errors="ignore")
+    match = _DWGCODEPAGE.search(data)
+    if match:
+        index.encoding = toencoding(match.group(1).strip().decode(errors="ignore"))
+    if index.version >= "AC1021":  # R2007 and later
+        index.encoding = "utf-8"
+
+
+def _scan_binary_entities(fp: BinaryIO, index: EntityIndex) -> bool:
+    builder = _EntityIndexBuilder(index)
+    encoding, version = scan_binary_dxf_params(fp.read(1024))
+    fp.seek(0)
+    index.encoding = encoding
+    index.version = version
+    r12 = version <= "AC1009"
+    offset = -1
+    dxftype = handle = layer = owner = name = ""
+    handle_code = 5
+    tag_count = 0
+    inside_app_data = False
+    for location, tag in binary_stream_tags_locator(fp):
+        code = tag.code
+        if code == 0:
+            if offset >= 0 and dxftype not in _NOT_INDEXED:
+                builder.add(offset, location, dxftype, handle, layer, owner, name)
+            dxftype = tag.value
+            if dxftype == "EOF":
+                return True
+            offset = location
+            handle = layer = owner = name = ""
+            handle_code = 105 if dxftype == "DIMSTYLE" else 5
+            tag_count = 0
+            inside_app_data = False
+            continue
+        tag_count += 1
+        if tag_count > _HEAD_TAGS:
+            continue
+        value = tag.value
+        if code == 102:
+            inside_app_data = value.startswith("{")
+        elif inside_app_data:
+            continue
+        elif code == handle_code:
+            handle = value
+        elif code == 330:
+            if not owner:
+                owner = value
+        elif code == 8:
+            layer = value
+        elif code == 2:
+            if dxftype == "BLOCK" and not name:
+                name = value
+        elif code == 100:
+            if handle and value not in _BASIC_SUBCLASSES:
+                tag_count = _HEAD_TAGS
+        elif code == 1001:  # XDATA
+            tag_count = _HEAD_TAGS
+        if (
+            handle
+            and layer
+            and (owner or r12)
+            and (name or dxftype != "BLOCK")
+        ):
+            tag_count = _HEAD_TAGS
+    return False
@@ -2,13 +2,18 @@
 # License: MIT License
 from __future__ import annotations
 import logging
-from typing import Iterable, TYPE_CHECKING, Optional
+import re
+from typing import Iterable, Iterator, TYPE_CHECKING, Optional, Callable, cast
 from collections import OrderedDict
+import functools
+import fnmatch
 
+from . import const
 from .const import DXFStructureError
 from .tags import group_tags, DXFTag, Tags
 from .extendedtags import ExtendedTags
 from ezdxf.entities import factory
+from ezdxf.entities.subentity import entity_linker, LINKED_ENTITIES
 
 if TYPE_CHECKING:
     from ezdxf.document import Drawing
@@ -18,8 +23,20 @@ if TYPE_CHECKING:
 logger = logging.getLogger("ezdxf")
 
 
+# Type of the progress function, the function gets the name of the current
+# section, the count of processed DXF structure entities and the total count of
+# entities of this section or 0 if the total count is unknown. The progress
+# function can raise an exception to abort the loading process.
+ProgressFunc = Callable[[str, int, int], None]
+
+# Count of DXF structure entities between two calls of the progress function.
+PROGRESS_INTERVAL = 1000
+
+
 def load_dxf_structure(
-    tagger: Iterable[DXFTag], ignore_missing_eof: bool = False
+    tagger: Iterable[DXFTag],
+    ignore_missing_eof: bool = False,
+    progress: Optional[ProgressFunc] = None,
 ) -> SectionDict:
     """Divide input tag stream from tagger into DXF structure entities.
     Each DXF structure entity starts with a DXF structure (0, ...) tag,
@@ -64,11 +81,52 @@ def load_dxf_structure(
         tagger: generates DXFTag() entities from input data
         ignore_missing_eof: raises DXFStructureError() if False and EOF tag is
             not present, set to True only in tests
+        progress: progress function, see :data:`ProgressFunc`, the total count
+            of entities is unknown in this stage
 
     Returns:
         dict of sections, each section is a list of DXF structure entities
         as Tags() objects
 
+    """
+    entities: Iterable[Tags] = group_tags(tagger)
+    if progress is not None:
+        entities = _report_loading_progress(entities, progress)
+    return build_dxf_structure(entities, ignore_missing_eof)
+
+
+def _report_loading_progress(
+    entities: Iterable[Tags], progress: ProgressFunc
+) -> Iterator[Tags]:
+    name = ""
+    count = 0
+    for entity in entities:
+        tag = entity[0]
+        if tag == (0, "SECTION") and len(entity) > 1:
+            name = str(entity[1].value)
+            count = 0
+        elif tag == (0, "ENDSEC") and name:
+            progress(name, count, 0)
+            name = ""
+        yield entity
+        if name:
+            count += 1
+            if count % PROGRESS_INTERVAL == 0:
+                progress(name, count, 0)
+
+
+def build_dxf_structure(
+    entities: Iterable[Tags], ignore_missing_eof: bool = False
+) -> SectionDict:
+    """Divide the DXF structure entities into sections, see
+    :func:`load_dxf_structure` for more information.
+
+    Args:
+        entities: DXF structure entities as Tags() objects, each entity starts
+            with a DXF structure (0, ...) tag
+        ignore_missing_eof: raises DXFStructureError() if False and EOF tag is
+            not present, set to True only in tests
+
     """
 
     def inside_section() -> bool:
@@ -88,7 +146,7 @@ def load_dxf_structure(
     # DXF file, to load messy DXF files exist an (future) add-on
     # called 'recover'.
 
-    for entity in group_tags(tagger):
+    for entity in entities:
         tag = entity[0]
         if tag == (0, "SECTION"):
             if inside_section():
@@ -138,19 +196,418 @@ def load_dxf_entities(
         yield factory.load(ExtendedTags(entity), doc)
 
 
-def load_and_bind_dxf_content(sections: dict, doc: Drawing) -> None:
+# Type of the prefilter function for the lazy loading mode, the function gets
+# the DXF type and the layer name of an entity and returns False to skip the
+# entity.
+PrefilterFunc = Callable[[str, str], bool]
+
+
+class UnloadedEntity:
+    """The compiled DXF tags of an entity of the ENTITIES section and of its
+    linked sub-entities (VERTEX, ATTRIB, SEQEND) for the lazy loading mode.
+
+    The basic attributes are extracted from the DXF tags without loading the
+    entity.
+
+    """
+
+    __slots__ = (
+        "dxftype",
+        "handle",
+        "layer",
+        "owner",
+        "paperspace",
+        "seqend_handle",
+        "tags",
+    )
+
+    def __init__(self, tags: list[Tags]):
+        self.tags = tags
+        main = tags[0]
+        self.dxftype: str = main[0].value
+        self.handle: Optional[str] = None
+        self.layer: str = "0"
+        self.owner: Optional[str] = None
+        self.paperspace: int = 0
+        # reserved handle of the SEQEND entity created by the loading process
+        # of INSERT and POLYLINE entities:
+        self.seqend_handle: Optional[str] = None
+        inside_app_data = False
+        for code, value in main:
+            if code == 102:
+                inside_app_data = value.startswith("{")
+            elif inside_app_data:
+                continue
+            elif code == 5:
+                self.handle = value
+            elif code == 330:
+                if self.owner is None:
+                    self.owner = value
+            elif code == 8:
+                self.layer = value
+            elif code == 67:
+                self.paperspace = value
+            elif code == 1001:  # XDATA
+                break
+
+    def handles(self) -> list[str]:
+        """Returns the handles of the entity and all linked sub-entities,
+        raises :class:`DXFValueError` if any entity has no handle.
+        """
+        return [tags.get_handle() for tags in self.tags]
+
+    def copy(self) -> UnloadedEntity:
+        """Returns a copy which shares the compiled DXF tags."""
+        entity = UnloadedEntity.__new__(UnloadedEntity)
+        entity.tags = self.tags
+        entity.dxftype = self.dxftype
+        entity.handle = self.handle
+        entity.layer = self.layer
+        entity.owner = self.owner
+        entity.paperspace = self.paperspace
+        entity.seqend_handle = None
+        return entity
+
+
+class LoadFilter:
+    """Selective loading of layout entities by DXF type, layer and layout.
+
+    The filter is applied to the compiled DXF tags of the layout entities,
+    rejected entities are removed before the DXF entities are created.
+    The content of the TABLES, BLOCKS and OBJECTS sections is preserved, only
+    entities of the ENTITIES section and the content of the paperspace layout
+    blocks in the BLOCKS section are filtered. Linked sub-entities like VERTEX,
+    ATTRIB and SEQEND and the objects owned by an entity, like the extension
+    dictionary, share the fate of their main entity. The VIEWPORT entities of
+    the paperspace layouts are always loaded.
+
+    Each argument is an iterable of names or ``None`` to accept all names.
+
+    Args:
+        types: accepted DXF types, e.g. ["LWPOLYLINE", "HATCH"]
+        layers: accepted layer names, supports shell-style wildcards like
+            "WALL*", case-insensitive
+        layouts: accepted layout names, "Model" for the modelspace,
+            case-insensitive
+
+    """
+
+    def __init__(
+        self,
+        types: Optional[Iterable[str]] = None,
+        layers: Optional[Iterable[str]] = None,
+        layouts: Optional[Iterable[str]] = None,
+    ):
+        self.types: Optional[frozenset[str]] = None
+        self.layers: Optional[re.Pattern] = None
+        self.layouts: Optional[frozenset[str]] = None
+        if types is not None:
+            self.types = frozenset(dxftype.upper() for dxftype in types)
+        if layers is not None:
+            patterns = [fnmatch.translate(layer) for layer in layers]
+            # an empty pattern list rejects all layers:
+            self.layers = re.compile("|".join(patterns) or "(?!)", re.IGNORECASE)
+        if layouts is not None:
+            self.layouts = frozenset(name.lower() for name in layouts)
+
+    def accept(self, dxftype: str, layer: str, layout: str) -> bool:
+        """Returns ``True`` if the entity of type `dxftype` on layer `layer`
+        located in the layout `layout` should be loaded.
+        """
+        if self.types is not None and dxftype not in self.types:
+            return False
+        if self.layouts is not None and layout.lower() not in self.layouts:
+            return False
+        if self.layers is not None and not self.layers.match(layer):
+            return False
+        return True
+
+
+def filter_layout_entities(sections: SectionDict, load_filter: LoadFilter) -> None:
+    """Removes the compiled DXF tags of all layout entities rejected by the
+    `load_filter` from the ENTITIES and the BLOCKS section. This function has
+    to be called before the DXF entities are loaded.
+
+    The VIEWPORT entities of the paperspace layouts are always preserved.
+    The objects of the OBJECTS section owned by removed entities, like the
+    extension dictionaries and their content, are removed too.
+    """
+    layouts_by_handle, layouts_by_block_name = _layout_names(sections)
+    active_paperspace = layouts_by_block_name.get("*PAPER_SPACE", "Layout1")
+    removed_handles: set[str] = set()
+
+    def accept(entity: UnloadedEntity, layout: str) -> bool:
+        if entity.dxftype == "VIEWPORT":
+            # required by the paperspace layouts
+            return True
+        if entity.owner is not None:
+            layout = layouts_by_handle.get(entity.owner, layout)
+        return load_filter.accept(entity.dxftype, entity.layer, layout)
+
+    def filter_entities(entities: list[Tags], layout: str) -> Iterator[Tags]:
+        for group in group_linked_entities(entities):
+            entity = UnloadedEntity(group)
+            if entity.paperspace and layout == "Model":
+                entity_layout = active_paperspace
+            else:
+                entity_layout = layout
+            if accept(entity, entity_layout):
+                yield from group
+            else:
+                removed_handles.update(
+                    str(tags.get_first_value(5, "")) for tags in group
+                )
+
+    section = cast("list[Tags]", sections.get("ENTITIES"))
+    if section:
+        section[1:] = list(filter_entities(section[1:], "Model"))
+
+    section = cast("list[Tags]", sections.get("BLOCKS"))
+    if section:
+        content: list[Tags] = section[:1]
+        block_content: list[Tags] = []
+        layout: Optional[str] = None
+        for tags in section[1:]:
+            dxftype = tags[0].value
+            if dxftype == "BLOCK":
+                layout = layouts_by_block_name.get(
+                    str(tags.get_first_value(2, "")).upper()
+                )
+                content.append(tags)
+            elif dxftype == "ENDBLK":
+                if layout is not None:
+                    content.extend(filter_entities(block_content, layout))
+                    block_content = []
+                layout = None
+                content.append(tags)
+            elif layout is None:
+                content.append(tags)
+            else:
+                block_content.append(tags)
+        if layout is not None:  # missing ENDBLK
+            content.extend(filter_entities(block_content, layout))
+        section[:] = content
+
+    section = cast("list[Tags]", sections.get("OBJECTS"))
+    removed_handles.discard("")  # entities without handle
+    if section and removed_handles:
+        section[1:] = _remove_owned_objects(section[1:], removed_handles)
+
+
+def _remove_owned_objects(objects: list[Tags], owners: set[str]) -> list[Tags]:
+    """Returns the `objects` without the objects owned directly or indirectly
+    by the handles in `owners`.
+    """
+    entities = [UnloadedEntity([tags]) for tags in objects]
+    removed = set(owners)
+    count = 0
+    while count != len(removed):  # owners may be stored after the owned objects
+        count = len(removed)
+        for entity in entities:
+            if entity.owner in removed and entity.handle is not None:
+                removed.add(entity.handle)
+    return [entity.tags[0] for entity in entities if entity.owner not in removed]
+
+
+def _layout_names(sections: SectionDict) -> tuple[dict[str, str], dict[str, str]]:
+    """Returns the layout names associated to the block record handles and to
+    the uppercase block names of the layout blocks.
+    """
+    layouts_by_handle: dict[str, str] = dict()
+    for tags in sections.get("OBJECTS", []):
+        if tags[0] != (0, "LAYOUT"):
+            continue
+        try:
+            layout = ExtendedTags(tags).get_subclass("AcDbLayout")  # type: ignore
+        except (const.DXFKeyError, const.DXFStructureError):
+            continue
+        name = layout.get_first_value(1, "")
+        handle = layout.get_first_value(330, "")
+        if name and handle:
+            layouts_by_handle[handle] = name
+
+    # DXF R12 has no LAYOUT entities, the default names are restored by the
+    # Layouts() manager:
+    layouts_by_block_name = {"*MODEL_SPACE": "Model", "*PAPER_SPACE": "Layout1"}
+    for tags in sections.get("TABLES", []):
+        if tags[0] != (0, "BLOCK_RECORD"):
+            continue
+        handle = tags.get_first_value(5, "")  # type: ignore
+        if handle in layouts_by_handle:
+            name = str(tags.get_first_value(2, "")).upper()  # type: ignore
+            layouts_by_block_name[name] = layouts_by_handle[handle]
+    return layouts_by_handle, layouts_by_block_name
+
+
+def group_linked_entities(entities: Iterable[Tags]) -> Iterator[list[Tags]]:
+    """Group the compiled DXF tags of main entities (POLYLINE, INSERT) and their
+    linked sub-entities (VERTEX, ATTRIB, SEQEND), yields single entities as
+    lists of one item.
+    """
+    group: list[Tags] = []
+    expected_dxftype = ""
+    for tags in entities:
+        dxftype = tags[0].value
+        if expected_dxftype:
+            group.append(tags)
+            if dxftype == "SEQEND":
+                yield group
+                group = []
+                expected_dxftype = ""
+            elif dxftype != expected_dxftype:
+                raise DXFStructureError(
+                    f"Expected DXF entity {expected_dxftype} or SEQEND"
+                )
+        elif dxftype == "POLYLINE" or (dxftype == "INSERT" and (66, 1) in tags):
+            group = [tags]
+            expected_dxftype = LINKED_ENTITIES[dxftype]
+        else:
+            yield [tags]
+    if group:  # missing SEQEND
+        yield group
+
+
+def load_unloaded_entity(unloaded_entity: UnloadedEntity, doc: Drawing) -> DXFEntity:
+    """Load the entity and its linked sub-entities from the compiled DXF tags
+    of an :class:`UnloadedEntity` and store them in the entity database. This
+    function replicates the loading process of the DXF document, which has been
+    finished at this point. Returns the main entity.
+    """
+    entities = list(load_dxf_entities(unloaded_entity.tags, doc))
+    main_entity = entities[0]
+    main_entity.doc = doc
+    if unloaded_entity.seqend_handle is not None:
+        # The regular loading process creates a SEQEND entity for each INSERT
+        # and POLYLINE entity when binding the entity, which is replaced by
+        # the linked SEQEND entity if present:
+        seqend = factory.new(
+            "SEQEND",
+            {"layer": main_entity.dxf.layer, "handle": unloaded_entity.seqend_handle},
+        )
+        seqend.doc = doc
+        main_entity.link_seqend(seqend)  # type: ignore
+    if unloaded_entity.owner is not None:
+        # same as adding the entity to the layout before linking the
+        # sub-entities:
+        try:
+            main_entity.set_owner(  # type: ignore
+                unloaded_entity.owner, paperspace=unloaded_entity.paperspace
+            )
+        except AttributeError:
+            pass
+    link_entity = entity_linker()
+    for entity in entities:
+        entity.doc = doc
+        link_entity(entity)
+    # adds also the linked sub-entities to the entity database:
+    doc.entitydb.add(main_entity)
+    for entity in entities:
+        if not entity.is_alive:
+            continue
+        cmd = entity.post_load_hook(doc)
+        if cmd is not None:
+            if doc.is_loading:
+                doc._post_init_commands.append(cmd)
+            else:
+                cmd()
+    return main_entity
+
+
+def load_and_bind_dxf_content(
+    sections: dict,
+    doc: Drawing,
+    lazy: bool = False,
+    prefilter: Optional[PrefilterFunc] = None,
+    progress: Optional[ProgressFunc] = None,
+    unloaded_entities: Optional[list[UnloadedEntity]] = None,
+) -> None:
+    """Load and bind the content of all sections to the DXF document `doc`.
+
+    In lazy loading mode the entities of the ENTITIES section are not loaded,
+    instead the compiled DXF tags of these entities are stored as
+    :class:`UnloadedEntity` in the entity database and in the ENTITIES section.
+    The optional `prefilter` function is applied to these unloaded entities.
+    Already prepared `unloaded_entities` replace the content of the ENTITIES
+    section in lazy loading mode, see :class:`ezdxf.snapshot.Snapshot`.
+
+    The optional `progress` function is called every :data:`PROGRESS_INTERVAL`
+    entities and after each section, see :data:`ProgressFunc`.
+
+    """
     # HEADER has no database entries.
-    db = doc.entitydb
     for name in ["TABLES", "CLASSES", "ENTITIES", "BLOCKS", "OBJECTS"]:
         if name in sections:
             section = sections[name]
-            for index, entity in enumerate(load_dxf_entities(section, doc)):
-                handle = entity.dxf.get("handle")
-                if handle and handle in db:
-                    logger.warning(
-                        f"Found non-unique entity handle #{handle}, data validation is required."
-                    )
+            if lazy and name == "ENTITIES":
+                _store_unloaded_entities(
+                    section, doc, prefilter, progress, unloaded_entities
+                )
+                continue
+            total = len(section)
+            for index, tags in enumerate(section):
+                if progress is not None and index % PROGRESS_INTERVAL == 0:
+                    progress(name, index, total)
                 # Replace Tags() by DXFEntity() objects
-                section[index] = entity
-                # Bind entities to the DXF document:
-                factory.bind(entity, doc)
+                section[index] = _load_and_bind(tags, doc)
+            if progress is not None:
+                progress(name, total, total)
+
+
+def _load_and_bind(tags: Tags, doc: Drawing) -> DXFEntity:
+    entity = factory.load(ExtendedTags(tags), doc)
+    handle = entity.dxf.get("handle")
+    if handle and handle in doc.entitydb:
+        logger.warning(
+            f"Found non-unique entity handle #{handle}, data validation is required."
+        )
+    # Bind entities to the DXF document:
+    factory.bind(entity, doc)
+    return entity
+
+
+def _store_unloaded_entities(
+    section: list,
+    doc: Drawing,
+    prefilter: Optional[PrefilterFunc],
+    progress: Optional[ProgressFunc] = None,
+    unloaded_entities: Optional[list[UnloadedEntity]] = None,
+) -> None:
+    """Replace the compiled DXF tags of the entities in the ENTITIES `section`
+    by :class:`UnloadedEntity` objects and store them in the entity database.
+    Entities without valid handles will be loaded immediately. Already
+    prepared `unloaded_entities` replace the entities of the `section`.
+    """
+    db = doc.entitydb
+    db.entity_loader = functools.partial(load_unloaded_entity, doc=doc)
+    content: list[DXFEntity | UnloadedEntity] = [
+        _load_and_bind(section[0], doc)  # (0, SECTION) (2, ENTITIES)
+    ]
+    if unloaded_entities is None:
+        unloaded_entities = [
+            UnloadedEntity(group) for group in group_linked_entities(section[1:])
+        ]
+    total = len(unloaded_entities)
+    for index, unloaded_entity in enumerate(unloaded_entities):
+        if progress is not None and index % PROGRESS_INTERVAL == 0:
+            progress("ENTITIES", index, total)
+        if prefilter is not None and not prefilter(
+            unloaded_entity.dxftype, unloaded_entity.layer
+        ):
+            continue
+        try:
+            handles = unloaded_entity.handles()
+        except const.DXFValueError:
+            handles = []
+        if handles and not any(handle in db for handle in handles):
+            if unloaded_entity.dxftype in LINKED_ENTITIES:
+                # Reserve the handle of the SEQEND entity, which is created by
+                # the regular loading process at this point, to get the same
+                # handles for all entities created afterwards:
+                unloaded_entity.seqend_handle = db.next_handle()
+            db.add_unloaded_entity(handles, unloaded_entity)
+            content.append(unloaded_entity)
+        else:  # load this entities immediately
+            content.extend(_load_and_bind(tags, doc) for tags in unloaded_entity.tags)
+    section[:] = content
+    if progress is not None:
+        progress("ENTITIES", total, total)
@@ -169,11 +169,7 @@ class VertexArray:
         self.values = survivors
 
     def export_dxf(self, tagwriter: AbstractTagWriter, code=10):
-        for vertex in self.values:
-            tagwriter.write_tag2(code, vertex[0])
-            tagwriter.write_tag2(code + 10, vertex[1])
-            if len(vertex) > 2:
-                tagwriter.write_tag2(code + 20, vertex[2])
+        tagwriter.write_vertices(code, self.values[:, :3])
 
     def append(self, point: Sequence[float]) -> None:
         """Append `point`."""
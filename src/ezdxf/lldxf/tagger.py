@@ -1,7 +1,16 @@
 # Copyright (c) 2016-2022, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import Iterable, TextIO, Iterator, Any, Optional, Sequence
+from typing import (
+    Iterable,
+    TextIO,
+    BinaryIO,
+    Iterator,
+    Any,
+    Optional,
+    Sequence,
+    Callable,
+)
 import struct
 from .types import (
     DXFTag,
@@ -19,6 +28,7 @@ from .types import (
 )
 from .const import DXFStructureError
 from ezdxf.tools.codepage import toencoding
+from ezdxf.acc import USE_C_EXT
 
 
 def internal_tag_compiler(s: str) -> Iterable[DXFTag]:
@@ -131,6 +141,116 @@ def ascii_tags_loader(stream: TextIO, skip_comments: bool = True) -> Iterator[DX
             return
 
 
+# group codes with a numeric or binary value, these values are not decoded by the
+# ascii_bytes_tags_loader(), int() and float() accept bytes as input
+_UNDECODED_CODES = frozenset(TYPE_TABLE) | frozenset(BINARY_DATA)
+
+
+def ascii_bytes_tags_loader(
+    stream: BinaryIO,
+    encoding: str = "utf8",
+    errors: str = "surrogateescape",
+    skip_comments: bool = True,
+) -> Iterator[DXFTag]:
+    """Yields :class:``DXFTag`` objects from an ASCII DXF document opened as
+    binary `stream` (untrusted external source) and does not optimize coordinates.
+    Comment tags (group code == 999) will be skipped if argument `skip_comments`
+    is `True`.
+
+    The `stream` can be any object that provides a :meth:`readline` method
+    returning bytes, like a binary file or a :class:`BytesIO` stream.
+
+    Only string values are decoded, values of numeric and binary group codes are
+    returned as raw bytes without line endings, which is the expected input for
+    the :func:`tag_compiler` function. ``DXFTag.code`` is always an ``int``.
+    Requires "\n" or "\r\n" line endings.
+
+    Args:
+        stream: binary stream
+        encoding: text encoding of the DXF document
+        errors: specify decoding error handler
+        skip_comments: skip comment tags (group code == 999) if `True`
+
+    Raises:
+        DXFStructureError: Found invalid group code.
+
+    """
+    line: int = 1
+    yield_comments = not skip_comments
+    # localize attributes
+    readline = stream.readline
+    undecoded_codes = _UNDECODED_CODES
+    _DXFTag = DXFTag
+    value: Any
+    while True:
+        code: bytes = readline()
+        if not code:  # empty bytes indicates EOF
+            return
+        try:
+            group_code = int(code)
+        except ValueError:
+            invalid_code = code.decode(encoding, errors="ignore").rstrip("\r\n")
+            raise DXFStructureError(
+                f'Invalid group code "{invalid_code}" at line {line}.'
+            )
+
+        value = readline()
+        if not value:  # empty bytes indicates EOF
+            return
+        value = value.rstrip(b"\r\n")
+        if group_code not in undecoded_codes:
+            value = value.decode(encoding, errors=errors)
+            if group_code == 0 and value == "EOF":
+                # yield EOF tag but ignore any data beyond EOF
+                yield _DXFTag(group_code, value)
+                return
+        if group_code != 999 or yield_comments:
+            yield _DXFTag(group_code, value)
+        line += 2
+
+
+BINARY_DXF_SIGNATURE = b"AutoCAD Binary DXF\r\n\x1a\x00"
+BINARY_CHUNK_SIZE = 262_144
+
+
+def scan_binary_dxf_params(data: bytes) -> tuple[str, str]:
+    """Returns the text encoding and the DXF version of a binary DXF document,
+    searches only the first 1024 bytes of `data`.
+    """
+    dxfversion = "AC1009"
+    encoding = "cp1252"
+    try:
+        # Limit search to first 1024 bytes - an arbitrary number
+        # start index for 1-byte group code
+        start = data.index(b"$ACADVER", 22, 1024) + 10
+    except ValueError:
+        pass  # HEADER var $ACADVER not present
+    else:
+        if data[start] != 65:  # not 'A' = 2-byte group code
+            start += 1
+        dxfversion = data[start : start + 6].decode()
+
+    if dxfversion >= "AC1021":
+        encoding = "utf8"
+    else:
+        try:
+            # Limit search to first 1024 bytes - an arbitrary number
+            # start index for 1-byte group code
+            start = data.index(b"$DWGCODEPAGE", 22, 1024) + 14
+        except ValueError:
+            pass  # HEADER var $DWGCODEPAGE not present
+        else:  # name schema is 'ANSI_xxxx'
+            if data[start] != 65:  # not 'A' = 2-byte group code
+                start += 1
+            end = start + 5
+            while data[end] != 0:
+                end += 1
+            codepage = data[start:end].decode()
+            encoding = toencoding(codepage)
+
+    return encoding, dxfversion
+
+
 def binary_tags_loader(
     data: bytes, errors: str = "surrogateescape"
 ) -> Iterator[DXFTag]:
@@ -153,44 +273,10 @@ def binary_tags_loader(
         UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
 
     """
-    if data[:22] != b"AutoCAD Binary DXF\r\n\x1a\x00":
+    if data[:22] != BINARY_DXF_SIGNATURE:
         raise DXFStructureError("Not a binary DXF data structure.")
 
-    def scan_params():
-        dxfversion = "AC1009"
-        encoding = "cp1252"
-        try:
-            # Limit search to first 1024 bytes - an arbitrary number
-            # start index for 1-byte group code
-            start = data.index(b"$ACADVER", 22, 1024) + 10
-        except ValueError:
-            pass  # HEADER var $ACADVER not present
-        else:
-            if data[start] != 65:  # not 'A' = 2-byte group code
-                start += 1
-            dxfversion = data[start : start + 6].decode()
-
-        if dxfversion >= "AC1021":
-            encoding = "utf8"
-        else:
-            try:
-                # Limit search to first 1024 bytes - an arbitrary number
-                # start index for 1-byte group code
-                start = data.index(b"$DWGCODEPAGE", 22, 1024) + 14
-            except ValueError:
-                pass  # HEADER var $DWGCODEPAGE not present
-            else:  # name schema is 'ANSI_xxxx'
-                if data[start] != 65:  # not 'A' = 2-byte group code
-                    start += 1
-                end = start + 5
-                while data[end] != 0:
-                    end += 1
-                codepage = data[start:end].decode()
-                encoding = toencoding(codepage)
-
-        return encoding, dxfversion
-
-    encoding, dxfversion = scan_params()
+    encoding, dxfversion = scan_binary_dxf_params(data)
     r12 = dxfversion <= "AC1009"
     index: int = 22
     data_length: int = len(data)
@@ -242,6 +328,170 @@ def binary_tags_loader(
             yield DXFTag(code, value)
 
 
+def binary_stream_tags_loader(
+    stream: BinaryIO,
+    errors: str = "surrogateescape",
+    chunk_size: int = BINARY_CHUNK_SIZE,
+) -> Iterator[DXFTag]:
+    """Yields :class:`DXFTag` or :class:`DXFBinaryTag` objects from a binary DXF
+    `stream` (untrusted external source) and does not optimize coordinates.
+    The `stream` is read in chunks of `chunk_size` bytes, the memory usage
+    does not depend on the size of the DXF document.
+    ``DXFTag.code`` is always an ``int`` and ``DXFTag.value`` is either an
+    unicode string,``float``, ``int`` or ``bytes`` for binary chunks.
+
+    The `stream` can be any object that provides a :meth:`read` method
+    returning bytes, like a binary file or a :class:`BytesIO` stream. The stream
+    does not have to be seekable.
+
+    Args:
+        stream: binary DXF stream
+        errors: specify decoding error handler
+
+            - "surrogateescape" to preserve possible binary data (default)
+            - "ignore" to use the replacement char U+FFFD: "\ufffd"
+            - "strict" to raise an :class:`UnicodeDecodeError`
+
+        chunk_size: count of bytes to read at once
+
+    Raises:
+        DXFStructureError: Not a binary DXF file or unexpected end of file
+        UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
+
+    """
+    for _, tag in binary_stream_tags_locator(stream, errors, chunk_size):
+        yield tag
+
+
+def binary_stream_tags_locator(
+    stream: BinaryIO,
+    errors: str = "surrogateescape",
+    chunk_size: int = BINARY_CHUNK_SIZE,
+) -> Iterator[tuple[int, DXFTag]]:
+    """Yields (location, tag) tuples from a binary DXF `stream`, the location
+    is the stream position of the group code of the tag, see
+    :func:`binary_stream_tags_loader` for more information.
+    """
+    chunk_size = max(chunk_size, 1024)
+    data = stream.read(chunk_size)
+    if data[:22] != BINARY_DXF_SIGNATURE:
+        raise DXFStructureError("Not a binary DXF data structure.")
+    encoding, dxfversion = scan_binary_dxf_params(data)
+    return binary_chunk_tags_locator(
+        stream.read,
+        data,
+        start=22,
+        r12=dxfversion <= "AC1009",
+        encoding=encoding,
+        errors=errors,
+        chunk_size=chunk_size,
+    )
+
+
+def binary_chunk_tags_locator(
+    read: Callable[[int], bytes],
+    data: bytes = b"",
+    *,
+    start: int = 0,
+    r12: bool = False,
+    encoding: str = "utf8",
+    errors: str = "surrogateescape",
+    chunk_size: int = BINARY_CHUNK_SIZE,
+) -> Iterator[tuple[int, DXFTag]]:
+    """Yields (location, tag) tuples from binary encoded DXF tags without the
+    binary DXF signature and without scanning the DXF version and the text
+    encoding. The tags are decoded from the initial `data` beginning at index
+    `start`, additional data is fetched by the function `read` in chunks
+    of `chunk_size` bytes. The location of the tags starts at 0 for
+    the first byte of `data`.
+
+    Args:
+        read: function to read the next chunk of data, returns an empty bytes
+            object at the end of the data
+        data: initial data
+        start: index of the first tag in `data`
+        r12: ``True`` for DXF R12 and older
+        encoding: text encoding
+        errors: specify decoding error handler
+        chunk_size: count of bytes to read at once
+
+    Raises:
+        DXFStructureError: unexpected end of data
+
+    """
+    index: int = start
+    offset: int = 0  # stream location of data[0]
+    unpack = struct.unpack_from
+    value: Any
+
+    while True:
+        if index >= len(data):
+            # all data processed, the next tag starts at the beginning of the
+            # next chunk:
+            offset += len(data)
+            index = 0
+            data = read(chunk_size)
+            if not data:
+                return
+        tag_start = index
+        try:
+            # decode next group code
+            code = data[index]
+            if r12:
+                if code == 255:  # extended data
+                    code = (data[index + 2] << 8) | data[index + 1]
+                    index += 3
+                else:
+                    index += 1
+            else:  # 2-byte group code
+                code = (data[index + 1] << 8) | code
+                index += 2
+
+            # decode next value
+            if code in BINARY_DATA:
+                length = data[index]
+                index += 1
+                value = data[index : index + length]
+                if len(value) != length:
+                    raise IndexError
+                index += length
+            elif code in INT16:
+                value = unpack("<h", data, offset=index)[0]
+                index += 2
+            elif code in DOUBLE:
+                value = unpack("<d", data, offset=index)[0]
+                index += 8
+            elif code in INT32:
+                value = unpack("<i", data, offset=index)[0]
+                index += 4
+            elif code in INT64:
+                value = unpack("<q", data, offset=index)[0]
+                index += 8
+            elif code in BYTES:
+                value = data[index]
+                index += 1
+            else:  # zero terminated string
+                end_index = data.index(b"\x00", index)
+                value = data[index:end_index]
+                index = end_index + 1
+        except (IndexError, ValueError, struct.error):
+            # incomplete tag at the end of the current chunk
+            chunk = read(chunk_size)
+            if not chunk:
+                raise DXFStructureError("Unexpected end of binary DXF data.")
+            offset += tag_start
+            data = data[tag_start:] + chunk
+            index = 0
+            continue
+
+        if code in BINARY_DATA:
+            yield offset + tag_start, DXFBinaryTag(code, value)
+        else:
+            if type(value) is bytes:
+                value = value.decode(encoding, errors=errors)
+            yield offset + tag_start, DXFTag(code, value)
+
+
 # invalid point codes if not part of a point started with 1010, 1011, 1012, 1013
 INVALID_POINT_CODES = {1020, 1021, 1022, 1023, 1030, 1031, 1032, 1033}
 
@@ -299,11 +549,16 @@ def tag_compiler(tags: Iterator[DXFTag]) -> Iterator[DXFTag]:
                         f"Missing required y coordinate near line: {line}."
                     )
                 # z-axis just for 3d points
-                z = next(tags)
-                line += 2
+                try:
+                    z = next(tags)
+                except StopIteration:
+                    # a 2d point can be the last tag of the stream
+                    z = None
+                else:
+                    line += 2
                 try:
                     # z-axis like (30, 0.0) for base x-code 10
-                    if z.code == code + 20:
+                    if z is not None and z.code == code + 20:
                         point = (float(x.value), float(y.value), float(z.value))
                     else:
                         point = (float(x.value), float(y.value))
@@ -382,3 +637,18 @@ def json_tag_loader(
             yield _DXFTag(code, value)
         if code == 0 and value == "EOF":
             return
+
+
+# The Python implementations are always available:
+py_internal_tag_compiler = internal_tag_compiler
+py_tag_compiler = tag_compiler
+
+# Import of the Cython implementations, if available:
+if USE_C_EXT:
+    try:
+        from ezdxf.acc.tagger import (  # type: ignore
+            internal_tag_compiler,
+            tag_compiler,
+        )
+    except ImportError:
+        pass
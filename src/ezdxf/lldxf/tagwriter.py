@@ -1,9 +1,21 @@
 # Copyright (c) 2018-2026, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import Any, TextIO, TYPE_CHECKING, Union, Iterable, BinaryIO
+from typing import (
+    Any,
+    TextIO,
+    TYPE_CHECKING,
+    Union,
+    Iterable,
+    BinaryIO,
+    Optional,
+    Callable,
+)
+from itertools import chain
 import abc
 
+import numpy as np
+
 from .types import TAG_STRING_FORMAT, cast_tag_value, DXFVertex
 from .types import BYTES, INT16, INT32, INT64, DOUBLE, BINARY_DATA
 from .tags import DXFTag, Tags
@@ -18,6 +30,7 @@ if TYPE_CHECKING:
 __all__ = [
     "TagWriter",
     "BinaryTagWriter",
+    "BufferedBinaryTagWriter",
     "TagCollector",
     "basic_tags_from_text",
     "AbstractTagWriter",
@@ -54,6 +67,17 @@ class AbstractTagWriter(abc.ABC):
         for index, value in enumerate(vertex):
             self.write_tag2(code + index * 10, value)
 
+    def write_vertices(self, code: int, vertices: Iterable[Iterable[float]]) -> None:
+        for vertex in vertices:
+            self.write_vertex(code, vertex)
+
+    def write_entities(self, entities: Iterable[DXFEntity]) -> None:
+        """Export the content entities of a layout or block, the export of
+        these entities is independent of each other.
+        """
+        for entity in entities:
+            entity.export_dxf(self)
+
 
 class TagWriter(AbstractTagWriter):
     """Writes DXF tags into a text stream."""
@@ -119,19 +143,23 @@ class BinaryTagWriter(AbstractTagWriter):
         encoding="utf8",
     ):
         self._stream = stream
+        self._write: Callable[[bytes], Any] = stream.write
         self.dxfversion = dxfversion
         self.write_handles = write_handles
         self._encoding = encoding  # output encoding
         self._r12 = self.dxfversion <= "AC1009"
+        self._layouts = _R12_TAG_LAYOUTS if self._r12 else _TAG_LAYOUTS
+        self._vertex_layouts = (
+            _R12_VERTEX_LAYOUTS if self._r12 else _VERTEX_LAYOUTS
+        )
 
     def write_signature(self) -> None:
-        self._stream.write(b"AutoCAD Binary DXF\r\n\x1a\x00")
+        self._write(b"AutoCAD Binary DXF\r\n\x1a\x00")
 
     # Start of low level interface:
     def write_tag(self, tag: DXFTag) -> None:
         if isinstance(tag, DXFVertex):
-            for code, value in tag.dxftags():
-                self.write_tag2(code, value)
+            self.write_vertex(tag.code, tag.value)
         else:
             self.write_tag2(tag.code, tag.value)
 
@@ -143,63 +171,179 @@ class BinaryTagWriter(AbstractTagWriter):
     def write_tag2(self, code: int, value: Any) -> None:
         # Binary DXF files do not support comments!
         assert code != 999
-        if code in BINARY_DATA:
-            self._write_binary_chunks(code, value)
-            return
-        stream = self._stream
-
-        # write group code
-        if self._r12:
-            # Special group code handling if DXF R12 and older
-            if code >= 1000:  # extended data
-                stream.write(b"\xff")
-                # always 2-byte group code for extended data
-                stream.write(code.to_bytes(2, "little"))
-            else:
-                stream.write(code.to_bytes(1, "little"))
-        else:  # for R2000+ do not need a leading 0xff in front of extended data
-            stream.write(code.to_bytes(2, "little"))
-        # write tag content
-        if code in BYTES:
-            stream.write(int(value).to_bytes(1, "little"))
-        elif code in INT16:
-            stream.write(int(value).to_bytes(2, "little", signed=True))
-        elif code in INT32:
-            stream.write(int(value).to_bytes(4, "little", signed=True))
-        elif code in INT64:
-            stream.write(int(value).to_bytes(8, "little", signed=True))
-        elif code in DOUBLE:
-            stream.write(struct.pack("<d", float(value)))
-        else:  # write zero terminated string
-            stream.write(str(value).encode(self._encoding, errors="dxfreplace"))
-            stream.write(b"\x00")
+        try:
+            prefix, layout = self._layouts[code]
+        except KeyError:
+            if code in BINARY_DATA:
+                self._write_binary_chunks(code, value)
+                return
+            prefix, layout = _tag_layout(code, self._r12)
+            self._layouts[code] = prefix, layout
+        if layout is None:  # write zero terminated string
+            self._write(
+                prefix
+                + str(value).encode(self._encoding, errors="dxfreplace")
+                + b"\x00"
+            )
+        elif layout is _DOUBLE:
+            self._write(prefix + layout.pack(float(value)))
+        else:
+            self._write(prefix + layout.pack(int(value)))
 
     # End of low level interface
 
+    def write_vertex(self, code: int, vertex: Iterable[float]) -> None:
+        """Optimized vertex export, packs all axis of a vertex at once."""
+        values = tuple(vertex)
+        layout = self._vertex_layout(code, len(values))
+        if layout is None:
+            super().write_vertex(code, values)
+        else:
+            struct_, prefixes = layout
+            self._write(struct_.pack(*chain.from_iterable(zip(prefixes, values))))
+
+    def write_vertices(self, code: int, vertices: Iterable[Iterable[float]]) -> None:
+        """Optimized export of vertex arrays, packs all vertices at once."""
+        array = np.asarray(vertices, dtype=np.float64)
+        if array.ndim != 2 or len(array) == 0:
+            super().write_vertices(code, array)
+            return
+        count, dim = array.shape
+        layout = self._vertex_layout(code, dim)
+        if layout is None:
+            super().write_vertices(code, array)
+            return
+        _, prefixes = layout
+        dtype = np.dtype(
+            [
+                field
+                for axis, prefix in enumerate(prefixes)
+                for field in (
+                    (f"c{axis}", f"S{len(prefix)}"),
+                    (f"v{axis}", "<f8"),
+                )
+            ]
+        )
+        records = np.empty(count, dtype=dtype)
+        for axis, prefix in enumerate(prefixes):
+            records[f"c{axis}"] = prefix
+            records[f"v{axis}"] = array[:, axis]
+        self._write(records.tobytes())
+
+    def _vertex_layout(self, code: int, dim: int) -> _VertexLayout:
+        """Returns the precompiled struct and the group code prefixes of a
+        vertex or ``None`` if the axis are not stored as doubles.
+        """
+        key = code, dim
+        try:
+            return self._vertex_layouts[key]
+        except KeyError:
+            pass
+        codes = [code + axis * 10 for axis in range(dim)]
+        layout: _VertexLayout = None
+        if all(c in DOUBLE for c in codes):
+            prefixes = tuple(_tag_layout(c, self._r12)[0] for c in codes)
+            fmt = "".join(f"{len(prefix)}sd" for prefix in prefixes)
+            layout = struct.Struct("<" + fmt), prefixes
+        self._vertex_layouts[key] = layout
+        return layout
+
     def _write_binary_chunks(self, code: int, data: bytes) -> None:
         # Split binary data into small chunks, 127 bytes is the
         # regular size of binary data in ASCII DXF files.
         CHUNK_SIZE = 127
         index = 0
         size = len(data)
-        stream = self._stream
+        write = self._write
 
         while index < size:
             # write group code
             if self._r12 and code >= 1000:  # extended data, just 1004?
-                stream.write(b"\xff")  # extended data marker
+                write(b"\xff")  # extended data marker
             # binary data does not exist in regular R12 entities,
             # only 2-byte group codes required
-            stream.write(code.to_bytes(2, "little"))
+            write(code.to_bytes(2, "little"))
 
             # write max CHUNK_SIZE bytes of binary data in one tag
             chunk = data[index : index + CHUNK_SIZE]
             # write actual chunk size
-            stream.write(len(chunk).to_bytes(1, "little"))
-            stream.write(chunk)
+            write(len(chunk).to_bytes(1, "little"))
+            write(chunk)
             index += CHUNK_SIZE
 
 
+class BufferedBinaryTagWriter(BinaryTagWriter):
+    """Write binary encoded DXF tags into a binary stream like the
+    :class:`BinaryTagWriter`, but collects the encoded tags in a large buffer
+    and writes the buffer content at once to the stream.
+
+    The :meth:`flush` method has to be called at the end of the export!
+
+    """
+
+    buffer_size = 1 << 20
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        dxfversion=LATEST_DXF_VERSION,
+        write_handles: bool = True,
+        encoding="utf8",
+    ):
+        super().__init__(stream, dxfversion, write_handles, encoding)
+        self._buffer = bytearray()
+        self._write = self._write_buffered
+
+    def _write_buffered(self, data: bytes) -> None:
+        buffer = self._buffer
+        buffer += data
+        if len(buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffer content to the stream."""
+        if self._buffer:
+            self._stream.write(self._buffer)
+            self._buffer = bytearray()
+
+
+_DOUBLE = struct.Struct("<d")
+_VALUE_LAYOUTS = [
+    (BYTES, struct.Struct("<B")),
+    (INT16, struct.Struct("<h")),
+    (INT32, struct.Struct("<i")),
+    (INT64, struct.Struct("<q")),
+    (DOUBLE, _DOUBLE),
+]
+# Caches of the precompiled tag layouts for DXF R12 and DXF R2000+:
+_TagLayout = tuple[bytes, Optional[struct.Struct]]
+_TAG_LAYOUTS: dict[int, _TagLayout] = {}
+_R12_TAG_LAYOUTS: dict[int, _TagLayout] = {}
+# key is (group code, dimension):
+_VertexLayout = Optional[tuple[struct.Struct, tuple[bytes, ...]]]
+_VERTEX_LAYOUTS: dict[tuple[int, int], _VertexLayout] = {}
+_R12_VERTEX_LAYOUTS: dict[tuple[int, int], _VertexLayout] = {}
+
+
+def _tag_layout(code: int, r12: bool) -> _TagLayout:
+    """Returns the binary encoded group code and the struct to pack the tag
+    value, ``None`` for zero terminated strings.
+    """
+    if r12:
+        # Special group code handling if DXF R12 and older
+        if code >= 1000:  # extended data
+            # always 2-byte group code for extended data
+            prefix = b"\xff" + code.to_bytes(2, "little")
+        else:
+            prefix = code.to_bytes(1, "little")
+    else:  # for R2000+ do not need a leading 0xff in front of extended data
+        prefix = code.to_bytes(2, "little")
+    for codes, layout in _VALUE_LAYOUTS:
+        if code in codes:
+            return prefix, layout
+    return prefix, None
+
+
 class TagCollector(AbstractTagWriter):
     """Collect DXF tags as DXFTag() entities for testing."""
 
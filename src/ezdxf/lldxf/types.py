@@ -28,6 +28,8 @@ from ezdxf.math import Vec3
 
 
 TAG_STRING_FORMAT = "%3d\n%s\n"
+VERTEX_2D_STRING_FORMAT = TAG_STRING_FORMAT * 2
+VERTEX_3D_STRING_FORMAT = TAG_STRING_FORMAT * 3
 POINT_CODES = {
     10,
     11,
@@ -318,6 +320,14 @@ class DXFVertex(DXFTag):
 
     def dxfstr(self) -> str:
         """Returns the DXF string for all vertex components."""
+        c = self.code
+        value = self._value
+        if len(value) == 3:
+            x, y, z = value
+            return VERTEX_3D_STRING_FORMAT % (c, x, c + 10, y, c + 20, z)
+        if len(value) == 2:
+            x, y = value
+            return VERTEX_2D_STRING_FORMAT % (c, x, c + 10, y)
         return "".join(tag.dxfstr() for tag in self.dxftags())
 
 
@@ -7,16 +7,37 @@
 #   https://github.com/mlarocca/AlgorithmsAndDataStructuresInAction/tree/master/JavaScript/src/ss_tree
 # - Research paper of Antonin Guttman:
 #   http://www-db.deis.unibo.it/courses/SI-LS/papers/Gut84.pdf
+# Dynamic search tree DynamicRTree based on the R*-tree paper of Norbert Beckmann,
+# Hans-Peter Kriegel, Ralf Schneider and Bernhard Seeger, bulk loading by the
+# Sort-Tile-Recursive algorithm of Scott T. Leutenegger, Mario A. Lopez and
+# Jeffrey Edgington.
 from __future__ import annotations
 from operator import itemgetter
 import statistics
-from typing import Iterator, Callable, Sequence, Iterable, TypeVar, Generic
+from typing import (
+    Any,
+    Iterator,
+    Callable,
+    Sequence,
+    Iterable,
+    TypeVar,
+    Generic,
+    Hashable,
+)
 import abc
+import heapq
 import math
 
-from ezdxf.math import BoundingBox, Vec2, Vec3, spherical_envelope
+from ezdxf.math import (
+    BoundingBox,
+    BoundingBox2d,
+    UVec,
+    Vec2,
+    Vec3,
+    spherical_envelope,
+)
 
-__all__ = ["RTree"]
+__all__ = ["RTree", "DynamicRTree"]
 
 INF = float("inf")
 
@@ -326,3 +347,497 @@ def nearest_neighbor_distances(points: Sequence[T]) -> list[float]:
         min(point.distance(p) for p in points[index + 1 :])
         for index, point in enumerate(points[:-1])
     ]
+
+
+# Bounding boxes of the DynamicRTree are stored as tuples of the minimum
+# coordinates followed by the maximum coordinates: (x0, y0, x1, y1) for 2D and
+# (x0, y0, z0, x1, y1, z1) for 3D.
+Box = tuple[float, ...]
+K = TypeVar("K", bound=Hashable)
+OVERLAP_CANDIDATES = 4
+
+
+class DynamicRTree(Generic[K]):
+    """Dynamic spatial search tree of bounding boxes based on `R*-trees`_.
+
+    In contrast to the :class:`RTree` class, this search tree can be altered
+    after the initialization by inserting and deleting entries and supports
+    bounding boxes as well as points. Each entry is a unique hashable `key`
+    associated with a bounding box or a point, a point is stored as bounding
+    box of zero size.
+
+    Inserted entries are distributed by the R*-tree split strategy, which
+    minimizes the margin and the overlapping of the node bounding boxes. The
+    :meth:`bulk_load` method creates a packed search tree by the
+    Sort-Tile-Recursive algorithm, which is much faster than inserting the
+    entries one by one.
+
+    The search tree works in 2D (default) or 3D space, for 2D search trees
+    the z-axis of the input data is ignored.
+
+    Args:
+        dims: dimensions 2 or 3
+        max_node_size: maximum count of entries of a node, at least 4
+
+    Raises:
+        ValueError: invalid dimensions or max. node size too small
+
+    .. _R*-trees: https://en.wikipedia.org/wiki/R*-tree
+
+    """
+
+    def __init__(self, dims: int = 2, max_node_size: int = 16):
+        if dims not in (2, 3):
+            raise ValueError("dims has to be 2 or 3")
+        if max_node_size < 4:
+            raise ValueError("max node size must be > 3")
+        self.dims = dims
+        self._max_size = int(max_node_size)
+        # minimum node size of 40% like proposed for R*-trees:
+        self._min_size = max(2, int(max_node_size * 0.4))
+        self._root = _DNode(is_leaf=True)
+        # leaf node of each key to delete keys without searching
+        self._leafs: dict[K, _DNode] = {}
+
+    @classmethod
+    def bulk_load(
+        cls,
+        entries: Iterable[tuple[K, BoundingBox | BoundingBox2d | UVec]],
+        dims: int = 2,
+        max_node_size: int = 16,
+    ) -> DynamicRTree[K]:
+        """Returns a new search tree for the given (key, bounding box or point)
+        `entries` packed by the Sort-Tile-Recursive algorithm.
+        """
+        tree = cls(dims, max_node_size)
+        items = [(tree._box(extents), key) for key, extents in entries]
+        if len(set(key for _, key in items)) != len(items):
+            raise ValueError("keys are not unique")
+        if items:
+            nodes = tree._pack(items, is_leaf=True)
+            while len(nodes) > 1:
+                nodes = tree._pack(
+                    [(_union(node.boxes), node) for node in nodes], is_leaf=False
+                )
+            tree._root = nodes[0]
+        return tree
+
+    def __len__(self) -> int:
+        """Returns the count of entries."""
+        return len(self._leafs)
+
+    def __iter__(self) -> Iterator[K]:
+        """Yields all keys."""
+        return iter(list(self._leafs.keys()))
+
+    def __contains__(self, key: K) -> bool:
+        """Returns ``True`` if `key` exists."""
+        return key in self._leafs
+
+    def insert(self, key: K, extents: BoundingBox | BoundingBox2d | UVec) -> None:
+        """Insert `key` with the bounding box or the point given by `extents`.
+
+        Raises:
+            KeyError: `key` already exists
+
+        """
+        if key in self._leafs:
+            raise KeyError(f"key {key!r} already exists")
+        self._insert(key, self._box(extents))
+
+    def delete(self, key: K) -> None:
+        """Delete `key`.
+
+        Raises:
+            KeyError: `key` does not exist
+
+        """
+        node = self._leafs.pop(key)
+        index = node.items.index(key)
+        del node.items[index]
+        del node.boxes[index]
+        self._condense(node)
+
+    def discard(self, key: K) -> None:
+        """Delete `key` if exist."""
+        if key in self._leafs:
+            self.delete(key)
+
+    def update(self, key: K, extents: BoundingBox | BoundingBox2d | UVec) -> None:
+        """Replace the bounding box of an existing `key` or insert a new `key`."""
+        self.discard(key)
+        self._insert(key, self._box(extents))
+
+    def extents(self, key: K) -> Box:
+        """Returns the bounding box of `key` as tuple of the minimum coordinates
+        followed by the maximum coordinates.
+
+        Raises:
+            KeyError: `key` does not exist
+
+        """
+        node = self._leafs[key]
+        return node.boxes[node.items.index(key)]
+
+    def overlapping(self, extents: BoundingBox | BoundingBox2d | UVec) -> Iterator[K]:
+        """Yields all keys with bounding boxes overlapping the given bounding box
+        or containing the given point, including the boundaries.
+        """
+        return self._search(self._box(extents), _overlap)
+
+    def inside(self, extents: BoundingBox | BoundingBox2d) -> Iterator[K]:
+        """Yields all keys with bounding boxes inside the given bounding box,
+        including the boundaries.
+        """
+        return self._search(self._box(extents), _contains)
+
+    def containing(self, extents: BoundingBox | BoundingBox2d | UVec) -> Iterator[K]:
+        """Yields all keys with bounding boxes containing the given bounding box
+        or point, including the boundaries.
+        """
+        return self._search(
+            self._box(extents), lambda box, query: _contains(query, box)
+        )
+
+    def nearest(self, point: UVec, count: int = 1) -> list[tuple[K, float]]:
+        """Returns the `count` nearest entries to the given `point` as
+        (key, distance) tuples in ascending order of their distances. The distance
+        of a bounding box to a point inside the bounding box is 0.
+        """
+        target = self._box(point)[: self.dims]
+        result: list[tuple[K, float]] = []
+        heap: list[tuple[float, int, bool, Any]] = [(0.0, 0, False, self._root)]
+        counter = 1
+        while heap and len(result) < count:
+            distance, _, is_key, item = heapq.heappop(heap)
+            if is_key:
+                result.append((item, distance))
+                continue
+            for box, child in zip(item.boxes, item.items):
+                heapq.heappush(
+                    heap, (_distance(box, target), counter, item.is_leaf, child)
+                )
+                counter += 1
+        return result
+
+    def _box(self, extents: BoundingBox | BoundingBox2d | UVec) -> Box:
+        if isinstance(extents, (BoundingBox, BoundingBox2d)):
+            if not extents.has_data:
+                raise ValueError("empty bounding box")
+            extmin = Vec3(extents.extmin)
+            extmax = Vec3(extents.extmax)
+        else:
+            extmin = extmax = Vec3(extents)
+        if self.dims == 2:
+            return extmin.x, extmin.y, extmax.x, extmax.y
+        return extmin.x, extmin.y, extmin.z, extmax.x, extmax.y, extmax.z
+
+    def _search(
+        self, query: Box, entry_test: Callable[[Box, Box], bool]
+    ) -> Iterator[K]:
+        # The child nodes of inner nodes have to overlap the query box for all
+        # queries, the entry_test(box, query) tests the entries of leaf nodes.
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.is_leaf:
+                for box, key in zip(node.boxes, node.items):
+                    if entry_test(box, query):
+                        yield key
+            else:
+                for box, child in zip(node.boxes, node.items):
+                    if _overlap(box, query):
+                        stack.append(child)
+
+    def _pack(self, entries: list[tuple[Box, Any]], is_leaf: bool) -> list[_DNode]:
+        size = self._max_size
+        node_count = math.ceil(len(entries) / size)
+        # count of slices for each dimension:
+        slices = math.ceil(node_count ** (1.0 / self.dims))
+        dims = self.dims
+        nodes: list[_DNode] = []
+
+        def tile(entries_: list[tuple[Box, Any]], axis: int) -> None:
+            entries_.sort(key=lambda e: e[0][axis] + e[0][axis + dims])
+            if axis == dims - 1:
+                for start in range(0, len(entries_), size):
+                    node = _DNode(is_leaf)
+                    for box, item in entries_[start : start + size]:
+                        self._append(node, box, item)
+                    nodes.append(node)
+                return
+            # count of entries in each slice of this axis:
+            slice_size = math.ceil(len(entries_) / slices)
+            slice_size = math.ceil(slice_size / size) * size
+            for start in range(0, len(entries_), slice_size):
+                tile(entries_[start : start + slice_size], axis + 1)
+
+        tile(entries, 0)
+        return nodes
+
+    def _append(self, node: _DNode, box: Box, item: Any) -> None:
+        node.boxes.append(box)
+        node.items.append(item)
+        if node.is_leaf:
+            self._leafs[item] = node
+        else:
+            item.parent = node
+
+    def _insert(self, key: K, box: Box) -> None:
+        node = self._root
+        while not node.is_leaf:
+            node = node.items[self._choose_subtree(node, box)]
+        self._add_entry(node, box, key)
+
+    def _choose_subtree(self, node: _DNode, box: Box) -> int:
+        boxes = node.boxes
+        candidates: list[tuple[float, float, int, Box]] = []
+        for index, node_box in enumerate(boxes):
+            enlarged = _extend(node_box, box)
+            area = _area(node_box)
+            candidates.append((_area(enlarged) - area, area, index, enlarged))
+        candidates.sort(key=lambda c: (c[0], c[1]))
+        if candidates[0][0] == 0.0 or not node.items[0].is_leaf:
+            # no enlargement required or node does not point to leaf nodes
+            return candidates[0][2]
+
+        # R*-tree: minimize the overlap enlargement for nodes pointing to
+        # leaf nodes, like the R*-tree paper recommends for large nodes, only
+        # the candidates with the least area enlargement are tested:
+        def overlap_enlargement(candidate: tuple[float, float, int, Box]) -> float:
+            index = candidate[2]
+            enlarged = candidate[3]
+            original = boxes[index]
+            result = 0.0
+            for i, other in enumerate(boxes):
+                if i != index:
+                    result += _overlap_area(enlarged, other) - _overlap_area(
+                        original, other
+                    )
+            return result
+
+        return min(
+            candidates[:OVERLAP_CANDIDATES],
+            key=lambda c: (overlap_enlargement(c), c[0], c[1]),
+        )[2]
+
+    def _add_entry(self, node: _DNode, box: Box, item: Any) -> None:
+        self._append(node, box, item)
+        self._extend_parents(node, box)
+        if len(node.items) > self._max_size:
+            self._split(node)
+
+    def _extend_parents(self, node: _DNode, box: Box) -> None:
+        parent = node.parent
+        while parent is not None:
+            index = _index_of(parent.items, node)
+            node_box = parent.boxes[index]
+            extended_box = _extend(node_box, box)
+            if extended_box == node_box:
+                return
+            parent.boxes[index] = extended_box
+            node = parent
+            parent = node.parent
+
+    def _split(self, node: _DNode) -> None:
+        entries = list(zip(node.boxes, node.items))
+        group1, group2 = _rstar_split(entries, self._min_size, self.dims)
+        sibling = _DNode(node.is_leaf)
+        node.boxes.clear()
+        node.items.clear()
+        for box, item in group1:
+            self._append(node, box, item)
+        for box, item in group2:
+            self._append(sibling, box, item)
+
+        parent = node.parent
+        if parent is None:  # split root node
+            root = _DNode(is_leaf=False)
+            self._append(root, _union(node.boxes), node)
+            self._append(root, _union(sibling.boxes), sibling)
+            self._root = root
+            return
+        parent.boxes[_index_of(parent.items, node)] = _union(node.boxes)
+        self._add_entry(parent, _union(sibling.boxes), sibling)
+
+    def _condense(self, node: _DNode) -> None:
+        orphans: list[tuple[Box, Any]] = []
+        parent = node.parent
+        while parent is not None:
+            index = _index_of(parent.items, node)
+            if len(node.items) < self._min_size:
+                del parent.items[index]
+                del parent.boxes[index]
+                self._collect_entries(node, orphans)
+            else:
+                parent.boxes[index] = _union(node.boxes)
+            node = parent
+            parent = node.parent
+
+        root = self._root
+        while not root.is_leaf and len(root.items) == 1:
+            root = root.items[0]
+            root.parent = None
+        if not root.items:
+            root = _DNode(is_leaf=True)
+        self._root = root
+        for box, key in orphans:
+            self._insert(key, box)
+
+    def _collect_entries(self, node: _DNode, entries: list[tuple[Box, Any]]) -> None:
+        if node.is_leaf:
+            for box, key in zip(node.boxes, node.items):
+                del self._leafs[key]
+                entries.append((box, key))
+        else:
+            for child in node.items:
+                self._collect_entries(child, entries)
+
+
+class _DNode:
+    __slots__ = ("is_leaf", "parent", "boxes", "items")
+
+    def __init__(self, is_leaf: bool):
+        self.is_leaf = is_leaf
+        self.parent: _DNode | None = None
+        self.boxes: list[Box] = []
+        # keys of leaf nodes or child nodes of inner nodes
+        self.items: list = []
+
+
+def _index_of(nodes: list[_DNode], node: _DNode) -> int:
+    for index, item in enumerate(nodes):
+        if item is node:
+            return index
+    raise ValueError("node not found")
+
+
+def _union(boxes: Iterable[Box]) -> Box:
+    columns = list(zip(*boxes))
+    dims = len(columns) // 2
+    return tuple(min(c) for c in columns[:dims]) + tuple(
+        max(c) for c in columns[dims:]
+    )
+
+
+def _extend(box1: Box, box2: Box) -> Box:
+    # faster union of two boxes, the most frequent case
+    if len(box1) == 4:
+        return (
+            box1[0] if box1[0] < box2[0] else box2[0],
+            box1[1] if box1[1] < box2[1] else box2[1],
+            box1[2] if box1[2] > box2[2] else box2[2],
+            box1[3] if box1[3] > box2[3] else box2[3],
+        )
+    return (
+        box1[0] if box1[0] < box2[0] else box2[0],
+        box1[1] if box1[1] < box2[1] else box2[1],
+        box1[2] if box1[2] < box2[2] else box2[2],
+        box1[3] if box1[3] > box2[3] else box2[3],
+        box1[4] if box1[4] > box2[4] else box2[4],
+        box1[5] if box1[5] > box2[5] else box2[5],
+    )
+
+
+def _area(box: Box) -> float:
+    # area for 2D boxes, volume for 3D boxes
+    if len(box) == 4:
+        return (box[2] - box[0]) * (box[3] - box[1])
+    return (box[3] - box[0]) * (box[4] - box[1]) * (box[5] - box[2])
+
+
+def _margin(box: Box) -> float:
+    dims = len(box) // 2
+    return sum(box[index + dims] - box[index] for index in range(dims))
+
+
+def _overlap_area(box1: Box, box2: Box) -> float:
+    dims = len(box1) // 2
+    result = 1.0
+    for index in range(dims):
+        size = min(box1[index + dims], box2[index + dims]) - max(
+            box1[index], box2[index]
+        )
+        if size <= 0.0:
+            return 0.0
+        result *= size
+    return result
+
+
+def _overlap(box: Box, query: Box) -> bool:
+    dims = len(box) // 2
+    for index in range(dims):
+        if box[index] > query[index + dims] or box[index + dims] < query[index]:
+            return False
+    return True
+
+
+def _contains(box: Box, query: Box) -> bool:
+    # Returns True if `box` is inside of `query`.
+    dims = len(box) // 2
+    for index in range(dims):
+        if box[index] < query[index] or box[index + dims] > query[index + dims]:
+            return False
+    return True
+
+
+def _distance(box: Box, point: Box) -> float:
+    dims = len(box) // 2
+    return math.sqrt(
+        sum(
+            max(box[index] - point[index], 0.0, point[index] - box[index + dims]) ** 2
+            for index in range(dims)
+        )
+    )
+
+
+def _rstar_split(
+    entries: list[tuple[Box, Any]], min_size: int, dims: int
+) -> tuple[list[tuple[Box, Any]], list[tuple[Box, Any]]]:
+    # R*-tree split: choose the split axis with the minimum sum of margins of
+    # all distributions, then choose the distribution with the minimum overlap
+    # and the minimum area along this axis.
+    count = len(entries)
+    distributions = range(min_size, count - min_size + 1)
+
+    def sorted_entries(axis: int) -> list[list[tuple[Box, Any]]]:
+        return [
+            sorted(entries, key=lambda e: (e[0][axis], e[0][axis + dims])),
+            sorted(entries, key=lambda e: (e[0][axis + dims], e[0][axis])),
+        ]
+
+    def split_boxes(sorted_: list[tuple[Box, Any]]) -> list[tuple[Box, Box]]:
+        # bounding boxes of both groups of all distributions, prefix and
+        # suffix boxes are calculated incrementally
+        prefix = [sorted_[0][0]]
+        for entry in sorted_[1:]:
+            prefix.append(_extend(prefix[-1], entry[0]))
+        suffix = [sorted_[-1][0]]
+        for entry in reversed(sorted_[:-1]):
+            suffix.append(_extend(suffix[-1], entry[0]))
+        suffix.reverse()
+        return [(prefix[k - 1], suffix[k]) for k in distributions]
+
+    best_axis_entries: list[list[tuple[Box, Any]]] = []
+    best_axis_boxes: list[list[tuple[Box, Box]]] = []
+    best_margin = INF
+    for axis in range(dims):
+        candidates = sorted_entries(axis)
+        boxes = [split_boxes(sorted_) for sorted_ in candidates]
+        margin = sum(
+            _margin(box1) + _margin(box2) for boxes_ in boxes for box1, box2 in boxes_
+        )
+        if margin < best_margin:
+            best_margin = margin
+            best_axis_entries = candidates
+            best_axis_boxes = boxes
+
+    best: tuple[float, float] = (INF, INF)
+    result = (entries[:min_size], entries[min_size:])
+    for sorted_, boxes_ in zip(best_axis_entries, best_axis_boxes):
+        for k, (box1, box2) in zip(distributions, boxes_):
+            quality = (_overlap_area(box1, box2), _area(box1) + _area(box2))
+            if quality < best:
+                best = quality
+                result = (sorted_[:k], sorted_[k:])
+    return result
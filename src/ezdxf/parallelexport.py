@@ -0,0 +1,163 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+"""
+Parallel ASCII DXF export of the content entities of layouts and blocks.
+
+The export of a DXF entity is independent of all other entities once the
+document is prepared for the export. The worker processes are started by the
+"fork" start method at the export of the first large entity space and inherit
+the prepared document, which is not transferred to the worker processes by
+pickling. Each worker process renders a chunk of entities, given by their
+handles, as ASCII DXF string and the main process writes these chunks in the
+original order into the text stream. The output is identical to the single
+process export.
+
+Forking a multithreaded process is unsafe, therefore the main process exports
+all entities if the process has more than one running thread at the start of
+the worker processes. The "spawn" and "forkserver" start methods would require
+to transfer the whole document to each worker process, which costs more time
+than the parallel export saves.
+
+The "fork" start method is not available on Windows, the
+:class:`ParallelTagWriter` exports all entities by the main process on such
+platforms and for small documents or if only a single CPU is available.
+
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Optional, TextIO
+import io
+import logging
+import multiprocessing
+import os
+import threading
+
+from ezdxf.lldxf.tagwriter import TagWriter
+
+if TYPE_CHECKING:
+    from multiprocessing.pool import Pool
+    from ezdxf.document import Drawing
+    from ezdxf.entities import DXFEntity
+
+__all__ = ["ParallelTagWriter", "is_parallel_export_supported"]
+
+logger = logging.getLogger("ezdxf")
+
+# Layouts and blocks with less entities are exported by the main process:
+MIN_CHUNK_SIZE = 1000
+
+# Documents with less entities are exported by the main process:
+MIN_DOCUMENT_SIZE = 5 * MIN_CHUNK_SIZE
+
+# The document and the export parameters, set by the initializer of the worker
+# processes, not used by the main process:
+_worker_context: Optional[tuple[Drawing, str, bool]] = None
+
+
+def is_parallel_export_supported() -> bool:
+    """Returns ``True`` if the parallel export is supported on this platform."""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _init_worker(doc: Drawing, dxfversion: str, write_handles: bool) -> None:
+    global _worker_context
+    _worker_context = (doc, dxfversion, write_handles)
+
+
+def export_chunk(handles: list[str]) -> str:
+    """Returns the entities of the given `handles` as ASCII DXF string.
+    (internal API, called by the worker processes)
+    """
+    assert _worker_context is not None, "requires initialized worker process"
+    doc, dxfversion, write_handles = _worker_context
+    stream = io.StringIO()
+    tagwriter = TagWriter(stream, dxfversion=dxfversion, write_handles=write_handles)
+    entitydb = doc.entitydb
+    for handle in handles:
+        entitydb[handle].export_dxf(tagwriter)
+    return stream.getvalue()
+
+
+class ParallelTagWriter(TagWriter):
+    """Writes DXF tags as ASCII DXF into a text stream like the
+    :class:`~ezdxf.lldxf.tagwriter.TagWriter`, but the content entities of
+    layouts and blocks are exported by multiple worker processes.
+
+    The worker processes are started at the export of the first entity space
+    with enough entities and inherit the current state of the document `doc`,
+    which has to be prepared for the export. The count of worker processes is
+    limited to the count of available CPUs. The :meth:`close` method has to be
+    called at the end of the export to stop the worker processes.
+
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        doc: Drawing,
+        workers: int,
+        dxfversion: str,
+        write_handles: bool = True,
+    ):
+        super().__init__(stream, dxfversion=dxfversion, write_handles=write_handles)
+        self._doc = doc
+        self._workers = min(workers, os.cpu_count() or 1)
+        self._pool: Optional[Pool] = None
+        self._parallel = (
+            self._workers > 1
+            and is_parallel_export_supported()
+            and len(doc.entitydb) >= MIN_DOCUMENT_SIZE
+        )
+
+    def write_entities(self, entities: Iterable[DXFEntity]) -> None:
+        entities = list(entities)
+        chunks = self._split_chunks(entities) if self._parallel else []
+        if len(chunks) < 2:
+            super().write_entities(entities)
+            return
+        pool = self._get_pool()
+        if pool is None:
+            super().write_entities(entities)
+            return
+        write = self._stream.write
+        for data in pool.imap(export_chunk, chunks):
+            write(data)
+
+    def _get_pool(self) -> Optional[Pool]:
+        if self._pool is None:
+            if threading.active_count() > 1:
+                # forking a multithreaded process is unsafe
+                logger.info(
+                    "parallel DXF export disabled, process has multiple threads"
+                )
+                self._parallel = False
+                return None
+            self._pool = multiprocessing.get_context("fork").Pool(
+                self._workers,
+                initializer=_init_worker,
+                initargs=(self._doc, self.dxfversion, self.write_handles),
+            )
+        return self._pool
+
+    def _split_chunks(self, entities: list[DXFEntity]) -> list[list[str]]:
+        count = len(entities)
+        if count < MIN_CHUNK_SIZE * 2:
+            return []
+        db_get = self._doc.entitydb.get
+        handles: list[str] = []
+        for entity in entities:
+            handle = entity.dxf.handle
+            # entities without a valid database entry are not available in the
+            # worker processes
+            if handle is None or db_get(handle) is not entity:
+                return []
+            handles.append(handle)
+        # more chunks than workers for a better load balancing
+        size = max(MIN_CHUNK_SIZE, -(-count // (self._workers * 4)))
+        return [handles[start : start + size] for start in range(0, count, size)]
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
@@ -2,6 +2,7 @@
 # License: MIT License
 from __future__ import annotations
 from typing import (
+    Any,
     Iterable,
     Iterator,
     Callable,
@@ -9,16 +10,23 @@ from typing import (
     Sequence,
     Union,
     Optional,
+    NamedTuple,
+    TYPE_CHECKING,
 )
 import re
 import operator
 from collections import abc
+from functools import lru_cache
 
 from ezdxf.entities.dxfentity import DXFEntity
+from ezdxf.entities.dxfns import INDEXED_ATTRIBUTES
 from ezdxf.groupby import groupby
 from ezdxf.math import Vec3, Vec2
 from ezdxf.queryparser import EntityQueryParser
 
+if TYPE_CHECKING:
+    from ezdxf.entitydb import AttributeIndex
+
 
 class _AttributeDescriptor:
     def __init__(self, name: str):
@@ -190,7 +198,11 @@ class EntityQuery(abc.Sequence):
 
     def _discard_dxf_attribute_for_all(self, key):
         for e in self.entities:
-            e.dxf.discard(key)
+            dxf = e.dxf
+            if dxf.hasattr(key):
+                # delete by __delattr__() to update the change journal and
+                # the attribute index of the entity database
+                delattr(dxf, key)
 
     def __eq__(self, other):
         """Equal selector (self == other).
@@ -440,134 +452,333 @@ class EntityQuery(abc.Sequence):
 
 
 def entity_matcher(query: str) -> Callable[[DXFEntity], bool]:
-    query_args = EntityQueryParser.parse_string(query, parse_all=True)
-    entity_matcher_ = build_entity_name_matcher(query_args.EntityQuery)
-    attrib_matcher = build_entity_attributes_matcher(
-        query_args.AttribQuery, query_args.AttribQueryOptions
-    )
+    """Returns the matcher function of the compiled `query` string."""
+    return compile_query(query).match
+
+
+class CompiledQuery(NamedTuple):
+    """A query string compiled into Python closures, returned by
+    :func:`compile_query`.
+
+    Attributes:
+        match: matcher function of the whole query string
+        dxftypes: entity names of the entity query or ``None`` if the entity
+            query matches all entity names
+        attributes: (name, value) tuples of the equality relations of indexed
+            DXF attributes, which are combined by "&" operators with all other
+            terms of the attribute query
+        match_unindexed: matcher function of all terms which are not covered
+            by `dxftypes` and `attributes`
+
+    """
 
-    def matcher(entity: DXFEntity) -> bool:
-        return entity_matcher_(entity) and attrib_matcher(entity)
+    match: Callable[[DXFEntity], bool]
+    dxftypes: Optional[frozenset[str]]
+    attributes: tuple[tuple[str, Any], ...]
+    match_unindexed: Callable[[DXFEntity], bool]
 
-    return matcher
+
+@lru_cache(maxsize=256)
+def compile_query(query: str) -> CompiledQuery:
+    """Returns the :class:`CompiledQuery` of the `query` string. The query
+    string is parsed only once, the compiled queries of the recently used query
+    strings are cached.
+
+    Raises:
+        pyparsing.ParseException: query string parsing error
+
+    """
+    query_args = EntityQueryParser.parse_string(query, parse_all=True)
+    names = query_args.EntityQuery
+    take_all, include, exclude = _parse_names(" ".join(names))
+    match_names = build_entity_name_matcher(names)
+    dxftypes: Optional[frozenset[str]] = None
+    attributes: list[tuple[str, Any]] = []
+    unindexed: list[Callable[[DXFEntity], bool]] = []
+    if not take_all:
+        dxftypes = frozenset(include)
+    elif exclude:
+        unindexed.append(match_names)
+
+    tokens = query_args.AttribQuery
+    if not len(tokens):
+        return CompiledQuery(
+            match_names, dxftypes, tuple(attributes), _match_all(unindexed)
+        )
+
+    ignore_case = "i" == query_args.AttribQueryOptions
+    expression = _build_expression(tokens)
+    match_attributes = _compile_expression(expression, ignore_case)
+    relations = _conjunctive_relations(expression)
+    if relations is None:
+        unindexed.append(match_attributes)
+    else:
+        for relation in relations:
+            name, op, value = relation
+            if op == "==" and name in INDEXED_ATTRIBUTES:
+                attributes.append((name, to_lower(value) if ignore_case else value))
+                if not isinstance(value, str) or ignore_case:
+                    continue
+                # the index stores lowercase strings
+            unindexed.append(_compile_relation(relation, ignore_case))
+    if take_all and not exclude:
+        match = match_attributes
+    else:
+        match = _match_all([match_names, match_attributes])
+    return CompiledQuery(match, dxftypes, tuple(attributes), _match_all(unindexed))
 
 
 def build_entity_name_matcher(
     names: Sequence[str],
 ) -> Callable[[DXFEntity], bool]:
-    def match(e: DXFEntity) -> bool:
-        return _match(e.dxftype())
+    take_all, include, exclude = _parse_names(" ".join(names))
+    if take_all:
+        if not exclude:
+            return _match_any
 
-    _match = name_matcher(query=" ".join(names))
-    return match
+        def match_exclude(e: DXFEntity) -> bool:
+            return e.dxftype() not in exclude
 
+        return match_exclude
 
-class Relation:
-    CMP_OPERATORS = {
-        "==": operator.eq,
-        "!=": operator.ne,
-        "<": operator.lt,
-        "<=": operator.le,
-        ">": operator.gt,
-        ">=": operator.ge,
-        "?": lambda e, regex: regex.match(e) is not None,
-        "!?": lambda e, regex: regex.match(e) is None,
-    }
-    VALID_CMP_OPERATORS = frozenset(CMP_OPERATORS.keys())
-
-    def __init__(self, relation: Sequence, ignore_case: bool):
-        name, op, value = relation
-        self.dxf_attrib = name
-        self.compare = Relation.CMP_OPERATORS[op]
-        self.convert_case = to_lower if ignore_case else lambda x: x
+    def match_include(e: DXFEntity) -> bool:
+        return e.dxftype() in include
 
-        re_flags = re.IGNORECASE if ignore_case else 0
-        if "?" in op:
-            self.value = re.compile(
-                value + "$", flags=re_flags
-            )  # always match whole pattern
+    return match_include
+
+
+def build_entity_attributes_matcher(
+    tokens: Sequence, options: str
+) -> Callable[[DXFEntity], bool]:
+    if not len(tokens):
+        return _match_any
+    ignore_case = "i" == options  # at this time just one option is supported
+    return _compile_expression(_build_expression(tokens), ignore_case)
+
+
+CMP_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+REGEX_OPERATORS = frozenset(["?", "!?"])
+VALID_CMP_OPERATORS = frozenset(CMP_OPERATORS.keys()) | REGEX_OPERATORS
+
+
+class Relation(NamedTuple):
+    """Relation of the attribute query: "name comparator value"."""
+
+    name: str
+    op: str
+    value: Any
+
+
+# The attribute query is represented as a tree of relations and bool operations,
+# a bool operation is a tuple of the operator "!", "&" or "|" and the operands.
+Expression = Union[Relation, tuple]
+
+
+def _build_expression(tokens: Sequence) -> Expression:
+    tokens = tuple(tokens)
+    if (
+        len(tokens) == 3
+        and isinstance(tokens[1], str)
+        and tokens[1] in VALID_CMP_OPERATORS
+    ):
+        return Relation(*tokens)
+
+    operands = []  # first in, first out
+    operators = []  # first in, first out
+    for token in tokens:
+        if isinstance(token, str):  # bool operator
+            operators.append(token)
+        else:
+            operands.append(_build_expression(token))
+    operands.reverse()
+    for op in operators:  # as queue -> first in, first out
+        if op == "!":
+            operands.append((op, operands.pop()))
         else:
-            self.value = self.convert_case(value)
+            operands.append((op, operands.pop(), operands.pop()))
+    return operands.pop()
+
+
+def _compile_expression(
+    expression: Expression, ignore_case: bool
+) -> Callable[[DXFEntity], bool]:
+    if isinstance(expression, Relation):
+        return _compile_relation(expression, ignore_case)
+    op = expression[0]
+    operands = [_compile_expression(e, ignore_case) for e in expression[1:]]
+    if op == "!":
+        operand = operands[0]
 
-    def evaluate(self, entity: DXFEntity) -> bool:
+        def match_not(entity: DXFEntity) -> bool:
+            return not operand(entity)
+
+        return match_not
+    if op == "&":
+        return _match_all(operands)
+    left, right = operands
+
+    def match_or(entity: DXFEntity) -> bool:
+        return left(entity) or right(entity)
+
+    return match_or
+
+
+def _compile_relation(
+    relation: Relation, ignore_case: bool
+) -> Callable[[DXFEntity], bool]:
+    name, op, value = relation
+    if op in REGEX_OPERATORS:
+        # always match whole pattern
+        regex_match = re.compile(
+            value + "$", flags=re.IGNORECASE if ignore_case else 0
+        ).match
+        is_match = op == "?"
+
+        def match_regex(entity: DXFEntity) -> bool:
+            try:
+                entity_value = entity.dxf.get_default(name)
+            except (AttributeError, ValueError):
+                return False
+            return (regex_match(entity_value) is not None) is is_match
+
+        return match_regex
+
+    compare = CMP_OPERATORS[op]
+    if ignore_case:
+        value = to_lower(value)
+
+        def match_ignore_case(entity: DXFEntity) -> bool:
+            try:
+                return compare(to_lower(entity.dxf.get_default(name)), value)
+            except (AttributeError, ValueError):
+                return False
+
+        return match_ignore_case
+
+    def match(entity: DXFEntity) -> bool:
         try:
-            value = self.convert_case(entity.dxf.get_default(self.dxf_attrib))
-            return self.compare(value, self.value)
+            return compare(entity.dxf.get_default(name), value)
         except AttributeError:  # entity does not support this attribute
             return False
-        except ValueError:  # entity supports this attribute, but has no value for it
+        except ValueError:  # entity supports this attribute, but has no value
             return False
 
+    return match
+
+
+def _conjunctive_relations(expression: Expression) -> Optional[list[Relation]]:
+    # Returns all relations of an expression which combines relations only by
+    # "&" operators or None for any other expression.
+    if isinstance(expression, Relation):
+        return [expression]
+    if expression[0] != "&":
+        return None
+    relations: list[Relation] = []
+    for operand in expression[1:]:
+        sub_relations = _conjunctive_relations(operand)
+        if sub_relations is None:
+            return None
+        relations.extend(sub_relations)
+    return relations
+
+
+def _match_any(entity: DXFEntity) -> bool:
+    return True
+
+
+def _match_all(
+    functions: Sequence[Callable[[DXFEntity], bool]],
+) -> Callable[[DXFEntity], bool]:
+    if not functions:
+        return _match_any
+    if len(functions) == 1:
+        return functions[0]
+    if len(functions) == 2:
+        first, second = functions
+
+        def match_both(entity: DXFEntity) -> bool:
+            return first(entity) and second(entity)
+
+        return match_both
+    functions = tuple(functions)
+
+    def match_all(entity: DXFEntity) -> bool:
+        for function in functions:
+            if not function(entity):
+                return False
+        return True
+
+    return match_all
+
 
 def to_lower(value):
     return value.lower() if hasattr(value, "lower") else value
 
 
-class BoolExpression:
-    OPERATORS = {
-        "&": operator.and_,
-        "|": operator.or_,
-    }
-
-    def __init__(self, tokens: Sequence):
-        self.tokens = tokens
-
-    def __iter__(self):
-        return iter(self.tokens)
-
-    def evaluate(self, entity: DXFEntity) -> bool:
-        if isinstance(
-            self.tokens, Relation
-        ):  # expression is just one relation, no bool operations
-            return self.tokens.evaluate(entity)
-
-        values = []  # first in, first out
-        operators = []  # first in, first out
-        for token in self.tokens:
-            if hasattr(token, "evaluate"):
-                values.append(token.evaluate(entity))
-            else:  # bool operator
-                operators.append(token)
-        values.reverse()
-        for op in operators:  # as queue -> first in, first out
-            if op == "!":
-                value = not values.pop()
-            else:
-                value = BoolExpression.OPERATORS[op](values.pop(), values.pop())
-            values.append(value)
-        return values.pop()
-
-
-def _compile_tokens(
-    tokens: Union[str, Sequence], ignore_case: bool
-) -> Union[str, Relation, BoolExpression]:
-    def is_relation(tokens: Sequence) -> bool:
-        return len(tokens) == 3 and tokens[1] in Relation.VALID_CMP_OPERATORS
-
-    if isinstance(tokens, str):  # bool operator as string
-        return tokens
+class QueryPlan(NamedTuple):
+    """Execution plan of a query string for an :class:`AttributeIndex`,
+    returned by :func:`plan_query`.
 
-    tokens = tuple(tokens)
-    if is_relation(tokens):
-        return Relation(tokens, ignore_case)
-    else:
-        return BoolExpression(
-            [_compile_tokens(token, ignore_case) for token in tokens]
-        )
+    Attributes:
+        handles: handles of the candidate entities from the attribute index
+        match: matcher for the predicates which are not covered by the index
 
+    """
 
-def build_entity_attributes_matcher(
-    tokens: Sequence, options: str
-) -> Callable[[DXFEntity], bool]:
-    if not len(tokens):
-        return lambda x: True
-    ignore_case = "i" == options  # at this time just one option is supported
-    expr = BoolExpression(_compile_tokens(tokens, ignore_case))  # type: ignore
+    handles: set[str]
+    match: Callable[[DXFEntity], bool]
+
+    def matcher(self) -> Callable[[DXFEntity], bool]:
+        """Returns a matcher for the whole query, which tests the handles of
+        entities stored in the entity database of the index.
+        """
+        handles = self.handles
+        match = self.match
+
+        def matcher(entity: DXFEntity) -> bool:
+            return entity.dxf.handle in handles and match(entity)
+
+        return matcher
 
-    def match_bool_expr(entity: DXFEntity) -> bool:
-        return expr.evaluate(entity)
 
-    return match_bool_expr
+def plan_query(query: str, index: AttributeIndex) -> Optional[QueryPlan]:
+    """Returns the :class:`QueryPlan` of the `query` string for the attribute
+    `index` or ``None`` if the query string has no predicates which can be
+    answered by the index. The entity names and equality relations of indexed
+    attributes, which are combined by "&" operators, are looked up in the index,
+    all other predicates are evaluated by the matcher of the plan.
+
+    """
+    compiled = compile_query(query)
+    if compiled.dxftypes is None and not compiled.attributes:
+        return None
+    handles = index.find(compiled.dxftypes, compiled.attributes)
+    return QueryPlan(handles, compiled.match_unindexed)
+
+
+def indexed_query(
+    entities: Iterable[DXFEntity],
+    query: str = "*",
+    index: Optional[AttributeIndex] = None,
+) -> EntityQuery:
+    """Returns an :class:`EntityQuery` of all `entities` matching the `query`
+    string like :class:`EntityQuery`, but uses the attribute `index` if the
+    query string has attribute relations which can be answered by the index.
+    All `entities` have to be stored in the entity database of the `index`.
+    """
+    # testing the entity names is faster than testing the handles:
+    if index is not None and query != "*" and compile_query(query).attributes:
+        plan = plan_query(query, index)
+        if plan is not None:
+            return EntityQuery(filter(plan.matcher(), entities))
+    return EntityQuery(entities, query)
 
 
 def unique_entities(entities: Iterable[DXFEntity]) -> Iterator[DXFEntity]:
@@ -604,19 +815,22 @@ def name_matcher(query: str = "*") -> Callable[[str], bool]:
         else:
             return e in include
 
-    match_strings = set(query.upper().split())
+    take_all, include, exclude = _parse_names(query)
+    return match
+
+
+def _parse_names(query: str) -> tuple[bool, set[str], set[str]]:
     take_all = False
     exclude = set()
     include = set()
-    for name in match_strings:
+    for name in set(query.upper().split()):
         if name == "*":
             take_all = True
         elif name.startswith("!"):
             exclude.add(name[1:])
         else:
             include.add(name)
-
-    return match
+    return take_all, include, exclude
 
 
 def new(
@@ -160,10 +160,12 @@ class Recover:
 
     def __init__(self, loader: Optional[Callable] = None):
         # different tag loading strategies can be used:
+        #  - fast_bytes_loader(): expects a valid low level structure, reads
+        #    the stream in big chunks, same result as bytes_loader()
         #  - bytes_loader(): expects a valid low level structure
         #  - synced_bytes_loader(): loads everything which looks like a tag
         #    and skip other content (dangerous!)
-        self.tag_loader = loader or bytes_loader
+        self.tag_loader = loader or fast_bytes_loader
 
         # The main goal of all efforts, a Drawing compatible dict of sections:
         self.section_dict: "SectionDict" = dict()
@@ -610,6 +612,103 @@ def bytes_loader(stream: BinaryIO) -> Iterator[DXFTag]:
             return
 
 
+FAST_LOADER_CHUNK_SIZE = 65536
+
+
+def fast_bytes_loader(
+    stream: BinaryIO, chunk_size: int = FAST_LOADER_CHUNK_SIZE
+) -> Iterator[DXFTag]:
+    """Yields :class:``DXFTag`` objects from a bytes `stream`
+    (untrusted external  source), skips all comment tags (group code == 999).
+
+    Same result as :func:`bytes_loader`, but reads the `stream` in chunks of
+    `chunk_size` bytes and splits each chunk into lines at once. The group codes
+    of a chunk are converted by a single :func:`map` call, the slow search for
+    malformed group codes is only applied if this fast conversion fails.
+    Works with file system streams and :class:`BytesIO` streams.
+
+    Raises:
+        DXFStructureError: Found invalid group code.
+
+    """
+    read = stream.read
+    _DXFTag = DXFTag
+    line = 1  # line number of the first group code in `lines`
+    tail = b""  # incomplete last line of the previous chunk
+    carry: list[bytes] = []  # group code without value of the previous chunk
+    strip_cr = False
+    while True:
+        chunk = read(chunk_size)
+        if chunk:
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            eof = False
+        else:
+            # the last line does not require a line ending
+            lines = [tail] if tail else []
+            eof = True
+        if carry:
+            lines = carry + lines
+        count = len(lines) & -2  # even count of lines
+        carry = lines[count:]
+        codes = lines[0:count:2]
+        values = lines[1:count:2]
+        if not strip_cr:
+            strip_cr = b"\r" in chunk or b"\r" in tail
+        if strip_cr:
+            values = [value.rstrip(b"\r") for value in values]
+        try:  # fast path: int() ignores surrounding whitespace and "\r"
+            group_codes = list(map(int, codes))
+        except ValueError:  # slow path: search for group codes tag by tag
+            group_codes = _recover_group_codes(codes, values, line)
+        stop = _find_eof(group_codes, values)
+        if stop:  # ignore any data beyond EOF
+            del group_codes[stop:]
+            eof = True
+        for code, value in zip(group_codes, values):
+            if code != 999:
+                yield _DXFTag(code, value)
+        line += count
+        if eof:
+            return
+
+
+def _find_eof(codes: list[int], values: list[bytes]) -> int:
+    """Returns the index after the EOF tag or 0 if no EOF tag exist."""
+    start = 0
+    while True:
+        try:
+            index = values.index(b"EOF", start)
+        except ValueError:
+            return 0
+        if codes[index] == 0:
+            return index + 1
+        start = index + 1
+
+
+def _recover_group_codes(
+    codes: list[bytes], values: list[bytes], line: int
+) -> list[int]:
+    # Returns the group codes until the EOF tag, data beyond EOF is ignored.
+    group_codes: list[int] = []
+    for code, value in zip(codes, values):
+        try:
+            group_code = int(code)
+        except ValueError:
+            try:  # harder to find an int
+                group_code = _search_int(code)
+            except ValueError:
+                invalid_code = code.decode(errors="ignore").rstrip("\r")
+                raise const.DXFStructureError(
+                    f'Invalid group code "{invalid_code}" at line {line}.'
+                )
+        group_codes.append(group_code)
+        if group_code == 0 and value == b"EOF":
+            break
+        line += 2
+    return group_codes
+
+
 def synced_bytes_loader(stream: BinaryIO) -> Iterator[DXFTag]:
     """Yields :class:``DXFTag`` objects from a bytes `stream`
     (untrusted external source), skips all comment tags (group code == 999).
@@ -837,8 +936,9 @@ def byte_tag_compiler(
                             )
                         )
 
-                    # exclude structure tags (code == 0):
-                    if code:
+                    # exclude structure tags (code == 0) and skip the regex
+                    # searches for strings without backslash:
+                    if code and "\\" in str_:
                         # Convert DXF-Unicode notation "\U+xxxx" to unicode
                         if has_dxf_unicode(str_):
                             str_ = decode_dxf_unicode(str_)
@@ -6,6 +6,7 @@ from itertools import chain
 import logging
 
 from ezdxf.lldxf import const
+from ezdxf.lldxf.loader import UnloadedEntity
 from ezdxf.entities import entity_linker
 
 if TYPE_CHECKING:
@@ -90,6 +91,25 @@ class EntitySection:
             else:
                 msp.add_entity(entity)
 
+        def add_unloaded(unloaded_entity: UnloadedEntity):
+            handle = unloaded_entity.owner
+            if handle == msp_layout_key:
+                paperspace = 0
+            elif handle == psp_layout_key:
+                paperspace = 1
+            else:
+                paperspace = unloaded_entity.paperspace
+            # set the owner handle and the paperspace flag when the entity
+            # will be loaded:
+            if paperspace:
+                unloaded_entity.owner = psp_layout_key
+                unloaded_entity.paperspace = 1
+                psp.entity_space.add_unloaded(unloaded_entity.handle)  # type: ignore
+            else:
+                unloaded_entity.owner = msp_layout_key
+                unloaded_entity.paperspace = 0
+                msp.entity_space.add_unloaded(unloaded_entity.handle)  # type: ignore
+
         msp = cast("BlockRecord", self.doc.block_records.get("*Model_Space"))
         psp = cast("BlockRecord", self.doc.block_records.get("*Paper_Space"))
         msp_layout_key: str = msp.dxf.handle
@@ -97,9 +117,11 @@ class EntitySection:
         linked_entities = entity_linker()
         # Don't store linked entities (VERTEX, ATTRIB, SEQEND) in entity space
         for entity in entities:
+            if isinstance(entity, UnloadedEntity):
+                add_unloaded(entity)
             # No check for valid entities here:
             # Use the audit- or the recover module to fix invalid DXF files!
-            if not linked_entities(entity):
+            elif not linked_entities(entity):
                 add(entity)  # type: ignore
 
     def export_dxf(self, tagwriter: AbstractTagWriter) -> None:
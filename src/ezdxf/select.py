@@ -1,7 +1,7 @@
 # Copyright (c) 2024, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import Iterable, Callable, Sequence
+from typing import TYPE_CHECKING, Iterable, Callable, Sequence
 from typing_extensions import override
 import abc
 
@@ -12,6 +12,9 @@ from ezdxf.math.clipping import CohenSutherlandLineClipping2d
 from ezdxf.math import rtree, BoundingBox
 from ezdxf.query import EntityQuery
 
+if TYPE_CHECKING:
+    from ezdxf.layouts import BaseLayout
+    from ezdxf.entitydb import ChangeJournal
 
 __all__ = [
     "bbox_chained",
@@ -23,6 +26,7 @@ __all__ = [
     "PlanarSearchIndex",
     "point_in_bbox",
     "Polygon",
+    "SpatialIndex",
     "Window",
 ]
 
@@ -42,6 +46,13 @@ class SelectionShape(abc.ABC):
     @abc.abstractmethod
     def is_overlapping_bbox(self, entity_bbox: BoundingBox2d) -> bool: ...
 
+    def bbox(self) -> BoundingBox2d:
+        """Returns the bounding box of the selection shape, which is used by the
+        :class:`SpatialIndex` to pre-select the entities. An empty bounding box
+        disables the pre-selection.
+        """
+        return BoundingBox2d()
+
 
 class Window(SelectionShape):
     """This selection shape tests entities against a rectangular and axis-aligned 2D
@@ -55,6 +66,10 @@ class Window(SelectionShape):
     def __init__(self, p1: UVec, p2: UVec):
         self._bbox = BoundingBox2d((p1, p2))
 
+    @override
+    def bbox(self) -> BoundingBox2d:
+        return self._bbox
+
     @override
     def is_inside_bbox(self, entity_bbox: BoundingBox2d) -> bool:
         return self._bbox.contains(entity_bbox)
@@ -83,6 +98,10 @@ class Circle(SelectionShape):
         r_vec = Vec2(self._radius, self._radius)
         self._bbox = BoundingBox2d((self._center - r_vec, self._center + r_vec))
 
+    @override
+    def bbox(self) -> BoundingBox2d:
+        return self._bbox
+
     def _is_vertex_inside(self, v: Vec2) -> bool:
         return self._center.distance(v) <= self._radius
 
@@ -120,6 +139,10 @@ class Polygon(SelectionShape):
         self._vertices: list[Vec2] = v
         self._bbox = BoundingBox2d(self._vertices)
 
+    @override
+    def bbox(self) -> BoundingBox2d:
+        return self._bbox
+
     def _has_intersection(self, extmin: Vec2, extmax: Vec2) -> bool:
         cs = CohenSutherlandLineClipping2d(extmin, extmax)
         vertices = self._vertices
@@ -260,7 +283,15 @@ def bbox_crosses_fence(
         cache: optional :class:`ezdxf.bbox.Cache` instance
 
     """
+    is_crossing, _ = _fence_test(vertices)
+    return select_by_bbox(entities, is_crossing, cache)
 
+
+def _fence_test(
+    vertices: Iterable[UVec],
+) -> tuple[Callable[[BoundingBox2d], bool], BoundingBox2d]:
+    # Returns the test function for entity bounding boxes and the bounding box
+    # of the fence polyline.
     def is_crossing(entity_bbox: BoundingBox2d) -> bool:
         if not _bbox.has_overlap(entity_bbox):
             return False
@@ -281,8 +312,7 @@ def bbox_crosses_fence(
     if len(_vertices) < 2:
         raise ValueError("2 or more vertices required")
     _bbox = BoundingBox2d(_vertices)
-
-    return select_by_bbox(entities, is_crossing, cache)
+    return is_crossing, _bbox
 
 
 def point_in_bbox(
@@ -448,3 +478,182 @@ class PlanarSearchIndex:
         )
         entities = self._entities
         return [entities[uid] for uid in set(v.uid for v in detection_vertices)]
+
+
+class SpatialIndex:
+    """**Persistent Spatial Search Index of a Layout**
+
+    This class implements a 2D spatial search index for the bounding boxes of all
+    entities of a layout, the bounding boxes are projected onto the xy-plane.
+    Use the :meth:`~ezdxf.layouts.BaseLayout.spatial_index` method of the layout to
+    get the index, don't instantiate this class directly.
+
+    The index is updated incrementally by the changes of the
+    :class:`~ezdxf.entitydb.ChangeJournal` of the entity database at each query.
+    Added, deleted and modified entities of the layout, including transformed
+    entities, are re-indexed automatically. Changes of block definitions do not
+    update the bounding boxes of their block references (INSERT) and modifications
+    of entity data which is not stored as DXF attribute have to be recorded by
+    :meth:`ChangeJournal.modified` manually, but this is done for all
+    transformations.
+
+    The selection methods have the same meaning as the module functions of the same
+    name, but the entities are pre-selected by their bounding boxes in logarithmic
+    time by a :class:`ezdxf.math.rtree.DynamicRTree` instead of testing all entities
+    of the layout:
+
+    - window selection: :meth:`bbox_inside` with a :class:`Window` or a
+      :class:`Polygon` as selection shape
+    - crossing selection: :meth:`bbox_overlap` with a :class:`Window` or a
+      :class:`Polygon` as selection shape
+    - fence selection: :meth:`bbox_crosses_fence`
+
+    The selected entities are returned in the order of the search tree and not
+    in the order of the layout.
+
+    The index is a registered reader of the change journal, changes processed
+    by all readers are discarded from the journal at each update. Call
+    :meth:`close` to release the journal if the index is not used anymore.
+
+    Attributes:
+        cache: the bounding box cache of the index
+
+    """
+
+    def __init__(self, layout: BaseLayout, cache: bbox.Cache | None = None):
+        assert layout.doc is not None, "valid DXF document required"
+        self.cache = cache or bbox.Cache()
+        self._layout = layout
+        self._entitydb = layout.doc.entitydb
+        self._journal: ChangeJournal | None = None
+        self._revision = 0
+        self._entities: dict[str, tuple[DXFEntity, BoundingBox2d]] = {}
+        self._tree: rtree.DynamicRTree[str] = rtree.DynamicRTree()
+        self.rebuild()
+
+    def __len__(self) -> int:
+        """Returns the count of indexed entities."""
+        self.update()
+        return len(self._entities)
+
+    def rebuild(self) -> None:
+        """Rebuilds the whole index from scratch."""
+        journal = self._entitydb.start_journal()
+        self._journal = journal
+        self._revision = journal.revision
+        journal.acknowledge(self, self._revision)
+        self._entities.clear()
+        entries: list[tuple[str, BoundingBox2d]] = []
+        for entity in self._layout:
+            box = self._index_entry(entity)
+            if box is not None:
+                entries.append((entity.dxf.handle, box))
+        self._tree = rtree.DynamicRTree.bulk_load(entries)
+
+    def update(self) -> None:
+        """Updates the index by the changes of the entity database since the last
+        update. This method is called automatically by all queries.
+        """
+        journal = self._entitydb.journal
+        # journal was stopped or replaced or the index was closed:
+        if journal is None or journal is not self._journal:
+            self.rebuild()
+            return
+        try:
+            changes = journal.changes_since(self._revision)
+        except ValueError:  # changes were discarded
+            self.rebuild()
+            return
+        self._revision = changes.revision
+        if not (changes.created or changes.modified or changes.deleted):
+            return
+        journal.acknowledge(self, self._revision)
+        self.cache.apply_changes(changes)
+        for handle in changes.deleted:
+            self._remove(handle)
+        owner = self._layout.layout_key
+        db_get = self._entitydb.get
+        for handles in (changes.created, changes.modified):
+            for handle in handles:
+                self._remove(handle)
+                entity = db_get(handle)
+                if (
+                    entity is not None
+                    and entity.is_alive
+                    and entity.dxf.get("owner") == owner
+                ):
+                    box = self._index_entry(entity)
+                    if box is not None:
+                        self._tree.insert(handle, box)
+
+    def close(self) -> None:
+        """Releases the change journal of the entity database, the index is
+        rebuilt from scratch at the next query.
+        """
+        journal = self._entitydb.journal
+        if journal is not None:
+            journal.release(self)
+        self._journal = None
+        self._entities.clear()
+        self._tree = rtree.DynamicRTree()
+
+    def _index_entry(self, entity: DXFEntity) -> BoundingBox2d | None:
+        extents = bbox.extents((entity,), fast=True, cache=self.cache)
+        if not extents.has_data:
+            return None
+        box = BoundingBox2d(extents)
+        self._entities[entity.dxf.handle] = (entity, box)
+        return box
+
+    def _remove(self, handle: str) -> None:
+        if self._entities.pop(handle, None) is not None:
+            self._tree.delete(handle)
+
+    def _select(
+        self, box: BoundingBox2d, test_func: Callable[[BoundingBox2d], bool]
+    ) -> EntityQuery:
+        self.update()
+        entities = self._entities
+        if box.has_data:
+            handles: Iterable[str] = self._tree.overlapping(box)
+        else:
+            handles = list(entities.keys())
+        selection: list[DXFEntity] = []
+        for handle in handles:
+            entity, entity_bbox = entities[handle]
+            if test_func(entity_bbox):
+                selection.append(entity)
+        return EntityQuery(selection)
+
+    def bbox_inside(self, shape: SelectionShape) -> EntityQuery:
+        """Selects entities whose bounding box lies withing the selection shape."""
+        return self._select(shape.bbox(), shape.is_inside_bbox)
+
+    def bbox_overlap(self, shape: SelectionShape) -> EntityQuery:
+        """Selects entities whose bounding box overlaps the selection shape."""
+        return self._select(shape.bbox(), shape.is_overlapping_bbox)
+
+    def bbox_crosses_fence(self, vertices: Iterable[UVec]) -> EntityQuery:
+        """Selects entities whose bounding box intersects an open polyline.
+        A single point can not be selected by a fence polyline by definition.
+        """
+        is_crossing, box = _fence_test(vertices)
+        return self._select(box, is_crossing)
+
+    def point_in_bbox(self, location: UVec) -> EntityQuery:
+        """Selects entities where the selection point lies within the bounding box."""
+        point = Vec2(location)
+        return self._select(BoundingBox2d((point,)), lambda b: b.inside(point))
+
+    def nearest(self, location: UVec, count: int = 1) -> EntityQuery:
+        """Selects the `count` entities with the nearest bounding boxes to the
+        given `location` ordered by their distance. The distance of a location
+        inside a bounding box is 0.
+        """
+        self.update()
+        entities = self._entities
+        return EntityQuery(
+            entities[handle][0]
+            for handle, _ in self._tree.nearest(Vec2(location), count)
+        )
+
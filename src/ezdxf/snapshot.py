@@ -0,0 +1,91 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+"""
+Immutable snapshots of DXF documents as source for many derived documents.
+
+A :class:`Snapshot` stores the compiled DXF tags of all DXF structure entities
+of a document, which are shared by all documents derived from the snapshot.
+A derived document loads the entities of the ENTITIES section in lazy loading
+mode, each entity is created from the shared compiled tags at the first
+access, unused entities cost no time and memory. Table entries, blocks and
+objects are loaded from the shared compiled tags at the creation of the
+derived document, which is much faster than loading the DXF file again.
+
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional, cast
+import io
+
+from ezdxf.lldxf.loader import (
+    load_dxf_structure,
+    group_linked_entities,
+    UnloadedEntity,
+)
+from ezdxf.lldxf.tagger import ascii_tags_loader, tag_compiler
+from ezdxf.lldxf.tags import Tags
+
+if TYPE_CHECKING:
+    from ezdxf.document import Drawing
+    from ezdxf.eztypes import SectionDict
+
+__all__ = ["Snapshot"]
+
+
+class Snapshot:
+    """Immutable snapshot of a DXF document, see :meth:`Drawing.snapshot`.
+
+    Changes of the source document after the snapshot was taken do not affect
+    the snapshot and the documents derived from the snapshot are independent
+    of each other and of the source document.
+
+    """
+
+    def __init__(self, sections: SectionDict, dxfversion: str):
+        entities = sections.get("ENTITIES")
+        # Extract the basic attributes of the unloaded entities only once:
+        self._unloaded_entities: list[UnloadedEntity] = []
+        if entities:
+            # the sections contain only compiled DXF tags:
+            compiled_tags = cast("list[Tags]", entities[1:])
+            self._unloaded_entities = [
+                UnloadedEntity(group) for group in group_linked_entities(compiled_tags)
+            ]
+            # keep only the section head (0, SECTION) (2, ENTITIES)
+            del entities[1:]
+        self._sections = sections
+        self.dxfversion = dxfversion
+
+    @classmethod
+    def from_document(cls, doc: Drawing) -> Snapshot:
+        """Returns a snapshot of the current state of `doc`. The document is
+        prepared for the export like for saving the document.
+        """
+        stream = io.StringIO()
+        doc.write(stream)
+        stream.seek(0)
+        sections = load_dxf_structure(tag_compiler(ascii_tags_loader(stream)))
+        sections.pop("THUMBNAILIMAGE", None)
+        return cls(sections, doc.dxfversion)
+
+    def document(self, filename: Optional[str] = None) -> Drawing:
+        """Returns a new :class:`~ezdxf.document.Drawing` derived from the
+        snapshot.
+
+        Args:
+            filename: file name of the new document, the file name of the
+                source document is not inherited to prevent overwriting the
+                source document by saving the derived document
+
+        """
+        from ezdxf.document import Drawing
+
+        # The loading process replaces the compiled tags of the section lists
+        # by DXF entities, the compiled tags itself are not modified:
+        sections = {name: list(entities) for name, entities in self._sections.items()}
+        # the owner and the paperspace flag of unloaded entities are modified by
+        # the loading process:
+        unloaded_entities = [entity.copy() for entity in self._unloaded_entities]
+        doc = Drawing()
+        doc._load_section_dict(sections, lazy=True, unloaded_entities=unloaded_entities)
+        doc.filename = filename
+        return doc
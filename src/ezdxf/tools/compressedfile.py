@@ -0,0 +1,151 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+"""
+Transparent streaming access to compressed DXF files like "drawing.dxf.gz" or
+"drawing.dxf.zst".
+
+The data is compressed and decompressed on the fly, the uncompressed file
+content is never stored in memory as a whole.
+
+The gzip format is supported by the Python standard library, the zstd format
+requires Python 3.14+ (module :mod:`compression.zstd`) or the `zstandard`
+package from PyPI.
+
+"""
+from __future__ import annotations
+from typing import IO, Optional, BinaryIO, TextIO, Literal, overload
+import gzip
+import os
+
+__all__ = [
+    "GZIP",
+    "ZSTD",
+    "compression_by_extension",
+    "detect_compression",
+    "is_zstd_supported",
+    "open_file",
+]
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+# zlib default level, a good compromise of speed and size, the gzip module
+# uses the slowest level 9 by default
+GZIP_COMPRESS_LEVEL = 6
+
+EXTENSIONS = {
+    ".gz": GZIP,
+    ".zst": ZSTD,
+}
+MAGIC_BYTES = {
+    b"\x1f\x8b": GZIP,
+    b"\x28\xb5\x2f\xfd": ZSTD,
+}
+
+
+def compression_by_extension(filename: str | os.PathLike) -> Optional[str]:
+    """Returns the compression format defined by the file extension of
+    `filename` or ``None`` for uncompressed files.
+    """
+    _, ext = os.path.splitext(str(filename))
+    return EXTENSIONS.get(ext.lower())
+
+
+def detect_compression(filename: str | os.PathLike) -> Optional[str]:
+    """Returns the compression format of the existing file `filename` detected
+    by the magic bytes at the beginning of the file or ``None`` for
+    uncompressed files.
+    """
+    with open(filename, "rb") as fp:
+        head = fp.read(4)
+    for magic, compression in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def is_zstd_supported() -> bool:
+    """Returns ``True`` if the zstd compression format is supported."""
+    try:
+        _import_zstd()
+    except ImportError:
+        return False
+    return True
+
+
+@overload
+def open_file(
+    filename: str | os.PathLike,
+    mode: Literal["rb", "wb"] = "rb",
+    compression: Optional[str] = None,
+    *,
+    encoding: Optional[str] = None,
+    errors: Optional[str] = None,
+) -> BinaryIO: ...
+
+
+@overload
+def open_file(
+    filename: str | os.PathLike,
+    mode: Literal["rt", "wt"],
+    compression: Optional[str] = None,
+    *,
+    encoding: Optional[str] = None,
+    errors: Optional[str] = None,
+) -> TextIO: ...
+
+
+def open_file(
+    filename: str | os.PathLike,
+    mode: str = "rb",
+    compression: Optional[str] = None,
+    *,
+    encoding: Optional[str] = None,
+    errors: Optional[str] = None,
+) -> IO:
+    """Open file `filename` like the built-in function :func:`open` and
+    compress or decompress the data on the fly in the given `compression`
+    format, ``None`` opens an uncompressed file.
+
+    Args:
+        filename: file name
+        mode: file mode, "rb", "wb", "rt" or "wt"
+        compression: :data:`GZIP`, :data:`ZSTD` or ``None``
+        encoding: text encoding for text modes
+        errors: encoding error handler for text modes
+
+    Raises:
+        ValueError: unknown compression format
+        ImportError: zstd compression is not supported
+
+    """
+    if compression is None:
+        return open(filename, mode, encoding=encoding, errors=errors)
+    if compression == GZIP:
+        return gzip.open(  # type: ignore[return-value]
+            filename,
+            mode,
+            compresslevel=GZIP_COMPRESS_LEVEL,
+            encoding=encoding,
+            errors=errors,
+        )
+    if compression == ZSTD:
+        zstd = _import_zstd()
+        return zstd.open(filename, mode, encoding=encoding, errors=errors)
+    raise ValueError(f"unknown compression format: '{compression}'")
+
+
+def _import_zstd():
+    try:
+        from compression import zstd  # type: ignore  # Python 3.14+
+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "zstd compression requires Python 3.14+ or the 'zstandard' package"
+        )
+    return zstandard
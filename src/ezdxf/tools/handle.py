@@ -11,18 +11,20 @@ START_HANDLE = "1"
 
 
 class HandleGenerator:
+    FORMAT = "%X"
+
     def __init__(self, start_value: str = START_HANDLE):
         self._handle: int = max(1, int(start_value, 16))
 
     reset = __init__
 
     def __str__(self):
-        return "%X" % self._handle
+        return self.FORMAT % self._handle
 
     def next(self) -> str:
-        next_handle = self.__str__()
-        self._handle += 1
-        return next_handle
+        handle = self._handle
+        self._handle = handle + 1
+        return self.FORMAT % handle
 
     __next__ = next
 
@@ -31,8 +33,7 @@ class HandleGenerator:
 
 
 class UnderlayKeyGenerator(HandleGenerator):
-    def __str__(self):
-        return "Underlay%05d" % self._handle
+    FORMAT = "Underlay%05d"
 
 
 def safe_handle(handle: Optional[str], doc: Optional["Drawing"] = None) -> str:
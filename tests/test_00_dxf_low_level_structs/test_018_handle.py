@@ -2,7 +2,7 @@
 # Copyright (C) 2011-2019, Manfred Moitzi
 # License: MIT License
 import pytest
-from ezdxf.tools.handle import HandleGenerator
+from ezdxf.tools.handle import HandleGenerator, UnderlayKeyGenerator
 
 
 def test_next():
@@ -58,3 +58,9 @@ def test_copied_handle_generators_are_independent():
     h1 = h0.copy()
     h1.next()
     assert str(h0) != str(h1)
+
+
+def test_underlay_key_generator():
+    keys = UnderlayKeyGenerator()
+    assert keys.next() == "Underlay00001"
+    assert str(keys) == "Underlay00002"
@@ -1,18 +1,42 @@
-# Copyright (c) 2010-2019 Manfred Moitzi
+# Copyright (c) 2010-2026 Manfred Moitzi
 # License: MIT License
 import pytest
-from io import StringIO
+from io import StringIO, BytesIO
 
 from ezdxf.lldxf.tagger import (
     internal_tag_compiler,
     ascii_tags_loader,
-    tag_compiler,
+    ascii_bytes_tags_loader,
+    binary_tags_loader,
+    binary_stream_tags_loader,
+    binary_stream_tags_locator,
+    json_tag_loader,
+    py_internal_tag_compiler,
+    py_tag_compiler,
     DXFStructureError,
 )
 from ezdxf.lldxf.types import strtag, DXFTag, DXFVertex
 from ezdxf.math import Vec3
 
 
+@pytest.fixture(params=["python", "cython"])
+def compiler(request):
+    """Python and Cython implementation of the tag_compiler() function."""
+    if request.param == "cython":
+        return pytest.importorskip("ezdxf.acc.tagger").tag_compiler
+    return py_tag_compiler
+
+
+@pytest.fixture(params=["python", "cython"])
+def internal_compiler(request):
+    """Python and Cython implementation of the internal_tag_compiler()
+    function.
+    """
+    if request.param == "cython":
+        return pytest.importorskip("ezdxf.acc.tagger").internal_tag_compiler
+    return py_internal_tag_compiler
+
+
 def test_strtag_int():
     assert "  1\n1\n" == strtag((1, 1))
 
@@ -42,52 +66,52 @@ def test_strtag2_vector():
     )
 
 
-def test_int_not_skip_comments():
-    tags = list(internal_tag_compiler(TAGS1))
+def test_int_not_skip_comments(internal_compiler):
+    tags = list(internal_compiler(TAGS1))
     assert 9 == len(tags)
     assert DXFTag(999, "comment") == tags[0]
 
 
-def test_int_3d_coords():
-    tags = list(internal_tag_compiler(TAGS_3D_COORDS))
+def test_int_3d_coords(internal_compiler):
+    tags = list(internal_compiler(TAGS_3D_COORDS))
     assert 2 == len(tags)
     assert DXFTag(10, (100, 200, 300)) == tags[1]
 
 
-def test_int_2d_coords():
-    tags = list(internal_tag_compiler(TAGS_2D_COORDS))
+def test_int_2d_coords(internal_compiler):
+    tags = list(internal_compiler(TAGS_2D_COORDS))
     assert 2 == len(tags)
     assert DXFTag(10, (100, 200)) == tags[1]
 
 
-def test_int_multiple_2d_coords():
-    tags = list(internal_tag_compiler(TAGS_2D_COORDS2))
+def test_int_multiple_2d_coords(internal_compiler):
+    tags = list(internal_compiler(TAGS_2D_COORDS2))
     assert 3 == len(tags)
     assert DXFTag(10, (100, 200)) == tags[1]
     assert DXFTag(11, (1000, 2000)) == tags[2]
 
 
-def test_int_no_line_break_at_eof():
-    tags = list(internal_tag_compiler(TAGS_NO_LINE_BREAK_AT_EOF))
+def test_int_no_line_break_at_eof(internal_compiler):
+    tags = list(internal_compiler(TAGS_NO_LINE_BREAK_AT_EOF))
     assert 3 == len(tags)
     assert DXFTag(10, (100, 200)) == tags[1]
     assert DXFTag(11, (1000, 2000)) == tags[2]
 
 
-def test_int_float_to_int():
+def test_int_float_to_int(internal_compiler):
     with pytest.raises(ValueError):
         # Floats as int not allowed for internal tag compiler.
-        list(internal_tag_compiler(FLOAT_FOR_INT_TAGS))
+        list(internal_compiler(FLOAT_FOR_INT_TAGS))
 
 
-def test_int_no_eof():
-    tags = list(internal_tag_compiler(TEST_NO_EOF))
+def test_int_no_eof(internal_compiler):
+    tags = list(internal_compiler(TEST_NO_EOF))
     assert 7 == len(tags)
     assert (0, "ENDSEC") == tags[-1]
 
 
-def external_tag_compiler(text):
-    return tag_compiler(ascii_tags_loader(StringIO(text)))
+def external_tag_compiler(text, compiler=py_tag_compiler):
+    return compiler(ascii_tags_loader(StringIO(text)))
 
 
 def test_low_level_tagger_skip_comments():
@@ -108,8 +132,8 @@ def test_low_level_tagger_not_skip_comments():
 
 
 @pytest.fixture
-def reader():
-    return external_tag_compiler(TEST_TAGREADER)
+def reader(compiler):
+    return external_tag_compiler(TEST_TAGREADER, compiler)
 
 
 def test_ext_next(reader):
@@ -120,20 +144,20 @@ def test_ext_to_list(reader):
     assert 8 == len(list(reader))
 
 
-def test_ext_one_point_reader():
-    tags = list(external_tag_compiler(POINT_TAGS))
+def test_ext_one_point_reader(compiler):
+    tags = list(external_tag_compiler(POINT_TAGS, compiler))
     point_tag = tags[1]
     assert (100, 200, 300) == point_tag.value
 
 
-def test_xdata_coords():
-    tags = list(external_tag_compiler(XDATA_COORDS))
+def test_xdata_coords(compiler):
+    tags = list(external_tag_compiler(XDATA_COORDS, compiler))
     assert tags[0] == (1011, (100, 200, 300))
     assert len(tags) == 1
 
 
-def test_ext_read_2D_points():
-    stri = internal_tag_compiler(POINT_2D_TAGS)
+def test_ext_read_2D_points(internal_compiler):
+    stri = internal_compiler(POINT_2D_TAGS)
     tags = list(stri)
     tag = tags[0]  # 2D point
     assert (100, 200) == tag.value
@@ -145,26 +169,149 @@ def test_ext_read_2D_points():
     assert "check mark 2" == tag.value
 
 
-def test_ext_error_tag():
-    tags = list(external_tag_compiler(TAGS_WITH_ERROR))
+def test_ext_error_tag(compiler):
+    tags = list(external_tag_compiler(TAGS_WITH_ERROR, compiler))
     assert 1 == len(tags)
 
 
-def test_ext_float_to_int():
+def test_ext_float_to_int(compiler):
     # Floats as int allowed for external tag compiler (thx ProE).
-    assert list(external_tag_compiler(FLOAT_FOR_INT_TAGS))[0] == (71, 1)
+    assert list(external_tag_compiler(FLOAT_FOR_INT_TAGS, compiler))[0] == (71, 1)
 
 
-def test_ext_coord_error_tag():
+def test_ext_coord_error_tag(compiler):
     with pytest.raises(DXFStructureError):
-        list(external_tag_compiler(TAGS_WITH_COORD_ERROR))
+        list(external_tag_compiler(TAGS_WITH_COORD_ERROR, compiler))
 
 
-def test_polyline_with_xdata():
-    tags = list(tag_compiler(ascii_tags_loader(StringIO(POLYLINE_WITH_XDATA))))
+def test_polyline_with_xdata(compiler):
+    tags = list(compiler(ascii_tags_loader(StringIO(POLYLINE_WITH_XDATA))))
     assert len(tags) == 49
 
 
+def test_2d_point_at_the_end_of_the_stream(compiler):
+    tags = list(compiler(ascii_tags_loader(StringIO(LWPOLYLINE_2D_END))))
+    assert tags[1] == (90, 2)
+    vertices = [tag.value for tag in tags if tag.code == 10]
+    assert vertices == [(0.0, 0.0), (10.0, 0.0)]
+
+
+def test_convert_values_of_string_group_codes_to_str(compiler):
+    data = [[0, "LINE"], [5, 255], [8, 7], [62, 7], [10, [1, 2]]]
+    tags = list(compiler(json_tag_loader(data)))
+    assert tags == [(0, "LINE"), (5, "255"), (8, "7"), (62, 7), (10, (1.0, 2.0))]
+    assert type(tags[1].value) is str
+    assert type(tags[2].value) is str
+
+
+class TestAsciiBytesTagsLoader:
+    def test_numeric_values_are_not_decoded(self):
+        tags = list(ascii_bytes_tags_loader(BytesIO(b"  8\nLayer\n 70\n  1\n")))
+        assert tags[0] == (8, "Layer")
+        assert tags[1] == (70, b"  1")
+
+    def test_skip_comments(self):
+        stream = BytesIO(b"999\ncomment\n0\nEOF\n")
+        tags = list(ascii_bytes_tags_loader(stream))
+        assert tags == [(0, "EOF")]
+
+    def test_not_skip_comments(self):
+        stream = BytesIO(b"999\ncomment\n0\nEOF\n")
+        tags = list(ascii_bytes_tags_loader(stream, skip_comments=False))
+        assert tags == [(999, "comment"), (0, "EOF")]
+
+    def test_ignore_data_beyond_eof(self):
+        stream = BytesIO(b"0\nEOF\n0\nLINE\n")
+        assert len(list(ascii_bytes_tags_loader(stream))) == 1
+
+    def test_windows_line_endings(self, compiler):
+        stream = BytesIO(b"  8\r\nLayer\r\n 70\r\n1\r\n")
+        tags = list(compiler(ascii_bytes_tags_loader(stream)))
+        assert tags == [(8, "Layer"), (70, 1)]
+
+    def test_decoding(self):
+        stream = BytesIO("  1\nÄÖÜ\n".encode("cp1252"))
+        tags = list(ascii_bytes_tags_loader(stream, encoding="cp1252"))
+        assert tags[0] == (1, "ÄÖÜ")
+
+    def test_invalid_group_code(self):
+        with pytest.raises(DXFStructureError):
+            list(ascii_bytes_tags_loader(BytesIO(b"LINE\n0\n")))
+
+    def test_same_compiled_tags_as_ascii_tags_loader(self, compiler):
+        for text in (TAGS1, POINT_TAGS, XDATA_COORDS, POLYLINE_WITH_XDATA):
+            expected = list(external_tag_compiler(text, compiler))
+            stream = BytesIO(text.encode())
+            assert list(compiler(ascii_bytes_tags_loader(stream))) == expected
+
+    def test_float_for_int(self, compiler):
+        stream = BytesIO(FLOAT_FOR_INT_TAGS.encode())
+        assert list(compiler(ascii_bytes_tags_loader(stream)))[0] == (71, 1)
+
+
+@pytest.fixture(scope="module", params=["R12", "R2000", "R2018"])
+def binary_dxf_data(request):
+    import ezdxf
+
+    doc = ezdxf.new(request.param)
+    doc.appids.add("EZDXF")
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={"layer": "Äöü"})
+    msp.add_text("TEXT").set_xdata("EZDXF", [(1000, "xdata"), (1040, 1.5)])
+    msp.add_polyline2d([(0, 0), (1, 0), (1, 1)])
+    if request.param != "R12":
+        doc.objects.add_xrecord().tags.append((310, b"\xfe\xff\x00" * 100))
+    stream = BytesIO()
+    doc.write(stream, fmt="bin")
+    return stream.getvalue()
+
+
+class TestBinaryStreamTagsLoader:
+    @pytest.fixture
+    def data(self, binary_dxf_data):
+        return binary_dxf_data
+
+    @pytest.mark.parametrize("chunk_size", [1024, 1025, 4096, 100_000])
+    def test_same_tags_as_binary_tags_loader(self, data, chunk_size):
+        expected = list(binary_tags_loader(data))
+        tags = list(binary_stream_tags_loader(BytesIO(data), chunk_size=chunk_size))
+        assert tags == expected
+        assert [type(tag) for tag in tags] == [type(tag) for tag in expected]
+
+    def test_tag_locations(self, data):
+        for location, tag in binary_stream_tags_locator(
+            BytesIO(data), chunk_size=1024
+        ):
+            if tag == (0, "EOF"):
+                assert location == len(data) - 6 or location == len(data) - 5
+            elif tag.code == 0:
+                name = tag.value.encode()
+                assert data[location : location + 5 + len(name)].find(name) > 0
+
+    def test_not_a_binary_dxf_stream(self):
+        with pytest.raises(DXFStructureError):
+            list(binary_stream_tags_loader(BytesIO(b"  0\nSECTION\n")))
+
+    def test_unexpected_end_of_data(self, data):
+        stream = BytesIO(data[:-3])
+        with pytest.raises(DXFStructureError):
+            list(binary_stream_tags_loader(stream, chunk_size=1024))
+
+
+LWPOLYLINE_2D_END = """  0
+LWPOLYLINE
+ 90
+2
+ 10
+0
+ 20
+0
+ 10
+10
+ 20
+0
+"""
+
 TAGS1 = """999
 comment
   0
@@ -1,8 +1,14 @@
 # Copyright (c) 2010-2020 Manfred Moitzi
 # License: MIT License
 import pytest
-from io import StringIO
-from ezdxf.lldxf.tagwriter import TagWriter, TagCollector
+import struct
+from io import StringIO, BytesIO
+from ezdxf.lldxf.tagwriter import (
+    TagWriter,
+    TagCollector,
+    BinaryTagWriter,
+    BufferedBinaryTagWriter,
+)
 from ezdxf.lldxf.types import DXFTag, DXFVertex
 
 
@@ -33,6 +39,13 @@ def test_write_point_tag():
     assert result == " 10\n7.0\n 20\n8.0\n 30\n9.0\n"
 
 
+def test_write_2d_point_tag():
+    s, t = setup_stream()
+    t.write_tag(DXFVertex(11, (1.5, 2.5)))
+    result = s.getvalue()
+    assert result == " 11\n1.5\n 21\n2.5\n"
+
+
 def test_write_str():
     s, t = setup_stream()
     t.write_str(" 10\n7.0\n 20\n8.0\n 30\n9.0\n")
@@ -47,6 +60,104 @@ def test_write_anything():
     assert result == "... writes just any nonsense ..."
 
 
+class TestBinaryTagWriter:
+    @staticmethod
+    def tagwriter(dxfversion="AC1032"):
+        stream = BytesIO()
+        return stream, BinaryTagWriter(stream, dxfversion=dxfversion)
+
+    @pytest.mark.parametrize(
+        "code,value,expected",
+        [
+            (0, "LINE", b"\x00\x00LINE\x00"),
+            (10, 1.5, b"\x0a\x00" + struct.pack("<d", 1.5)),
+            (62, 7, b"\x3e\x00\x07\x00"),
+            (90, -1, b"\x5a\x00\xff\xff\xff\xff"),
+            (160, 1, b"\xa0\x00" + struct.pack("<q", 1)),
+            (290, True, b"\x22\x01\x01"),
+            (1071, 5, b"\x2f\x04\x05\x00\x00\x00"),
+        ],
+    )
+    def test_write_tag2(self, code, value, expected):
+        stream, tagwriter = self.tagwriter()
+        tagwriter.write_tag2(code, value)
+        assert stream.getvalue() == expected
+
+    def test_write_tag2_r12(self):
+        stream, tagwriter = self.tagwriter("AC1009")
+        tagwriter.write_tag2(62, 7)
+        tagwriter.write_tag2(1070, 3)
+        assert stream.getvalue() == b"\x3e\x07\x00\xff\x2e\x04\x03\x00"
+
+    @pytest.mark.parametrize("dxfversion", ["AC1009", "AC1032"])
+    @pytest.mark.parametrize(
+        "code,vertex", [(10, (1, 2)), (11, (1.5, 2, 3)), (1010, (4, 5, 6))]
+    )
+    def test_write_vertex_as_single_tags(self, dxfversion, code, vertex):
+        stream, tagwriter = self.tagwriter(dxfversion)
+        tagwriter.write_vertex(code, vertex)
+        expected_stream, expected = self.tagwriter(dxfversion)
+        for index, value in enumerate(vertex):
+            expected.write_tag2(code + index * 10, value)
+        assert stream.getvalue() == expected_stream.getvalue()
+
+    def test_write_vertex_tag(self):
+        stream, tagwriter = self.tagwriter()
+        tagwriter.write_tag(DXFVertex(10, (1, 2, 3)))
+        expected_stream, expected = self.tagwriter()
+        expected.write_vertex(10, (1, 2, 3))
+        assert stream.getvalue() == expected_stream.getvalue()
+
+    @pytest.mark.parametrize("dxfversion", ["AC1009", "AC1032"])
+    @pytest.mark.parametrize("dim", [2, 3])
+    def test_write_vertices_at_once(self, dxfversion, dim):
+        vertices = [[index + axis / 7 for axis in range(dim)] for index in range(10)]
+        stream, tagwriter = self.tagwriter(dxfversion)
+        tagwriter.write_vertices(10, vertices)
+        expected_stream, expected = self.tagwriter(dxfversion)
+        for vertex in vertices:
+            for index, value in enumerate(vertex):
+                expected.write_tag2(10 + index * 10, value)
+        assert stream.getvalue() == expected_stream.getvalue()
+
+    def test_write_vertices_of_none_double_codes(self):
+        stream, tagwriter = self.tagwriter()
+        tagwriter.write_vertices(60, [(1, 2)])  # group codes 60 and 70 are int16
+        assert stream.getvalue() == b"\x3c\x00\x01\x00\x46\x00\x02\x00"
+
+    def test_write_empty_vertex_list(self):
+        stream, tagwriter = self.tagwriter()
+        tagwriter.write_vertices(10, [])
+        assert stream.getvalue() == b""
+
+
+class TestBufferedBinaryTagWriter:
+    def test_write_into_buffer_until_flush(self):
+        stream = BytesIO()
+        tagwriter = BufferedBinaryTagWriter(stream)
+        tagwriter.write_signature()
+        tagwriter.write_tag2(0, "SECTION")
+        tagwriter.write_vertex(10, (1, 2, 3))
+        assert stream.getvalue() == b""
+        tagwriter.flush()
+        expected_stream = BytesIO()
+        expected = BinaryTagWriter(expected_stream)
+        expected.write_signature()
+        expected.write_tag2(0, "SECTION")
+        expected.write_vertex(10, (1, 2, 3))
+        assert stream.getvalue() == expected_stream.getvalue()
+
+    def test_flush_large_buffer_automatically(self):
+        stream = BytesIO()
+        tagwriter = BufferedBinaryTagWriter(stream)
+        tagwriter.buffer_size = 100
+        for _ in range(10):
+            tagwriter.write_vertex(10, (1, 2, 3))
+        assert len(stream.getvalue()) >= 100
+        tagwriter.flush()
+        assert len(stream.getvalue()) == 10 * 3 * 10
+
+
 class TestTagCollector:
     @pytest.fixture
     def t(self):
@@ -4,6 +4,7 @@ import pytest
 from io import BytesIO
 from ezdxf.recover import (
     bytes_loader,
+    fast_bytes_loader,
     detect_encoding,
     synced_bytes_loader,
     _detect_dxf_version,
@@ -48,7 +49,7 @@ AC1027
 
 
 class TestBytesLoader:
-    @pytest.fixture(params=[bytes_loader, synced_bytes_loader])
+    @pytest.fixture(params=[bytes_loader, synced_bytes_loader, fast_bytes_loader])
     def loader(self, request):
         return request.param
 
@@ -92,6 +93,46 @@ class TestBytesLoader:
         assert tags[3] == (1, b"AC1027")
 
 
+class TestFastBytesLoader:
+    @pytest.fixture(scope="class")
+    def data(self) -> bytes:
+        return (HEADER + "  0\nENDSEC\n  0\nEOF\n").encode("latin1")
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 4096])
+    def test_chunk_boundaries(self, data, chunk_size):
+        expected = list(bytes_loader(BytesIO(data)))
+        assert list(fast_bytes_loader(BytesIO(data), chunk_size)) == expected
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+    def test_windows_line_endings_at_chunk_boundaries(self, data, chunk_size):
+        data = data.replace(b"\n", b"\r\n")
+        expected = list(bytes_loader(BytesIO(data)))
+        assert list(fast_bytes_loader(BytesIO(data), chunk_size)) == expected
+
+    def test_last_line_without_line_ending(self):
+        tags = list(fast_bytes_loader(BytesIO(b"0\n1\n0\n2")))
+        assert tags == [(0, b"1"), (0, b"2")]
+
+    def test_ignore_incomplete_last_tag(self):
+        tags = list(fast_bytes_loader(BytesIO(b"0\n1\n0\n")))
+        assert tags == [(0, b"1")]
+
+    def test_ignore_data_beyond_eof(self):
+        data = b"0\nEOF\ninvalid\ndata\n"
+        tags = list(fast_bytes_loader(BytesIO(data), 4))
+        assert tags == [(0, b"EOF")]
+
+    def test_skip_comments(self):
+        tags = list(fast_bytes_loader(BytesIO(b"999\ncomment\n0\nEOF\n")))
+        assert tags == [(0, b"EOF")]
+
+    @pytest.mark.parametrize("chunk_size", [3, 4096])
+    def test_invalid_group_code_raises_structure_error(self, chunk_size):
+        data = b"0\nSECTION\n2\nHEADER\ninvalid\nTAG\n"
+        with pytest.raises(const.DXFStructureError, match="at line 5"):
+            list(fast_bytes_loader(BytesIO(data), chunk_size))
+
+
 MALFORMED_VALUE_TAGS = b"""  70 # int value
   42xyz
 40 # float value
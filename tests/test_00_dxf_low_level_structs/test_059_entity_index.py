@@ -0,0 +1,190 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import os
+from array import array
+import pytest
+import ezdxf
+from ezdxf.lldxf import fileindex
+
+
+@pytest.fixture(
+    scope="module",
+    params=[("R12", "asc"), ("R12", "bin"), ("R2000", "asc"), ("R2000", "bin")],
+    ids=["R12-asc", "R12-bin", "R2000-asc", "R2000-bin"],
+)
+def filename(request, tmp_path_factory):
+    dxfversion, fmt = request.param
+    doc = ezdxf.new(dxfversion)
+    doc.layers.add("WALL")
+    blk = doc.blocks.new("BLK")
+    blk.add_line((0, 0), (1, 0))
+    blk.add_attdef("TAG", (0, 0))
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={"layer": "WALL"})
+    msp.add_polyline2d([(0, 0), (1, 0), (1, 1)], dxfattribs={"layer": "WALL"})
+    msp.add_blockref("BLK", (0, 0)).add_auto_attribs({"TAG": "Äöü"})
+    msp.add_text("Äöü", dxfattribs={"layer": "TEXT"})
+    doc.layout().add_circle((0, 0), 1)
+    filename = tmp_path_factory.mktemp(f"{dxfversion}{fmt}") / "index.dxf"
+    doc.saveas(filename, fmt=fmt)
+    return filename
+
+
+@pytest.fixture(scope="module")
+def doc(filename):
+    return ezdxf.readfile(filename)
+
+
+@pytest.fixture(scope="module")
+def index(filename):
+    return fileindex.build_entity_index(filename)
+
+
+def test_index_properties(index, doc, filename):
+    assert index.filename == os.path.abspath(filename)
+    assert index.version == doc.dxfversion
+    assert index.binary is (filename.read_bytes()[:6] == b"AutoCA")
+    assert index.is_up_to_date() is True
+
+
+def test_all_entities_are_indexed(index, doc):
+    for entity in doc.modelspace():
+        location = index[entity.dxf.handle]
+        assert location.dxftype == entity.dxftype()
+        assert location.layer == entity.dxf.layer
+        if doc.dxfversion > "AC1009":
+            assert location.owner == entity.dxf.owner
+    assert doc.layers.get("WALL").dxf.handle in index
+    assert doc.dimstyles.get("Standard").dxf.handle in index
+
+
+def test_get_location(index):
+    assert index.get("FFFFFF") is None
+    with pytest.raises(KeyError):
+        index["FFFFFF"]
+
+
+def test_select_handles(index, doc):
+    msp = doc.modelspace()
+    polyline = msp[1]
+    assert list(index.select(layer="WALL")) == [msp[0].dxf.handle] + [
+        e.dxf.handle for e in (polyline, *polyline.vertices, polyline.seqend)
+    ]
+    assert list(index.select(dxftype="TEXT", layer="TEXT")) == [msp[3].dxf.handle]
+    assert list(index.select(dxftype="TEXT", layer="WALL")) == []
+    assert list(index.select(layer="UNKNOWN")) == []
+
+
+def test_main_entity_includes_linked_entities(index, doc):
+    polyline = doc.modelspace()[1]
+    location = index[polyline.dxf.handle]
+    seqend = index[polyline.seqend.dxf.handle]
+    assert location.offset + location.length == seqend.offset + seqend.length
+
+
+def test_load_single_entities(index, doc):
+    msp = doc.modelspace()
+    line = index.load_entity(msp[0].dxf.handle)
+    assert line.dxftype() == "LINE"
+    assert line.dxf.end.isclose((1, 0))
+    polyline = index.load_entity(msp[1].dxf.handle)
+    assert len(polyline.vertices) == 3
+    insert = index.load_entity(msp[2].dxf.handle)
+    assert insert.attribs[0].dxf.text == "Äöü"
+
+
+def test_load_multiple_entities(index, doc):
+    handles = [e.dxf.handle for e in reversed(doc.modelspace())]
+    entities = index.load_entities(handles)
+    assert set(entities) == set(handles)
+    assert entities[handles[0]].dxf.text == "Äöü"
+
+
+@pytest.mark.parametrize("fmt", ["asc", "bin"])
+def test_lwpolyline_round_trip(fmt, tmp_path):
+    doc = ezdxf.new("R2000")
+    msp = doc.modelspace()
+    points = [(0, 0, 0, 0, 0), (1, 0, 0, 0, 0), (1, 1, 0, 0, 0), (0, 1, 0, 0, 0)]
+    lwpolyline = msp.add_lwpolyline(points, format="xyseb")
+    filename = tmp_path / "lwpolyline.dxf"
+    doc.saveas(filename, fmt=fmt)
+
+    index = fileindex.build_entity_index(filename)
+    loaded = index.load_entity(lwpolyline.dxf.handle)
+    assert loaded.dxftype() == "LWPOLYLINE"
+    assert list(loaded.get_points(format="xyseb")) == points
+
+
+def test_load_block(index):
+    entities = index.load_block("BLK")
+    assert [e.dxftype() for e in entities] == ["BLOCK", "LINE", "ATTDEF", "ENDBLK"]
+    with pytest.raises(KeyError):
+        index.load_block("UNKNOWN")
+
+
+def test_small_chunks_produce_same_index(index, filename, monkeypatch):
+    monkeypatch.setattr(fileindex, "INDEX_CHUNK_SIZE", 100)
+    small_chunks_index = fileindex.build_entity_index(filename)
+    assert list(small_chunks_index) == list(index)
+    assert [small_chunks_index[h] for h in index] == [index[h] for h in index]
+    assert small_chunks_index.blocks == index.blocks
+
+
+def test_save_and_load_index(index, tmp_path):
+    index_filename = tmp_path / "index.bin"
+    index.save(index_filename)
+    loaded_index = fileindex.load_entity_index(index_filename)
+    assert loaded_index.filename == index.filename
+    assert loaded_index.encoding == index.encoding
+    assert loaded_index.binary is index.binary
+    assert loaded_index.blocks == index.blocks
+    assert list(loaded_index) == list(index)
+    assert [loaded_index[h] for h in index] == [index[h] for h in index]
+    assert loaded_index.is_up_to_date() is True
+
+
+def test_index_arrays_are_stored_in_little_endian_byte_order():
+    assert fileindex._to_bytes(array("q", [1])) == b"\x01" + bytes(7)
+    assert fileindex._to_bytes(array("I", [1])) == b"\x01" + bytes(3)
+    values = array("I")
+    fileindex._from_bytes(values, b"\x01" + bytes(3))
+    assert values == array("I", [1])
+    with pytest.raises(ValueError):
+        fileindex._from_bytes(values, b"\x01")
+
+
+def test_load_invalid_index_file(tmp_path):
+    index_filename = tmp_path / "index.bin"
+    index_filename.write_bytes(b"invalid data")
+    with pytest.raises(ValueError):
+        fileindex.load_entity_index(index_filename)
+
+
+def test_open_entity_index_rebuilds_outdated_index(tmp_path):
+    doc = ezdxf.new()
+    doc.modelspace().add_point((0, 0))
+    filename = tmp_path / "outdated.dxf"
+    doc.saveas(filename)
+    index_filename = tmp_path / "outdated.index"
+    index = fileindex.open_entity_index(filename, index_filename)
+    assert index_filename.exists()
+    assert len(list(index.select(dxftype="POINT"))) == 1
+
+    doc.modelspace().add_point((1, 0))
+    doc.saveas(filename)
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert index.is_up_to_date() is False
+    index = fileindex.open_entity_index(filename, index_filename)
+    assert len(list(index.select(dxftype="POINT"))) == 2
+
+
+def test_incomplete_file_raises_structure_error(tmp_path):
+    filename = tmp_path / "incomplete.dxf"
+    filename.write_text("  0\nSECTION\n  2\nENTITIES\n  0\nLINE\n  5\nA\n")
+    with pytest.raises(ezdxf.DXFStructureError):
+        fileindex.build_entity_index(filename)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,139 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+import pickle
+from copy import deepcopy
+
+import pytest
+from ezdxf.entities import Line, Text, Arc, Insert
+from ezdxf.entities.dxfns import CompactDXFNamespace, DXFNamespace
+from ezdxf.lldxf.const import DXFAttributeError
+from ezdxf.math import Vec3
+
+
+@pytest.mark.parametrize("cls", [Line, Text, Arc, Insert])
+def test_compact_namespace_does_not_use_the_instance_dict(cls):
+    entity = cls.new(handle="ABBA", owner="0", dxfattribs={"color": 1})
+    entity.dxf.true_color = 1
+    assert isinstance(entity.dxf, CompactDXFNamespace)
+    instance_dict = DXFNamespace.__dict__["__dict__"].__get__(entity.dxf)
+    assert instance_dict == {}
+
+
+def test_dict_is_a_view_of_the_dxf_attributes():
+    line = Line.new(handle="ABBA", dxfattribs={"color": 1})
+    dxf = line.dxf
+    assert dxf.__dict__["_entity"] is line
+    assert dxf.__dict__["color"] == 1
+    assert dict(vars(dxf)) == {"_entity": line, **dxf.all_existing_dxf_attribs()}
+
+    dxf.__dict__["color"] = -1  # bypasses the validator
+    assert dxf.color == -1
+    dxf.__dict__["true_color"] = 1
+    assert dxf.true_color == 1
+    del dxf.__dict__["color"]
+    assert dxf.hasattr("color") is False
+    with pytest.raises(KeyError):
+        _ = dxf.__dict__["linetype"]
+
+
+@pytest.fixture
+def line() -> Line:
+    return Line.new(
+        handle="ABBA",
+        owner="0",
+        dxfattribs={"start": (1, 2), "end": (3, 4), "color": 1},
+    )
+
+
+def test_slot_attributes(line):
+    dxf = line.dxf
+    assert dxf.handle == "ABBA"
+    assert dxf.start == (1, 2, 0)
+    assert dxf.color == 1
+    assert dxf._extra is None, "extra dict should be created only when needed"
+
+
+def test_default_values_of_unset_slots(line):
+    dxf = line.dxf
+    assert dxf.hasattr("linetype") is False
+    assert dxf.linetype == "BYLAYER"
+    assert dxf.get("linetype") is None
+    assert dxf.get("linetype", "X") == "X"
+    assert dxf.get_default("linetype") == "BYLAYER"
+
+
+def test_non_slot_attributes_are_stored_in_extra_dict(line):
+    dxf = line.dxf
+    assert dxf.hasattr("true_color") is False
+    dxf.true_color = 0x0A0B0C
+    assert dxf.hasattr("true_color") is True
+    assert dxf.true_color == 0x0A0B0C
+    assert dxf._extra == {"true_color": 0x0A0B0C}
+
+
+def test_delete_attributes(line):
+    dxf = line.dxf
+    dxf.transparency = 0x02000000
+    del dxf.color
+    del dxf.transparency
+    assert dxf.hasattr("color") is False
+    assert dxf.hasattr("transparency") is False
+    with pytest.raises(DXFAttributeError):
+        del dxf.color
+    dxf.discard("color")  # does not raise an exception
+
+
+def test_invalid_attribute(line):
+    with pytest.raises(DXFAttributeError):
+        line.dxf.xxx = 1
+    with pytest.raises(DXFAttributeError):
+        _ = line.dxf.xxx
+
+
+def test_all_existing_dxf_attribs(line):
+    line.dxf.true_color = 1
+    attribs = line.dxf.all_existing_dxf_attribs()
+    assert attribs == {
+        "handle": "ABBA",
+        "owner": "0",
+        "layer": "0",
+        "start": Vec3(1, 2),
+        "end": Vec3(3, 4),
+        "color": 1,
+        "true_color": 1,
+    }
+
+
+def test_copy_is_independent(line):
+    line.dxf.true_color = 1
+    copy = line.copy()
+    assert copy.dxf._entity is copy
+    assert copy.dxf.handle is None
+    assert copy.dxf.start == (1, 2)
+    assert copy.dxf.true_color == 1
+    copy.dxf.color = 2
+    copy.dxf.true_color = 2
+    assert line.dxf.color == 1
+    assert line.dxf.true_color == 1
+
+
+def test_deepcopy(line):
+    dxf = deepcopy(line.dxf)
+    assert dxf is not line.dxf
+    assert dxf.handle == "ABBA"
+    assert dxf.end == (3, 4)
+
+
+def test_pickle(line):
+    line.dxf.true_color = 1
+    line2 = pickle.loads(pickle.dumps(line))
+    assert line2.dxf._entity is line2
+    assert line2.dxf.all_existing_dxf_attribs() == line.dxf.all_existing_dxf_attribs()
+
+
+def test_inherited_slots():
+    arc = Arc.new(dxfattribs={"center": (1, 1), "radius": 2, "start_angle": 30})
+    assert arc.dxf.center == (1, 1)
+    assert arc.dxf.radius == 2
+    assert arc.dxf.start_angle == 30
+    assert arc.dxf._extra is None
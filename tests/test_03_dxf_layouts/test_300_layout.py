@@ -44,6 +44,34 @@ def test_delete_entity():
     assert line3.is_alive is False
 
 
+def test_delete_entities():
+    doc = ezdxf.new()
+    layout = doc.modelspace()
+    lines = [layout.add_line((0, 0), (index, 0)) for index in range(5)]
+    layout.delete_entities(lines[1:4])
+    assert len(layout) == 2
+    assert list(layout) == [lines[0], lines[4]]
+    assert all(line.is_alive is False for line in lines[1:4])
+
+
+def test_delete_entities_of_another_layout_raises_value_error(doc):
+    line = doc.layout().add_line((0, 0), (1, 0))
+    with pytest.raises(ValueError):
+        doc.modelspace().delete_entities([line])
+    assert line.is_alive is True
+
+
+def test_unlink_entities():
+    doc = ezdxf.new()
+    layout = doc.modelspace()
+    lines = [layout.add_line((0, 0), (index, 0)) for index in range(3)]
+    layout.unlink_entities(lines[:2])
+    assert list(layout) == [lines[2]]
+    assert lines[0].is_alive is True
+    assert lines[0].dxf.owner is None
+    assert lines[0].dxf.handle in doc.entitydb
+
+
 def test_delete_all_entities(doc):
     paperspace = doc.layout()
     paperspace_count = len(paperspace)
@@ -44,3 +44,69 @@ def test_remove(space):
 
     space.clear()
     assert len(space) == 0
+
+
+def test_remove_not_existing_entity_raises_value_error(space):
+    with pytest.raises(ValueError):
+        space.remove(Entity(1))
+
+
+def test_remove_keeps_order(space):
+    space.remove(space[1])
+    space.remove(space[3])
+    assert [e.value for e in space] == [1, 5, 6, -4, 7]
+    assert len(space) == 5
+    assert space[2].value == 6
+    assert space[-1].value == 7
+
+
+def test_remove_many_entities(space):
+    for e in list(space)[:6]:
+        space.remove(e)
+    assert len(space) == 1
+    assert space[0].value == 7
+
+
+def test_remove_after_insert_and_pop(space):
+    e = space[0]
+    space.remove(space[2])
+    space.insert(0, Entity(0))
+    assert space.pop().value == 7
+    space.remove(e)
+    assert [e.value for e in space] == [0, 4, 6, 76, -4]
+
+
+def test_remove_entity_stored_twice(space):
+    e = space[0]
+    space.entities.append(e)
+    space.remove(e)
+    space.remove(e)
+    assert e not in space
+    assert len(space) == 6
+
+
+def test_remove_entities(space):
+    space.remove(space[0])
+    space.remove_entities([space[1], space[3]])
+    assert [e.value for e in space] == [4, 6, -4, 7]
+    assert len(space) == 4
+
+
+def test_remove_entities_does_not_change_space_for_invalid_entities(space):
+    with pytest.raises(ValueError):
+        space.remove_entities([space[1], Entity(1)])
+    assert len(space) == 7
+
+
+def test_select_entities_in_order_of_entity_space(space):
+    first, second, third = space[0], space[1], space[2]
+    assert space.select([third, Entity(1), first]) == [first, third]
+    space.remove(second)
+    space.insert(len(space), second)
+    assert space.select([second, third]) == [third, second]
+
+
+def test_select_ignores_destroyed_entities(space):
+    first = space[0]
+    first.is_alive = False
+    assert space.select([first]) == []
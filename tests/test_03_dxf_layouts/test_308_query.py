@@ -3,7 +3,7 @@
 import pytest
 import ezdxf
 
-from ezdxf.query import EntityQuery, name_query
+from ezdxf.query import EntityQuery, name_query, compile_query
 from ezdxf.entities import Text, Line, Circle, Arc, MText
 from ezdxf.math import Vec3
 from ezdxf import colors
@@ -27,6 +27,37 @@ class TestNameQuery:
         assert "SOLID" not in result
 
 
+class TestCompileQuery:
+    def test_compiled_queries_are_cached(self):
+        assert compile_query("LINE") is compile_query("LINE")
+
+    def test_match_compiled_query(self):
+        match = compile_query('LINE[layer=="WALL" & !(color<3 | color>5)]').match
+        assert match(Line.new(dxfattribs={"layer": "WALL", "color": 4})) is True
+        assert match(Line.new(dxfattribs={"layer": "WALL", "color": 2})) is False
+        assert match(Line.new(dxfattribs={"layer": "wall", "color": 4})) is False
+        assert match(Circle.new(dxfattribs={"layer": "WALL", "color": 4})) is False
+
+    def test_match_regular_expression(self):
+        match = compile_query('*[layer ? "wa.*"]i').match
+        assert match(Line.new(dxfattribs={"layer": "WALL"})) is True
+        assert match(Line.new(dxfattribs={"layer": "DOOR"})) is False
+
+    def test_unsupported_attribute_does_not_match(self):
+        assert compile_query('*[text=="TEXT"]').match(Line()) is False
+
+    def test_conjunctive_equality_relations_of_indexed_attributes(self):
+        query = compile_query('LINE CIRCLE[layer=="WALL" & color==1 & color<3]i')
+        assert query.dxftypes == {"LINE", "CIRCLE"}
+        assert query.attributes == (("layer", "wall"), ("color", 1))
+        assert query.match_unindexed(Line.new(dxfattribs={"color": 5})) is False
+
+    def test_no_indexed_terms(self):
+        query = compile_query('*[layer=="WALL" | color==1]')
+        assert query.dxftypes is None
+        assert query.attributes == tuple()
+
+
 def test_remove_supports_virtual_entities():
     result = EntityQuery([Text(), Line(), Arc()]).remove("TEXT")
     assert len(result) == 2
@@ -38,6 +38,13 @@ def test_removing_entiy_does_not_destroy_entity(layout):
     assert point.is_alive
 
 
+def test_removing_entities_does_not_destroy_entities(layout):
+    points = [layout.add_point((0, 0)), layout.add_point((1, 0))]
+    layout.delete_entities(points)
+    assert len(layout) == 0
+    assert all(point.is_alive for point in points)
+
+
 def test_purge_destroyed_entities(layout):
     point = layout.add_point((1, 1))
     point.destroy()
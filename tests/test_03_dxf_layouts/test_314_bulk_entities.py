@@ -0,0 +1,173 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+import pytest
+import numpy as np
+
+import ezdxf
+from ezdxf import columnar
+from ezdxf.layouts import VirtualLayout
+from ezdxf.lldxf.const import DXFValueError
+
+
+@pytest.fixture
+def doc():
+    return ezdxf.new()
+
+
+def test_add_lines(doc):
+    msp = doc.modelspace()
+    starts = np.array([(0, 0, 0), (1, 1, 1), (2, 2, 2)])
+    ends = np.array([(1, 0, 0), (2, 1, 1), (3, 2, 2)])
+    lines = msp.add_lines(starts, ends, dxfattribs={"layer": "LINES", "color": 1})
+    assert len(lines) == 3
+    assert len(msp) == 3
+    for line, start, end in zip(lines, starts, ends):
+        assert line.dxf.start == start.tolist()
+        assert line.dxf.end == end.tolist()
+        assert line.dxf.layer == "LINES"
+        assert line.dxf.color == 1
+        assert line.dxf.owner == msp.layout_key
+        assert line.dxf.hasattr("paperspace") is False
+        assert doc.entitydb[line.dxf.handle] is line
+    assert len(set(line.dxf.handle for line in lines)) == 3
+
+
+def test_add_lines_from_2d_points(doc):
+    msp = doc.modelspace()
+    lines = msp.add_lines([(0, 0), (1, 1)], [(1, 0), (2, 1)])
+    assert lines[1].dxf.start == (1, 1, 0)
+    assert lines[1].dxf.end == (2, 1, 0)
+
+
+def test_add_lines_to_paperspace(doc):
+    psp = doc.paperspace()
+    lines = psp.add_lines([(0, 0)], [(1, 0)])
+    assert lines[0].dxf.paperspace == 1
+    assert lines[0].dxf.owner == psp.layout_key
+
+
+def test_add_lines_validates_common_attributes(doc):
+    msp = doc.modelspace()
+    with pytest.raises(ezdxf.DXFAttributeError):
+        msp.add_lines([(0, 0)], [(1, 0)], dxfattribs={"xyz": 1})
+    assert len(msp) == 0
+
+
+def test_add_lines_count_mismatch(doc):
+    with pytest.raises(DXFValueError):
+        doc.modelspace().add_lines([(0, 0), (1, 1)], [(1, 0)])
+
+
+@pytest.mark.parametrize("points", [[(0, 0, 0, 0)], [0, 1, 2], [[[0, 0]]]])
+def test_add_points_with_invalid_shape(doc, points):
+    with pytest.raises(DXFValueError):
+        doc.modelspace().add_points(points)
+
+
+def test_add_points(doc):
+    msp = doc.modelspace()
+    points = msp.add_points(np.arange(30).reshape(10, 3))
+    assert len(points) == 10
+    assert points[9].dxf.location == (27, 28, 29)
+
+
+def test_add_no_entities(doc):
+    msp = doc.modelspace()
+    assert msp.add_points([]) == []
+    assert msp.add_lines(np.empty((0, 3)), np.empty((0, 3))) == []
+    assert len(msp) == 0
+
+
+def test_add_circles(doc):
+    block = doc.blocks.new("CIRCLES")
+    circles = block.add_circles([(0, 0), (1, 1)], [1, 2])
+    assert circles[0].dxf.radius == 1
+    assert circles[1].dxf.radius == 2
+    assert circles[1].dxf.center == (1, 1)
+    assert circles[1].dxf.owner == block.block_record_handle
+
+
+def test_add_circles_with_common_radius(doc):
+    circles = doc.modelspace().add_circles([(0, 0), (1, 1)], 3)
+    assert [c.dxf.radius for c in circles] == [3, 3]
+
+
+def test_add_circles_count_mismatch(doc):
+    with pytest.raises(DXFValueError):
+        doc.modelspace().add_circles([(0, 0), (1, 1)], [1, 2, 3])
+
+
+@pytest.mark.parametrize("radius", [0, -1, np.nan, np.inf])
+def test_add_circles_rejects_invalid_radius(doc, radius):
+    msp = doc.modelspace()
+    with pytest.raises(DXFValueError):
+        msp.add_circles([(0, 0), (1, 1)], [1, radius])
+    assert len(msp) == 0
+
+
+@pytest.mark.parametrize("value", [np.nan, np.inf])
+def test_bulk_entities_reject_invalid_coordinates(doc, value):
+    msp = doc.modelspace()
+    with pytest.raises(DXFValueError):
+        msp.add_points([(0, 0), (1, value)])
+    with pytest.raises(DXFValueError):
+        msp.add_lines([(0, 0)], [(value, 1, 0)])
+    with pytest.raises(DXFValueError):
+        msp.add_circles([(0, value)], 1)
+    assert len(msp) == 0
+
+
+def test_add_lines_to_virtual_layout():
+    layout = VirtualLayout()
+    lines = layout.add_lines([(0, 0)], [(1, 0)])
+    assert len(layout) == 1
+    assert lines[0].dxf.handle is None
+    assert lines[0].doc is None
+
+
+class TestColumnar:
+    @pytest.fixture(scope="class")
+    def msp(self):
+        doc = ezdxf.new()
+        msp = doc.modelspace()
+        msp.add_line((0, 0), (1, 0))
+        msp.add_point((7, 8, 9))
+        msp.add_circle((1, 2), radius=3)
+        msp.add_line((1, 1, 1), (2, 2, 2))
+        msp.add_arc((0, 0), radius=1, start_angle=0, end_angle=90)
+        return msp
+
+    def test_lines(self, msp):
+        starts, ends = columnar.lines(msp)
+        assert starts.tolist() == [[0, 0, 0], [1, 1, 1]]
+        assert ends.tolist() == [[1, 0, 0], [2, 2, 2]]
+
+    def test_points(self, msp):
+        assert columnar.points(msp).tolist() == [[7, 8, 9]]
+
+    def test_circles_ignores_arcs(self, msp):
+        centers, radii = columnar.circles(msp)
+        assert centers.tolist() == [[1, 2, 0]]
+        assert radii.tolist() == [3]
+
+    def test_empty_results(self):
+        starts, ends = columnar.lines([])
+        assert starts.shape == (0, 3)
+        assert ends.shape == (0, 3)
+        centers, radii = columnar.circles([])
+        assert centers.shape == (0, 3)
+        assert radii.shape == (0,)
+
+    def test_entity_list(self, msp):
+        starts, _ = columnar.lines(list(msp)[3:])
+        assert starts.tolist() == [[1, 1, 1]]
+
+    def test_round_trip(self):
+        doc = ezdxf.new()
+        msp = doc.modelspace()
+        starts = np.random.random((100, 3))
+        ends = np.random.random((100, 3))
+        msp.add_lines(starts, ends)
+        starts2, ends2 = columnar.lines(msp)
+        assert np.array_equal(starts, starts2)
+        assert np.array_equal(ends, ends2)
@@ -0,0 +1,233 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.entitydb import AttributeIndex
+from ezdxf.query import plan_query
+
+
+@pytest.fixture
+def doc():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(20):
+        msp.add_line(
+            (index, 0),
+            (index, 1),
+            dxfattribs={"layer": "WALL" if index % 2 else "Door", "color": index % 3},
+        )
+    msp.add_circle((0, 0), 1, dxfattribs={"layer": "wall"})
+    msp.add_point((0, 0), dxfattribs={"linetype": "DASHED"})
+    block = doc.blocks.new("BLOCK")
+    block.add_line((0, 0), (1, 0), dxfattribs={"layer": "WALL"})
+    return doc
+
+
+def handles(entities):
+    return [e.dxf.handle for e in entities]
+
+
+class TestAttributeIndex:
+    def test_index_is_not_created_by_default(self, doc):
+        assert doc.entitydb.attribute_index is None
+
+    def test_create_index(self, doc):
+        index = doc.entitydb.create_attribute_index()
+        assert isinstance(index, AttributeIndex)
+        assert doc.entitydb.create_attribute_index() is index
+        assert len(index) == len(list(doc.entitydb.values()))
+        doc.entitydb.delete_attribute_index()
+        assert doc.entitydb.attribute_index is None
+
+    def test_get_handles(self, doc):
+        index = doc.entitydb.create_attribute_index()
+        assert len(index.get("dxftype", "LINE")) == 21
+        assert len(index.get("layer", "WALL")) == 12, "expected case-insensitive"
+        assert len(index.get("color", 1)) == 7
+        assert len(index.get("linetype", "dashed")) == 1
+        assert index.get("layer", "xxx") == set()
+
+    def test_find_handles(self, doc):
+        index = doc.entitydb.create_attribute_index()
+        assert len(index.find(["LINE", "CIRCLE"])) == 22
+        assert len(index.find(["LINE"], [("layer", "wall"), ("color", 1)])) == 4
+        assert len(index.find(attributes=[("layer", "wall")])) == 12
+        assert len(index.find()) == len(index)
+
+    def test_unset_attributes_are_indexed_by_default_value(self, doc):
+        index = doc.entitydb.create_attribute_index()
+        circle = doc.modelspace().query("CIRCLE").first
+        assert circle.dxf.handle in index.get("color", 256)
+
+    def test_invalid_attribute_name_raises_key_error(self, doc):
+        index = doc.entitydb.create_attribute_index()
+        with pytest.raises(KeyError):
+            index.get("lineweight", -1)
+
+    def test_index_new_entities(self, doc):
+        index = doc.entitydb.create_attribute_index()
+        circle = doc.modelspace().add_circle((0, 0), 1, dxfattribs={"layer": "NEW"})
+        assert index.get("layer", "NEW") == {circle.dxf.handle}
+
+    def test_update_modified_attributes(self, doc):
+        index = doc.entitydb.create_attribute_index()
+        circle = doc.modelspace().query("CIRCLE").first
+        handle = circle.dxf.handle
+        circle.dxf.layer = "MOVED"
+        circle.dxf.color = 5
+        assert index.get("layer", "MOVED") == {handle}
+        assert handle not in index.get("layer", "WALL")
+        assert index.get("color", 5) == {handle}
+        del circle.dxf.color
+        assert handle in index.get("color", 256)
+
+    def test_change_attribute_twice(self, doc):
+        index = doc.entitydb.create_attribute_index()
+        circle = doc.modelspace().query("CIRCLE").first
+        handle = circle.dxf.handle
+        circle.dxf.layer = "FIRST"
+        circle.dxf.layer = "SECOND"
+        assert index.get("layer", "FIRST") == set()
+        assert handle not in index.get("layer", "wall")
+        assert index.get("layer", "SECOND") == {handle}
+        assert len(doc.modelspace().query('*[layer=="FIRST"]')) == 0
+
+    def test_remove_deleted_entities(self, doc):
+        index = doc.entitydb.create_attribute_index()
+        msp = doc.modelspace()
+        circle = msp.query("CIRCLE").first
+        handle = circle.dxf.handle
+        msp.delete_entity(circle)
+        assert handle not in index
+        assert index.get("dxftype", "CIRCLE") == set()
+
+    def test_remove_entities_deleted_by_trashcan(self, doc):
+        db = doc.entitydb
+        index = db.create_attribute_index()
+        handle = doc.modelspace().query("POINT").first.dxf.handle
+        with db.trashcan() as trash:
+            trash.add(handle)
+        assert handle not in db
+        assert handle not in index
+
+    def test_remove_destroyed_entities(self, doc):
+        index = doc.entitydb.create_attribute_index()
+        point = doc.modelspace().query("POINT").first
+        handle = point.dxf.handle
+        point.destroy()
+        assert handle not in index
+
+
+QUERIES = [
+    "LINE",
+    "LINE CIRCLE",
+    'LINE[layer=="WALL"]',
+    'LINE[layer=="wall"]',
+    '*[layer=="wall"]i',
+    'LINE CIRCLE[layer=="WALL" & color==1]',
+    '*[layer=="WALL" & color<2]',
+    '* !LINE[layer=="wall"]i',
+    '*[linetype=="DASHED"]',
+    '*[layer=="WALL" | color==1]',
+    "LINE[color<2]",
+    "*[color==256]",
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_indexed_layout_query_is_equal_to_scan(doc, query):
+    msp = doc.modelspace()
+    expected = handles(msp.query(query))
+    doc.entitydb.create_attribute_index()
+    assert handles(msp.query(query)) == expected
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_indexed_document_query_is_equal_to_scan(doc, query):
+    expected = handles(doc.query(query))
+    doc.entitydb.create_attribute_index()
+    assert handles(doc.query(query)) == expected
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_indexed_entitydb_query_is_equal_to_scan(doc, query):
+    expected = handles(doc.entitydb.query(query))
+    doc.entitydb.create_attribute_index()
+    assert handles(doc.entitydb.query(query)) == expected
+
+
+def test_indexed_query_preserves_layout_order(doc):
+    msp = doc.modelspace()
+    doc.entitydb.create_attribute_index()
+    first = msp[0]
+    msp.delete_entity(msp[1])
+    msp.move_to_layout(first, msp)  # moves the first entity to the end
+    assert msp.query("LINE")[-1] is first
+    lines = [e for e in msp if e.dxftype() == "LINE"]
+    assert handles(msp.query("LINE")) == handles(lines)
+
+
+def test_indexed_query_preserves_layout_order_of_few_candidates(doc):
+    msp = doc.modelspace()
+    for _ in range(100):
+        msp.add_point((0, 0))
+    doc.entitydb.create_attribute_index()
+    query = 'LINE[layer=="Door"]'
+    first = msp.query(query).first
+    msp.move_to_layout(first, msp)  # moves the first entity to the end
+    result = msp.query(query)
+    assert result[-1] is first
+    doors = [e for e in msp if e.dxftype() == "LINE" and e.dxf.layer == "Door"]
+    assert handles(result) == handles(doors)
+
+
+def test_indexed_query_of_modified_entities(doc):
+    msp = doc.modelspace()
+    doc.entitydb.create_attribute_index()
+    circle = msp.query("CIRCLE").first
+    circle.dxf.layer = "CIRCLE"
+    assert msp.query('*[layer=="CIRCLE"]').first is circle
+    msp.query("CIRCLE").layer = "WALL"
+    assert len(msp.query('*[layer=="CIRCLE"]')) == 0
+    assert circle in msp.query('*[layer=="WALL"]')
+    del msp.query("CIRCLE").layer
+    assert circle in msp.query('*[layer=="0"]')
+
+
+def test_indexed_query_of_lazy_loaded_document(doc, tmp_path):
+    filename = tmp_path / "index.dxf"
+    doc.saveas(filename)
+    expected = handles(doc.modelspace().query('LINE[layer=="WALL"]'))
+    lazy_doc = ezdxf.readfile(filename, lazy=True)
+    lazy_doc.entitydb.create_attribute_index()
+    assert handles(lazy_doc.modelspace().query('LINE[layer=="WALL"]')) == expected
+
+
+class TestQueryPlan:
+    @pytest.fixture
+    def index(self, doc):
+        return doc.entitydb.create_attribute_index()
+
+    def test_query_without_indexed_predicates(self, index):
+        assert plan_query("*", index) is None
+        assert plan_query("* !LINE", index) is None
+        assert plan_query("*[color<2]", index) is None
+        assert plan_query('*[layer=="WALL" | color==1]', index) is None
+
+    def test_entity_names(self, index):
+        plan = plan_query("LINE CIRCLE", index)
+        assert len(plan.handles) == 22
+
+    def test_conjunctive_equality_relations(self, index):
+        plan = plan_query('LINE[layer=="WALL" & color==1]', index)
+        assert len(plan.handles) == 4
+
+    def test_case_sensitive_string_relations_are_tested_by_matcher(self, doc, index):
+        plan = plan_query('CIRCLE[layer=="WALL"]', index)
+        circle = doc.modelspace().query("CIRCLE").first
+        assert plan.handles == {circle.dxf.handle}
+        assert plan.match(circle) is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -5,6 +5,7 @@ import ezdxf
 from ezdxf.entitydb import EntityDB
 from ezdxf.entities.dxfentity import DXFEntity
 from ezdxf.audit import Auditor
+from ezdxf.lldxf.const import DXFInternalEzdxfError
 
 ENTITY = DXFEntity.new(handle="FFFF")
 auditor = Auditor(ezdxf.new())
@@ -148,6 +149,24 @@ def test_add_entity_multiple_times():
     assert len(db) == 1, "do not store same entity multiple times"
 
 
+def test_add_skips_used_handles():
+    db = EntityDB()
+    db["1"] = DXFEntity()
+    db["3"] = DXFEntity()
+    entities = [DXFEntity() for _ in range(2)]
+    for e in entities:
+        db.add(e)
+    assert [e.dxf.handle for e in entities] == ["2", "4"]
+    assert db["4"] is entities[1]
+
+
+def test_add_to_locked_database():
+    db = EntityDB()
+    db.locked = True
+    with pytest.raises(DXFInternalEzdxfError):
+        db.add(DXFEntity())
+
+
 def test_discard_contained_entity():
     db = EntityDB()
     e = DXFEntity()
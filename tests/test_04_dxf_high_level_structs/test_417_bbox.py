@@ -5,6 +5,7 @@ import pytest
 import ezdxf
 from ezdxf.layouts import VirtualLayout
 from ezdxf import bbox, disassemble
+from ezdxf.math import BoundingBox
 from ezdxf.render.forms import square, translate
 
 
@@ -173,5 +174,138 @@ def test_precise_bounding_box_calculation(circle):
     assert box.extmax == (+100, +100)
 
 
+def primitive_extents(entities) -> BoundingBox:
+    box = BoundingBox()
+    for primitive in disassemble.to_primitives(
+        disassemble.recursive_decompose(entities)
+    ):
+        box.extend(primitive.bbox())
+    return box
+
+
+def assert_extents(entities, extmin, extmax):
+    box = bbox.extents(entities)
+    assert box.extmin.isclose(extmin, abs_tol=1e-6)
+    assert box.extmax.isclose(extmax, abs_tol=1e-6)
+
+
+class TestBatchProcessing:
+    def test_arc(self):
+        lay = VirtualLayout()
+        lay.add_arc((1, 2, 3), radius=2, start_angle=45, end_angle=135)
+        assert_extents(lay, (-0.414214, 3.414214, 3), (2.414214, 4, 3))
+
+    def test_arc_passing_zero_degrees(self):
+        lay = VirtualLayout()
+        lay.add_arc((0, 0), radius=1, start_angle=270, end_angle=90)
+        assert_extents(lay, (0, -1), (1, 1))
+
+    def test_arc_with_normalized_equal_angles_is_a_full_circle(self):
+        lay = VirtualLayout()
+        lay.add_arc((0, 0), radius=1, start_angle=30, end_angle=390)
+        assert_extents(lay, (-1, -1), (1, 1))
+
+    def test_empty_arcs_and_circles(self):
+        lay = VirtualLayout()
+        lay.add_arc((0, 0), radius=1, start_angle=30, end_angle=30)
+        lay.add_circle((0, 0), radius=0)
+        assert bbox.extents(lay).has_data is False
+
+    def test_negative_radius(self):
+        lay = VirtualLayout()
+        lay.add_circle((1, 1), radius=-2)
+        assert_extents(lay, (-1, -1), (3, 3))
+
+    def test_lwpolyline_with_elevation(self):
+        lay = VirtualLayout()
+        lay.add_lwpolyline([(0, 0), (2, 1), (1, 3)], dxfattribs={"elevation": 4})
+        assert_extents(lay, (0, 0, 4), (2, 3, 4))
+
+    def test_lwpolyline_with_bulges(self):
+        lay = VirtualLayout()
+        # counter-clockwise semicircle below the x-axis, clockwise semicircle
+        # left of the y-axis:
+        lay.add_lwpolyline([(0, 0, 1), (2, 0, 0), (0, 0, -1), (0, 2, 0)], format="xyb")
+        assert_extents(lay, (-1, -1), (2, 2))
+
+    def test_closing_segment_of_lwpolyline(self):
+        lay = VirtualLayout()
+        lay.add_lwpolyline([(0, 0, 0), (2, 0, 1)], format="xyb", close=False)
+        assert_extents(lay, (0, 0), (2, 0))
+        lay[0].closed = True
+        assert_extents(lay, (0, 0), (2, 1))
+
+    def test_lwpolyline_with_less_than_two_vertices_is_empty(self):
+        lay = VirtualLayout()
+        lay.add_lwpolyline([(1, 1)])
+        assert bbox.extents(lay).has_data is False
+
+    @pytest.mark.parametrize(
+        "dxfattribs",
+        [
+            {"extrusion": (0, 0, -1)},
+            {"extrusion": (1, 1, 1)},
+        ],
+    )
+    def test_extrusion_is_processed_as_primitive(self, dxfattribs):
+        lay = VirtualLayout()
+        lay.add_circle((1, 2, 3), radius=2, dxfattribs=dxfattribs)
+        lay.add_arc((1, 2, 3), 2, 10, 80, dxfattribs=dxfattribs)
+        lay.add_lwpolyline([(0, 0, 1), (2, 1, 0)], "xyb", dxfattribs=dxfattribs)
+        expected = primitive_extents(lay)
+        assert_extents(lay, expected.extmin, expected.extmax)
+
+    def test_lwpolyline_with_width_is_processed_as_primitive(self):
+        lay = VirtualLayout()
+        lay.add_lwpolyline([(0, 0, 2, 2), (4, 0, 2, 2)], format="xyse")
+        assert_extents(lay, (0, -1), (4, 1))
+
+    def test_lwpolyline_with_const_width_is_processed_as_primitive(self):
+        lay = VirtualLayout()
+        lay.add_lwpolyline([(0, 0), (10, 0)], dxfattribs={"const_width": 4})
+        assert_extents(lay, (0, -2), (10, 2))
+
+    def test_block_references(self):
+        doc = ezdxf.new()
+        blk = doc.blocks.new("BLOCK")
+        blk.add_circle((0, 0), radius=1)
+        blk.add_solid(square(1))
+        msp = doc.modelspace()
+        msp.add_blockref("BLOCK", (10, 0), dxfattribs={"xscale": 2, "yscale": 2})
+        assert_extents(msp, (8, -2), (12, 2))
+
+    def test_store_bounding_boxes_of_top_level_entities_in_cache(self):
+        doc = ezdxf.new()
+        blk = doc.blocks.new("BLOCK")
+        blk.add_line((0, 0), (1, 1))
+        blk.add_solid(square(1))
+        msp = doc.modelspace()
+        line = msp.add_line((0, 0), (-1, -1))
+        blockref = msp.add_blockref("BLOCK", (10, 0))
+        circle = msp.add_circle((0, 0), radius=0)
+        cache = bbox.Cache()
+        bbox.extents(msp, cache=cache)
+        assert cache.get(line).extmin.isclose((-1, -1))
+        assert cache.get(blockref).extmax.isclose((11, 1))
+        assert cache.get(circle).has_data is False
+        box = bbox.extents(msp, cache=cache)
+        assert box.extmin.isclose((-1, -1))
+        assert box.extmax.isclose((11, 1))
+
+    def test_batch_processed_sub_entities_are_not_cached(self):
+        doc = ezdxf.new()
+        blk = doc.blocks.new("BLOCK")
+        blk.add_line((0, 0), (1, 1))
+        blk.add_solid(square(1))
+        msp = doc.modelspace()
+        msp.add_blockref("BLOCK", (10, 0))
+        cache = bbox.Cache(uuid=True)
+        bbox.extents(msp, cache=cache)
+        # the INSERT and the SOLID primitive, the virtual LINE is not accessed:
+        assert cache.misses == 2
+        bbox.extents(msp, cache=cache)
+        assert cache.hits == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
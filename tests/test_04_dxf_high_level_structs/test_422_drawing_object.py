@@ -248,3 +248,51 @@ ENDSEC
   0
 EOF
 """
+
+
+
+@pytest.fixture
+def fixed_meta_data():
+    import ezdxf
+
+    state = ezdxf.options.write_fixed_meta_data_for_testing
+    ezdxf.options.write_fixed_meta_data_for_testing = True
+    yield
+    ezdxf.options.write_fixed_meta_data_for_testing = state
+
+
+@pytest.mark.parametrize("dxfversion", ["R12", "R2000", "R2018"])
+def test_saveas_creates_same_output_as_text_stream(
+    dxfversion, tmp_path, fixed_meta_data
+):
+    import ezdxf
+
+    doc = ezdxf.new(dxfversion)
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1 / 3, 2 / 3))
+    msp.add_polyline2d([(0, 0), (1.5, 2.5), (3, 4)])
+    msp.add_text("äöü € 中文")
+    buffered = tmp_path / "buffered.dxf"
+    doc.saveas(buffered)
+
+    text_stream = tmp_path / "text_stream.dxf"
+    with open(
+        text_stream, "wt", encoding=doc.output_encoding, errors="dxfreplace"
+    ) as fp:
+        doc.write(fp)
+    assert buffered.read_bytes() == text_stream.read_bytes()
+
+
+@pytest.mark.parametrize("fmt", ["asc", "bin"])
+def test_save_calls_overridden_write_method(fmt, tmp_path):
+    from ezdxf.document import Drawing
+
+    class CustomDrawing(Drawing):
+        def write(self, stream, fmt="asc"):
+            calls.append(fmt)
+            super().write(stream, fmt)
+
+    calls = []
+    doc = CustomDrawing.new()
+    doc.saveas(tmp_path / "custom.dxf", fmt=fmt)
+    assert calls == [fmt]
@@ -0,0 +1,187 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.entitydb import LazyEntitySpace
+
+
+@pytest.fixture(scope="module")
+def filename(tmp_path_factory):
+    doc = ezdxf.new()
+    doc.blocks.new("BLK").add_attdef("TAG", (0, 0))
+    msp = doc.modelspace()
+    for index in range(10):
+        msp.add_line((index, 0), (index, 1), dxfattribs={"layer": f"L{index % 2}"})
+    msp.add_polyline3d([(0, 0, 0), (1, 1, 1)])
+    insert = msp.add_blockref("BLK", (0, 0), dxfattribs={"layer": "TITLE"})
+    insert.add_auto_attribs({"TAG": "VALUE"})
+    doc.groups.new("GROUP").extend(msp[:2])
+    doc.layout().add_circle((0, 0), 1)
+    filename = tmp_path_factory.mktemp("lazy") / "lazy.dxf"
+    doc.saveas(filename)
+    return filename
+
+
+def test_entities_are_not_loaded(filename):
+    doc = ezdxf.readfile(filename, lazy=True)
+    msp = doc.modelspace()
+    assert isinstance(msp.entity_space, LazyEntitySpace)
+    assert msp.entity_space.unloaded_count() == 12
+    assert doc.entitydb.has_unloaded_entities() is True
+
+
+def test_load_entity_by_handle(filename):
+    expected = ezdxf.readfile(filename).modelspace()[-1]
+    doc = ezdxf.readfile(filename, lazy=True)
+    insert = doc.entitydb[expected.dxf.handle]
+    assert insert.dxftype() == "INSERT"
+    assert insert.dxf.owner == doc.modelspace().block_record_handle
+    assert insert.attribs[0].dxf.text == "VALUE"
+    assert insert.doc is doc
+    assert doc.modelspace()[-1] is insert, "expected same entity object"
+
+
+def test_load_entity_by_handle_of_sub_entity(filename):
+    expected = ezdxf.readfile(filename).modelspace()[-1]
+    doc = ezdxf.readfile(filename, lazy=True)
+    attrib = doc.entitydb.get(expected.attribs[0].dxf.handle)
+    assert attrib.dxftype() == "ATTRIB"
+    assert doc.entitydb[expected.dxf.handle].attribs[0] is attrib
+
+
+def test_load_entities_by_iteration(filename):
+    expected = [e.dxftype() for e in ezdxf.readfile(filename).modelspace()]
+    doc = ezdxf.readfile(filename, lazy=True)
+    msp = doc.modelspace()
+    assert [e.dxftype() for e in msp] == expected
+    assert msp.entity_space.unloaded_count() == 0
+
+
+def test_load_entities_by_query(filename):
+    doc = ezdxf.readfile(filename, lazy=True)
+    assert len(doc.modelspace().query("LINE[layer=='L0']")) == 5
+
+
+def test_load_entities_of_paperspace(filename):
+    doc = ezdxf.readfile(filename, lazy=True)
+    assert doc.layout()[0].dxftype() == "CIRCLE"
+
+
+def test_grouped_entities_are_loaded(filename):
+    doc = ezdxf.readfile(filename, lazy=True)
+    assert len(doc.groups.get("GROUP")) == 2
+
+
+def test_prefilter(filename):
+    doc = ezdxf.readfile(
+        filename, lazy=True, prefilter=lambda dxftype, layer: layer == "TITLE"
+    )
+    msp = doc.modelspace()
+    assert len(msp) == 1
+    assert msp[0].attribs[0].dxf.text == "VALUE"
+    assert len(doc.layout()) == 0
+    # grouped entities are removed from GROUP:
+    assert len(doc.groups.get("GROUP")) == 0
+    assert doc.audit().has_errors is False
+
+
+def test_prefilter_requires_lazy_loading_mode(filename):
+    with pytest.raises(ValueError):
+        ezdxf.readfile(filename, prefilter=lambda dxftype, layer: True)
+
+
+def test_audit_and_export_lazy_loaded_document(filename, tmp_path):
+    doc = ezdxf.readfile(filename, lazy=True)
+    assert doc.audit().has_errors is False
+    doc.saveas(tmp_path / "copy.dxf")
+    doc2 = ezdxf.readfile(tmp_path / "copy.dxf")
+    assert len(doc2.modelspace()) == 12
+
+
+def test_new_entities_do_not_reuse_unloaded_handles(filename):
+    doc = ezdxf.readfile(filename, lazy=True)
+    msp = doc.modelspace()
+    line = msp.add_line((0, 0), (1, 0))
+    assert line.dxf.handle not in [e.dxf.handle for e in msp if e is not line]
+
+
+def test_delete_lazy_loaded_entity(filename):
+    doc = ezdxf.readfile(filename, lazy=True)
+    msp = doc.modelspace()
+    line = doc.entitydb[msp[0].dxf.handle]
+    msp.delete_entity(line)
+    assert len(msp) == 11
+    assert line.is_alive is False
+
+
+def test_remove_does_not_load_other_entities(filename):
+    handles = [e.dxf.handle for e in ezdxf.readfile(filename).modelspace()]
+    doc = ezdxf.readfile(filename, lazy=True)
+    space = doc.modelspace().entity_space
+    line = doc.entitydb[handles[2]]  # the entity space stores the handle
+    space.remove(line)
+    assert space.unloaded_count() == 11
+    assert len(space) == 11
+    assert line not in list(space)
+    with pytest.raises(ValueError):
+        space.remove(line)
+
+
+def test_remove_entities_does_not_load_other_entities(filename):
+    handles = [e.dxf.handle for e in ezdxf.readfile(filename).modelspace()]
+    doc = ezdxf.readfile(filename, lazy=True)
+    space = doc.modelspace().entity_space
+    line1 = space[0]  # loaded by the entity space
+    line2 = doc.entitydb[handles[2]]  # the entity space stores the handle
+    space.remove_entities([line1, line2])
+    assert space.unloaded_count() == 10
+    assert len(space) == 10
+    assert [e.dxf.handle for e in space] == handles[1:2] + handles[3:]
+
+
+def test_remove_entities_of_lazy_entity_space_raises_value_error(filename):
+    doc = ezdxf.readfile(filename, lazy=True)
+    space = doc.modelspace().entity_space
+    line = doc.entitydb[space.entities[0]]
+    with pytest.raises(ValueError):
+        space.remove_entities([line, doc.layout()[0]])
+    assert space.unloaded_count() == 12
+
+
+def test_model_space_block_layout_shares_lazy_entity_space(filename):
+    doc = ezdxf.readfile(filename, lazy=True)
+    block = doc.blocks.get("*Model_Space")
+    assert block.entity_space is doc.modelspace().entity_space
+    assert len(block) == 12
+
+
+def test_export_is_equal_to_regular_loaded_document(filename, tmp_path):
+    state = ezdxf.options.write_fixed_meta_data_for_testing
+    ezdxf.options.write_fixed_meta_data_for_testing = True
+    try:
+        ezdxf.readfile(filename).saveas(tmp_path / "regular.dxf")
+        ezdxf.readfile(filename, lazy=True).saveas(tmp_path / "lazy.dxf")
+    finally:
+        ezdxf.options.write_fixed_meta_data_for_testing = state
+    assert (tmp_path / "regular.dxf").read_bytes() == (
+        tmp_path / "lazy.dxf"
+    ).read_bytes()
+
+
+def test_entitydb_len_is_equal_to_iteration_count(filename):
+    db = ezdxf.readfile(filename, lazy=True).entitydb
+    assert db.has_unloaded_entities() is True
+    assert len(db) == len(list(db))
+
+
+def test_invalid_linked_entity_structure():
+    from ezdxf.lldxf.loader import group_linked_entities
+    from ezdxf.lldxf.tags import Tags
+    from ezdxf.lldxf.const import DXFStructureError
+
+    entities = [
+        Tags.from_text("0\nPOLYLINE\n5\nA\n"),
+        Tags.from_text("0\nLINE\n5\nB\n"),
+    ]
+    with pytest.raises(DXFStructureError, match="Expected DXF entity VERTEX"):
+        list(group_linked_entities(entities))
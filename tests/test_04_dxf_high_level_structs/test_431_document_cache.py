@@ -0,0 +1,204 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+import os
+import pytest
+
+import ezdxf
+from ezdxf.doccache import DocumentCache, default_cache
+from ezdxf.lldxf.types import DXFVertex, DXFBinaryTag
+from ezdxf.filemanagement import _load_dxf_structure
+
+MAX_SIZE = 10_000_000
+
+
+@pytest.fixture
+def filename(tmp_path):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={"layer": "LINES"})
+    msp.add_lwpolyline([(0, 0), (1, 0), (1, 1)])
+    msp.add_text("TEXT")
+    psp = doc.layout()
+    psp.add_circle((0, 0), 1)
+    filename = tmp_path / "test.dxf"
+    doc.saveas(filename)
+    return filename
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DocumentCache(tmp_path / "cache", MAX_SIZE)
+
+
+def load_sections(filename):
+    return _load_dxf_structure(
+        str(filename),
+        False,
+        encoding=None,
+        errors="surrogateescape",
+    )
+
+
+def test_empty_cache_returns_none(cache, filename):
+    assert cache.get(filename) is None
+    assert cache.entries() == []
+    assert cache.total_size() == 0
+
+
+def test_cached_sections_are_equal_to_loaded_sections(cache, filename):
+    sections = load_sections(filename)
+    assert cache.put(filename, sections) is True
+
+    cached_sections = cache.get(filename)
+    assert list(cached_sections.keys()) == list(sections.keys())
+    for name, entities in sections.items():
+        cached_entities = cached_sections[name]
+        assert len(cached_entities) == len(entities)
+        for cached_entity, entity in zip(cached_entities, entities):
+            assert cached_entity == entity
+            assert [type(tag) for tag in cached_entity] == [
+                type(tag) for tag in entity
+            ]
+
+
+def test_cached_sections_have_typed_values(cache, filename):
+    cache.put(filename, load_sections(filename))
+    tags = [tag for entity in cache.get(filename)["ENTITIES"] for tag in entity]
+    vertices = [tag for tag in tags if isinstance(tag, DXFVertex)]
+    assert len(vertices) > 0
+    assert all(isinstance(v, float) for tag in vertices for v in tag.value)
+    assert any(isinstance(tag.value, int) for tag in tags)
+
+
+def test_cache_binary_tags(cache, tmp_path):
+    doc = ezdxf.new()
+    doc.objects.add_xrecord().tags.append((310, b"\xfe\xff\x00"))
+    filename = tmp_path / "binary.dxf"
+    doc.saveas(filename)
+    cache.put(filename, load_sections(filename))
+    tags = [tag for entity in cache.get(filename)["OBJECTS"] for tag in entity]
+    binary_tags = [tag for tag in tags if isinstance(tag, DXFBinaryTag)]
+    assert binary_tags[0].value == b"\xfe\xff\x00"
+
+
+def test_modified_file_invalidates_cache_entry(cache, filename):
+    cache.put(filename, load_sections(filename))
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(filename) is None
+
+
+def test_different_loading_arguments_invalidate_cache_entry(cache, filename):
+    cache.put(filename, load_sections(filename))
+    assert cache.get(filename, encoding="cp1252") is None
+    assert cache.get(filename, errors="ignore") is None
+    assert cache.get(filename) is not None
+
+
+def test_invalid_cache_entry_returns_none(cache, filename):
+    cache.put(filename, load_sections(filename))
+    cache.entry_path(filename).write_bytes(b"invalid data")
+    assert cache.get(filename) is None
+
+
+def test_discard_cache_entry(cache, filename):
+    cache.put(filename, load_sections(filename))
+    assert cache.discard(filename) is True
+    assert cache.get(filename) is None
+    assert cache.discard(filename) is False
+
+
+def test_list_cache_entries(cache, filename):
+    cache.put(filename, load_sections(filename))
+    entries = cache.entries()
+    assert len(entries) == 1
+    assert entries[0].filename == os.path.abspath(filename)
+    assert entries[0].size == cache.total_size()
+
+
+def test_evict_least_recently_used_entries(cache, filename, tmp_path):
+    sections = load_sections(filename)
+    names = []
+    for index in range(3):
+        name = tmp_path / f"copy{index}.dxf"
+        name.write_bytes(filename.read_bytes())
+        cache.put(name, sections)
+        path = cache.entry_path(name)
+        os.utime(path, (index * 100, index * 100))  # set time of last usage
+        names.append(name)
+
+    # get() updates the time of last usage:
+    assert cache.get(names[0]) is not None
+    entry_size = cache.entry_path(names[0]).stat().st_size
+    assert cache.evict(max_size=entry_size * 2) == 1
+    assert cache.get(names[1]) is None  # least recently used
+    assert cache.get(names[0]) is not None
+    assert cache.get(names[2]) is not None
+
+
+def test_put_evicts_entries_exceeding_max_size(filename, tmp_path):
+    sections = load_sections(filename)
+    cache = DocumentCache(tmp_path / "cache", MAX_SIZE)
+    cache.put(filename, sections)
+    cache.max_size = cache.total_size() + 100
+    second = tmp_path / "second.dxf"
+    second.write_bytes(filename.read_bytes())
+    assert cache.put(second, sections) is True
+    assert len(cache.entries()) == 1
+    assert cache.get(second) is not None
+
+
+def test_do_not_store_entries_larger_than_max_size(filename, tmp_path):
+    cache = DocumentCache(tmp_path / "cache", max_size=100)
+    assert cache.put(filename, load_sections(filename)) is False
+    assert cache.entries() == []
+
+
+def test_clear_cache(cache, filename):
+    cache.put(filename, load_sections(filename))
+    assert cache.clear() == 1
+    assert cache.entries() == []
+
+
+class TestReadfile:
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache_home"))
+
+    def test_default_cache_location(self, tmp_path):
+        assert default_cache().directory.is_relative_to(tmp_path / "cache_home")
+
+    def test_readfile_creates_cache_entry(self, filename):
+        ezdxf.readfile(filename, use_cache=True)
+        assert default_cache().get(filename) is not None
+
+    def test_readfile_without_cache_does_not_create_cache_entry(self, filename):
+        ezdxf.readfile(filename)
+        assert default_cache().entries() == []
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_load_document_from_cache(self, filename, lazy):
+        ezdxf.readfile(filename, use_cache=True)
+        doc = ezdxf.readfile(filename, use_cache=True, lazy=lazy)
+        msp = doc.modelspace()
+        assert [e.dxftype() for e in msp] == ["LINE", "LWPOLYLINE", "TEXT"]
+        assert msp[0].dxf.layer == "LINES"
+        assert msp[0].dxf.end == (1, 0)
+        assert len(msp[1]) == 3
+        psp = doc.layout()
+        assert psp[0].dxftype() == "CIRCLE"
+        assert doc.filename == str(filename)
+        assert len(doc.audit().errors) == 0
+
+    def test_load_binary_dxf_from_cache(self, tmp_path):
+        doc = ezdxf.new()
+        doc.modelspace().add_line((0, 0), (1, 0))
+        filename = tmp_path / "binary.dxf"
+        doc.saveas(filename, fmt="bin")
+        ezdxf.readfile(filename, use_cache=True)
+        doc = ezdxf.readfile(filename, use_cache=True)
+        assert doc.modelspace()[0].dxf.end == (1, 0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,148 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf import LoadFilter
+
+
+@pytest.fixture(scope="module", params=["R12", "R2000"])
+def filename(request, tmp_path_factory):
+    doc = ezdxf.new(request.param)
+    for name in ("WALL_1", "WALL_2", "OTHER"):
+        doc.layers.add(name)
+    doc.blocks.new("BLK").add_line((0, 0), (1, 0), dxfattribs={"layer": "OTHER"})
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={"layer": "WALL_1"})
+    msp.add_line((0, 0), (1, 0), dxfattribs={"layer": "OTHER"})
+    msp.add_polyline2d([(0, 0), (1, 0), (1, 1)], dxfattribs={"layer": "Wall_2"})
+    msp.add_polyline2d([(0, 0), (1, 0)], dxfattribs={"layer": "OTHER"})
+    msp.add_blockref("BLK", (0, 0), dxfattribs={"layer": "WALL_1"})
+    doc.layout().add_circle((0, 0), 1, dxfattribs={"layer": "WALL_1"})
+    if request.param != "R12":
+        xdict = msp[0].new_extension_dict()
+        xdict.add_xrecord("XREC")
+        doc.layouts.new("Second").add_circle((0, 0), 2)
+    filename = tmp_path_factory.mktemp(request.param) / "filter.dxf"
+    doc.saveas(filename)
+    return filename
+
+
+def content(layout):
+    return [(e.dxftype(), e.dxf.layer) for e in layout]
+
+
+class TestLoadFilter:
+    def test_accept_all(self):
+        assert LoadFilter().accept("LINE", "0", "Model") is True
+
+    def test_types(self):
+        f = LoadFilter(types=["line"])
+        assert f.accept("LINE", "0", "Model") is True
+        assert f.accept("CIRCLE", "0", "Model") is False
+
+    def test_layer_wildcards_are_case_insensitive(self):
+        f = LoadFilter(layers=["WALL*", "DOOR"])
+        assert f.accept("LINE", "wall_1", "Model") is True
+        assert f.accept("LINE", "Door", "Model") is True
+        assert f.accept("LINE", "DOOR_1", "Model") is False
+
+    def test_empty_layer_list_rejects_all(self):
+        assert LoadFilter(layers=[]).accept("LINE", "0", "Model") is False
+
+    def test_layouts_are_case_insensitive(self):
+        f = LoadFilter(layouts=["model"])
+        assert f.accept("LINE", "0", "Model") is True
+        assert f.accept("LINE", "0", "Layout1") is False
+
+
+def test_filter_by_type_and_layer(filename):
+    doc = ezdxf.readfile(
+        filename, filter=LoadFilter(types=["POLYLINE", "INSERT"], layers=["WALL*"])
+    )
+    msp = doc.modelspace()
+    assert content(msp) == [("POLYLINE", "Wall_2"), ("INSERT", "WALL_1")]
+    assert len(msp[0].vertices) == 3
+    assert len(doc.layout("Layout1")) == 0
+
+
+def test_block_definitions_are_not_filtered(filename):
+    doc = ezdxf.readfile(filename, filter=LoadFilter(layers=["WALL*"]))
+    assert content(doc.blocks.get("BLK")) == [("LINE", "OTHER")]
+
+
+def test_filter_by_layout(filename):
+    doc = ezdxf.readfile(filename, filter=LoadFilter(layouts=["Layout1"]))
+    assert len(doc.modelspace()) == 0
+    assert content(doc.layout("Layout1")) == [("CIRCLE", "WALL_1")]
+    if "Second" in doc.layouts:
+        assert len(doc.layout("Second")) == 0
+
+
+def test_filter_paperspace_layout_stored_in_blocks_section(filename):
+    doc = ezdxf.readfile(filename)
+    if "Second" not in doc.layouts:
+        pytest.skip("DXF R12 supports only a single paperspace layout")
+    doc = ezdxf.readfile(filename, filter=LoadFilter(layouts=["second"]))
+    assert content(doc.layout("Second")) == [("CIRCLE", "0")]
+    assert len(doc.modelspace()) == 0
+    assert len(doc.layout("Layout1")) == 0
+
+
+def test_filtered_document_is_valid(filename):
+    doc = ezdxf.readfile(filename, filter=LoadFilter(types=["LINE"]))
+    assert len(doc.audit().errors) == 0
+    assert doc.layers.has_entry("WALL_1")
+    assert "BLK" in doc.blocks
+
+
+@pytest.mark.parametrize(
+    "load_filter",
+    [LoadFilter(types=["CIRCLE"]), LoadFilter(layouts=["Model"]), LoadFilter(types=[])],
+)
+def test_filtered_document_is_audit_clean(filename, load_filter):
+    doc = ezdxf.readfile(filename, filter=load_filter)
+    auditor = doc.audit()
+    assert len(auditor.errors) == 0
+    assert len(auditor.fixes) == 0
+
+
+@pytest.mark.parametrize("dxfversion", ["R12", "R2000"])
+def test_paperspace_viewports_are_preserved(dxfversion, tmp_path):
+    doc = ezdxf.new(dxfversion, setup=True)
+    doc.modelspace().add_line((0, 0), (1, 0))
+    psp = doc.layout()
+    psp.add_viewport((5, 5), (10, 10), (0, 0), 10)
+    psp.add_circle((0, 0), 1)
+    expected = [e.dxf.handle for e in psp.viewports()]
+    filename = tmp_path / "viewports.dxf"
+    doc.saveas(filename)
+
+    doc = ezdxf.readfile(filename, filter=LoadFilter(layouts=["Model"]))
+    psp = doc.layout()
+    assert [e.dxf.handle for e in psp.viewports()] == expected
+    assert len(psp.query("CIRCLE")) == 0
+    assert len(doc.audit().errors) == 0
+
+
+def test_remove_objects_owned_by_removed_entities(filename):
+    doc = ezdxf.readfile(filename)
+    if doc.dxfversion == "AC1009":
+        pytest.skip("DXF R12 has no OBJECTS section")
+    xrecords = len(doc.objects.query("XRECORD"))
+    doc = ezdxf.readfile(filename, filter=LoadFilter(layers=["OTHER"]))
+    assert len(doc.objects.query("XRECORD")) == xrecords - 1
+
+
+def test_filter_in_lazy_loading_mode(filename):
+    doc = ezdxf.readfile(filename, lazy=True, filter=LoadFilter(types=["LINE"]))
+    assert content(doc.modelspace()) == [("LINE", "WALL_1"), ("LINE", "OTHER")]
+
+
+def test_read_stream_with_filter(filename):
+    with open(filename, "rt", encoding="cp1252") as fp:
+        doc = ezdxf.read(fp, filter=LoadFilter(layers=["OTHER"]))
+    assert content(doc.modelspace()) == [("LINE", "OTHER"), ("POLYLINE", "OTHER")]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
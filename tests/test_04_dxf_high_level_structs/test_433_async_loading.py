@@ -0,0 +1,157 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+import asyncio
+import gc
+import io
+import threading
+
+import pytest
+import ezdxf
+from ezdxf.document import Drawing, run_in_worker_thread
+from ezdxf.lldxf import loader
+from ezdxf.lldxf.tagger import ascii_tags_loader
+
+COUNT = 2500
+
+
+@pytest.fixture(scope="module")
+def filename(tmp_path_factory):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(COUNT):
+        msp.add_line((index, 0), (0, index))
+    filename = tmp_path_factory.mktemp("async") / "lines.dxf"
+    doc.saveas(filename)
+    return filename
+
+
+def test_readfile_reports_progress(filename):
+    reports = []
+    doc = ezdxf.readfile(filename, progress=lambda *args: reports.append(args))
+    assert len(doc.modelspace()) == COUNT
+    # loading stage, total count of entities is unknown
+    assert ("ENTITIES", loader.PROGRESS_INTERVAL, 0) in reports
+    # last report of the loading stage
+    assert ("ENTITIES", COUNT + 1, 0) in reports
+    # building stage, entities plus the section head
+    assert ("ENTITIES", 0, COUNT + 1) in reports
+    assert ("ENTITIES", COUNT + 1, COUNT + 1) in reports
+    assert ("OBJECTS", 0, 0) not in reports
+
+
+def test_exception_in_progress_function_aborts_loading(filename):
+    def abort(section: str, count: int, total: int):
+        if section == "ENTITIES":
+            raise ValueError
+
+    with pytest.raises(ValueError):
+        ezdxf.readfile(filename, progress=abort)
+
+
+def test_areadfile(filename):
+    reports = []
+
+    def progress(section: str, count: int, total: int):
+        # the progress function is called in the thread of the event loop
+        reports.append(threading.current_thread())
+
+    async def main():
+        return await ezdxf.areadfile(filename, progress=progress)
+
+    doc = asyncio.run(main())
+    assert len(doc.modelspace()) == COUNT
+    assert len(reports) > 0
+    assert set(reports) == {threading.main_thread()}
+
+
+def test_aread(filename):
+    async def main():
+        with open(filename, "rt") as fp:
+            return await ezdxf.aread(fp)
+
+    doc = asyncio.run(main())
+    assert len(doc.modelspace()) == COUNT
+
+
+def test_load_async(filename):
+    async def main():
+        with open(filename, "rt") as fp:
+            return await Drawing.load_async(ascii_tags_loader(fp))
+
+    doc = asyncio.run(main())
+    assert len(doc.modelspace()) == COUNT
+
+
+def test_cancel_loading(filename):
+    cancelled = threading.Event()
+    stopped = threading.Event()
+    completed = []
+
+    def blocking_loader(stream):
+        # start loading after the task was cancelled
+        cancelled.wait(5)
+        try:
+            yield from ascii_tags_loader(stream)
+            completed.append(True)
+        finally:
+            stopped.set()
+
+    async def main():
+        with open(filename, "rt") as fp:
+            task = asyncio.create_task(Drawing.load_async(blocking_loader(fp)))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            cancelled.set()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # worker thread stops at the next progress report
+            await asyncio.get_running_loop().run_in_executor(None, stopped.wait, 5)
+
+    asyncio.run(main())
+    assert stopped.is_set()
+    assert completed == []
+
+
+def test_cancelled_worker_result_is_retrieved(filename):
+    loop_errors = []
+    cancelled = threading.Event()
+
+    def blocking_loader(stream):
+        # start loading after the task was cancelled
+        cancelled.wait(5)
+        yield from ascii_tags_loader(stream)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: loop_errors.append(context))
+        stopped = loop.create_future()
+
+        def func(progress):
+            try:
+                with open(filename, "rt") as fp:
+                    return Drawing.load(blocking_loader(fp), progress=progress)
+            finally:
+                loop.call_soon_threadsafe(stopped.set_result, None)
+
+        task = asyncio.create_task(run_in_worker_thread(func))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        cancelled.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await stopped
+        await asyncio.sleep(0.01)
+        gc.collect()  # unretrieved exceptions are reported by Future.__del__()
+
+    asyncio.run(main())
+    assert loop_errors == []
+
+
+def test_load_async_raises_structure_error():
+    stream = io.StringIO("0\nSECTION\n0\nEOF\n")
+
+    async def main():
+        return await Drawing.load_async(ascii_tags_loader(stream))
+
+    with pytest.raises(ezdxf.DXFStructureError):
+        asyncio.run(main())
@@ -0,0 +1,138 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+import io
+import threading
+
+import pytest
+import ezdxf
+from ezdxf import parallelexport
+from ezdxf.parallelexport import ParallelTagWriter
+
+pytestmark = pytest.mark.skipif(
+    not parallelexport.is_parallel_export_supported(),
+    reason="requires the fork start method",
+)
+
+COUNT = parallelexport.MIN_CHUNK_SIZE * 3
+
+
+@pytest.fixture(autouse=True)
+def multiple_cpus(monkeypatch):
+    # the parallel export requires more than one CPU
+    monkeypatch.setattr(parallelexport.os, "cpu_count", lambda: 4)
+
+
+@pytest.fixture
+def fixed_meta_data():
+    state = ezdxf.options.write_fixed_meta_data_for_testing
+    ezdxf.options.write_fixed_meta_data_for_testing = True
+    yield
+    ezdxf.options.write_fixed_meta_data_for_testing = state
+
+
+def create_doc(dxfversion: str):
+    doc = ezdxf.new(dxfversion)
+    msp = doc.modelspace()
+    block = doc.blocks.new("LARGE_BLOCK")
+    for index in range(COUNT):
+        msp.add_line((index, 0), (0, index / 3))
+        msp.add_text(f"TEXT{index} äöü € 中文")
+        block.add_circle((index, 0), radius=index / 7)
+    msp.add_blockref("LARGE_BLOCK", (0, 0))
+    return doc
+
+
+@pytest.mark.parametrize("dxfversion", ["R12", "R2018"])
+def test_parallel_export_creates_same_output(dxfversion, tmp_path, fixed_meta_data):
+    doc = create_doc(dxfversion)
+    single = tmp_path / "single.dxf"
+    doc.saveas(single)
+    parallel = tmp_path / "parallel.dxf"
+    doc.saveas(parallel, workers=2)
+    assert single.read_bytes() == parallel.read_bytes()
+
+
+def test_parallel_export_with_encoding(tmp_path, fixed_meta_data):
+    doc = create_doc("R2000")
+    single = tmp_path / "single.dxf"
+    doc.saveas(single, encoding="cp1252")
+    parallel = tmp_path / "parallel.dxf"
+    doc.saveas(parallel, encoding="cp1252", workers=3)
+    assert single.read_bytes() == parallel.read_bytes()
+
+
+def test_binary_export_ignores_workers(tmp_path, fixed_meta_data):
+    doc = create_doc("R2000")
+    single = tmp_path / "single.dxb"
+    doc.saveas(single, fmt="bin")
+    parallel = tmp_path / "parallel.dxb"
+    doc.saveas(parallel, fmt="bin", workers=2)
+    assert single.read_bytes() == parallel.read_bytes()
+
+
+def test_small_entity_spaces_are_exported_by_main_process():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(10):
+        msp.add_point((index, 0))
+    tagwriter = ParallelTagWriter(io.StringIO(), doc, 2, dxfversion=doc.dxfversion)
+    tagwriter.write_entities(msp)
+    tagwriter.close()
+    assert tagwriter._pool is None
+
+
+def test_virtual_entities_are_exported_by_main_process():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    lines = [msp.add_line((index, 0), (0, index)) for index in range(COUNT)]
+    virtual = [line.copy() for line in lines]
+    tagwriter = ParallelTagWriter(io.StringIO(), doc, 2, dxfversion=doc.dxfversion)
+    assert tagwriter._split_chunks(virtual) == []
+    assert len(tagwriter._split_chunks(lines)) > 1
+
+
+def test_large_entity_spaces_are_exported_by_worker_processes():
+    doc = create_doc("R2000")
+    doc.write(io.StringIO())  # prepare the document for the export
+    stream = io.StringIO()
+    tagwriter = ParallelTagWriter(stream, doc, 2, dxfversion=doc.dxfversion)
+    tagwriter.write_entities(doc.modelspace())
+    assert tagwriter._pool is not None
+    tagwriter.close()
+    assert tagwriter._pool is None
+    assert stream.getvalue().count("\nLINE\n") == COUNT
+
+
+def test_single_cpu_exports_by_main_process(monkeypatch):
+    monkeypatch.setattr(parallelexport.os, "cpu_count", lambda: 1)
+    doc = create_doc("R2000")
+    tagwriter = ParallelTagWriter(io.StringIO(), doc, 4, dxfversion=doc.dxfversion)
+    assert tagwriter._parallel is False
+
+
+def test_small_documents_are_exported_by_main_process():
+    doc = ezdxf.new()
+    tagwriter = ParallelTagWriter(io.StringIO(), doc, 2, dxfversion=doc.dxfversion)
+    assert tagwriter._parallel is False
+
+
+def test_multithreaded_process_exports_by_main_process(tmp_path, fixed_meta_data):
+    doc = create_doc("R2000")
+    single = tmp_path / "single.dxf"
+    doc.saveas(single)
+
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        stream = io.StringIO()
+        tagwriter = ParallelTagWriter(stream, doc, 2, dxfversion=doc.dxfversion)
+        tagwriter.write_entities(doc.modelspace())
+        assert tagwriter._pool is None
+        tagwriter.close()
+        parallel = tmp_path / "parallel.dxf"
+        doc.saveas(parallel, workers=2)
+    finally:
+        stop.set()
+        thread.join()
+    assert single.read_bytes() == parallel.read_bytes()
@@ -0,0 +1,128 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+import io
+
+import pytest
+import ezdxf
+from ezdxf.document import Drawing
+from ezdxf.lldxf.tagger import ascii_tags_loader
+from ezdxf.snapshot import Snapshot
+
+
+@pytest.fixture
+def fixed_meta_data():
+    state = ezdxf.options.write_fixed_meta_data_for_testing
+    ezdxf.options.write_fixed_meta_data_for_testing = True
+    yield
+    ezdxf.options.write_fixed_meta_data_for_testing = state
+
+
+def create_doc(dxfversion: str = "R2018"):
+    doc = ezdxf.new(dxfversion)
+    doc.layers.add("LINES", color=1)
+    msp = doc.modelspace()
+    for index in range(10):
+        msp.add_line((index, 0), (0, index), dxfattribs={"layer": "LINES"})
+    msp.add_text("TEXT äöü")
+    msp.add_polyline3d([(0, 0, 0), (1, 2, 3), (4, 5, 6)])
+    block = doc.blocks.new("BLOCK")
+    block.add_circle((0, 0), radius=1)
+    blockref = msp.add_blockref("BLOCK", (1, 1))
+    blockref.add_attrib("TAG", "VALUE")
+    doc.paperspace().add_point((1, 1))
+    return doc
+
+
+def to_string(doc) -> str:
+    stream = io.StringIO()
+    doc.write(stream)
+    return stream.getvalue()
+
+
+def reloaded(doc) -> str:
+    """Returns the DXF content of `doc` after a save and reload cycle in lazy
+    loading mode like the derived documents of snapshots.
+    """
+    tagger = ascii_tags_loader(io.StringIO(to_string(doc)))
+    return to_string(Drawing.load(tagger, lazy=True))
+
+
+@pytest.mark.parametrize("dxfversion", ["R12", "R2000", "R2018"])
+def test_derived_document_has_same_content(dxfversion, fixed_meta_data):
+    doc = create_doc(dxfversion)
+    snapshot = doc.snapshot()
+    assert isinstance(snapshot, Snapshot)
+    assert snapshot.dxfversion == doc.dxfversion
+    derived = snapshot.document()
+    assert to_string(derived) == reloaded(doc)
+
+
+def test_entities_are_loaded_lazy():
+    derived = create_doc().snapshot().document()
+    assert derived.entitydb.has_unloaded_entities() is True
+    msp = derived.modelspace()
+    assert len(msp) == 13
+    assert len(msp.query("LINE")) == 10
+    insert = msp.query("INSERT").first
+    assert insert.get_attrib_text("TAG") == "VALUE"
+    assert len(derived.paperspace()) == 1
+
+
+def test_derived_documents_are_independent(fixed_meta_data):
+    doc = create_doc()
+    snapshot = doc.snapshot()
+    expected = reloaded(doc)
+
+    variant1 = snapshot.document()
+    variant1.modelspace().query("LINE").first.dxf.color = 3
+    variant1.modelspace().add_circle((0, 0), radius=5)
+    variant1.blocks.get("BLOCK").add_line((0, 0), (1, 1))
+    variant1.layers.get("LINES").color = 5
+    variant1.header["$INSUNITS"] = 6
+
+    variant2 = snapshot.document()
+    assert to_string(variant2) == expected
+    line = variant2.modelspace().query("LINE").first
+    assert line.dxf.color == 256
+    assert variant2.layers.get("LINES").color == 1
+    assert reloaded(doc) == expected
+
+
+def test_snapshot_is_not_affected_by_source_changes(fixed_meta_data):
+    doc = create_doc()
+    snapshot = doc.snapshot()
+    expected = reloaded(doc)
+    doc.modelspace().add_circle((0, 0), radius=5)
+    doc.layers.add("NEW_LAYER")
+    assert to_string(snapshot.document()) == expected
+
+
+def test_derived_document_does_not_inherit_the_filename(tmp_path):
+    doc = create_doc()
+    doc.saveas(tmp_path / "source.dxf")
+    snapshot = doc.snapshot()
+    assert snapshot.document().filename is None
+    filename = str(tmp_path / "variant.dxf")
+    variant = snapshot.document(filename)
+    variant.save()
+    assert len(ezdxf.readfile(filename).modelspace()) == 13
+
+
+def test_new_entities_of_derived_documents_get_unique_handles():
+    snapshot = create_doc().snapshot()
+    variant = snapshot.document()
+    handles = set(variant.entitydb.keys())
+    circle = variant.modelspace().add_circle((0, 0), radius=5)
+    assert circle.dxf.handle not in handles
+    assert variant.audit().has_errors is False
+
+
+def test_snapshot_of_entities_with_proxy_graphic(fixed_meta_data, monkeypatch):
+    # the binary DXF export does not support the proxy graphic of entities
+    monkeypatch.setattr(ezdxf.options, "load_proxy_graphics", True)
+    doc = create_doc()
+    lwpolyline = doc.modelspace().add_lwpolyline([(0, 0), (1, 0), (1, 1)])
+    lwpolyline.proxy_graphic = bytes(range(200))
+    derived = to_string(doc.snapshot().document())
+    assert "\n310\n" in derived
+    assert derived == reloaded(doc)
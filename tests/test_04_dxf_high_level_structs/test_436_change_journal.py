@@ -0,0 +1,233 @@
+# Copyright (c) 2026, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf import bbox
+from ezdxf.entitydb import ChangeJournal
+
+
+class TestChangeJournal:
+    def test_new_journal_has_no_changes(self):
+        journal = ChangeJournal()
+        changes = journal.changes_since(0)
+        assert changes.revision == 0
+        assert not (changes.created or changes.modified or changes.deleted)
+
+    def test_revision_is_monotonic(self):
+        journal = ChangeJournal()
+        journal.created("A")
+        journal.modified("A")
+        journal.deleted("A")
+        assert journal.revision == 3
+
+    def test_created_and_modified_entity_is_reported_as_created(self):
+        journal = ChangeJournal()
+        journal.created("A")
+        journal.modified("A")
+        changes = journal.changes_since(0)
+        assert changes.created == {"A"}
+        assert changes.modified == set()
+
+    def test_created_and_deleted_entity_is_not_reported(self):
+        journal = ChangeJournal()
+        journal.created("A")
+        journal.deleted("A")
+        changes = journal.changes_since(0)
+        assert not (changes.created or changes.modified or changes.deleted)
+
+    def test_changes_since_revision(self):
+        journal = ChangeJournal()
+        journal.created("A")
+        journal.created("B")
+        revision = journal.revision
+        journal.modified("A")
+        journal.deleted("B")
+        journal.created("C")
+        changes = journal.changes_since(revision)
+        assert changes.created == {"C"}
+        assert changes.modified == {"A"}
+        assert changes.deleted == {"B"}
+        assert journal.changes_since(changes.revision).created == set()
+
+    def test_modification_of_deleted_entity_is_ignored(self):
+        journal = ChangeJournal()
+        journal.deleted("A")
+        revision = journal.revision
+        journal.modified("A")
+        journal.deleted("A")
+        assert journal.revision == revision
+
+    def test_changes_of_deleted_entities_keep_the_order_of_revisions(self):
+        journal = ChangeJournal()
+        journal.created("A")
+        journal.deleted("A")
+        journal.created("B")
+        journal.modified("A")
+        journal.deleted("A")
+        assert journal.changes_since(2).created == {"B"}
+
+    def test_discard_changes(self):
+        journal = ChangeJournal()
+        journal.created("A")
+        journal.created("B")
+        journal.discard(1)
+        assert len(journal) == 1
+        assert journal.changes_since(1).created == {"B"}
+        with pytest.raises(ValueError):
+            journal.changes_since(0)
+
+    def test_discard_changes_processed_by_all_readers(self):
+        class Reader:
+            pass
+
+        journal = ChangeJournal()
+        reader1, reader2 = Reader(), Reader()
+        journal.acknowledge(reader1, 0)
+        journal.acknowledge(reader2, 0)
+        journal.created("A")
+        journal.created("B")
+        journal.acknowledge(reader1, 2)
+        assert len(journal) == 2
+        journal.acknowledge(reader2, 1)
+        assert journal.changes_since(1).created == {"B"}
+        journal.release(reader2)
+        journal.acknowledge(reader1, 2)
+        assert len(journal) == 0
+
+    def test_garbage_collected_readers_are_released(self):
+        class Reader:
+            pass
+
+        journal = ChangeJournal()
+        reader1, reader2 = Reader(), Reader()
+        journal.acknowledge(reader2, 0)
+        journal.created("A")
+        del reader2
+        journal.acknowledge(reader1, 1)
+        assert len(journal) == 0
+
+
+@pytest.fixture
+def doc():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0))
+    msp.add_circle((0, 0), 1)
+    return doc
+
+
+def test_journal_is_not_started_by_default(doc):
+    assert doc.entitydb.journal is None
+
+
+def test_start_journal_returns_existing_journal(doc):
+    journal = doc.entitydb.start_journal()
+    assert doc.entitydb.start_journal() is journal
+    doc.entitydb.stop_journal()
+    assert doc.entitydb.journal is None
+
+
+def test_modifications_are_tracked_only_if_required(doc):
+    db = doc.entitydb
+    assert db.tracks_modifications is False
+    db.start_journal()
+    db.create_attribute_index()
+    db.stop_journal()
+    assert db.tracks_modifications is True, "required by the attribute index"
+    db.delete_attribute_index()
+    assert db.tracks_modifications is False
+
+
+def test_record_created_entities(doc):
+    journal = doc.entitydb.start_journal()
+    line = doc.modelspace().add_line((0, 0), (1, 0))
+    assert journal.changes_since(0).created == {line.dxf.handle}
+
+
+def test_record_modified_dxf_attributes(doc):
+    line, circle = doc.modelspace()
+    circle.dxf.color = 1
+    journal = doc.entitydb.start_journal()
+    line.dxf.end = (2, 0)
+    del circle.dxf.color
+    changes = journal.changes_since(0)
+    assert changes.modified == {line.dxf.handle, circle.dxf.handle}
+    assert changes.created == set()
+
+
+def test_record_transformed_entity(doc):
+    line = doc.modelspace()[0]
+    journal = doc.entitydb.start_journal()
+    line.translate(1, 1, 0)
+    assert journal.changes_since(0).modified == {line.dxf.handle}
+
+
+def test_record_deleted_entities(doc):
+    msp = doc.modelspace()
+    line = msp[0]
+    handle = line.dxf.handle
+    journal = doc.entitydb.start_journal()
+    msp.delete_entity(line)
+    assert journal.changes_since(0).deleted == {handle}
+
+
+def test_record_purged_entities(doc):
+    msp = doc.modelspace()
+    circle = msp[1]
+    handle = circle.dxf.handle
+    journal = doc.entitydb.start_journal()
+    circle.destroy()
+    doc.entitydb.purge()
+    assert journal.changes_since(0).deleted == {handle}
+
+
+def test_record_entities_deleted_by_trashcan(doc):
+    db = doc.entitydb
+    line = doc.modelspace()[0]
+    handle = line.dxf.handle
+    journal = db.start_journal()
+    with db.trashcan() as trash:
+        trash.add(handle)
+    assert handle not in db
+    assert line.is_alive is False
+    assert journal.changes_since(0).deleted == {handle}
+
+
+def test_record_dead_entities_removed_by_trashcan(doc):
+    db = doc.entitydb
+    line = doc.modelspace()[0]
+    handle = line.dxf.handle
+    line.destroy()  # entity is dead but still stored in the database
+    journal = db.start_journal()
+    with db.trashcan() as trash:
+        trash.add(handle)
+    assert handle not in db
+    assert journal.changes_since(0).deleted == {handle}
+
+
+def test_lazy_loading_is_not_recorded(doc, tmp_path):
+    filename = tmp_path / "journal.dxf"
+    doc.saveas(filename)
+    lazy_doc = ezdxf.readfile(filename, lazy=True)
+    journal = lazy_doc.entitydb.start_journal()
+    line = lazy_doc.modelspace()[0]
+    assert journal.revision == 0
+    line.dxf.layer = "LINE"
+    assert journal.changes_since(0).modified == {line.dxf.handle}
+
+
+def test_bbox_cache_apply_changes(doc):
+    msp = doc.modelspace()
+    line, circle = msp
+    cache = bbox.Cache()
+    bbox.extents(msp, cache=cache)
+    journal = doc.entitydb.start_journal()
+    line.dxf.end = (5, 0)
+    cache.apply_changes(journal.changes_since(0))
+    assert cache.get(line) is None
+    assert cache.get(circle) is not None
+    assert bbox.extents(msp, cache=cache).extmax.x == pytest.approx(5)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
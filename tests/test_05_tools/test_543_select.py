@@ -356,5 +356,106 @@ class TestPlanarSearchIndex:
         assert len(result) == 4
 
 
+class TestSpatialIndex:
+    @pytest.fixture
+    def msp(self):
+        doc = ezdxf.new()
+        msp_ = doc.modelspace()
+        msp_.add_point((0, 1))
+        msp_.add_circle((0, 0), radius=5)
+        msp_.add_line((-1, -1), (1, 1))
+        msp_.add_lwpolyline([(-2, -2), (2, -2), (2, 2), (-2, 2)], close=True)
+        return msp_
+
+    def test_index_is_persistent(self, msp: Modelspace):
+        index = msp.spatial_index()
+        assert msp.spatial_index() is index
+        assert len(index) == 4
+
+    def test_window_selection(self, msp: Modelspace):
+        index = msp.spatial_index()
+        selection = index.bbox_inside(select.Window((-1, -1), (1, 1)))
+        assert {e.dxftype() for e in selection} == {"POINT", "LINE"}
+
+    def test_crossing_selection(self, msp: Modelspace):
+        index = msp.spatial_index()
+        selection = index.bbox_overlap(select.Window((3, 3), (4, 4)))
+        assert {e.dxftype() for e in selection} == {"CIRCLE"}
+
+    def test_polygon_selection(self, msp: Modelspace):
+        index = msp.spatial_index()
+        polygon = select.Polygon([(-3, -3), (3, -3), (3, 3), (-3, 3)])
+        selection = index.bbox_inside(polygon)
+        assert {e.dxftype() for e in selection} == {"POINT", "LINE", "LWPOLYLINE"}
+
+    def test_fence_selection(self, msp: Modelspace):
+        index = msp.spatial_index()
+        selection = index.bbox_crosses_fence([(0, 10), (10, 0)])
+        assert {e.dxftype() for e in selection} == {"CIRCLE"}
+
+    def test_point_in_bbox(self, msp: Modelspace):
+        assert len(msp.spatial_index().point_in_bbox((0, 1))) == 4
+
+    def test_nearest_entities(self, msp: Modelspace):
+        index = msp.spatial_index()
+        selection = index.nearest((10, 0), count=2)
+        assert [e.dxftype() for e in selection] == ["CIRCLE", "LWPOLYLINE"]
+
+    def test_index_added_entities(self, msp: Modelspace):
+        index = msp.spatial_index()
+        line = msp.add_line((20, 20), (21, 21))
+        assert list(index.bbox_inside(select.Window((19, 19), (22, 22)))) == [line]
+
+    def test_index_deleted_entities(self, msp: Modelspace):
+        index = msp.spatial_index()
+        msp.delete_entity(msp[1])
+        assert len(index.bbox_overlap(select.Window((3, 3), (4, 4)))) == 0
+        assert len(index) == 3
+
+    def test_index_transformed_entities(self, msp: Modelspace):
+        index = msp.spatial_index()
+        polyline = msp[3]
+        polyline.translate(20, 0, 0)
+        assert list(index.bbox_inside(select.Window((17, -3), (23, 3)))) == [polyline]
+
+    def test_index_entities_moved_to_another_layout(self, msp: Modelspace):
+        index = msp.spatial_index()
+        point = msp[0]
+        msp.move_to_layout(point, msp.doc.layout())
+        assert point not in index.point_in_bbox((0, 1))
+
+    def test_rebuild_index_if_journal_was_stopped(self, msp: Modelspace):
+        index = msp.spatial_index()
+        msp.doc.entitydb.stop_journal()
+        msp.add_point((20, 20))
+        assert len(index.point_in_bbox((20, 20))) == 1
+
+    def test_processed_changes_are_discarded(self, msp: Modelspace):
+        index = msp.spatial_index()
+        msp.add_point((20, 20))
+        assert len(index) == 5
+        assert len(msp.doc.entitydb.journal) == 0
+
+    def test_changes_are_kept_for_other_indexes(self, msp: Modelspace):
+        psp = msp.doc.layout()
+        psp_index = psp.spatial_index()
+        index = msp.spatial_index()
+        journal = msp.doc.entitydb.journal
+        psp.add_point((20, 20))
+        assert len(index) == 4
+        assert len(journal) == 1, "not processed by the paperspace index"
+        assert len(psp_index) == 1
+        assert len(journal) == 0
+
+    def test_closed_index_releases_the_journal(self, msp: Modelspace):
+        psp_index = msp.doc.layout().spatial_index()
+        index = msp.spatial_index()
+        psp_index.close()
+        msp.add_point((20, 20))
+        assert len(index) == 5
+        assert len(msp.doc.entitydb.journal) == 0
+        assert len(psp_index) == 0, "closed index is rebuilt at the next query"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
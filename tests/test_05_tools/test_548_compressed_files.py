@@ -0,0 +1,128 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import gzip
+
+import pytest
+import ezdxf
+from ezdxf.addons import iterdxf
+from ezdxf.addons.r12writer import r12writer
+from ezdxf.tools import compressedfile
+from ezdxf.tools.compressedfile import GZIP, ZSTD
+
+EXTENSIONS = [".gz"]
+if compressedfile.is_zstd_supported():
+    EXTENSIONS.append(".zst")
+
+
+@pytest.mark.parametrize(
+    "filename,compression",
+    [
+        ("a.dxf.gz", GZIP),
+        ("a.DXF.GZ", GZIP),
+        ("a.dxf.zst", ZSTD),
+        ("a.dxf", None),
+        ("a.gz.dxf", None),
+    ],
+)
+def test_compression_by_extension(filename, compression):
+    assert compressedfile.compression_by_extension(filename) == compression
+
+
+def test_detect_compression_by_content(tmp_path):
+    filename = tmp_path / "gzip.dxf"
+    with gzip.open(filename, "wb") as fp:
+        fp.write(b"0\nEOF\n")
+    assert compressedfile.detect_compression(filename) == GZIP
+    filename.write_bytes(b"0\nEOF\n")
+    assert compressedfile.detect_compression(filename) is None
+
+
+def test_unknown_compression_format(tmp_path):
+    with pytest.raises(ValueError):
+        compressedfile.open_file(tmp_path / "x.dxf", "wb", "xyz")
+
+
+@pytest.fixture(scope="module")
+def doc():
+    doc = ezdxf.new("R2000")
+    msp = doc.modelspace()
+    for index in range(100):
+        msp.add_line((index, 0), (0, index), dxfattribs={"layer": "LINES"})
+    msp.add_text("Äöü")
+    return doc
+
+
+@pytest.mark.parametrize("ext", EXTENSIONS)
+@pytest.mark.parametrize("fmt", ["asc", "bin"])
+def test_saveas_and_readfile(doc, tmp_path, ext, fmt):
+    filename = tmp_path / f"test.dxf{ext}"
+    doc.saveas(filename, fmt=fmt)
+    assert compressedfile.detect_compression(filename) is not None
+
+    doc2 = ezdxf.readfile(filename)
+    assert len(doc2.modelspace()) == 101
+    assert doc2.modelspace().query("TEXT").first.dxf.text == "Äöü"
+    assert doc2.filename == str(filename)
+
+
+def test_saveas_creates_same_content_as_uncompressed_file(doc, tmp_path):
+    ezdxf.options.write_fixed_meta_data_for_testing = True
+    try:
+        doc.saveas(tmp_path / "test.dxf")
+        doc.saveas(tmp_path / "test.dxf.gz")
+    finally:
+        ezdxf.options.write_fixed_meta_data_for_testing = False
+    data = (tmp_path / "test.dxf").read_bytes()
+    with gzip.open(tmp_path / "test.dxf.gz", "rb") as fp:
+        assert fp.read() == data
+
+
+def test_readfile_rejects_compressed_non_dxf_files(tmp_path):
+    filename = tmp_path / "test.dxf.gz"
+    with gzip.open(filename, "wt") as fp:
+        fp.write("no DXF content")
+    with pytest.raises(IOError):
+        ezdxf.readfile(filename)
+
+
+def test_dxf_file_info_of_compressed_file(doc, tmp_path):
+    filename = tmp_path / "test.dxf.gz"
+    doc.saveas(filename)
+    info = ezdxf.filemanagement.dxf_file_info(filename)
+    assert info.version == "AC1015"
+
+
+@pytest.mark.parametrize("ext", EXTENSIONS)
+@pytest.mark.parametrize("fmt", ["asc", "bin"])
+def test_r12writer(tmp_path, ext, fmt):
+    filename = tmp_path / f"r12.dxf{ext}"
+    with r12writer(filename, fmt=fmt) as dxf:
+        dxf.add_line((0, 0), (1, 1))
+        dxf.add_circle((0, 0), 2)
+    assert compressedfile.detect_compression(filename) is not None
+    doc = ezdxf.readfile(filename)
+    assert len(doc.modelspace()) == 2
+
+
+@pytest.mark.parametrize("fmt", ["asc", "bin"])
+def test_iterdxf_modelspace(doc, tmp_path, fmt):
+    filename = tmp_path / "test.dxf.gz"
+    doc.saveas(filename, fmt=fmt)
+    lines = list(iterdxf.modelspace(filename, types=["LINE"]))
+    assert len(lines) == 100
+    assert lines[0].dxf.layer == "LINES"
+
+
+def test_iterdxf_export_compressed_file(doc, tmp_path):
+    source = tmp_path / "source.dxf"
+    doc.saveas(source)
+    filename = tmp_path / "export.dxf.gz"
+    reader = iterdxf.opendxf(source)
+    writer = reader.export(filename)
+    for entity in reader.modelspace(types=["TEXT"]):
+        writer.write(entity)
+    writer.close()
+    reader.close()
+
+    doc2 = ezdxf.readfile(filename)
+    assert len(doc2.modelspace()) == 1
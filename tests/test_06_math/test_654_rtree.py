@@ -3,9 +3,11 @@
 
 import pytest
 
-from ezdxf.math import Vec2, Vec3, BoundingBox, spherical_envelope
+import random
+
+from ezdxf.math import Vec2, Vec3, BoundingBox, BoundingBox2d, spherical_envelope
 from ezdxf.math import rtree
-from ezdxf.math.rtree import RTree
+from ezdxf.math.rtree import RTree, DynamicRTree
 
 
 def test_can_not_build_empty_tree():
@@ -161,5 +163,115 @@ def test_spherical_envelope():
     assert radius == pytest.approx(0.8660254037844386)
 
 
+def random_boxes(count: int, dims: int = 2, seed: int = 42) -> dict[int, BoundingBox]:
+    rnd = random.Random(seed)
+    boxes = {}
+    for key in range(count):
+        x, y, z = rnd.uniform(0, 100), rnd.uniform(0, 100), rnd.uniform(0, 100)
+        size = Vec3(rnd.uniform(0, 5), rnd.uniform(0, 5), rnd.uniform(0, 5))
+        if dims == 2:
+            z = 0
+            size = size.replace(z=0)
+        boxes[key] = BoundingBox([(x, y, z), Vec3(x, y, z) + size])
+    return boxes
+
+
+def brute_force_overlap(boxes: dict, query: BoundingBox) -> set:
+    return {key for key, box in boxes.items() if query.has_overlap(box)}
+
+
+class TestDynamicRTree:
+    def test_empty_tree(self):
+        tree = DynamicRTree()
+        assert len(tree) == 0
+        assert list(tree.overlapping(BoundingBox([(0, 0), (1, 1)]))) == []
+        assert tree.nearest((0, 0)) == []
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            DynamicRTree(dims=4)
+        with pytest.raises(ValueError):
+            DynamicRTree(max_node_size=3)
+
+    def test_insert_boxes_and_points(self):
+        tree = DynamicRTree()
+        tree.insert("box", BoundingBox2d([(0, 0), (2, 2)]))
+        tree.insert("point", (5, 5))
+        assert len(tree) == 2
+        assert "point" in tree
+        assert tree.extents("box") == (0, 0, 2, 2)
+        assert tree.extents("point") == (5, 5, 5, 5)
+
+    def test_insert_existing_key_raises_key_error(self):
+        tree = DynamicRTree()
+        tree.insert(1, (0, 0))
+        with pytest.raises(KeyError):
+            tree.insert(1, (1, 1))
+
+    def test_bulk_load_requires_unique_keys(self):
+        with pytest.raises(ValueError):
+            DynamicRTree.bulk_load([(1, (0, 0)), (1, (1, 1))])
+
+    @pytest.mark.parametrize("dims", [2, 3])
+    def test_insert_and_delete(self, dims):
+        boxes = random_boxes(500, dims)
+        tree = DynamicRTree(dims=dims, max_node_size=8)
+        for key, box in boxes.items():
+            tree.insert(key, box)
+        for key in range(0, 500, 3):
+            tree.delete(key)
+            del boxes[key]
+        assert len(tree) == len(boxes)
+        query = BoundingBox([(20, 20, 0), (60, 50, 70)])
+        assert set(tree.overlapping(query)) == brute_force_overlap(boxes, query)
+
+    @pytest.mark.parametrize("dims", [2, 3])
+    def test_bulk_load_and_insert(self, dims):
+        boxes = random_boxes(500, dims)
+        items = list(boxes.items())
+        tree = DynamicRTree.bulk_load(items[:300], dims=dims)
+        for key, box in items[300:]:
+            tree.insert(key, box)
+        assert set(tree) == set(boxes)
+        query = BoundingBox([(10, 30, 0), (50, 80, 40)])
+        assert set(tree.overlapping(query)) == brute_force_overlap(boxes, query)
+
+    def test_delete_all_entries(self):
+        boxes = random_boxes(100)
+        tree = DynamicRTree.bulk_load(boxes.items(), max_node_size=4)
+        for key in boxes:
+            tree.delete(key)
+        assert len(tree) == 0
+        tree.insert(1, (0, 0))
+        assert list(tree.overlapping((0, 0))) == [1]
+
+    def test_update_entry(self):
+        tree = DynamicRTree.bulk_load(random_boxes(50).items())
+        tree.update(7, (200, 200))
+        assert list(tree.overlapping(BoundingBox2d([(150, 150), (250, 250)]))) == [7]
+
+    def test_inside_and_containing(self):
+        boxes = random_boxes(200)
+        tree = DynamicRTree.bulk_load(boxes.items())
+        query = BoundingBox([(20, 20), (60, 60)])
+        assert set(tree.inside(query)) == {
+            key for key, box in boxes.items() if query.contains(box)
+        }
+        point = Vec2(50, 50)
+        assert set(tree.containing(point)) == {
+            key for key, box in boxes.items() if box.inside(point)
+        }
+
+    def test_k_nearest(self):
+        boxes = random_boxes(200)
+        tree = DynamicRTree.bulk_load(boxes.items())
+        target = (30, 70)
+        result = tree.nearest(target, count=5)
+        distances = sorted(
+            rtree._distance(tree.extents(key), target) for key in boxes
+        )
+        assert [distance for _, distance in result] == pytest.approx(distances[:5])
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,137 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import pytest
+import ezdxf
+from ezdxf.addons import iterdxf
+from ezdxf.lldxf import fileindex
+
+
+class NotSeekableStream:
+    def __init__(self, filename):
+        self._stream = open(filename, "rb")
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+    def readline(self):
+        return self._stream.readline()
+
+    def close(self):
+        self._stream.close()
+
+
+@pytest.fixture(
+    scope="module",
+    params=[("R12", "asc"), ("R12", "bin"), ("R2000", "asc"), ("R2000", "bin")],
+    ids=["R12-asc", "R12-bin", "R2000-asc", "R2000-bin"],
+)
+def filename(request, tmp_path_factory):
+    dxfversion, fmt = request.param
+    doc = ezdxf.new(dxfversion)
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={"layer": "LINES"})
+    msp.add_polyline2d([(0, 0), (1, 0), (1, 1)])
+    msp.add_text("Äöü")
+    doc.layout().add_circle((0, 0), 1)  # paperspace entity
+    filename = tmp_path_factory.mktemp(f"{dxfversion}{fmt}") / "test.dxf"
+    doc.saveas(filename, fmt=fmt)
+    return filename
+
+
+def check_entities(entities):
+    assert [e.dxftype() for e in entities] == ["LINE", "POLYLINE", "TEXT"]
+    line, polyline, text = entities
+    assert line.dxf.layer == "LINES"
+    assert line.dxf.end.isclose((1, 0))
+    assert len(polyline.vertices) == 3
+    assert text.dxf.text == "Äöü"
+
+
+def test_file_structure(filename):
+    structure = fileindex.load(str(filename))
+    assert structure.binary is (filename.read_bytes()[:6] == b"AutoCA")
+    assert structure.index[0].value == "SECTION"
+    assert structure.index[-1].value == "EOF"
+    assert len(list(structure.fetchall(0, "LINE"))) == 1
+
+
+def test_opendxf(filename):
+    doc = iterdxf.opendxf(filename)
+    try:
+        check_entities(list(doc.modelspace()))
+    finally:
+        doc.close()
+
+
+def test_modelspace(filename):
+    check_entities(list(iterdxf.modelspace(filename)))
+
+
+def test_modelspace_type_filter(filename):
+    entities = list(iterdxf.modelspace(filename, types=["TEXT"]))
+    assert [e.dxftype() for e in entities] == ["TEXT"]
+
+
+def test_single_pass_modelspace(filename):
+    stream = NotSeekableStream(filename)
+    try:
+        check_entities(list(iterdxf.single_pass_modelspace(stream)))  # type: ignore
+    finally:
+        stream.close()
+
+
+def last_entity_doc():
+    # no paperspace entities in the ENTITIES section, the modelspace POINT
+    # is the last entity before ENDSEC
+    doc = ezdxf.new("R2000")
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0))
+    msp.add_point((7, 8), dxfattribs={"layer": "LAST"})
+    return doc
+
+
+def check_last_entity(entities):
+    assert [e.dxftype() for e in entities] == ["LINE", "POINT"]
+    assert entities[-1].dxf.layer == "LAST"
+
+
+@pytest.mark.parametrize("name", ["last.dxf", "last.dxf.gz"])
+@pytest.mark.parametrize("fmt", ["asc", "bin"])
+def test_modelspace_loads_last_entity(tmp_path, fmt, name):
+    filename = tmp_path / name
+    last_entity_doc().saveas(filename, fmt=fmt)
+    check_last_entity(list(iterdxf.modelspace(filename)))
+
+
+@pytest.mark.parametrize("fmt", ["asc", "bin"])
+def test_single_pass_modelspace_loads_last_entity(tmp_path, fmt):
+    filename = tmp_path / "last.dxf"
+    last_entity_doc().saveas(filename, fmt=fmt)
+    stream = NotSeekableStream(filename)
+    try:
+        check_last_entity(list(iterdxf.single_pass_modelspace(stream)))  # type: ignore
+    finally:
+        stream.close()
+
+
+def test_export(filename, tmp_path):
+    doc = iterdxf.opendxf(filename)
+    export_name = tmp_path / "export.dxf"
+    exporter = doc.export(export_name)
+    try:
+        for entity in doc.modelspace():
+            if entity.dxftype() != "POLYLINE":
+                exporter.write(entity)
+    finally:
+        exporter.close()
+        doc.close()
+
+    exported_doc = ezdxf.readfile(export_name)
+    assert exported_doc.dxfversion == doc.dxfversion
+    entities = list(exported_doc.modelspace())
+    assert [e.dxftype() for e in entities] == ["LINE", "TEXT"]
+    assert entities[1].dxf.text == "Äöü"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
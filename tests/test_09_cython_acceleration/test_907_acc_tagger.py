@@ -0,0 +1,131 @@
+#  Copyright (c) 2026, Manfred Moitzi
+#  License: MIT License
+import pytest
+from io import StringIO
+
+pytest.importorskip("ezdxf.acc.tagger")
+
+from ezdxf.lldxf.tagger import (
+    ascii_tags_loader,
+    py_tag_compiler,
+    py_internal_tag_compiler,
+)
+from ezdxf.lldxf.types import DXFBinaryTag, DXFVertex
+from ezdxf.lldxf.const import DXFStructureError
+from ezdxf.acc.tagger import internal_tag_compiler, tag_compiler
+
+LINE = """0
+LINE
+5
+AB
+8
+0
+10
+1.5
+20
+2.5
+30
+3.5
+11
+4
+21
+5
+70
+3
+40
+1.25
+"""
+
+POINT_2D = """0
+LWPOLYLINE
+10
+1
+20
+2
+10
+3
+20
+4
+0
+EOF
+"""
+
+BINARY = """0
+DATA
+310
+FFAA01
+1004
+0A0B
+"""
+
+
+def cy_compile(s: str):
+    return list(tag_compiler(ascii_tags_loader(StringIO(s))))
+
+
+def py_compile(s: str):
+    return list(py_tag_compiler(ascii_tags_loader(StringIO(s))))
+
+
+@pytest.mark.parametrize("s", [LINE, POINT_2D, BINARY])
+def test_tag_compiler_produces_same_result_as_python_version(s):
+    cy_tags = cy_compile(s)
+    py_tags = py_compile(s)
+    assert cy_tags == py_tags
+    assert [type(tag) for tag in cy_tags] == [type(tag) for tag in py_tags]
+
+
+def test_tag_compiler_value_types():
+    tags = cy_compile(LINE)
+    assert tags[0] == (0, "LINE")
+    assert tags[3] == (10, (1.5, 2.5, 3.5))
+    assert isinstance(tags[3], DXFVertex)
+    assert tags[4] == (11, (4.0, 5.0))
+    assert tags[5] == (70, 3)
+    assert type(tags[5].value) is int
+    assert tags[6] == (40, 1.25)
+
+
+def test_tag_compiler_2d_points():
+    tags = cy_compile(POINT_2D)
+    assert tags[1] == (10, (1.0, 2.0))
+    assert tags[2] == (10, (3.0, 4.0))
+    assert tags[3] == (0, "EOF")
+
+
+def test_tag_compiler_binary_data():
+    tags = cy_compile(BINARY)
+    assert isinstance(tags[1], DXFBinaryTag)
+    assert tags[1].value == b"\xff\xaa\x01"
+    assert tags[2].value == b"\x0a\x0b"
+
+
+def test_tag_compiler_accepts_int_values_stored_as_floats():
+    assert cy_compile("70\n1.0\n") == [(70, 1)]
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        "70\nx\n",  # invalid int
+        "40\nabc\n",  # invalid float
+        "10\n1\n30\n2\n40\n0\n",  # missing y-axis
+        "10\nx\n20\n1\n0\nA\n",  # invalid coordinate
+        "0\nA\n10\n1\n20\n1\n0\nB\n70\nz\n",  # error after a 2d point
+    ],
+)
+def test_tag_compiler_raises_same_errors_as_python_version(s):
+    with pytest.raises(DXFStructureError) as cy_error:
+        cy_compile(s)
+    with pytest.raises(DXFStructureError) as py_error:
+        py_compile(s)
+    assert str(cy_error.value) == str(py_error.value)
+
+
+@pytest.mark.parametrize("s", [LINE, POINT_2D, BINARY, "10\n1\n20\n2"])
+def test_internal_tag_compiler_produces_same_result_as_python_version(s):
+    assert list(internal_tag_compiler(s)) == list(py_internal_tag_compiler(s))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])